@@ -2,16 +2,23 @@
 Analyzer Agent - Fast analysis and deep analysis of user responses
 """
 
-from models.schemas import AnalyzedResponse, ResponseQuality, Sentiment, DeepAnalysis
-from groq import Groq
+from models.schemas import AnalyzedResponse, ResponseQuality, DeepAnalysis
+from llm.prompts import prompt_registry
+from llm.router import llm_router
+from utils.sentiment import get_sentiment_engine
 import config
 import json
+from typing import Optional
+from utils.logger import get_logger
+
+logger = get_logger("agents.analyzer")
 
 class AnalyzerAgent:
     """Analyzes user responses for quality and sentiment"""
     
     def __init__(self):
-        self.groq_client = Groq(api_key=config.GROQ_API_KEY)
+        self.llm = llm_router
+        self.sentiment_engine = get_sentiment_engine()
     
     async def analyze(self, user_response: str) -> AnalyzedResponse:
         """
@@ -22,7 +29,7 @@ class AnalyzerAgent:
         
         # Quick heuristic analysis
         quality = self._assess_quality(user_response, word_count)
-        sentiment = self._assess_sentiment(user_response)
+        sentiment, sentiment_score = self.sentiment_engine.classify(user_response)
         
         # Extract quick insights for shallow responses
         quick_insights = []
@@ -37,6 +44,7 @@ class AnalyzerAgent:
             user_response=user_response,
             quality=quality,
             sentiment=sentiment,
+            sentiment_score=round(sentiment_score, 4),
             word_count=word_count,
             key_insights=quick_insights
         )
@@ -59,60 +67,32 @@ class AnalyzerAgent:
         
         return ResponseQuality.GOOD
     
-    def _assess_sentiment(self, text: str) -> Sentiment:
-        """Assess sentiment"""
-        positive_words = ["good", "great", "excellent", "love", "enjoy", "amazing", "happy"]
-        negative_words = ["bad", "terrible", "hate", "awful", "disappointed", "frustrated"]
-        
-        text_lower = text.lower()
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
-        
-        if pos_count > neg_count:
-            return Sentiment.POSITIVE
-        elif neg_count > pos_count:
-            return Sentiment.NEGATIVE
-        return Sentiment.NEUTRAL
-    
-    async def deep_analyze(self, user_response: str, conversation_context: str) -> DeepAnalysis:
+    async def deep_analyze(
+        self,
+        user_response: str,
+        conversation_context: str,
+        template_id: Optional[str] = None
+    ) -> DeepAnalysis:
         """
         Deep analysis using Groq LLM - only for GOOD/EXCELLENT responses.
         Extracts insights, emotional tone, and determines if follow-up is needed.
         """
         
-        prompt = f"""You are analyzing a market research interview response.
-
-Context (recent conversation):
-{conversation_context}
-
-User's response:
-{user_response}
-
-Extract:
-1. Key insights (2-3 concrete insights about user behavior, preferences, or pain points)
-2. Emotional tone (one word: excited, frustrated, satisfied, neutral, etc.)
-3. Does this need follow-up? (yes/no - only if something interesting was mentioned but not fully explained)
-4. If follow-up needed, suggest a specific topic to probe
-
-Return as JSON:
-{{
-  "key_insights": ["insight1", "insight2"],
-  "emotional_tone": "satisfied",
-  "needs_follow_up": false,
-  "suggested_follow_up_topic": ""
-}}
-"""
+        prompt = prompt_registry.render(
+            "deep_analysis",
+            variant=template_id,
+            context=conversation_context,
+            response=user_response
+        )
         
         try:
-            response = self.groq_client.chat.completions.create(
-                model=config.GROQ_QUALITY_MODEL,
-                messages=[{"role": "user", "content": prompt}],
+            result_text = await self.llm.complete(
+                prompt.messages,
+                role="quality",
                 max_tokens=200,
                 temperature=0.3
             )
             
-            result_text = response.choices[0].message.content.strip()
-            
             # Parse JSON
             result = json.loads(result_text)
             
@@ -124,7 +104,7 @@ Return as JSON:
             )
         
         except Exception as e:
-            print(f"⚠️ Deep analysis error: {e}")
+            logger.warning("⚠️ Deep analysis error: %s", e)
             # Fallback
             return DeepAnalysis(
                 key_insights=[],
@@ -3,26 +3,91 @@ Interviewer Agent - Generates main interview questions
 """
 
 from models.schemas import InterviewState
-from typing import List
-from groq import Groq
+from typing import Callable, List, Optional
+from llm.prompts import prompt_registry
+from llm.router import llm_router
 import config
+from utils.logger import get_logger
+
+logger = get_logger("agents.interviewer")
+
+FALLBACK_QUESTION = "Could you tell me more about your experience with that?"
+
+
+def _unquote(question: str) -> str:
+    """Remove quotes if the LLM wrapped the question in them."""
+    if len(question) > 1 and question.startswith('"') and question.endswith('"'):
+        return question[1:-1]
+    return question
+
+
+class _UnquotedTokens:
+    """
+    Forwards streamed question text to `on_token` without the quotes the LLM
+    may wrap it in: a leading `"` is held back, and so are trailing whitespace
+    and a `"` until more text follows them.
+    """
+    
+    def __init__(self, on_token: Callable[[str], None]):
+        self.on_token = on_token
+        self.started = False
+        self.opening_quote = False
+        self.pending = ""
+        self.sent: List[str] = []
+    
+    def __call__(self, delta: str):
+        if not self.started:
+            delta = delta.lstrip()
+            if not delta:
+                return
+            self.started = True
+            if delta.startswith('"'):
+                self.opening_quote = True
+                delta = delta[1:]
+        
+        text = self.pending + delta
+        ready = text.rstrip()
+        if ready.endswith('"'):
+            ready = ready[:-1]
+        self.pending = text[len(ready):]
+        if ready:
+            self._send(ready)
+    
+    def _send(self, text: str):
+        self.sent.append(text)
+        self.on_token(text)
+    
+    def finish(self) -> str:
+        """Send what is still held back, except a closing quote matching the opening one; returns all text sent."""
+        tail = self.pending.strip()
+        if tail and not (self.opening_quote and tail == '"'):
+            self._send(self.pending.rstrip())
+        return "".join(self.sent)
+
 
 class InterviewerAgent:
     """Generates engaging, context-aware interview questions"""
     
     def __init__(self):
-        self.groq_client = Groq(api_key=config.GROQ_API_KEY)
+        self.llm = llm_router
     
     async def generate_next_question(
         self,
         state: InterviewState,
-        collected_insights: List[str]
+        collected_insights: List[str],
+        on_token: Optional[Callable[[str], None]] = None,
+        on_replace: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Generate the next main interview question based on:
         1. Research topic
         2. What's been discussed so far
         3. Insights collected
+        
+        If `on_token` is given the question is streamed token by token,
+        without wrapping quotes. When the streamed text isn't the final
+        question (an unmatched quote, or the fallback after an error) the
+        whole question is sent to `on_replace`.
         """
         
         # Build context from conversation
@@ -33,67 +98,47 @@ class InterviewerAgent:
         
         recent_topics = discussed_topics[-3:] if discussed_topics else []
         
-        # Get recent user insights
-        recent_insights = collected_insights[-5:] if collected_insights else []
+        # The workflow passes the insights most relevant to the current thread
+        # (utils/insight_index.py); otherwise this keeps the latest ones
+        recent_insights = collected_insights[-config.INSIGHT_CONTEXT_SIZE:] if collected_insights else []
         
-        prompt = f"""You are an ENGAGING market researcher conducting an interview.
-
-Research Topic: {state.research_topic}
-
-Progress: Question {state.current_question_count}/{state.max_questions}
-
-What you've already asked:
-{chr(10).join([f"- {topic}" for topic in recent_topics])}
-
-Insights collected so far:
-{chr(10).join([f"- {insight}" for insight in recent_insights])}
-
-Your task: Generate the NEXT natural follow-up question.
-
-RULES:
-1. STAY ON TOPIC - Only ask about: {state.research_topic}
-2. Build on what they've shared - reference their previous responses
-3. Ask open-ended questions (who, what, when, where, why, how)
-4. Be conversational and WARM - show genuine curiosity
-5. Keep questions SHORT (1-2 sentences MAX)
-6. Add emotional engagement:
-   - "I'm curious..."
-   - "I'd love to understand..."
-   - "That's fascinating! Tell me more about..."
-7. Ask for SPECIFICS - examples, stories, concrete details
-8. Create natural conversation flow
-
-GOOD questions:
-- "That's interesting! Can you walk me through a specific example of when that happened?"
-- "I'm curious - what made you choose that approach over others?"
-- "Tell me more about how that impacts your daily routine?"
-
-BAD questions (NEVER use):
-- "How do you feel about that?" (too vague)
-- "Can you tell me more?" (lazy)
-- "What else?" (unengaging)
-
-Generate ONE natural, engaging follow-up question:"""
+        prompt = prompt_registry.render(
+            "next_question",
+            variant=state.template_id,
+            research_topic=state.research_topic,
+            question_number=state.current_question_count,
+            max_questions=state.max_questions,
+            asked_questions="\n".join([f"- {topic}" for topic in recent_topics]),
+            insights="\n".join([f"- {insight}" for insight in recent_insights])
+        )
         
         try:
-            response = self.groq_client.chat.completions.create(
-                model=config.GROQ_FAST_MODEL,
-                messages=[{"role": "user", "content": prompt}],
+            if on_token:
+                tokens = _UnquotedTokens(on_token)
+                question = _unquote(await self.llm.complete_streaming(
+                    prompt.messages,
+                    role="fast",
+                    on_token=tokens,
+                    max_tokens=120,
+                    temperature=0.4
+                ))
+                if tokens.finish() != question and on_replace:
+                    on_replace(question)
+                return question
+            
+            return _unquote(await self.llm.complete(
+                prompt.messages,
+                role="fast",
                 max_tokens=120,
                 temperature=0.4
-            )
-            
-            question = response.choices[0].message.content.strip()
-            
-            # Remove quotes if LLM added them
-            if question.startswith('"') and question.endswith('"'):
-                question = question[1:-1]
-            
-            return question
+            ))
         
         except Exception as e:
-            print(f"âš ï¸ Question generation error: {e}")
-            return "Could you tell me more about your experience with that?"
+            logger.warning("⚠️ Question generation error: %s", e)
+            if on_replace:
+                # Part of the failed question may already be on screen
+                on_replace(FALLBACK_QUESTION)
+            return FALLBACK_QUESTION
 
 # Singleton instance
 interviewer_agent = InterviewerAgent()
\ No newline at end of file
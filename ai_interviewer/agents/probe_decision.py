@@ -3,25 +3,46 @@ Probe Decision Agent - Intelligently decides if probing is TRULY needed
 Only probes when response is IRRELEVANT/OFF-TOPIC, not just short
 """
 
-from typing import Dict
-from groq import Groq
+from typing import Dict, Optional
+from llm.prompts import prompt_registry
+from llm.router import llm_router
+from utils.relevance import relevance_classifier, RELEVANT, IRRELEVANT
 import config
+from utils.logger import get_logger
+
+logger = get_logger("agents.probe_decision")
 
 class ProbeDecisionAgent:
     """Makes intelligent decisions about when to probe"""
     
     def __init__(self):
-        self.groq_client = Groq(api_key=config.GROQ_API_KEY)
+        self.llm = llm_router
+        self.relevance_classifier = relevance_classifier
+        self.stats = {
+            "excellent_skips": 0,
+            "heuristic_relevant": 0,
+            "heuristic_irrelevant": 0,
+            "llm_checks": 0
+        }
+    
+    def llm_skip_rate(self) -> float:
+        """Fraction of decisions made without an LLM call"""
+        total = sum(self.stats.values())
+        return 1 - self.stats["llm_checks"] / total if total else 0.0
     
     async def should_probe(
         self,
         question_asked: str,
         user_response: str,
         research_topic: str,
-        response_quality: str
+        response_quality: str,
+        template_id: Optional[str] = None,
+        record: bool = True
     ) -> Dict[str, any]:
         """
         Intelligently decide if we TRULY need to probe.
+        `record=False` keeps the decision out of `stats` (speculative runs on
+        a draft, which may never become a turn).
         
         Returns:
             {
@@ -33,17 +54,48 @@ class ProbeDecisionAgent:
         
         # If response is already excellent, never probe
         if response_quality == "excellent":
+            if record:
+                self.stats["excellent_skips"] += 1
             return {
                 "should_probe": False,
                 "reason": "Response is excellent quality",
                 "probe_type": "none"
             }
         
-        # Check if response is TRULY irrelevant/off-topic
+        # Fast path: confidently on/off-topic answers skip the LLM check
+        if config.RELEVANCE_FAST_PATH:
+            verdict, why = self.relevance_classifier.classify(
+                question_asked,
+                user_response,
+                research_topic
+            )
+            
+            if verdict == RELEVANT:
+                if record:
+                    self.stats["heuristic_relevant"] += 1
+                return {
+                    "should_probe": False,
+                    "reason": f"Response is on-topic (fast path: {why})",
+                    "probe_type": "none"
+                }
+            
+            if verdict == IRRELEVANT:
+                if record:
+                    self.stats["heuristic_irrelevant"] += 1
+                return {
+                    "should_probe": True,
+                    "reason": f"Response is off-topic (fast path: {why})",
+                    "probe_type": "irrelevant"
+                }
+        
+        # Ambiguous - check if response is TRULY irrelevant/off-topic
+        if record:
+            self.stats["llm_checks"] += 1
         is_irrelevant = await self._check_relevance(
             question_asked,
             user_response,
-            research_topic
+            research_topic,
+            template_id
         )
         
         if is_irrelevant:
@@ -65,76 +117,41 @@ class ProbeDecisionAgent:
         self,
         question: str,
         response: str,
-        topic: str
+        topic: str,
+        template_id: Optional[str] = None
     ) -> bool:
         """
         Check if response is ACTUALLY relevant to the question.
         Returns True if IRRELEVANT (needs probe)
         """
         
-        prompt = f"""You are a relevance checker. Determine if the user's response is RELEVANT or IRRELEVANT to the question.
-
-Research Topic: {topic}
-Question Asked: {question}
-User Response: {response}
-
-A response is IRRELEVANT if:
-- They talk about a completely different topic (e.g., asked about chess, they talk about cooking)
-- They give a random unrelated answer (e.g., asked about product features, they talk about the weather)
-- They completely ignore the question
-
-A response is RELEVANT even if:
-- It's short (e.g., "yes", "no", "good", "bad")
-- It's vague (e.g., "it's okay", "not sure")
-- It's shallow but still answers the question
-
-Examples:
-
-Q: "Tell me about your experience with our mobile app"
-A: "I like it" → RELEVANT (short but on-topic)
-A: "It's good" → RELEVANT (vague but on-topic)
-A: "I went to the store yesterday" → IRRELEVANT (random topic)
-A: "I love pizza" → IRRELEVANT (unrelated)
-
-Q: "What features do you use most?"
-A: "The search feature" → RELEVANT (on-topic)
-A: "Not sure" → RELEVANT (vague but still engaging with question)
-A: "My cat is sleeping" → IRRELEVANT (random topic)
-
-Q: "How often do you use the app?"
-A: "Daily" → RELEVANT (short but perfect answer)
-A: "Sometimes" → RELEVANT (vague but answers question)
-A: "I like dancing" → IRRELEVANT (unrelated)
-
-Now analyze:
-Question: {question}
-Response: {response}
-
-Respond with ONLY ONE WORD: "RELEVANT" or "IRRELEVANT"
-"""
+        prompt = prompt_registry.render(
+            "relevance_check",
+            variant=template_id,
+            topic=topic,
+            question=question,
+            response=response
+        )
         
         try:
-            response = self.groq_client.chat.completions.create(
-                model=config.GROQ_FAST_MODEL,
-                messages=[{"role": "user", "content": prompt}],
+            result = await self.llm.complete(
+                prompt.messages,
+                role="fast",
                 max_tokens=10,
-                temperature=0.1
+                temperature=0.1,
+                cache=True
             )
-            
-            result = response.choices[0].message.content.strip().upper()
+            result = result.upper()
             
             # Return True if IRRELEVANT (needs probe)
             is_irrelevant = "IRRELEVANT" in result
             
-            if is_irrelevant:
-                print(f"   🚨 IRRELEVANT RESPONSE DETECTED")
-            else:
-                print(f"   ✅ Response is RELEVANT (no probe needed)")
+            logger.debug("%s", "🚨 IRRELEVANT RESPONSE DETECTED" if is_irrelevant else "✅ Response is RELEVANT (no probe needed)")
             
             return is_irrelevant
         
         except Exception as e:
-            print(f"⚠️ Relevance check error: {e}")
+            logger.warning("⚠️ Relevance check error: %s", e)
             # Default to RELEVANT (don't probe on error)
             return False
 
@@ -3,23 +3,126 @@ Summary Agent - Generates final interview summaries
 """
 
 from models.schemas import InterviewState, AnalyzedResponse, InterviewSummary
-from typing import List
-from groq import Groq
+from typing import Dict, List, Optional, Tuple
+from llm.prompts import prompt_registry
+from llm.router import llm_router
+from utils.sentiment import get_sentiment_engine, score_to_unit
+from utils.context_window import context_window, fit_lines, STOPWORDS
+from utils.insight_index import add_insights
+from utils.phrase_matcher import tokenize
+import asyncio
 import config
 import json
+from utils.logger import get_logger
+
+logger = get_logger("agents.summary")
+
+THEME_CANDIDATES_KEPT = 100
+THEME_CANDIDATES_SHOWN = 15
+
+
+def _is_content_word(word: str) -> bool:
+    return word.isdigit() or (len(word) > 2 and word.isalpha() and word not in STOPWORDS)
+
+
+def _theme_terms(text: str) -> List[str]:
+    """Content words plus pairs of content words that are adjacent in the text."""
+    words = tokenize(text)
+    terms = []
+    for index, word in enumerate(words):
+        if not _is_content_word(word) or word.isdigit():
+            continue
+        terms.append(word)
+        if index + 1 < len(words) and _is_content_word(words[index + 1]) and not words[index + 1].isdigit():
+            terms.append(f"{word} {words[index + 1]}")
+    return terms
+
 
 class SummaryAgent:
     """Generates comprehensive interview summaries"""
     
     def __init__(self):
-        self.groq_client = Groq(api_key=config.GROQ_API_KEY)
+        self.llm = llm_router
+    
+    # ====================================================================
+    # Incremental aggregates (updated as each analyzed response lands)
+    # ====================================================================
+    
+    def empty_progress(self) -> Dict:
+        return {"responses": 0, "sentiment_total": 0.0, "sentiments": {}, "themes": {}}
+    
+    def record_response(
+        self,
+        progress: Optional[Dict],
+        analyzed: AnalyzedResponse,
+        new_insights: List[str],
+        follow_up_topic: str = ""
+    ) -> Dict:
+        """
+        Fold one committed response into the running summary aggregates:
+        sentiment total and distribution, and theme candidates (content words
+        and word pairs) from `new_insights`, the response's insights that
+        weren't already in the session's insight list. The aggregates stay
+        fixed-size; the insights themselves live in `session_insights`.
+        Returns a new dict.
+        """
+        progress = dict(progress or self.empty_progress())
+        # Progress saved before the insights moved to session_insights
+        progress.pop("insights", None)
+        themes = dict(progress["themes"])
+        
+        progress["responses"] += 1
+        progress["sentiment_total"] += score_to_unit(analyzed.sentiment_score)
+        sentiments = dict(progress.get("sentiments", {}))  # absent in progress saved before it was tracked
+        sentiments[analyzed.sentiment.value] = sentiments.get(analyzed.sentiment.value, 0) + 1
+        progress["sentiments"] = sentiments
+        
+        for insight in new_insights:
+            for term in _theme_terms(insight):
+                themes[term] = themes.get(term, 0) + 1
+        
+        if follow_up_topic:
+            topic = " ".join(follow_up_topic.lower().split())
+            themes[topic] = themes.get(topic, 0) + 2
+        
+        if len(themes) > THEME_CANDIDATES_KEPT:
+            themes = dict(sorted(themes.items(), key=lambda item: -item[1])[:THEME_CANDIDATES_KEPT])
+        
+        progress["themes"] = themes
+        return progress
+    
+    def progress_from_responses(self, analyzed_responses: List[AnalyzedResponse]) -> Tuple[Dict, List[str]]:
+        """Aggregates and deduplicated insights for sessions that started before incremental progress existed."""
+        scores = get_sentiment_engine().score_batch(
+            [response.user_response for response in analyzed_responses]
+        )
+        progress = self.empty_progress()
+        index = None
+        for response, score in zip(analyzed_responses, scores):
+            index, added = add_insights(index, response.key_insights)
+            progress = self.record_response(progress, response.model_copy(update={"sentiment_score": score}), added)
+        return progress, index["insights"] if index else []
+    
+    def theme_candidates(self, progress: Dict) -> List[str]:
+        """Most frequent candidates; multi-word ones win ties."""
+        ranked = sorted(
+            progress["themes"].items(),
+            key=lambda item: (-item[1], -len(item[0].split()), item[0])
+        )
+        return [theme for theme, _ in ranked[:THEME_CANDIDATES_SHOWN]]
+    
+    # ====================================================================
+    # Finalization
+    # ====================================================================
     
     async def generate_summary(
         self,
         state: InterviewState,
-        analyzed_responses: List[AnalyzedResponse],
+        analyzed_responses: Optional[List[AnalyzedResponse]] = None,
         early_termination: bool = False,
-        termination_reason: str = None
+        termination_reason: str = None,
+        progress: Optional[Dict] = None,
+        insights: Optional[List[str]] = None
     ) -> InterviewSummary:
         """
         Generate final summary including:
@@ -27,44 +130,47 @@ class SummaryAgent:
         2. Key themes identified
         3. Average sentiment
         4. Total insights collected
+        
+        With `progress` (built by record_response during the interview) and
+        the session's deduplicated `insights`, only the two LLM calls are
+        left, and they run concurrently. Without it the aggregates and
+        insights are computed from `analyzed_responses`.
         """
         
-        # Collect all insights
-        all_insights = []
-        sentiment_scores = []
+        if progress is None:
+            progress, insights = self.progress_from_responses(analyzed_responses or [])
         
-        for response in analyzed_responses:
-            all_insights.extend(response.key_insights)
-            
-            # Convert sentiment to numeric score
-            if response.sentiment.value == "positive":
-                sentiment_scores.append(0.8)
-            elif response.sentiment.value == "negative":
-                sentiment_scores.append(0.2)
-            else:
-                sentiment_scores.append(0.5)
-        
-        # Calculate average sentiment
-        avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0.5
-        
-        # Extract user responses for summary
-        user_responses = [
-            msg["content"] 
-            for msg in state.conversation_history 
-            if msg["role"] == "user"
-        ]
-        
-        # Generate summary using Groq
-        summary_text = await self._generate_summary_text(
-            user_responses,
-            all_insights,
-            state.research_topic,
-            early_termination,
-            termination_reason
+        all_insights = insights or []
+        avg_sentiment = (
+            progress["sentiment_total"] / progress["responses"]
+            if progress["responses"] else 0.5
+        )
+        
+        # What the user said, as rolling-summary notes + recent answers,
+        # capped in tokens so the prompt size doesn't grow with the interview
+        user_responses = context_window.user_context(
+            state.conversation_history,
+            state.context_summary,
+            max_tokens=config.SUMMARY_CONTEXT_MAX_TOKENS
         )
         
-        # Extract key themes
-        key_themes = await self._extract_key_themes(all_insights, user_responses)
+        # Summary text and key themes are independent - run both LLM calls at once
+        summary_text, key_themes = await asyncio.gather(
+            self._generate_summary_text(
+                user_responses,
+                all_insights,
+                state.research_topic,
+                early_termination,
+                termination_reason,
+                state.template_id
+            ),
+            self._extract_key_themes(
+                all_insights,
+                user_responses,
+                self.theme_candidates(progress),
+                state.template_id
+            )
+        )
         
         return InterviewSummary(
             session_id=state.session_id,
@@ -76,7 +182,8 @@ class SummaryAgent:
             questions_asked=state.current_question_count,
             total_exchanges=len(state.conversation_history),
             terminated_early=early_termination,
-            termination_reason=termination_reason
+            termination_reason=termination_reason,
+            sentiment_distribution=progress.get("sentiments", {})
         )
     
     async def _generate_summary_text(
@@ -85,54 +192,41 @@ class SummaryAgent:
         insights: List[str],
         research_topic: str,
         early_termination: bool,
-        termination_reason: str
+        termination_reason: str,
+        template_id: Optional[str] = None
     ) -> str:
         """Generate summary text using Groq"""
         
         responses_text = "\n".join(user_responses)
-        insights_text = "\n".join([f"- {insight}" for insight in insights[:20]])  # Top 20
+        insights_text = "\n".join(
+            [f"- {insight}" for insight in fit_lines(insights, config.SUMMARY_INSIGHTS_MAX_TOKENS)]
+        )
         
         if early_termination:
             prefix = f"⚠️ Interview terminated early: {termination_reason}\n\n"
-            prompt = f"""Generate a brief summary (2-3 sentences) of this INCOMPLETE interview.
-
-Research Topic: {research_topic}
-
-User Responses:
-{responses_text}
-
-Key Insights:
-{insights_text}
-
-Note: This interview was terminated early. Focus on what was discussed before termination.
-Summarize the main points covered:"""
         else:
             prefix = ""
-            prompt = f"""Generate a comprehensive summary (3-4 sentences) of this interview.
-
-Research Topic: {research_topic}
-
-User Responses:
-{responses_text}
-
-Key Insights:
-{insights_text}
-
-Summarize the main findings, patterns, and user perspectives:"""
+        prompt = prompt_registry.render(
+            "summary_incomplete" if early_termination else "summary",
+            variant=template_id,
+            research_topic=research_topic,
+            responses=responses_text,
+            insights=insights_text
+        )
         
         try:
-            response = self.groq_client.chat.completions.create(
-                model=config.GROQ_QUALITY_MODEL,
-                messages=[{"role": "user", "content": prompt}],
+            summary = await self.llm.complete(
+                prompt.messages,
+                role="quality",
                 max_tokens=200,
-                temperature=0.0
+                temperature=0.0,
+                cache=True,
+                priority="background"
             )
-            
-            summary = response.choices[0].message.content.strip()
             return prefix + summary
         
         except Exception as e:
-            print(f"⚠️ Summary generation error: {e}")
+            logger.warning("⚠️ Summary generation error: %s", e)
             if early_termination:
                 return f"{prefix}Interview was terminated before completion. Limited insights were gathered about {research_topic}."
             return f"Interview completed successfully. User shared their perspectives on {research_topic}."
@@ -140,45 +234,48 @@ Summarize the main findings, patterns, and user perspectives:"""
     async def _extract_key_themes(
         self,
         insights: List[str],
-        user_responses: List[str]
+        user_responses: List[str],
+        candidates: Optional[List[str]] = None,
+        template_id: Optional[str] = None
     ) -> List[str]:
         """Extract key themes using Groq"""
         
         if not insights and not user_responses:
             return ["general feedback", "user experience"]
         
-        combined_text = "\n".join(insights) + "\n" + "\n".join(user_responses)
+        # Insights and answers sampled across the whole interview, token-capped
+        combined_text = "\n".join(
+            fit_lines(insights, config.SUMMARY_INSIGHTS_MAX_TOKENS)
+            + fit_lines(user_responses, config.SUMMARY_CONTEXT_MAX_TOKENS)
+        )
+        candidates_text = ", ".join(candidates) if candidates else "(none)"
         
-        prompt = f"""Extract 3-5 key themes from this interview data.
-
-Interview Data:
-{combined_text[:2000]}  
-
-Return ONLY a JSON array of theme strings:
-["theme1", "theme2", "theme3"]
-
-Themes should be:
-- Concise (2-4 words)
-- Specific to what was discussed
-- Actionable for researchers"""
+        prompt = prompt_registry.render(
+            "key_themes",
+            variant=template_id,
+            data=combined_text,
+            candidates=candidates_text
+        )
         
         try:
-            response = self.groq_client.chat.completions.create(
-                model=config.GROQ_QUALITY_MODEL,
-                messages=[{"role": "user", "content": prompt}],
+            themes_text = await self.llm.complete(
+                prompt.messages,
+                role="quality",
                 max_tokens=100,
-                temperature=0.0
+                temperature=0.0,
+                cache=True,
+                priority="background"
             )
             
-            themes_text = response.choices[0].message.content.strip()
-            
             # Parse JSON
             themes = json.loads(themes_text)
             return themes[:5]  # Max 5 themes
         
         except Exception as e:
-            print(f"⚠️ Theme extraction error: {e}")
-            # Fallback: Extract from insights
+            logger.warning("⚠️ Theme extraction error: %s", e)
+            # Fallback: recurring topics, then insights
+            if candidates:
+                return [theme for theme in candidates if " " in theme][:5] or candidates[:5]
             if insights:
                 return [insight.split(":")[0] for insight in insights[:5]]
             return ["user preferences", "experience feedback", "usage patterns"]
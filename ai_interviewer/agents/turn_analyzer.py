@@ -0,0 +1,96 @@
+"""
+Turn Analyzer Agent - Fused single-call turn analysis
+Returns relevance, deep analysis and the next question (or redirect probe)
+in one structured-JSON completion instead of three separate LLM calls.
+"""
+
+from models.schemas import InterviewState, FusedTurnAnalysis
+from typing import List, Optional
+from pydantic import ValidationError
+from llm.prompts import prompt_registry
+from llm.router import llm_router
+import config
+import json
+from utils.logger import get_logger
+
+logger = get_logger("agents.turn_analyzer")
+
+class TurnAnalyzerAgent:
+    """Analyzes a turn and drafts the follow-up in a single LLM round trip"""
+
+    def __init__(self):
+        self.llm = llm_router
+
+    async def analyze_turn(
+        self,
+        state: InterviewState,
+        question_asked: str,
+        user_response: str,
+        conversation_context: str,
+        collected_insights: List[str]
+    ) -> Optional[FusedTurnAnalysis]:
+        """
+        Run the fused analysis.
+
+        Returns None if the call fails or the output does not match the
+        FusedTurnAnalysis schema - callers fall back to the multi-call path.
+        """
+
+        asked_questions = [
+            msg["content"] for msg in state.conversation_history
+            if msg["role"] == "assistant"
+        ][-3:]
+        recent_insights = collected_insights[-config.INSIGHT_CONTEXT_SIZE:] if collected_insights else []
+
+        prompt = prompt_registry.render(
+            "turn_analysis",
+            variant=state.template_id,
+            research_topic=state.research_topic,
+            question_number=state.current_question_count,
+            max_questions=state.max_questions,
+            context=conversation_context,
+            question=question_asked,
+            response=user_response,
+            asked_questions="\n".join([f"- {q}" for q in asked_questions]),
+            insights="\n".join([f"- {insight}" for insight in recent_insights])
+        )
+
+        try:
+            result_text = await self.llm.complete(
+                prompt.messages,
+                role="quality",
+                max_tokens=350,
+                temperature=0.3
+            )
+
+            result = FusedTurnAnalysis.model_validate(self._parse_json_object(result_text))
+
+            next_question = result.next_question.strip()
+            if next_question.startswith('"') and next_question.endswith('"'):
+                next_question = next_question[1:-1]
+            if not next_question:
+                raise ValueError("empty next_question")
+            result.next_question = next_question
+
+            if not result.is_relevant:
+                result.key_insights = []
+
+            return result
+
+        except (ValueError, ValidationError) as e:
+            logger.warning("⚠️ Fused turn analysis returned invalid output: %s", e)
+            return None
+        except Exception as e:
+            logger.warning("⚠️ Fused turn analysis error: %s", e)
+            return None
+
+    def _parse_json_object(self, text: str) -> dict:
+        """Parse the JSON object out of the completion, tolerating code fences."""
+        start = text.find("{")
+        end = text.rfind("}")
+        if start == -1 or end <= start:
+            raise ValueError("no JSON object in response")
+        return json.loads(text[start:end + 1])
+
+# Singleton instance
+turn_analyzer_agent = TurnAnalyzerAgent()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+State codec microbenchmark.
+
+Encodes/decodes a full interview graph state (history included) at several
+interview lengths with the previous path (`json.dumps(state, default=str)` /
+`json.loads`) and each available StateCodec, reporting per-call time,
+payload size and whether models/enums/datetimes survive the round trip.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_codec
+    python -m benchmarks.bench_codec --turns 15 200 --iterations 500
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.bench_session_store import simulate_turn
+from graph.workflow import create_initial_state
+from models.schemas import AnalyzedResponse
+from storage.codec import CODECS
+
+COMPRESS_THRESHOLD = 1024
+
+
+class LegacyJson:
+    """What main.py did before the codec: lossy default=str"""
+
+    name = "json (default=str)"
+
+    def dumps(self, value):
+        return json.dumps(value, default=str)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+def build_state(turns: int) -> dict:
+    state = create_initial_state("bench", "template-1", "How often do you drink coffee?", max_questions=turns)
+    for turn in range(1, turns + 1):
+        simulate_turn(state, turn)
+    return state
+
+
+def time_per_call(func, arg, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def candidates():
+    yield LegacyJson()
+    for name, codec_class in CODECS.items():
+        try:
+            yield codec_class()
+            yield codec_class(compress_threshold=COMPRESS_THRESHOLD)
+        except ImportError:
+            print(f"  ({name} not installed - skipped)")
+
+
+def label(codec) -> str:
+    if getattr(codec, "compress_threshold", 0):
+        return f"{codec.name}+zstd"
+    return codec.name
+
+
+def main(turn_counts, iterations: int):
+    codecs = list(candidates())
+    for turns in turn_counts:
+        state = build_state(turns)
+        print(f"\n📊 {turns}-turn state ({iterations} iterations)")
+        print(f"  {'codec':<20} {'encode µs':>10} {'decode µs':>10} {'bytes':>9}  typed")
+        for codec in codecs:
+            payload = codec.dumps(state)
+            encode_us = time_per_call(codec.dumps, state, iterations)
+            decode_us = time_per_call(codec.loads, payload, iterations)
+            typed = isinstance(codec.loads(payload)["analyzed_response"], AnalyzedResponse)
+            print(
+                f"  {label(codec):<20} {encode_us:>10.1f} {decode_us:>10.1f} "
+                f"{len(payload):>9,}  {'yes' if typed else 'no'}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, nargs="+", default=[15, 50, 200])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.turns, args.iterations)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark: duplicate /agent/chat submits for the same session.
+
+Runs the FastAPI app in-process (httpx ASGI transport, fakeredis) against
+the fake provider. Every turn of every session is sent --duplicates times at
+once with the same message and idempotency key, like a double-submit from
+the respondent UI plus client retries. Two runs:
+
+- unguarded: the single-flight layer bypassed, as before
+  (each duplicate runs the workflow; optimistic locking re-runs the losers)
+- single-flight: per-session lock + idempotency keys (storage/single_flight.py)
+
+Reports provider calls per turn, latency of the duplicate requests, errors,
+and sessions whose stored history no longer matches the turns sent (a user
+message recorded twice, or a turn lost).
+
+A second part runs two SingleFlight instances on one Redis, as two service
+replicas would, and counts how often the work ran per idempotency key.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_contention
+    python -m benchmarks.bench_contention --sessions 20 --turns 4 --duplicates 5
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Dict, List
+
+from benchmarks.bench_workflow import percentile
+from benchmarks.fake_llm_server import FakeLLMServer
+
+ANSWERS = [
+    "Every morning I make two cups of oat latte before work",
+    "Mostly whatever is closest to the office, price matters more than taste",
+    "I switched to decaf after 3pm because I wasn't sleeping well",
+    "On weekends I go to a small roastery with friends",
+]
+
+
+async def run_sessions(client, main, server: FakeLLMServer, args, label: str) -> Dict:
+    latencies: List[float] = []
+    errors = 0
+    requests_before = server.request_count
+
+    async def session(index: int) -> bool:
+        nonlocal errors
+        session_id = f"contention-{label}-{index}"
+        await client.post("/agent/start", json={
+            "session_id": session_id, "template_id": "bench", "starter_questions": ["coffee habits"]
+        })
+        for turn in range(args.turns):
+            body = {
+                "session_id": session_id,
+                "message": ANSWERS[turn % len(ANSWERS)],
+                "idempotency_key": f"{session_id}-turn-{turn}"
+            }
+
+            async def submit():
+                started = time.perf_counter()
+                response = await client.post("/agent/chat", json=body)
+                latencies.append((time.perf_counter() - started) * 1000)
+                return response.status_code
+
+            statuses = await asyncio.gather(*(submit() for _ in range(args.duplicates)))
+            errors += sum(1 for status in statuses if status >= 400)
+
+        state = await main.session_store.load(session_id)
+        user_messages = [message for message in state["conversation_history"] if message["role"] == "user"]
+        return len(user_messages) == args.turns
+
+    consistent = await asyncio.gather(*(session(index) for index in range(args.sessions)))
+    return {
+        "provider_calls_per_turn": (server.request_count - requests_before) / (args.sessions * args.turns),
+        "latencies": latencies,
+        "errors": errors,
+        "corrupted": consistent.count(False)
+    }
+
+
+async def run_app(server: FakeLLMServer, args) -> Dict[str, Dict]:
+    # Imported here so MAX_QUESTIONS / LOG_LEVEL from the command line are seen by config
+    import fakeredis
+    import httpx
+
+    import main
+    from llm.client import llm_client
+
+    llm_client.base_url = server.base_url
+    await llm_client.aclose()
+    main.session_store.redis = main.chat_flight.redis = fakeredis.FakeAsyncRedis()
+    guarded_run = main.chat_flight.run
+
+    async def unguarded_run(session_id, key, compute):
+        return await compute(), False
+
+    results = {}
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.lifespan(main.app), httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        main.chat_flight.run = unguarded_run
+        results["unguarded"] = await run_sessions(client, main, server, args, "unguarded")
+        main.chat_flight.run = guarded_run
+        results["single-flight"] = await run_sessions(client, main, server, args, "single-flight")
+    return results
+
+
+async def run_replicas(args) -> Dict[str, float]:
+    """Duplicates split across two SingleFlight instances sharing one Redis."""
+    import fakeredis
+
+    from storage.single_flight import SingleFlight
+
+    redis = fakeredis.FakeAsyncRedis()
+    replicas = [SingleFlight(redis_client=redis, backend="redis") for _ in range(2)]
+    runs: Dict[str, int] = {}
+
+    async def request(replica: SingleFlight, session_id: str, key: str):
+        async def compute():
+            runs[key] = runs.get(key, 0) + 1
+            await asyncio.sleep(args.work_ms / 1000)
+            return {"key": key}
+        result, _ = await replica.run(session_id, key, compute)
+        assert result == {"key": key}
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        request(replicas[duplicate % 2], f"replica-{index}", f"replica-{index}-{turn}")
+        for index in range(args.sessions)
+        for turn in range(args.turns)
+        for duplicate in range(args.duplicates)
+    ))
+    keys = args.sessions * args.turns
+    return {
+        "keys": keys,
+        "runs": sum(runs.values()),
+        "max_runs": max(runs.values()),
+        "elapsed_ms": (time.perf_counter() - started) * 1000,
+        "deduplicated": sum(replica.counters["deduplicated"] for replica in replicas)
+    }
+
+
+def print_run(label: str, result: Dict):
+    latencies = result["latencies"]
+    print(
+        f"  {label:<18} provider calls/turn {result['provider_calls_per_turn']:5.2f}"
+        f" | p50 {percentile(latencies, 50):7.1f} ms | p95 {percentile(latencies, 95):7.1f} ms"
+        f" | errors {result['errors']:3d} | corrupted sessions {result['corrupted']:3d}"
+    )
+
+
+def main(args):
+    os.environ["MAX_QUESTIONS"] = str(args.turns + 5)
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    with FakeLLMServer(latency_ms=args.latency_ms, token_ms=0) as server:
+        results = asyncio.run(run_app(server, args))
+
+    print(
+        f"\n📊 {args.sessions} sessions x {args.turns} turns, each sent {args.duplicates}x at once"
+        f" | provider latency {args.latency_ms:.0f} ms"
+    )
+    print_run("⚠️  unguarded", results["unguarded"])
+    print_run("✅ single-flight", results["single-flight"])
+
+    replicas = asyncio.run(run_replicas(args))
+    print(
+        f"\n📊 Two replicas, one Redis: {replicas['keys']} idempotency keys, {args.duplicates} requests each"
+        f"\n  work ran {replicas['runs']} times (max {replicas['max_runs']} per key),"
+        f" {replicas['deduplicated']} requests answered from the first one, {replicas['elapsed_ms']:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--duplicates", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--work-ms", type=float, default=50.0, help="Duration of one unit of work in the replica run")
+    main(parser.parse_args())
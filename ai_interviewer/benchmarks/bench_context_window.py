@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Prompt size vs interview length.
+
+Builds synthetic interviews of increasing length and measures, in estimated
+tokens, the per-turn analysis context and the final summary prompt input -
+before (every user response joined; themes cut at 2000 characters) and with
+the ContextWindow (recent messages + rolling summary, token-capped).
+Then the summary input for an interview whose last answer alone is larger
+than the summary budget (it must be cut, not hang or overflow the cap).
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_context_window
+    python -m benchmarks.bench_context_window --turns 15 50 100 200 --long-answer-words 3000
+"""
+
+import argparse
+import random
+import time
+
+import config
+from utils.context_window import context_window, estimate_tokens
+
+TOPICS = [
+    "morning latte", "oat milk", "cold brew", "the rewards app", "delivery fees",
+    "the barista", "weekend visits", "price increases", "the commute", "subscription",
+]
+
+
+def build_history(turns: int, seed: int = 7):
+    rng = random.Random(seed)
+    history = []
+    for turn in range(turns):
+        topic = rng.choice(TOPICS)
+        history.append({"role": "assistant", "content": f"I'm curious - how does {topic} fit into your week?"})
+        detail = " ".join(rng.choice(TOPICS) for _ in range(rng.randint(2, 8)))
+        history.append({
+            "role": "user",
+            "content": f"Turn {turn}: honestly {topic} matters a lot to me, mostly because of {detail}. "
+                       f"I usually notice it on weekdays before work."
+        })
+    return history
+
+
+def long_answer_case(words: int):
+    history = build_history(10)
+    history.append({"role": "assistant", "content": "Anything else you'd like to add?"})
+    history.append({"role": "user", "content": " ".join(["everything about the coffee"] * (words // 4))})
+    summary = context_window.fold(None, history)
+
+    started = time.perf_counter()
+    lines = context_window.user_context(history, summary, max_tokens=config.SUMMARY_CONTEXT_MAX_TOKENS)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    tokens = sum(estimate_tokens(line) + 1 for line in lines)
+    answer_tokens = estimate_tokens(history[-1]["content"])
+    if tokens > config.SUMMARY_CONTEXT_MAX_TOKENS:
+        raise SystemExit(f"❌ Summary input {tokens} tokens exceeds the {config.SUMMARY_CONTEXT_MAX_TOKENS} cap")
+    print(
+        f"\n✂️  Last answer of {answer_tokens} tokens (cap {config.SUMMARY_CONTEXT_MAX_TOKENS}):"
+        f" summary input {tokens} tokens in {len(lines)} line(s), {elapsed_ms:.2f} ms"
+    )
+
+
+def main(turn_counts, long_answer_words):
+    print(f"\n📏 Estimated prompt tokens (recent messages: {config.CONTEXT_RECENT_MESSAGES}, "
+          f"context cap: {config.CONTEXT_MAX_TOKENS}, summary cap: {config.SUMMARY_CONTEXT_MAX_TOKENS})")
+    print(f"  {'turns':>5}  {'turn context':>12}  {'summary before':>14}  {'summary now':>11}  {'fold µs/turn':>12}")
+
+    for turns in turn_counts:
+        history = build_history(turns)
+
+        # Fold turn by turn, as analyze_response_node does
+        summary = None
+        growing = []
+        elapsed = 0.0
+        for index in range(0, len(history), 2):
+            growing.extend(history[index:index + 2])
+            started = time.perf_counter()
+            summary = context_window.fold(summary, growing)
+            elapsed += time.perf_counter() - started
+        fold_us = elapsed / turns * 1_000_000
+
+        turn_context = estimate_tokens(context_window.render(history, summary))
+        before = estimate_tokens("\n".join(m["content"] for m in history if m["role"] == "user"))
+        now = estimate_tokens("\n".join(
+            context_window.user_context(history, summary, max_tokens=config.SUMMARY_CONTEXT_MAX_TOKENS)
+        ))
+        print(f"  {turns:>5}  {turn_context:>12}  {before:>14}  {now:>11}  {fold_us:>12.1f}")
+
+    long_answer_case(long_answer_words)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, nargs="+", default=[15, 50, 100, 200])
+    parser.add_argument("--long-answer-words", type=int, default=1500, help="Length of the oversized last answer")
+    args = parser.parse_args()
+    main(args.turns, args.long_answer_words)
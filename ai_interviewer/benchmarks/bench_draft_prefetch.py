@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Draft prefetch benchmark: latency after submit with and without drafts.
+
+Runs the FastAPI app in-process (httpx ASGI transport, fakeredis) against
+the fake provider. Respondents answer from the scripted answers
+(benchmarks/fixtures/respondent_scripts.jsonl), typing at --typing-ms per
+word. With drafts on, the UI posts /agent/chat/draft at typing pauses
+(--draft-at, fractions of the answer typed); --rewrite-rate of the answers
+are deleted and rewritten before sending, so their drafts don't match.
+
+Two runs with the same typing pace:
+- no drafts: every turn's LLM work starts when the message is sent
+- drafts: graph/draft_prefetch.py speculates on the drafts
+
+Reports /agent/chat latency (what the respondent waits after pressing send),
+hit rate, latency saved per turn, and provider calls per turn (the spend on
+discarded speculations).
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_draft_prefetch
+    python -m benchmarks.bench_draft_prefetch --latency-ms 300 --typing-ms 120 --rewrite-rate 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from typing import Dict, List
+
+from benchmarks.bench_workflow import percentile
+from benchmarks.fake_llm_server import FakeLLMServer
+
+SCRIPTS = os.path.join(os.path.dirname(__file__), "fixtures", "respondent_scripts.jsonl")
+
+
+def load_answers() -> List[str]:
+    from simulation.batch import load_scripts
+
+    return [answer for script in load_scripts(SCRIPTS) for answer in script["answers"] if len(answer.split()) >= 6]
+
+
+async def run_sessions(client, server: FakeLLMServer, args, label: str, drafts: bool) -> Dict:
+    answers = load_answers()
+    rng = random.Random(args.seed)
+    # Same answers and rewrites in both runs
+    plan = [
+        [(rng.choice(answers), rng.choice(answers) if rng.random() < args.rewrite_rate else None) for _ in range(args.turns)]
+        for _ in range(args.sessions)
+    ]
+    latencies: List[float] = []
+    errors = 0
+    requests_before = server.request_count
+
+    async def type_words(count: int):
+        await asyncio.sleep(count * args.typing_ms / 1000)
+
+    async def session(index: int):
+        nonlocal errors
+        session_id = f"draft-{label}-{index}"
+        await client.post("/agent/start", json={
+            "session_id": session_id, "template_id": "bench", "starter_questions": ["How do you drink coffee?"]
+        })
+        for answer, abandoned in plan[index]:
+            words = answer.split()
+            typed = 0
+            if abandoned:
+                # Drafts of an answer the respondent deletes, then the real one typed from scratch
+                for fraction in args.draft_at:
+                    draft_words = abandoned.split()
+                    upto = int(len(draft_words) * fraction)
+                    await type_words(upto - typed)
+                    typed = upto
+                    if drafts:
+                        await client.post("/agent/chat/draft", json={"session_id": session_id, "draft": " ".join(draft_words[:upto])})
+                typed = 0
+            else:
+                for fraction in args.draft_at:
+                    upto = int(len(words) * fraction)
+                    await type_words(upto - typed)
+                    typed = upto
+                    if drafts:
+                        await client.post("/agent/chat/draft", json={"session_id": session_id, "draft": " ".join(words[:upto])})
+            await type_words(len(words) - typed)
+
+            started = time.perf_counter()
+            response = await client.post("/agent/chat", json={"session_id": session_id, "message": answer})
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+            elif response.json()["is_complete"]:
+                break
+
+    await asyncio.gather(*(session(index) for index in range(args.sessions)))
+    return {
+        "provider_calls_per_turn": (server.request_count - requests_before) / len(latencies),
+        "latencies": latencies,
+        "errors": errors
+    }
+
+
+async def run_app(server: FakeLLMServer, args) -> Dict[str, Dict]:
+    # Imported here so MAX_QUESTIONS / LOG_LEVEL from the command line are seen by config
+    import fakeredis
+    import httpx
+
+    import main
+    from llm.client import llm_client
+
+    llm_client.base_url = server.base_url
+    await llm_client.aclose()
+    main.session_store.redis = main.chat_flight.redis = fakeredis.FakeAsyncRedis()
+    # Off by default (DRAFT_PREFETCH); the "no drafts" run posts none, so it is unaffected
+    main.draft_prefetch.enabled = True
+
+    results = {}
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.lifespan(main.app), httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        results["no drafts"] = await run_sessions(client, server, args, "off", drafts=False)
+        results["drafts"] = await run_sessions(client, server, args, "on", drafts=True)
+        results["drafts"]["prefetch"] = main.draft_prefetch.stats()
+    return results
+
+
+def print_run(label: str, result: Dict):
+    latencies = result["latencies"]
+    print(
+        f"  {label:<12} {len(latencies):4d} turns | p50 {percentile(latencies, 50):7.1f} ms"
+        f" | p95 {percentile(latencies, 95):7.1f} ms | mean {sum(latencies) / len(latencies):7.1f} ms"
+        f" | provider calls/turn {result['provider_calls_per_turn']:5.2f} | errors {result['errors']}"
+    )
+
+
+def main(args):
+    os.environ["MAX_QUESTIONS"] = str(args.turns + 5)
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    with FakeLLMServer(latency_ms=args.latency_ms, token_ms=0, seed=args.seed) as server:
+        results = asyncio.run(run_app(server, args))
+
+    print(
+        f"\n📊 {args.sessions} sessions x {args.turns} turns | provider latency {args.latency_ms:.0f} ms"
+        f" | typing {args.typing_ms:.0f} ms/word, drafts at {', '.join(f'{f:.0%}' for f in args.draft_at)}"
+        f" | {args.rewrite_rate:.0%} of answers rewritten"
+    )
+    print_run("no drafts", results["no drafts"])
+    print_run("drafts", results["drafts"])
+
+    prefetch = results["drafts"]["prefetch"]
+    turns = len(results["drafts"]["latencies"])
+    mean_off = sum(results["no drafts"]["latencies"]) / len(results["no drafts"]["latencies"])
+    mean_on = sum(results["drafts"]["latencies"]) / turns
+    print(
+        f"\n🔮 {prefetch['speculations']} speculations from {prefetch['drafts']} drafts,"
+        f" {prefetch['cancelled']} cancelled | hits {prefetch['hits']}, misses {prefetch['misses']},"
+        f" stale {prefetch['stale']}, errors {prefetch['errors']} → hit rate {prefetch['hit_rate']:.0%}"
+    )
+    print(
+        f"⚡ Saved {prefetch['saved_seconds_per_hit'] * 1000:.0f} ms per hit,"
+        f" {prefetch['saved_seconds_total'] * 1000 / turns:.0f} ms per turn on average"
+        f" (mean latency {mean_off:.0f} → {mean_on:.0f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--typing-ms", type=float, default=150.0, help="Typing time per word")
+    parser.add_argument("--draft-at", type=float, nargs="+", default=[0.5, 0.8],
+                        help="Fractions of the answer typed when a draft is posted")
+    parser.add_argument("--rewrite-rate", type=float, default=0.2, help="Answers deleted and rewritten after drafting")
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Insight context benchmark: last-5 list vs the session insight index.
+
+Builds a synthetic session: each turn extracts a few insights about one of
+several threads (price, sleep, routine, ...), and insights carried over from
+probing or re-extracted on a later turn come back as duplicates. Then, for
+a question on each thread, compares the insight context handed to the
+question prompt:
+
+- legacy: every turn re-concatenates all analyzed responses'
+  key_insights (db_client.get_all_insights_for_session) and takes the last 5
+- index: utils/insight_index.py, deduplicated on insert, top-5 by TF-IDF
+  similarity to the thread
+
+Reports insights kept, per-turn cost of building the context, and how many of
+the 5 insights are about the thread being asked about.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_insight_index
+    python -m benchmarks.bench_insight_index --turns 60 --repeat-rate 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List, Tuple
+
+from models.schemas import AnalyzedResponse, ResponseQuality, Sentiment
+from storage.db_client import DatabaseClient
+from utils.insight_index import add_insights, top_insights
+
+THREADS: Dict[str, List[str]] = {
+    "price": [
+        "Finds a daily latte at five dollars too expensive",
+        "Compares cafe prices before choosing where to buy coffee",
+        "Would pay more for beans from a local roaster",
+        "Cut back on cafe visits to save money each month",
+        "Considers supermarket coffee good value for the price",
+    ],
+    "sleep": [
+        "Switched to decaf after 3pm to sleep better",
+        "Notices poor sleep when drinking coffee late in the evening",
+        "Avoids espresso at night because of insomnia",
+        "Feels caffeine keeps them awake past midnight",
+        "Limits coffee intake on weekdays to protect sleep schedule",
+    ],
+    "routine": [
+        "Brews two cups with a moka pot every morning before work",
+        "Coffee is the one fixed part of the morning routine",
+        "Grinds beans at home while preparing breakfast",
+        "Drinks the first cup right after waking up",
+        "Keeps the morning coffee ritual even when travelling",
+    ],
+    "social": [
+        "Meets friends at a small roastery on weekends",
+        "Sees coffee breaks at the office as time to chat with colleagues",
+        "Prefers cafes with space to sit and talk with friends",
+        "Invites neighbours over for coffee on Sundays",
+        "Uses coffee dates to catch up with family",
+    ],
+    "taste": [
+        "Likes strong bitter coffee with a splash of oat milk",
+        "Dislikes flavoured syrups in lattes",
+        "Prefers light roast beans for their fruity taste",
+        "Finds instant coffee too watery in taste",
+        "Enjoys trying single origin beans from different countries",
+    ],
+}
+QUESTIONS = {
+    "price": "You mentioned cost earlier - how much does price matter when you buy coffee?",
+    "sleep": "How does coffee affect your sleep at night?",
+    "routine": "Walk me through your morning coffee routine.",
+    "social": "Who do you usually drink coffee with on weekends?",
+    "taste": "What taste do you look for in your coffee beans?",
+}
+
+
+def synthetic_session(turns: int, repeat_rate: float, seed: int) -> List[Tuple[str, List[str]]]:
+    """(thread, key_insights) per turn; some insights repeat earlier ones."""
+    rng = random.Random(seed)
+    seen: List[str] = []
+    session = []
+    for _ in range(turns):
+        thread = rng.choice(list(THREADS))
+        insights = rng.sample(THREADS[thread], 2)
+        if seen and rng.random() < repeat_rate:
+            insights.append(rng.choice(seen))
+        seen.extend(insights)
+        session.append((thread, insights))
+    return session
+
+
+def thread_of(insight: str) -> str:
+    return next(thread for thread, insights in THREADS.items() if insight in insights)
+
+
+def analyzed(insights: List[str]) -> AnalyzedResponse:
+    return AnalyzedResponse(
+        session_id="bench",
+        respondent_id="bench",
+        user_response="",
+        sentiment=Sentiment.NEUTRAL,
+        sentiment_score=0.0,
+        quality=ResponseQuality.GOOD,
+        key_insights=list(insights),
+        word_count=0,
+    )
+
+
+async def legacy_context(db: DatabaseClient) -> List[str]:
+    insights = await db.get_all_insights_for_session("bench")
+    return insights[-5:]
+
+
+async def run(args):
+    session = synthetic_session(args.turns, args.repeat_rate, args.seed)
+
+    db = DatabaseClient()
+    await db.initialize_session("bench", "bench", "coffee")
+    index = None
+    legacy_us: List[float] = []
+    index_add_us: List[float] = []
+    index_query_us: List[float] = []
+
+    for thread, insights in session:
+        await db.save_analyzed_response(analyzed(insights), "bench", "bench")
+        started = time.perf_counter()
+        await legacy_context(db)
+        legacy_us.append((time.perf_counter() - started) * 1_000_000)
+
+        started = time.perf_counter()
+        index, _ = add_insights(index, insights)
+        index_add_us.append((time.perf_counter() - started) * 1_000_000)
+        started = time.perf_counter()
+        top_insights(index, QUESTIONS[thread], 5)
+        index_query_us.append((time.perf_counter() - started) * 1_000_000)
+
+    legacy = await legacy_context(db)
+    total = len(await db.get_all_insights_for_session("bench"))
+    print(f"\n📊 {args.turns} turns, {args.repeat_rate:.0%} of turns repeat an earlier insight")
+    print(f"  insights kept        legacy {total:5d} | index {len(index['insights']):5d} (distinct {len(set(i for _, ins in session for i in ins))})")
+    print(
+        f"  context per turn     legacy {sum(legacy_us) / len(legacy_us):7.1f} µs (last turn {legacy_us[-1]:.1f})"
+        f" | index add {sum(index_add_us) / len(index_add_us):6.1f} µs + top-5 {sum(index_query_us) / len(index_query_us):6.1f} µs"
+        f" (last turn {index_query_us[-1]:.1f})"
+    )
+
+    print("\n  on-thread insights in the 5 shown, asking about each thread at the end:")
+    hits = {"legacy": 0, "index": 0}
+    for thread, question in QUESTIONS.items():
+        shown = top_insights(index, question, 5)
+        legacy_hits = sum(1 for insight in legacy if thread_of(insight) == thread)
+        index_hits = sum(1 for insight in shown if thread_of(insight) == thread)
+        hits["legacy"] += legacy_hits
+        hits["index"] += index_hits
+        print(f"    {thread:<8} legacy {legacy_hits}/5 | index {index_hits}/5")
+    asked = 5 * len(QUESTIONS)
+    print(f"\n✅ On-thread context: legacy {hits['legacy']}/{asked} → index {hits['index']}/{asked}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--repeat-rate", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
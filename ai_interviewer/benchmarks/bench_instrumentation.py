@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Logging and tracing overhead on the request path.
+
+Times the per-turn cost of the old emoji print() lines against the leveled
+logger (disabled at the default WARNING level, and enabled with the
+background writer thread), and the per-call cost of the traced_node()
+wrapper around a no-op graph node.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_instrumentation
+    python -m benchmarks.bench_instrumentation --iterations 200000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+from utils.logger import configure_logging, get_logger
+from utils.tracing import traced_node
+
+logger = get_logger("benchmarks.instrumentation")
+
+USER_RESPONSE = "Every morning, two cups of oat latte from the place near the office " * 3
+
+
+def per_call_us(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def print_line():
+    print(f"🔍 Analyzing response: {USER_RESPONSE[:80]}...")
+
+
+def log_line():
+    logger.debug("🔍 Analyzing response: %.80s", USER_RESPONSE, extra={"session_id": "s1"})
+
+
+async def noop_node(state):
+    return {}
+
+
+async def time_node(node, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await node({})
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main(iterations: int):
+    print(f"\n📊 Per-call cost over {iterations} calls")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        print_us = per_call_us(print_line, iterations)
+    print(f"  print() f-string           {print_us:7.3f} µs")
+
+    configure_logging(level="WARNING")
+    print(f"  logger.debug (disabled)    {per_call_us(log_line, iterations):7.3f} µs")
+
+    # Enabled: records are queued here and written by the listener thread
+    with contextlib.redirect_stdout(io.StringIO()):
+        configure_logging(level="DEBUG", use_thread=True)
+        enabled_us = per_call_us(log_line, iterations)
+        configure_logging()
+    print(f"  logger.debug (enabled)     {enabled_us:7.3f} µs")
+
+    bare = asyncio.run(time_node(noop_node, iterations))
+    traced = asyncio.run(time_node(traced_node("noop", noop_node), iterations))
+    print(f"\n⏱️  no-op node {bare:.3f} µs | traced {traced:.3f} µs | overhead {traced - bare:.3f} µs per node")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.iterations)
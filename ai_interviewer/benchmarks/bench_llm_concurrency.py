@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the shared async LLM client.
+
+Starts the local fake provider, then drives N concurrent interview sessions
+through the same agent calls one /agent/chat turn makes (relevance check,
+deep analysis, next question). Reports turns/sec and LLM requests/sec at
+each concurrency level.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_llm_concurrency --latency-ms 200 --turns 3
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.fake_llm_server import FakeLLMServer
+from llm.client import llm_client
+from agents.analyzer import analyzer
+from agents.interviewer import interviewer_agent
+from agents.probe_decision import probe_decision_agent
+from models.schemas import InterviewState
+
+QUESTION = "How often do you drink coffee?"
+ANSWER = "Every morning before work, usually two cups"
+
+
+async def run_session(session_index: int, turns: int):
+    """One synthetic respondent answering `turns` questions."""
+    state = InterviewState(
+        session_id=f"bench-{session_index}",
+        respondent_id=f"bench-{session_index}",
+        template_id="bench",
+        research_topic="Coffee consumption habits",
+        conversation_history=[{"role": "assistant", "content": QUESTION}],
+        current_question_count=1
+    )
+
+    for _ in range(turns):
+        await probe_decision_agent.should_probe(QUESTION, ANSWER, state.research_topic, "shallow")
+        deep = await analyzer.deep_analyze(ANSWER, f"assistant: {QUESTION}\nuser: {ANSWER}")
+        await interviewer_agent.generate_next_question(state, deep.key_insights)
+
+
+async def run_level(concurrency: int, turns: int) -> dict:
+    started = time.perf_counter()
+    await asyncio.gather(*(run_session(i, turns) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    total_turns = concurrency * turns
+    return {
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "turns_per_s": total_turns / elapsed,
+        "llm_requests_per_s": total_turns * 3 / elapsed
+    }
+
+
+async def main(levels, turns: int, server: FakeLLMServer):
+    llm_client.base_url = server.base_url
+    await llm_client.aclose()
+
+    # Warm the connection pool so the first level isn't penalised
+    await run_session(-1, 1)
+
+    results = []
+    for concurrency in levels:
+        results.append(await run_level(concurrency, turns))
+
+    await llm_client.aclose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    with FakeLLMServer(latency_ms=args.latency_ms) as server:
+        results = asyncio.run(main(args.levels, args.turns, server))
+
+    print(f"\n📊 Async LLM client - fake provider latency {args.latency_ms:.0f}ms, {args.turns} turns/session")
+    print(f"{'sessions':>10} {'elapsed(s)':>12} {'turns/s':>10} {'llm req/s':>11}")
+    for row in results:
+        print(f"{row['concurrency']:>10} {row['elapsed_s']:>12.2f} {row['turns_per_s']:>10.1f} {row['llm_requests_per_s']:>11.1f}")
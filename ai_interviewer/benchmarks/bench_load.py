@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Load test: concurrent synthetic respondents through full interviews.
+
+Runs the FastAPI app in-process (httpx ASGI transport, fakeredis, in-memory
+job queue and database) against the fake provider in a child process.
+Respondents follow scripted answer corpora (`fixtures/respondent_scripts.jsonl`:
+engaged, terse, off-topic, early-exit, ...) through /agent/start, /agent/chat
+until the interview completes, /agent/end, then poll the summary job.
+
+Reports throughput, p50/p95/p99 per endpoint (measured by the client), per
+workflow node and LLM call counts (from the /metrics registry), and memory
+per session. Provider latencies, injected errors and the script assignment
+are seeded, so `--output` files from two commits can be compared with
+`--baseline` (non-zero exit on a regression beyond `--tolerance`).
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_load --respondents 20 --interviews 100
+    python -m benchmarks.bench_load --latency-dist lognormal --error-rate 0.02
+    python -m benchmarks.bench_load --output after.json --baseline before.json --tolerance 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.fake_llm_server import LATENCY_DISTRIBUTIONS, FakeLLMServer
+
+DEFAULT_SCRIPTS = os.path.join(os.path.dirname(__file__), "fixtures", "respondent_scripts.jsonl")
+JOB_POLL_SECONDS = 0.01
+# Latency regressions smaller than this are noise, whatever the ratio
+MIN_REGRESSION_MS = 1.0
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=os.path.dirname(__file__), timeout=5
+        ).stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def _rss_kb() -> int:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class LoadRecorder:
+    """Client-side latency samples and errors per endpoint"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.outcomes: Dict[str, int] = defaultdict(int)
+
+    async def call(self, endpoint: str, request):
+        started = time.perf_counter()
+        try:
+            response = await request
+        except Exception:
+            self.errors[endpoint] += 1
+            return None
+        self.samples[endpoint].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+            return None
+        return response.json()
+
+
+async def run_interview(client, recorder: LoadRecorder, script: Dict, session_id: str, max_turns: int, think_ms: float):
+    started = await recorder.call("start", client.post("/agent/start", json={
+        "session_id": session_id,
+        "template_id": script["template_id"],
+        "starter_questions": [script["topic"]]
+    }))
+    if started is None:
+        recorder.outcomes["failed_start"] += 1
+        return
+
+    answers = script["answers"]
+    for turn in range(max_turns):
+        if think_ms:
+            await asyncio.sleep(think_ms / 1000)
+        result = await recorder.call("chat", client.post("/agent/chat", json={
+            "session_id": session_id,
+            "message": answers[turn % len(answers)]
+        }))
+        if result is None:
+            break
+        recorder.outcomes["turns"] += 1
+        if result["is_complete"]:
+            recorder.outcomes["terminated_early" if result["terminated_early"] else "completed"] += 1
+            break
+    else:
+        recorder.outcomes["turn_limit"] += 1
+
+    end_started = time.perf_counter()
+    ended = await recorder.call("end", client.post("/agent/end", json={"session_id": session_id}))
+    if ended is None:
+        return
+
+    status = ended["summary_status"]
+    while status == "pending":
+        await asyncio.sleep(JOB_POLL_SECONDS)
+        job = await recorder.call("job_status", client.get(f"/agent/jobs/{ended['summary_job_id']}"))
+        if job is None:
+            break
+        status = {"succeeded": "ready", "failed": "failed"}.get(job["status"], "pending")
+    # End-to-end time from /agent/end until the summary is available
+    recorder.samples["summary_ready"].append((time.perf_counter() - end_started) * 1000)
+    recorder.outcomes[f"summary_{status}"] += 1
+
+
+def latency_stats(samples: List[float], percentile) -> Dict[str, float]:
+    return {
+        "count": len(samples),
+        "mean": round(sum(samples) / len(samples), 2) if samples else 0.0,
+        "p50": round(percentile(samples, 50), 2),
+        "p95": round(percentile(samples, 95), 2),
+        "p99": round(percentile(samples, 99), 2)
+    }
+
+
+async def run_load(args, server: FakeLLMServer) -> Dict:
+    # Imported here so MAX_QUESTIONS / LOG_LEVEL from the command line are seen by config
+    import fakeredis
+    import httpx
+
+    import main
+    from benchmarks.bench_workflow import percentile
+    from llm.client import llm_client
+    from utils.metrics import LLM_ERRORS, LLM_TOKENS_TOTAL, NODE_DURATION, NODE_ERRORS, metrics
+
+    llm_client.base_url = server.base_url
+    await llm_client.aclose()
+    main.session_store.redis = main.chat_flight.redis = fakeredis.FakeAsyncRedis()
+
+    with open(args.scripts) as f:
+        scripts = [json.loads(line) for line in f if line.strip()]
+    rng = random.Random(args.seed)
+    assigned = [rng.choice(scripts) for _ in range(args.interviews)]
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.lifespan(main.app), httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        # Warm-up interview: imports, pools and caches, not measured
+        await run_interview(client, LoadRecorder(), scripts[0], "load-warmup", args.max_turns, 0)
+        metrics.reset()
+        store_saves, store_bytes = main.session_store.saves, main.session_store.bytes_written
+        rss_before = _rss_kb()
+        if args.trace_memory:
+            tracemalloc.start()
+
+        recorder = LoadRecorder()
+        slots = asyncio.Semaphore(args.respondents)
+
+        async def respondent(index: int, script: Dict):
+            async with slots:
+                await run_interview(client, recorder, script, f"load-{index}", args.max_turns, args.think_ms)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(respondent(index, script) for index, script in enumerate(assigned)))
+        wall = time.perf_counter() - started
+
+        heap_peak = None
+        if args.trace_memory:
+            heap_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        rss_growth = _rss_kb() - rss_before
+
+    saves = main.session_store.saves - store_saves
+    state_bytes = main.session_store.bytes_written - store_bytes
+    concurrent = min(args.respondents, args.interviews)
+
+    nodes = {}
+    for (node,) in NODE_DURATION.label_values():
+        count = NODE_DURATION.count(node=node)
+        nodes[node] = {
+            "count": count,
+            "errors": int(NODE_ERRORS.value(node=node)),
+            "mean": round(NODE_DURATION.total(node=node) / count * 1000, 2),
+            # Bucket-interpolated (Prometheus histogram_quantile)
+            "p50": round(NODE_DURATION.quantile(0.50, node=node) * 1000, 2),
+            "p95": round(NODE_DURATION.quantile(0.95, node=node) * 1000, 2),
+            "p99": round(NODE_DURATION.quantile(0.99, node=node) * 1000, 2)
+        }
+
+    tokens = defaultdict(float)
+    for model, kind in LLM_TOKENS_TOTAL._values:
+        tokens[kind] += LLM_TOKENS_TOTAL.value(model=model, kind=kind)
+    provider = server.stats()
+
+    return {
+        "commit": _git_commit(),
+        "config": {
+            key: value for key, value in vars(args).items()
+            if key not in ("output", "baseline", "tolerance", "scripts")
+        },
+        "wall_seconds": round(wall, 3),
+        "outcomes": dict(recorder.outcomes),
+        "throughput": {
+            "interviews_per_s": round(args.interviews / wall, 3),
+            "turns_per_s": round(recorder.outcomes["turns"] / wall, 3)
+        },
+        "endpoints": {
+            endpoint: {**latency_stats(samples, percentile), "errors": recorder.errors[endpoint]}
+            for endpoint, samples in sorted(recorder.samples.items())
+        },
+        "nodes": nodes,
+        "llm": {
+            "provider_requests": provider["request_count"],
+            "provider_injected_errors": provider["error_count"],
+            "client_errors": int(sum(LLM_ERRORS._values.values())),
+            "prompt_tokens": int(tokens["prompt"]),
+            "completion_tokens": int(tokens["completion"])
+        },
+        "memory": {
+            "state_bytes_per_save": round(state_bytes / saves) if saves else 0,
+            "rss_growth_kb_per_concurrent_session": round(rss_growth / concurrent, 1),
+            "heap_peak_kb_per_concurrent_session": round(heap_peak / 1024 / concurrent, 1) if heap_peak is not None else None
+        }
+    }
+
+
+def compare(result: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions of `result` against `baseline`, as printable lines."""
+    regressions = []
+
+    def check_latency(name: str, new: float, old: float):
+        if old and new > old * (1 + tolerance) and new - old > MIN_REGRESSION_MS:
+            regressions.append(f"{name}: {old:.1f}ms → {new:.1f}ms (+{(new / old - 1) * 100:.0f}%)")
+
+    for endpoint, stats in result["endpoints"].items():
+        old = baseline.get("endpoints", {}).get(endpoint)
+        if old:
+            for pct in ("p50", "p95"):
+                check_latency(f"{endpoint} {pct}", stats[pct], old[pct])
+    for node, stats in result["nodes"].items():
+        old = baseline.get("nodes", {}).get(node)
+        if old:
+            check_latency(f"node {node} mean", stats["mean"], old["mean"])
+    for key, new in result["throughput"].items():
+        old = baseline.get("throughput", {}).get(key)
+        if old and new < old * (1 - tolerance):
+            regressions.append(f"{key}: {old:.2f} → {new:.2f} ({(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_report(result: Dict):
+    cfg = result["config"]
+    print(f"\n📊 Load test @ {result['commit']}: {cfg['interviews']} interviews, {cfg['respondents']} concurrent respondents, "
+          f"fake provider {cfg['latency_ms']:.0f}ms {cfg['latency_dist']}, error rate {cfg['error_rate']}")
+    print(f"  wall {result['wall_seconds']:.1f}s | {result['throughput']['interviews_per_s']:.2f} interviews/s | "
+          f"{result['throughput']['turns_per_s']:.2f} turns/s | outcomes {result['outcomes']}")
+
+    print(f"\n  {'endpoint':<16}{'count':>7}{'errors':>8}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for endpoint, stats in result["endpoints"].items():
+        print(f"  {endpoint:<16}{stats['count']:>7}{stats['errors']:>8}"
+              f"{stats['p50']:>8.1f}ms{stats['p95']:>8.1f}ms{stats['p99']:>8.1f}ms")
+
+    print(f"\n  {'node':<22}{'count':>7}{'mean':>10}{'~p95':>10}{'~p99':>10}")
+    for node, stats in result["nodes"].items():
+        print(f"  {node:<22}{stats['count']:>7}{stats['mean']:>8.1f}ms{stats['p95']:>8.1f}ms{stats['p99']:>8.1f}ms")
+
+    llm, memory = result["llm"], result["memory"]
+    print(f"\n  🤖 LLM: {llm['provider_requests']} provider requests, {llm['provider_injected_errors']} injected errors, "
+          f"{llm['prompt_tokens']} prompt / {llm['completion_tokens']} completion tokens")
+    heap = memory["heap_peak_kb_per_concurrent_session"]
+    print(f"  💾 Memory: state {memory['state_bytes_per_save']} B/save | RSS +{memory['rss_growth_kb_per_concurrent_session']} KiB"
+          f" per concurrent session" + (f" | heap peak {heap} KiB per concurrent session" if heap is not None else ""))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--respondents", type=int, default=20, help="concurrent respondents")
+    parser.add_argument("--interviews", type=int, default=100, help="total interviews")
+    parser.add_argument("--max-questions", type=int, default=8)
+    parser.add_argument("--max-turns", type=int, default=20, help="answers per interview before /agent/end")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="respondent pause before each answer")
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-sigma", type=float, default=0.4)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--scripts", default=DEFAULT_SCRIPTS)
+    parser.add_argument("--trace-memory", action="store_true", help="tracemalloc heap peak (slows the run)")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="results JSON from an earlier commit to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression")
+    args = parser.parse_args()
+
+    os.environ["MAX_QUESTIONS"] = str(args.max_questions)
+    # Injected provider errors make the agents log fallbacks; keep the report readable
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+    with FakeLLMServer(
+        latency_ms=args.latency_ms,
+        token_ms=args.token_ms,
+        latency_dist=args.latency_dist,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        error_statuses=(429, 500, 503),
+        seed=args.seed
+    ) as server:
+        result = asyncio.run(run_load(args, server))
+
+    print_report(result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"\n📝 Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != result["config"]:
+            print(f"\n⚠️ Baseline ({baseline.get('commit')}) ran with a different configuration")
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) vs {baseline.get('commit')} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n✅ No regressions vs {baseline.get('commit')} (tolerance {args.tolerance:.0%})")
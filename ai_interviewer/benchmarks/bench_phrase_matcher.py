@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Early-termination phrase matching: accuracy and cost.
+
+Runs the legacy substring scan and the compiled PhraseMatcher over a labeled
+regression corpus (`fixtures/termination_corpus.jsonl`: real exits plus
+sentences where a phrase appears without meaning it), then times exit checks
+and the repeated-dismissive check on a long interview.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_phrase_matcher
+    python -m benchmarks.bench_phrase_matcher --show-errors
+"""
+
+import argparse
+import json
+import os
+import time
+
+from utils.early_termination import EarlyTerminationDetector
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "fixtures", "termination_corpus.jsonl")
+
+
+def legacy_check_exit_intent(detector: EarlyTerminationDetector, text: str):
+    """The substring scan check_exit_intent used before PhraseMatcher."""
+    text_lower = text.lower().strip()
+    for phrase in detector.EXIT_PHRASES:
+        if phrase in text_lower:
+            return True, f"explicit_exit: '{phrase}'"
+    for phrase in detector.NEGATIVE_EMOTION_PHRASES:
+        if phrase in text_lower:
+            return True, f"negative_emotion: '{phrase}'"
+    return False, ""
+
+
+def legacy_is_repeated_dismissive(detector: EarlyTerminationDetector, text: str, history, threshold: int = 3):
+    """The per-call history rescan is_repeated_dismissive used before the cached streak."""
+    def dismissive(value):
+        value_lower = value.lower().strip()
+        return any(d in value_lower for d in detector.DISMISSIVE_RESPONSES) or len(value.split()) <= 2
+
+    if not dismissive(text):
+        return False
+    count = 1
+    responses = [m["content"] for m in reversed(history) if m["role"] == "user"][1:5]
+    for response in responses:
+        if not dismissive(response):
+            break
+        count += 1
+    return count >= threshold
+
+
+def category(result) -> str:
+    should_exit, reason = result
+    return reason.split(":")[0] if should_exit else "none"
+
+
+def time_us(func, texts, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - started) / (iterations * len(texts)) * 1_000_000
+
+
+def main(corpus_path: str, iterations: int, show_errors: bool):
+    with open(corpus_path) as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+
+    detector = EarlyTerminationDetector()
+
+    print(f"\n📊 Exit intent on {len(corpus)} labeled responses ({os.path.basename(corpus_path)})")
+    for name, check in (
+        ("substring scan", lambda row: legacy_check_exit_intent(detector, row["text"])),
+        ("PhraseMatcher", lambda row: detector.check_exit_intent(row["text"], row.get("template_id"))),
+    ):
+        errors = [(row, category(check(row))) for row in corpus if category(check(row)) != row["expected"]]
+        false_positives = sum(1 for row, got in errors if row["expected"] == "none")
+        print(f"  {name:<15} correct {len(corpus) - len(errors)}/{len(corpus)}  false positives {false_positives}")
+        if show_errors:
+            for row, got in errors:
+                print(f"      expected {row['expected']:<16} got {got:<16} {row['text']}")
+
+    texts = [row["text"] for row in corpus]
+    detector.exit_matcher()  # compile outside the timed loop, as in production
+    legacy_us = time_us(lambda text: legacy_check_exit_intent(detector, text), texts, iterations)
+    matcher_us = time_us(detector.check_exit_intent, texts, iterations)
+    print(f"\n⏱️  check_exit_intent per response: substring {legacy_us:.2f} µs | PhraseMatcher {matcher_us:.2f} µs")
+
+    # Cost as phrase sets grow (per-template / per-locale additions)
+    for extra in (100, 500):
+        grown = EarlyTerminationDetector()
+        synthetic = [f"please stop asking about topic {i}" for i in range(extra)]
+        grown.EXIT_PHRASES = grown.EXIT_PHRASES + synthetic
+        grown.exit_matcher()
+        legacy_us = time_us(lambda text: legacy_check_exit_intent(grown, text), texts, iterations)
+        matcher_us = time_us(grown.check_exit_intent, texts, iterations)
+        print(f"   with {extra} extra phrases:          substring {legacy_us:.2f} µs | PhraseMatcher {matcher_us:.2f} µs")
+
+    # Repeated-dismissive check on the last turn of a 200-turn interview
+    history = []
+    for turn in range(200):
+        history.append({"role": "assistant", "content": "What else do you usually have with it?"})
+        history.append({"role": "user", "content": "ok sure" if turn % 2 else "Usually a croissant from the bakery"})
+    last = history[-1]["content"]
+
+    started = time.perf_counter()
+    for _ in range(iterations * 10):
+        legacy_is_repeated_dismissive(detector, last, history)
+    legacy_dismissive_us = (time.perf_counter() - started) / (iterations * 10) * 1_000_000
+
+    started = time.perf_counter()
+    for _ in range(iterations * 10):
+        streak = detector.next_dismissive_streak(last, 1, history)
+        detector.is_repeated_dismissive(last, history, threshold=3, dismissive_streak=streak)
+    streak_us = (time.perf_counter() - started) / (iterations * 10) * 1_000_000
+    print(f"⏱️  repeated-dismissive check at turn 200: history rescan {legacy_dismissive_us:.2f} µs | cached streak {streak_us:.2f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--show-errors", action="store_true")
+    args = parser.parse_args()
+    main(args.corpus, args.iterations, args.show_errors)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Prompt layout benchmark: static system prefix vs one dynamic-first user message.
+
+Renders every registered agent prompt (llm/prompts.py) two ways:
+
+- legacy: one user message with the per-call values first and the rules and
+  examples after them, the layout the agents used before the registry
+- registry: the static system message followed by the short user suffix
+
+and sends both to a fake provider that charges prefill time per uncached
+prompt token and caches repeated leading messages, as providers with
+prompt prefix caching do. Reports per prompt the uncached prompt tokens the
+provider had to process, mean latency, and the render cost of the old
+per-call str.format() vs the precompiled template, which also estimates the
+prompt's tokens (most of its cost).
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_prompts
+    python -m benchmarks.bench_prompts --calls 50 --prefill-ms-per-1k 300
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from benchmarks.fake_llm_server import FakeLLMServer
+from llm.client import AsyncLLMClient
+from llm.prompts import prompt_registry
+from templates.agent_prompts import AGENT_PROMPTS
+
+ANSWERS = [
+    "Every morning I make two cups of oat latte before work, it's the one fixed part of my day",
+    "Honestly I mostly grab whatever is closest to the office, price matters more than taste",
+    "I switched to decaf after 3pm because I wasn't sleeping well",
+    "On weekends I go to a small roastery with friends, it's more of a social thing",
+]
+
+
+def sample_values(name: str, index: int) -> Dict[str, str]:
+    """Per-call values for `name`; they differ on every call like real turns."""
+    answer = ANSWERS[index % len(ANSWERS)] + f" (respondent {index})"
+    question = "How does coffee fit into your daily routine?"
+    context = f"assistant: {question}\nuser: {answer}"
+    values = {
+        "topic": "coffee habits",
+        "research_topic": "coffee habits",
+        "question": question,
+        "response": answer,
+        "context": context,
+        "question_number": str(index % 15 + 1),
+        "max_questions": "15",
+        "asked_questions": f"- {question}\n- What do you usually order?",
+        "insights": "- Drinks coffee every morning\n- Price-sensitive",
+        "responses": "\n".join(ANSWERS),
+        "data": "\n".join(ANSWERS),
+        "candidates": "morning routine, price, decaf",
+    }
+    return {field: values[field] for field in prompt_registry.get(name).fields}
+
+
+def legacy_messages(name: str, values: Dict[str, str]) -> List[Dict[str, str]]:
+    prompt = AGENT_PROMPTS[name]
+    return [{"role": "user", "content": (prompt["user"] + "\n\n" + prompt["system"]).format(**values)}]
+
+
+def render_us(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def send_all(client: AsyncLLMClient, name: str, calls: int, legacy: bool) -> Dict[str, float]:
+    uncached = 0
+    prompt_tokens = 0
+    latencies = []
+    for index in range(calls):
+        values = sample_values(name, index)
+        messages = legacy_messages(name, values) if legacy else prompt_registry.render(name, **values).messages
+        response = await client.chat(messages, model="fake-fast", max_tokens=60)
+        prompt_tokens += response.prompt_tokens
+        uncached += response.prompt_tokens - response.cached_prompt_tokens
+        latencies.append(response.latency_ms)
+    return {
+        "prompt_tokens": prompt_tokens / calls,
+        "uncached": uncached / calls,
+        "latency": sum(latencies) / len(latencies)
+    }
+
+
+async def run(server: FakeLLMServer, calls: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    client = AsyncLLMClient(base_url=server.base_url, api_key="bench")
+    results = {}
+    try:
+        for name in AGENT_PROMPTS:
+            results[name] = {
+                "legacy": await send_all(client, name, calls, legacy=True),
+                "registry": await send_all(client, name, calls, legacy=False)
+            }
+    finally:
+        await client.aclose()
+    return results
+
+
+def main(args):
+    with FakeLLMServer(
+        latency_ms=args.latency_ms, token_ms=0, prefill_ms_per_1k=args.prefill_ms_per_1k, prefix_cache=True
+    ) as server:
+        results = asyncio.run(run(server, args.calls))
+
+    print(f"\n📊 {args.calls} calls per prompt | prefill {args.prefill_ms_per_1k:.0f} ms per 1k uncached tokens")
+    print(f"  {'prompt':<20} {'prompt tok':>10} {'uncached old → new':>20} {'latency old → new':>24} {'render old → new+count':>24}")
+    totals = {"legacy": 0.0, "registry": 0.0}
+    for name, result in results.items():
+        values = sample_values(name, 0)
+        legacy_us = render_us(lambda: legacy_messages(name, values), args.render_iterations)
+        registry_us = render_us(lambda: prompt_registry.render(name, **values), args.render_iterations)
+        old, new = result["legacy"], result["registry"]
+        totals["legacy"] += old["uncached"]
+        totals["registry"] += new["uncached"]
+        print(
+            f"  {name:<20} {new['prompt_tokens']:10.0f} {old['uncached']:9.0f} → {new['uncached']:<8.0f}"
+            f" {old['latency']:9.1f} → {new['latency']:7.1f} ms {legacy_us:8.2f} → {registry_us:6.2f} µs"
+        )
+    saved = 1 - totals["registry"] / totals["legacy"] if totals["legacy"] else 0.0
+    print(f"\n✅ Uncached prompt tokens, one call of every prompt: {totals['legacy']:.0f} → {totals['registry']:.0f} ({saved:.0%} less)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--prefill-ms-per-1k", type=float, default=200.0)
+    parser.add_argument("--render-iterations", type=int, default=20_000)
+    main(parser.parse_args())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Relevance pre-classifier report.
+
+Runs RelevancePreClassifier over a labeled fixture corpus (labels are the
+LLM relevance check's verdicts) and reports how many turns skip the LLM and
+how often the fast-path verdicts agree with the LLM.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_relevance
+    python -m benchmarks.bench_relevance --show-disagreements
+"""
+
+import argparse
+import json
+import os
+import time
+
+from utils.relevance import RelevancePreClassifier, RELEVANT, IRRELEVANT, AMBIGUOUS
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "fixtures", "relevance_corpus.jsonl")
+
+
+def load_corpus(path: str):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main(corpus_path: str, show_disagreements: bool):
+    corpus = load_corpus(corpus_path)
+    classifier = RelevancePreClassifier()
+
+    counts = {RELEVANT: 0, IRRELEVANT: 0, AMBIGUOUS: 0}
+    agree = 0
+    disagreements = []
+
+    started = time.perf_counter()
+    for row in corpus:
+        verdict, reason = classifier.classify(row["question"], row["response"], row["research_topic"])
+        counts[verdict] += 1
+
+        if verdict == AMBIGUOUS:
+            continue
+
+        if verdict.upper() == row["llm_label"]:
+            agree += 1
+        else:
+            disagreements.append((row, verdict, reason))
+    elapsed_us = (time.perf_counter() - started) / len(corpus) * 1_000_000
+
+    decided = counts[RELEVANT] + counts[IRRELEVANT]
+    labeled_irrelevant = sum(1 for row in corpus if row["llm_label"] == "IRRELEVANT")
+
+    print(f"\n📊 Relevance pre-classifier on {len(corpus)} labeled turns ({os.path.basename(corpus_path)})")
+    print(f"  decided locally (LLM skipped): {decided}/{len(corpus)} = {decided / len(corpus):.0%}")
+    print(f"    relevant:   {counts[RELEVANT]}")
+    print(f"    irrelevant: {counts[IRRELEVANT]} (of {labeled_irrelevant} labeled irrelevant)")
+    print(f"  escalated to LLM (ambiguous):  {counts[AMBIGUOUS]}")
+    if decided:
+        print(f"  agreement with LLM on decided turns: {agree}/{decided} = {agree / decided:.1%}")
+    print(f"  mean classification time: {elapsed_us:.1f}µs")
+
+    if show_disagreements:
+        for row, verdict, reason in disagreements:
+            print(f"\n  ❌ Q: {row['question']}\n     A: {row['response']}\n"
+                  f"     LLM: {row['llm_label']} | fast path: {verdict.upper()} ({reason})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--show-disagreements", action="store_true")
+    args = parser.parse_args()
+
+    main(args.corpus, args.show_disagreements)
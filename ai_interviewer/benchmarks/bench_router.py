@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+LLM router benchmark: hedged requests and provider failover.
+
+Starts two fake providers ("groq" and "cerebras") and drives the router
+directly (no graph), so the numbers isolate the routing policy:
+
+- tail: the primary has a heavy-tailed lognormal latency, the secondary is
+  steady but slower on average. Compares p50/p95/p99 with hedging off and
+  on, plus how many extra requests hedging cost.
+- failover: the primary returns 503 on every call. Shows the calls that hit
+  it before its circuit breaker opens and the latency once traffic goes
+  straight to the secondary.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_router
+    python -m benchmarks.bench_router --calls 400 --primary-ms 150 --primary-sigma 1.2
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from benchmarks.bench_workflow import percentile
+from benchmarks.fake_llm_server import FakeLLMServer
+from llm.client import AsyncLLMClient
+from llm.router import CircuitBreaker, LLMProvider, LLMRouter
+
+MESSAGES = [{"role": "user", "content": "Generate the next interview question about coffee habits."}]
+MODELS = {"fast": "fake-fast", "quality": "fake-quality"}
+
+
+def build_router(primary: FakeLLMServer, secondary: FakeLLMServer, hedge: bool, args) -> LLMRouter:
+    providers = [
+        LLMProvider(
+            "groq", AsyncLLMClient(base_url=primary.base_url, api_key="bench"), MODELS,
+            breaker=CircuitBreaker(args.breaker_failures, args.breaker_cooldown)
+        ),
+        LLMProvider(
+            "cerebras", AsyncLLMClient(base_url=secondary.base_url, api_key="bench"), MODELS,
+            breaker=CircuitBreaker(args.breaker_failures, args.breaker_cooldown)
+        ),
+    ]
+    # Fixed order so the primary always goes first and only hedging changes
+    return LLMRouter(
+        providers,
+        routes={"fast": ["groq", "cerebras"], "quality": ["groq", "cerebras"]},
+        by_latency=False,
+        hedge=hedge,
+        hedge_min_delay_ms=args.hedge_min_delay_ms,
+        hedge_min_samples=args.hedge_min_samples
+    )
+
+
+async def drive(router: LLMRouter, calls: int, concurrency: int) -> Dict:
+    latencies: List[float] = []
+    winners: Dict[str, int] = {}
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_call():
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await router.chat(MESSAGES, role="fast", max_tokens=60)
+            except Exception:
+                errors += 1
+                return
+            latencies.append((time.perf_counter() - started) * 1000)
+            winners[response.provider] = winners.get(response.provider, 0) + 1
+
+    await asyncio.gather(*(one_call() for _ in range(calls)))
+    latencies.sort()
+    return {
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "winners": winners,
+        "errors": errors
+    }
+
+
+async def run_tail(args, primary: FakeLLMServer, secondary: FakeLLMServer, hedge: bool) -> Dict:
+    router = build_router(primary, secondary, hedge, args)
+    try:
+        # Warm up until the primary has enough samples for a p90 hedge delay
+        await drive(router, args.hedge_min_samples + 10, 1)
+        before = primary.request_count + secondary.request_count
+        result = await drive(router, args.calls, args.concurrency)
+        result["requests"] = primary.request_count + secondary.request_count - before
+        return result
+    finally:
+        await router.aclose()
+
+
+async def run_failover(args, failing: FakeLLMServer, secondary: FakeLLMServer) -> Dict:
+    router = build_router(failing, secondary, False, args)
+    try:
+        before = failing.request_count
+        result = await drive(router, args.calls, 1)
+        result["primary_hits"] = failing.request_count - before
+        result["breaker"] = router.providers["groq"].breaker.state
+        return result
+    finally:
+        await router.aclose()
+
+
+def print_tail(label: str, result: Dict, calls: int):
+    winners = ", ".join(f"{name}={count}" for name, count in sorted(result["winners"].items()))
+    print(
+        f"  {label:<10} p50 {result['p50']:7.1f} ms | p95 {result['p95']:7.1f} ms | p99 {result['p99']:7.1f} ms"
+        f" | requests {result['requests']} for {calls} calls | winners {winners}"
+    )
+
+
+def main(args):
+    common = {"token_ms": 0, "seed": args.seed}
+    primary = FakeLLMServer(
+        latency_ms=args.primary_ms, latency_dist="lognormal", latency_sigma=args.primary_sigma, **common
+    )
+    secondary = FakeLLMServer(latency_ms=args.secondary_ms, **common)
+    failing = FakeLLMServer(latency_ms=args.primary_ms, error_rate=1.0, **common)
+
+    with primary, secondary, failing:
+        print(f"\n📊 Tail latency: primary lognormal {args.primary_ms:.0f} ms (σ={args.primary_sigma}), "
+              f"secondary fixed {args.secondary_ms:.0f} ms, {args.calls} calls x{args.concurrency}")
+        print_tail("no hedge", asyncio.run(run_tail(args, primary, secondary, hedge=False)), args.calls)
+        print_tail("hedged", asyncio.run(run_tail(args, primary, secondary, hedge=True)), args.calls)
+
+        print(f"\n🔁 Failover: primary returns 503 on every call, breaker opens after {args.breaker_failures} failures"
+              f" and lets one trial call through every {args.breaker_cooldown:.0f}s")
+        result = asyncio.run(run_failover(args, failing, secondary))
+        print(
+            f"  primary hit {result['primary_hits']}x in {args.calls} calls (breaker {result['breaker']}) | "
+            f"errors {result['errors']} | p50 {result['p50']:.1f} ms | p99 {result['p99']:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--primary-ms", type=float, default=120.0)
+    parser.add_argument("--primary-sigma", type=float, default=1.0)
+    parser.add_argument("--secondary-ms", type=float, default=200.0)
+    parser.add_argument("--hedge-min-delay-ms", type=float, default=50.0)
+    parser.add_argument("--hedge-min-samples", type=int, default=20)
+    parser.add_argument("--breaker-failures", type=int, default=5)
+    parser.add_argument("--breaker-cooldown", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Rate-limit scheduler benchmark: a rate-limited provider under a burst.
+
+Starts a fake provider that answers 429 (with Retry-After) above
+--provider-rps, then sends a burst of background calls (end-of-interview
+summaries) while interactive calls (question generation) keep arriving at
+--interactive-rps. Two runs against the same provider:
+
+- unscheduled: no client-side budget, calls only back off after 429s
+- scheduled: the router's RateLimiter holds calls to the provider's budget,
+  interactive calls ahead of background ones
+
+Reports end-to-end latency per priority (queue wait included), calls that
+still failed (what an agent would have replaced with a canned fallback) and
+the 429s the provider sent.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_scheduler
+    python -m benchmarks.bench_scheduler --provider-rps 20 --background 150 --interactive 100
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+import config
+from benchmarks.bench_workflow import percentile
+from benchmarks.fake_llm_server import FakeLLMServer
+from llm.client import AsyncLLMClient
+from llm.router import LLMProvider, LLMRouter
+from llm.scheduler import RateLimiter
+from utils.logger import configure_logging
+
+MESSAGES = [{"role": "user", "content": "Generate the next interview question about coffee habits."}]
+
+
+def build_router(server: FakeLLMServer, args, scheduled: bool) -> LLMRouter:
+    limiter = RateLimiter(
+        "groq",
+        requests_per_minute=int(args.provider_rps * 60) if scheduled else 0,
+        max_wait_seconds=args.max_wait,
+        burst_seconds=1.0
+    )
+    provider = LLMProvider(
+        "groq",
+        AsyncLLMClient(base_url=server.base_url, api_key="bench"),
+        {"fast": "fake-fast", "quality": "fake-quality"},
+        limiter=limiter
+    )
+    return LLMRouter([provider], {"fast": ["groq"], "quality": ["groq"]}, hedge=False)
+
+
+async def run(server: FakeLLMServer, args, scheduled: bool) -> Dict[str, Dict]:
+    router = build_router(server, args, scheduled)
+    results = {priority: {"latencies": [], "failed": 0} for priority in ("interactive", "background")}
+
+    async def call(priority: str, role: str):
+        started = time.perf_counter()
+        try:
+            await router.chat(MESSAGES, role=role, max_tokens=60, priority=priority)
+        except Exception:
+            results[priority]["failed"] += 1
+            return
+        results[priority]["latencies"].append((time.perf_counter() - started) * 1000)
+
+    async def interactive_arrivals():
+        calls = []
+        for _ in range(args.interactive):
+            calls.append(asyncio.create_task(call("interactive", "fast")))
+            await asyncio.sleep(1 / args.interactive_rps)
+        await asyncio.gather(*calls)
+
+    before = server.stats()["rate_limited_count"]
+    try:
+        background = [asyncio.create_task(call("background", "quality")) for _ in range(args.background)]
+        await asyncio.gather(interactive_arrivals(), *background)
+    finally:
+        await router.aclose()
+    results["rate_limited"] = server.stats()["rate_limited_count"] - before
+    return results
+
+
+def print_run(label: str, results: Dict):
+    print(f"\n{label}  (provider 429s: {results['rate_limited']})")
+    for priority in ("interactive", "background"):
+        latencies: List[float] = results[priority]["latencies"]
+        print(
+            f"  {priority:<12} p50 {percentile(latencies, 50):8.1f} ms | p95 {percentile(latencies, 95):8.1f} ms"
+            f" | ok {len(latencies):4d} | failed {results[priority]['failed']:4d}"
+        )
+
+
+def main(args):
+    configure_logging(level="ERROR")
+    # Same retry policy for both runs
+    config.LLM_RATE_LIMIT_RETRIES = args.retries
+    with FakeLLMServer(latency_ms=args.latency_ms, token_ms=0, rate_limit_rps=args.provider_rps) as server:
+        print(
+            f"\n📊 Provider limit {args.provider_rps:.0f} req/s | {args.background} background calls at once, "
+            f"{args.interactive} interactive at {args.interactive_rps:.0f}/s | {args.retries} retries on 429"
+        )
+        print_run("⚠️  unscheduled (back off on 429 only)", asyncio.run(run(server, args, scheduled=False)))
+        time.sleep(1.5)  # let the provider's bucket refill between runs
+        print_run("✅ scheduled (token bucket + priorities)", asyncio.run(run(server, args, scheduled=True)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider-rps", type=float, default=10.0)
+    parser.add_argument("--background", type=int, default=60)
+    parser.add_argument("--interactive", type=int, default=40)
+    parser.add_argument("--interactive-rps", type=float, default=4.0)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--max-wait", type=float, default=30.0)
+    main(parser.parse_args())
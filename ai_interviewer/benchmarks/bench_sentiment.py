@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Sentiment scoring: accuracy and cost.
+
+Compares the substring-count heuristic AnalyzerAgent used before with the
+configured SentimentEngine on a labeled corpus
+(`fixtures/sentiment_corpus.jsonl`, including negations and "but" clauses),
+then times per-response and batch scoring of a long interview.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_sentiment
+    python -m benchmarks.bench_sentiment --engine textblob --show-errors
+"""
+
+import argparse
+import json
+import os
+import time
+
+from utils.sentiment import get_sentiment_engine, sentiment_label
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "fixtures", "sentiment_corpus.jsonl")
+
+
+def legacy_sentiment(text: str) -> str:
+    """The substring count AnalyzerAgent._assess_sentiment used before."""
+    positive_words = ["good", "great", "excellent", "love", "enjoy", "amazing", "happy"]
+    negative_words = ["bad", "terrible", "hate", "awful", "disappointed", "frustrated"]
+    text_lower = text.lower()
+    pos_count = sum(1 for word in positive_words if word in text_lower)
+    neg_count = sum(1 for word in negative_words if word in text_lower)
+    if pos_count > neg_count:
+        return "positive"
+    if neg_count > pos_count:
+        return "negative"
+    return "neutral"
+
+
+def main(corpus_path: str, engine_name: str, iterations: int, show_errors: bool):
+    with open(corpus_path) as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+
+    engine = get_sentiment_engine(engine_name)
+
+    print(f"\n📊 Sentiment on {len(corpus)} labeled responses ({os.path.basename(corpus_path)})")
+    for name, classify in (
+        ("substring count", legacy_sentiment),
+        (f"{engine.name} engine", lambda text: sentiment_label(engine.score(text)).value),
+    ):
+        errors = [(row, got) for row in corpus if (got := classify(row["text"])) != row["expected"]]
+        print(f"  {name:<16} correct {len(corpus) - len(errors)}/{len(corpus)}")
+        if show_errors:
+            for row, got in errors:
+                print(f"      expected {row['expected']:<9} got {got:<9} {row['text']}")
+
+    texts = [row["text"] for row in corpus] * 7  # ~200 responses, a long session
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for text in texts:
+            engine.score(text)
+    single_us = (time.perf_counter() - started) / (iterations * len(texts)) * 1_000_000
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        engine.score_batch(texts)
+    batch_ms = (time.perf_counter() - started) / iterations * 1000
+    print(f"\n⏱️  {engine.name}: {single_us:.2f} µs per response | score_batch of {len(texts)} responses {batch_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--engine", default=None, help="sentiment engine (default: config.SENTIMENT_ENGINE)")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--show-errors", action="store_true")
+    args = parser.parse_args()
+    main(args.corpus, args.engine, args.iterations, args.show_errors)
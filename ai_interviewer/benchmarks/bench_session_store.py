@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Session persistence cost per turn.
+
+Simulates interviews of 15, 50 and 200 turns against an in-memory Redis
+(fakeredis) and reports the bytes written by the save at the last turn for
+the delta layout (SessionStore: scalars rewritten, history appended) next to
+the previous full-state rewrite (`json.dumps(state, default=str)`).
+
+Each turn goes through the workflow's own state updates - the fast analysis
+(history, rolling context summary), the deep analysis commit (session
+insights, summary aggregates) and question generation with the question
+prefetched - so no LLM is called, and every field grows the way it does in a
+real interview. Deep analysis finds two new insights per turn.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_session_store
+    python -m benchmarks.bench_session_store --turns 15 50 200 500
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import fakeredis
+
+from graph.workflow import (
+    _commit_deep_analysis, analyze_response_node, create_initial_state, generate_question_node, workflow_stores
+)
+from models.schemas import AnalyzedResponse, DeepAnalysis
+from storage.db_client import DatabaseClient
+from storage.session_store import SessionStore
+from storage.template_analytics import InMemoryTemplateAnalytics
+
+ANSWER = (
+    "I usually drink two cups of coffee in the morning before work, mostly lattes "
+    "from the cafe near the station because the beans are fresher than at home."
+)
+QUESTION = "That's interesting! What makes that cafe your go-to choice over brewing at home?"
+DRINKS = ["lattes", "espresso", "cold brew", "filter coffee", "flat whites", "cappuccinos", "mochas"]
+PLACES = ["the station cafe", "home", "the office kitchen", "a bakery", "the gym bar", "a drive-through"]
+REASONS = ["price", "freshness", "habit", "the barista", "speed", "the loyalty card", "the atmosphere"]
+
+
+def insights_for(turn: int):
+    """Two insights per turn, none repeated within an interview."""
+    drink = DRINKS[turn % len(DRINKS)]
+    place = PLACES[turn % len(PLACES)]
+    reason = REASONS[turn % len(REASONS)]
+    return [
+        f"Buys {drink} at {place} because of {reason} (turn {turn})",
+        f"Would switch from {place} if {reason} changed (turn {turn})"
+    ]
+
+
+async def simulate_turn(state: dict, turn: int) -> dict:
+    """One /agent/chat turn: the graph nodes' updates, applied in order."""
+    state = {**state, "user_response": ANSWER}
+    state.update(await analyze_response_node(state))
+    state.update(await _commit_deep_analysis(state, DeepAnalysis(
+        key_insights=insights_for(turn),
+        emotional_tone="satisfied",
+        needs_follow_up=False,
+        suggested_follow_up_topic=REASONS[turn % len(REASONS)]
+    )))
+    state["prefetched_question"] = f"{QUESTION} ({turn})"
+    state.update(await generate_question_node(state))
+    return state
+
+
+async def run(turns: int) -> dict:
+    store = SessionStore(redis_client=fakeredis.FakeAsyncRedis())
+    session_id = f"bench-{turns}"
+
+    state = create_initial_state(session_id, "template-1", "How often do you drink coffee?", max_questions=turns)
+    state["conversation_history"].append({"role": "assistant", "content": "How often do you drink coffee?"})
+    version = await store.save(session_id, state)
+
+    save_ms = 0.0
+    with workflow_stores(DatabaseClient(), InMemoryTemplateAnalytics()):
+        for turn in range(1, turns + 1):
+            state, version = await store.load_versioned(session_id)
+            state = await simulate_turn(state, turn)
+
+            before = store.bytes_written
+            started = time.perf_counter()
+            version = await store.save(session_id, state, expected_version=version)
+            save_ms = (time.perf_counter() - started) * 1000
+            delta_bytes = store.bytes_written - before
+    scalar_bytes = len(store.codec.dumps({
+        key: value for key, value in state.items() if key not in ("conversation_history", "session_insights")
+    }))
+
+    full_bytes = len(json.dumps(state, default=str))
+
+    reloaded = await store.load(session_id)
+    assert len(reloaded["conversation_history"]) == len(state["conversation_history"])
+    assert reloaded["session_insights"] == state["session_insights"] and len(state["session_insights"]) == 2 * turns
+    assert reloaded["summary_progress"]["responses"] == turns
+    assert isinstance(reloaded["analyzed_response"], AnalyzedResponse)
+    assert isinstance(reloaded["deep_analysis"], DeepAnalysis)
+
+    return {
+        "turns": turns,
+        "delta_bytes": delta_bytes,
+        "full_bytes": full_bytes,
+        "scalar_bytes": scalar_bytes,
+        "save_ms": save_ms
+    }
+
+
+def main(turn_counts):
+    print("\n📊 Bytes written by the save at the last turn")
+    print(f"  {'turns':>6}  {'delta layout':>13}  {'of which scalars':>16}  {'full rewrite':>13}  {'save ms':>8}")
+    for turns in turn_counts:
+        row = asyncio.run(run(turns))
+        print(
+            f"  {row['turns']:>6}  {row['delta_bytes']:>13,}  {row['scalar_bytes']:>16,}  {row['full_bytes']:>13,}  "
+            f"{row['save_ms']:>8.2f}"
+        )
+    print("  (pydantic sub-objects reload as AnalyzedResponse / DeepAnalysis)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, nargs="+", default=[15, 50, 200])
+    args = parser.parse_args()
+    main(args.turns)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Time-to-first-token benchmark for the streaming chat path.
+
+Compares the blocking path (`ainvoke`, the respondent sees nothing until the
+whole next question exists) with the streaming path used by
+/agent/chat/stream (`astream` with custom token events) against the local
+fake provider.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_streaming --latency-ms 200 --token-ms 20
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from benchmarks.bench_workflow import ANSWER, RESEARCH_TOPIC, percentile
+from benchmarks.fake_llm_server import FakeLLMServer
+from llm.client import llm_client
+from graph.workflow import create_initial_state, interview_workflow
+
+
+def first_turn_state(session_index: int):
+    state = create_initial_state(f"stream-bench-{session_index}", "bench", RESEARCH_TOPIC)
+    state["conversation_history"].append({"role": "assistant", "content": RESEARCH_TOPIC})
+    state["current_question"] = RESEARCH_TOPIC
+    state["question_count"] = 1
+    state["user_response"] = ANSWER
+    return state
+
+
+async def blocking_turn(session_index: int, first_visible: List[float]):
+    started = time.perf_counter()
+    await interview_workflow.ainvoke(first_turn_state(session_index))
+    first_visible.append((time.perf_counter() - started) * 1000)
+
+
+async def streaming_turn(session_index: int, first_visible: List[float], totals: List[float]):
+    started = time.perf_counter()
+    first_token_at = None
+
+    async for mode, chunk in interview_workflow.astream(
+        first_turn_state(session_index),
+        config={"configurable": {"stream_tokens": True}},
+        stream_mode=["custom", "values"]
+    ):
+        if mode == "custom" and first_token_at is None:
+            first_token_at = time.perf_counter()
+
+    finished = time.perf_counter()
+    first_visible.append(((first_token_at or finished) - started) * 1000)
+    totals.append((finished - started) * 1000)
+
+
+async def main(sessions: int, server: FakeLLMServer):
+    llm_client.base_url = server.base_url
+    await llm_client.aclose()
+
+    blocking: List[float] = []
+    await asyncio.gather(*(blocking_turn(i, blocking) for i in range(sessions)))
+
+    ttft: List[float] = []
+    totals: List[float] = []
+    await asyncio.gather(*(streaming_turn(i, ttft, totals) for i in range(sessions)))
+
+    await llm_client.aclose()
+    return blocking, ttft, totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    with FakeLLMServer(latency_ms=args.latency_ms, token_ms=args.token_ms) as server:
+        blocking, ttft, totals = asyncio.run(main(args.sessions, server))
+
+    print(f"\n📊 Time until the respondent sees text - fake provider "
+          f"{args.latency_ms:.0f}ms first token, {args.token_ms:.0f}ms/token, {args.sessions} sessions")
+    print(f"  blocking  (full question)  p50 {percentile(blocking, 50):>6.0f}ms | p95 {percentile(blocking, 95):>6.0f}ms")
+    print(f"  streaming (first token)    p50 {percentile(ttft, 50):>6.0f}ms | p95 {percentile(ttft, 95):>6.0f}ms")
+    print(f"  streaming (full question)  p50 {percentile(totals, 50):>6.0f}ms | p95 {percentile(totals, 95):>6.0f}ms")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+End-of-interview latency: summary computed at the end vs incrementally.
+
+"before" replays the old finalization: read every analyzed response, score
+sentiment, collect insights, then the summary-text and key-theme LLM calls
+one after the other. "after" is SummaryAgent.generate_summary with the
+aggregates that record_response kept up to date during the interview, so
+only the two LLM calls are left and they run concurrently. Also reports
+the per-turn cost of record_response (with the insight index update it
+relies on for deduplicated insights).
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_summary --latency-ms 200 --turns 15 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from agents.summary import summary_agent
+from benchmarks.bench_context_window import build_history
+from benchmarks.fake_llm_server import FakeLLMServer
+from llm.cache import completion_cache
+from llm.client import llm_client
+from models.schemas import AnalyzedResponse, InterviewState, ResponseQuality, Sentiment
+from storage.db_client import DatabaseClient
+from utils.context_window import context_window
+from utils.insight_index import add_insights
+from utils.sentiment import get_sentiment_engine, score_to_unit
+
+INSIGHTS = [
+    "Drinks coffee as part of a fixed morning routine",
+    "Values convenience over price",
+    "Uses the rewards app for mobile ordering",
+    "Prefers oat milk lattes",
+    "Avoids the cafe on weekends because of queues",
+    "Drinks coffee as part of a fixed morning routine",  # duplicate on purpose
+]
+
+
+def build_session(session_id: str, turns: int):
+    history = build_history(turns)
+    engine = get_sentiment_engine()
+    responses = []
+    for index, message in enumerate(m for m in history if m["role"] == "user"):
+        label, score = engine.classify(message["content"])
+        responses.append(AnalyzedResponse(
+            session_id=session_id,
+            respondent_id=session_id,
+            user_response=message["content"],
+            quality=ResponseQuality.GOOD,
+            sentiment=label,
+            sentiment_score=score,
+            word_count=len(message["content"].split()),
+            key_insights=[INSIGHTS[index % len(INSIGHTS)], f"Mentioned detail #{index}"]
+        ))
+    state = InterviewState(
+        session_id=session_id,
+        respondent_id=session_id,
+        template_id="bench",
+        research_topic=f"Coffee habits ({session_id})",  # unique per run: no completion cache hits
+        conversation_history=history,
+        context_summary=context_window.fold(None, history),
+        current_question_count=turns,
+        max_questions=turns
+    )
+    return state, responses
+
+
+async def finalize_before(db: DatabaseClient, state: InterviewState):
+    """The pre-incremental generate_summary: aggregates at the end, sequential LLM calls."""
+    responses = await db.get_analyzed_responses(state.session_id)
+    insights = [insight for response in responses for insight in response.key_insights]
+    scores = get_sentiment_engine().score_batch([response.user_response for response in responses])
+    _ = sum(score_to_unit(score) for score in scores) / max(len(scores), 1)
+    user_responses = context_window.user_context(state.conversation_history, state.context_summary)
+    await summary_agent._generate_summary_text(user_responses, insights, state.research_topic, False, None)
+    await summary_agent._extract_key_themes(insights, user_responses)
+
+
+async def main(turn_counts, runs: int, server: FakeLLMServer):
+    llm_client.base_url = server.base_url
+    await llm_client.aclose()
+
+    print(f"\n⏱️  End-of-interview latency (fake LLM latency {server.latency_ms:.0f} ms, {runs} runs)")
+    print(f"  {'turns':>5}  {'before ms':>9}  {'after ms':>8}  {'record_response µs/turn':>24}")
+
+    for turns in turn_counts:
+        before, after, per_turn = [], [], []
+        for run in range(runs):
+            completion_cache.clear()
+            db = DatabaseClient()
+            state, responses = build_session(f"bench-{turns}-{run}", turns)
+
+            progress = summary_agent.empty_progress()
+            index = None
+            for response in responses:
+                await db.save_analyzed_response(response, state.session_id, state.respondent_id)
+                # As _commit_deep_analysis: the insight index dedupes, the aggregates count the new ones
+                started = time.perf_counter()
+                index, added = add_insights(index, response.key_insights)
+                progress = summary_agent.record_response(progress, response, added)
+                per_turn.append((time.perf_counter() - started) * 1_000_000)
+
+            started = time.perf_counter()
+            await finalize_before(db, state)
+            before.append((time.perf_counter() - started) * 1000)
+
+            completion_cache.clear()
+            state.research_topic += " (after)"
+            started = time.perf_counter()
+            await summary_agent.generate_summary(state, progress=progress, insights=index["insights"])
+            after.append((time.perf_counter() - started) * 1000)
+
+        print(f"  {turns:>5}  {statistics.median(before):>9.1f}  {statistics.median(after):>8.1f}  "
+              f"{statistics.mean(per_turn):>24.1f}")
+
+    await llm_client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--turns", type=int, nargs="+", default=[15, 50])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with FakeLLMServer(latency_ms=args.latency_ms) as server:
+        asyncio.run(main(args.turns, args.runs, server))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Template analytics benchmark: scanning summaries vs incremental aggregates.
+
+Stores N synthetic interviews of one template in SQLite (storage/sql_client.py),
+then answers "completion rate, questions asked, sentiment distribution and
+termination reasons for this template" two ways:
+
+- scan: load every InterviewSummary of the template and aggregate in Python
+- aggregates: storage/template_analytics.py, updated per response and per
+  finished interview as the workflow runs, read with one lookup
+
+Checks that both give the same numbers, and reports read latency at each
+size and the per-update cost the workflow pays (memory and fakeredis).
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_template_analytics
+    python -m benchmarks.bench_template_analytics --sizes 100 1000 10000 --reads 20
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List
+
+from sqlalchemy import select
+
+from models.schemas import InterviewSummary
+from storage.sql_client import SQLDatabaseClient, interview_summaries
+from storage.template_analytics import InMemoryTemplateAnalytics, RedisTemplateAnalytics, TemplateAnalyticsStore
+
+SENTIMENTS = ["positive", "neutral", "negative"]
+REASONS = ["User explicitly requested to end", "Repeated dismissive answers", "Negative sentiment streak"]
+
+
+def synthetic_interviews(count: int, seed: int) -> List[Dict]:
+    rng = random.Random(seed)
+    interviews = []
+    for index in range(count):
+        outcome = rng.choices(["completed", "terminated_early", "incomplete"], [6, 2, 2])[0]
+        questions = 15 if outcome == "completed" else rng.randint(2, 14)
+        responses = [
+            (rng.choice(SENTIMENTS), round(rng.uniform(-1, 1), 3), rng.randint(1, 60))
+            for _ in range(questions)
+        ]
+        interviews.append({
+            "session_id": f"bench-{index}",
+            "outcome": outcome,
+            "questions": questions,
+            "responses": responses,
+            "average_sentiment": round(rng.uniform(0, 1), 2),
+            "reason": rng.choice(REASONS) if outcome == "terminated_early" else None
+        })
+    return interviews
+
+
+def summary_of(interview: Dict) -> InterviewSummary:
+    return InterviewSummary(
+        session_id=interview["session_id"],
+        template_id="bench",
+        summary="Synthetic interview summary. " * 10,
+        key_themes=["price", "routine", "sleep"],
+        average_sentiment_score=interview["average_sentiment"],
+        total_insights_count=interview["questions"] * 2,
+        questions_asked=interview["questions"],
+        total_exchanges=interview["questions"] * 2,
+        terminated_early=interview["outcome"] == "terminated_early",
+        termination_reason=interview["reason"],
+        sentiment_distribution=dict(Counter(sentiment for sentiment, _, _ in interview["responses"]))
+    )
+
+
+async def scan(db: SQLDatabaseClient) -> Dict:
+    """The aggregate as a report without materialized analytics computes it."""
+    async with db.engine.connect() as conn:
+        result = await conn.execute(
+            select(interview_summaries.c.metadata).where(interview_summaries.c.template_id == "bench")
+        )
+        summaries = [InterviewSummary.model_validate(payload) for payload in result.scalars()]
+    completed = sum(1 for s in summaries if not s.terminated_early and s.questions_asked >= 15)
+    distribution = Counter()
+    for s in summaries:
+        distribution.update(s.sentiment_distribution)
+    return {
+        "finished": len(summaries),
+        "completion_rate": round(completed / len(summaries), 4),
+        "questions_mean": round(statistics.mean(s.questions_asked for s in summaries), 4),
+        "questions_variance": round(statistics.variance(s.questions_asked for s in summaries), 4),
+        "sentiment_distribution": {sentiment: distribution[sentiment] for sentiment in SENTIMENTS},
+        "termination_reasons": dict(Counter(s.termination_reason for s in summaries if s.termination_reason).most_common(10))
+    }
+
+
+async def aggregates(store: TemplateAnalyticsStore) -> Dict:
+    analytics = await store.get("bench")
+    return {
+        "finished": analytics.interviews_finished,
+        "completion_rate": analytics.completion_rate,
+        "questions_mean": analytics.questions_asked.mean,
+        "questions_variance": analytics.questions_asked.variance,
+        "sentiment_distribution": analytics.sentiment_distribution,
+        "termination_reasons": analytics.termination_reasons
+    }
+
+
+async def record(store: TemplateAnalyticsStore, interviews: List[Dict]) -> List[float]:
+    """Feed the store like the workflow does; returns µs per update."""
+    timings = []
+    for interview in interviews:
+        for sentiment, score, words in interview["responses"]:
+            started = time.perf_counter()
+            await store.record_response("bench", sentiment, score, words)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+        started = time.perf_counter()
+        await store.record_interview(
+            "bench", interview["outcome"], interview["questions"], interview["average_sentiment"], interview["reason"]
+        )
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+async def timed_ms(reads: int, read) -> float:
+    started = time.perf_counter()
+    for _ in range(reads):
+        await read()
+    return (time.perf_counter() - started) * 1000 / reads
+
+
+async def run(args):
+    import fakeredis
+
+    interviews = synthetic_interviews(max(args.sizes), args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLDatabaseClient(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}", create_tables=True)
+        await db.connect()
+        memory = InMemoryTemplateAnalytics()
+        redis = RedisTemplateAnalytics(fakeredis.FakeAsyncRedis())
+        update_us = {"memory": [], "redis": []}
+
+        print(f"\n📊 Analytics read for one template ({args.reads} reads each)")
+        print(f"  {'interviews':>10} | {'scan summaries':>15} | {'memory':>9} | {'redis':>9}")
+        stored = 0
+        for size in sorted(args.sizes):
+            batch = interviews[stored:size]
+            for interview in batch:
+                await db.save_summary(summary_of(interview))
+            update_us["memory"] += await record(memory, batch)
+            update_us["redis"] += await record(redis, batch)
+            stored = size
+
+            expected = await scan(db)
+            for store in (memory, redis):
+                if await aggregates(store) != expected:
+                    raise SystemExit(f"❌ {store.backend} aggregates differ from the scan at {size} interviews")
+            scan_ms = await timed_ms(args.reads, lambda: scan(db))
+            memory_ms = await timed_ms(args.reads, lambda: memory.get("bench"))
+            redis_ms = await timed_ms(args.reads, lambda: redis.get("bench"))
+            print(f"  {size:>10} | {scan_ms:12.2f} ms | {memory_ms:6.3f} ms | {redis_ms:6.3f} ms")
+
+        await db.close()
+
+    print("\n⏱️  Update cost per recorded response / interview:")
+    for backend, timings in update_us.items():
+        print(f"  {backend:<7} mean {statistics.mean(timings):6.1f} µs | max {max(timings):7.1f} µs ({len(timings)} updates)")
+    print("\n✅ Aggregates match the full scan at every size")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--reads", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Workflow latency benchmark: sequential vs speculative vs fused graph.
+
+Drives synthetic sessions through the compiled LangGraph workflow against the
+local fake provider and reports per-turn p50/p95 latency plus a per-node
+latency breakdown (taken from `astream(stream_mode="updates")`).
+
+Sessions answer from the scripted answers (benchmarks/fixtures/respondent_scripts.jsonl),
+and every mode runs with the relevance fast path on and off: speculation only
+overlaps the relevance check with deep analysis, so it pays off on the turns
+the fast path leaves to the LLM. The completion cache is cleared before each
+run so runs don't reuse each other's relevance checks.
+
+Run from ai_interviewer/:
+    python -m benchmarks.bench_workflow --latency-ms 200 --sessions 20 --turns 5
+    python -m benchmarks.bench_workflow --fast-path off
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import config
+from agents.probe_decision import probe_decision_agent
+from benchmarks.fake_llm_server import FakeLLMServer
+from llm.cache import completion_cache
+from llm.client import llm_client
+from graph.workflow import build_interview_workflow, create_initial_state
+
+RESEARCH_TOPIC = "How often do you drink coffee?"
+ANSWER = "I usually have two cups at home"
+SCRIPTS = os.path.join(os.path.dirname(__file__), "fixtures", "respondent_scripts.jsonl")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def load_sessions() -> List[Dict]:
+    """Scripted respondents, minus the ones that end the interview on purpose."""
+    from simulation.batch import load_scripts
+
+    return [script for script in load_scripts(SCRIPTS) if script["persona"] != "early-exit"]
+
+
+async def run_session(workflow, script: Dict, session_index: int, turns: int, turn_times: List[float], node_times: Dict[str, List[float]]):
+    state = create_initial_state(f"bench-{session_index}", "bench", script["topic"])
+    state["conversation_history"].append({"role": "assistant", "content": script["topic"]})
+    state["current_question"] = script["topic"]
+    state["question_count"] = 1
+
+    for turn in range(turns):
+        if state.get("is_complete"):
+            break
+        state["user_response"] = script["answers"][turn % len(script["answers"])]
+        turn_started = last = time.perf_counter()
+
+        async for update in workflow.astream(state, stream_mode="updates"):
+            now = time.perf_counter()
+            for node_name, node_update in update.items():
+                node_times[node_name].append((now - last) * 1000)
+                state = {**state, **(node_update or {})}
+            last = now
+
+        turn_times.append((time.perf_counter() - turn_started) * 1000)
+
+
+async def run_mode(mode: str, fast_path: bool, sessions: int, turns: int) -> dict:
+    workflow = build_interview_workflow(
+        speculative=(mode == "speculative"),
+        fused=(mode == "fused")
+    )
+    config.RELEVANCE_FAST_PATH = fast_path
+    completion_cache.clear()
+    llm_checks_before = probe_decision_agent.stats["llm_checks"]
+    scripts = load_sessions()
+    turn_times: List[float] = []
+    node_times: Dict[str, List[float]] = defaultdict(list)
+
+    await asyncio.gather(*(
+        run_session(workflow, scripts[i % len(scripts)], i, turns, turn_times, node_times) for i in range(sessions)
+    ))
+
+    return {
+        "mode": mode,
+        "fast_path": fast_path,
+        "p50": percentile(turn_times, 50),
+        "p95": percentile(turn_times, 95),
+        "mean": statistics.mean(turn_times),
+        "llm_checks": (probe_decision_agent.stats["llm_checks"] - llm_checks_before) / len(turn_times),
+        "nodes": {name: statistics.mean(times) for name, times in node_times.items()}
+    }
+
+
+async def main(sessions: int, turns: int, server: FakeLLMServer, fast_paths=(True, False)):
+    llm_client.base_url = server.base_url
+    await llm_client.aclose()
+
+    results = [
+        await run_mode(mode, fast_path, sessions, turns)
+        for fast_path in fast_paths
+        for mode in ("sequential", "speculative", "fused")
+    ]
+
+    await llm_client.aclose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--fast-path", choices=["on", "off", "both"], default="both",
+                        help="Relevance fast path (RELEVANCE_FAST_PATH) in the runs")
+    args = parser.parse_args()
+    fast_paths = {"on": (True,), "off": (False,), "both": (True, False)}[args.fast_path]
+
+    with FakeLLMServer(latency_ms=args.latency_ms) as server:
+        results = asyncio.run(main(args.sessions, args.turns, server, fast_paths))
+
+    print(f"\n📊 Workflow turn latency - fake provider {args.latency_ms:.0f}ms, "
+          f"{args.sessions} sessions x {args.turns} turns (scripted answers)")
+    for result in results:
+        print(
+            f"\n  {result['mode']} (fast path {'on' if result['fast_path'] else 'off'}):"
+            f" p50 {result['p50']:.0f}ms | p95 {result['p95']:.0f}ms | mean {result['mean']:.0f}ms"
+            f" | LLM relevance checks/turn {result['llm_checks']:.2f}"
+        )
+        for node_name, mean_ms in result["nodes"].items():
+            print(f"    {node_name:<22} {mean_ms:>8.1f}ms")
@@ -0,0 +1,399 @@
+"""
+Fake LLM Provider - local OpenAI/Groq-compatible chat completions server
+Used by benchmarks and local testing so no real API key or network is needed.
+
+Run standalone:
+    python -m benchmarks.fake_llm_server --port 9100 --latency-ms 200
+    python -m benchmarks.fake_llm_server --latency-ms 200 --latency-dist lognormal --error-rate 0.02
+    python -m benchmarks.fake_llm_server --rate-limit-rps 10 --rate-limit-burst 10
+    python -m benchmarks.fake_llm_server --prefill-ms-per-1k 150 --prefix-cache
+
+Then point the agents at it:
+    export GROQ_BASE_URL="http://127.0.0.1:9100/v1"
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Optional, Sequence
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+def _fake_content(messages: List[Dict[str, str]]) -> str:
+    """Pick a plausible reply for the agent prompt that was sent."""
+    prompt = "\n".join(msg.get("content", "") for msg in messages)
+
+    if '"RELEVANT" or "IRRELEVANT"' in prompt:
+        return "RELEVANT"
+
+    if '"next_question"' in prompt:
+        return json.dumps({
+            "is_relevant": True,
+            "key_insights": ["Drinks coffee as part of a fixed morning routine", "Values convenience"],
+            "emotional_tone": "satisfied",
+            "needs_follow_up": False,
+            "suggested_follow_up_topic": "",
+            "next_question": "That's interesting! What makes that part of your routine so important to you?"
+        })
+
+    if '"key_insights"' in prompt:
+        return json.dumps({
+            "key_insights": ["Drinks coffee as part of a fixed morning routine", "Values convenience"],
+            "emotional_tone": "satisfied",
+            "needs_follow_up": False,
+            "suggested_follow_up_topic": ""
+        })
+
+    if "JSON array of theme" in prompt:
+        return json.dumps(["morning routine", "convenience", "daily habits"])
+
+    if "Generate a brief summary" in prompt or "Generate a comprehensive summary" in prompt:
+        return "The respondent described a steady daily routine and values convenience."
+
+    if "FRIENDLY redirect" in prompt:
+        return "Ha, that sounds fun! Let's get back to my question though - how often would you say you do that?"
+
+    return "That's interesting! Can you walk me through a specific example of when that happened?"
+
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+PREFIX_CACHE_ENTRIES = 4096
+
+
+class LatencyModel:
+    """
+    Time to first token, in ms, drawn from a seeded distribution.
+
+    `fixed`: always `mean_ms`; `uniform`: mean ± `spread_ms`;
+    `exponential`: mean `mean_ms`; `lognormal`: median `mean_ms` with shape
+    `sigma` (long tail, closest to real providers).
+    """
+
+    def __init__(self, mean_ms: float, dist: str = "fixed", spread_ms: float = 0.0, sigma: float = 0.5, seed: int = 0):
+        if dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{dist}', expected one of {LATENCY_DISTRIBUTIONS}")
+        self.mean_ms = mean_ms
+        self.dist = dist
+        self.spread_ms = spread_ms
+        self.sigma = sigma
+        self._rng = random.Random(seed)
+
+    def sample(self) -> float:
+        if self.dist == "uniform":
+            return max(0.0, self._rng.uniform(self.mean_ms - self.spread_ms, self.mean_ms + self.spread_ms))
+        if self.dist == "exponential":
+            return self._rng.expovariate(1 / self.mean_ms) if self.mean_ms > 0 else 0.0
+        if self.dist == "lognormal":
+            return self._rng.lognormvariate(math.log(self.mean_ms), self.sigma) if self.mean_ms > 0 else 0.0
+        return self.mean_ms
+
+
+def _stream_chunks(content: str, model: str, token_ms: float, usage: Optional[Dict] = None):
+    """OpenAI-style SSE chunks, one word per chunk (plus a usage chunk if asked for)."""
+    async def generate():
+        words = content.split(" ")
+        for index, word in enumerate(words):
+            if index:
+                await asyncio.sleep(token_ms / 1000)
+            delta = word if index == 0 else " " + word
+            chunk = {
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": delta}, "finish_reason": None}]
+            }
+            yield f"data: {json.dumps(chunk)}\n\n"
+        if usage is not None:
+            yield f"data: {json.dumps({'object': 'chat.completion.chunk', 'model': model, 'choices': [], 'usage': usage})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return generate()
+
+
+def create_app(
+    latency_ms: float = 200.0,
+    token_ms: float = 20.0,
+    latency_dist: str = "fixed",
+    latency_spread_ms: float = 0.0,
+    latency_sigma: float = 0.5,
+    error_rate: float = 0.0,
+    error_statuses: Sequence[int] = (503,),
+    generation_delay: bool = False,
+    rate_limit_rps: float = 0.0,
+    rate_limit_burst: int = 0,
+    prefill_ms_per_1k: float = 0.0,
+    prefix_cache: bool = False,
+    seed: int = 0
+) -> FastAPI:
+    """
+    Build the fake provider app.
+
+    Time to first token is drawn from `latency_dist` around `latency_ms`;
+    streamed responses then emit one word every `token_ms` (non-streamed
+    ones also wait `token_ms` per completion word with `generation_delay`).
+    A fraction `error_rate` of requests fails with one of `error_statuses`.
+    With `rate_limit_rps`, requests beyond a token bucket of
+    `rate_limit_burst` get a 429 with Retry-After, like a real provider.
+    Prompt processing adds `prefill_ms_per_1k` per 1000 uncached prompt
+    tokens; with `prefix_cache`, every message before the last one that was
+    seen before counts as cached (reported as prompt_tokens_details).
+    Latencies and injected errors come from RNGs seeded with `seed`.
+    """
+    app = FastAPI(title="Fake LLM Provider")
+    app.state.latency = LatencyModel(latency_ms, latency_dist, latency_spread_ms, latency_sigma, seed)
+    app.state.token_ms = token_ms
+    app.state.request_count = 0
+    app.state.error_count = 0
+    app.state.rate_limited_count = 0
+    app.state.prefixes = {}
+    error_rng = random.Random(seed + 1)
+    bucket = {"level": float(rate_limit_burst or rate_limit_rps), "updated": time.monotonic()}
+
+    def rate_limit_wait() -> float:
+        """Take one request from the bucket; seconds until one is available when empty."""
+        now = time.monotonic()
+        capacity = float(rate_limit_burst or rate_limit_rps)
+        bucket["level"] = min(capacity, bucket["level"] + (now - bucket["updated"]) * rate_limit_rps)
+        bucket["updated"] = now
+        if bucket["level"] >= 1:
+            bucket["level"] -= 1
+            return 0.0
+        return (1 - bucket["level"]) / rate_limit_rps
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        app.state.request_count += 1
+
+        if rate_limit_rps:
+            wait = rate_limit_wait()
+            if wait:
+                app.state.rate_limited_count += 1
+                return JSONResponse(
+                    status_code=429,
+                    headers={"Retry-After": f"{wait:.2f}"},
+                    content={"error": {"message": "Rate limit reached (fake)", "type": "rate_limit_exceeded"}}
+                )
+
+        messages = body.get("messages", [])
+        prompt_tokens = sum(len(msg.get("content", "").split()) for msg in messages)
+        cached_tokens = 0
+        if prefix_cache and len(messages) > 1:
+            prefix = json.dumps(messages[:-1], sort_keys=True)
+            if prefix in app.state.prefixes:
+                cached_tokens = app.state.prefixes[prefix]
+            elif len(app.state.prefixes) < PREFIX_CACHE_ENTRIES:
+                app.state.prefixes[prefix] = sum(len(msg.get("content", "").split()) for msg in messages[:-1])
+
+        prefill_ms = (prompt_tokens - cached_tokens) * prefill_ms_per_1k / 1000
+        await asyncio.sleep((app.state.latency.sample() + prefill_ms) / 1000)
+
+        if error_rate and error_rng.random() < error_rate:
+            app.state.error_count += 1
+            status = error_rng.choice(list(error_statuses))
+            return JSONResponse(
+                status_code=status,
+                content={"error": {"message": f"Injected fake provider error ({status})", "type": "fake_error"}}
+            )
+
+        content = _fake_content(messages)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(content.split()),
+            "total_tokens": prompt_tokens + len(content.split()),
+            "prompt_tokens_details": {"cached_tokens": cached_tokens}
+        }
+
+        if body.get("stream"):
+            include_usage = (body.get("stream_options") or {}).get("include_usage")
+            return StreamingResponse(
+                _stream_chunks(content, body.get("model", "fake-model"), app.state.token_ms, usage if include_usage else None),
+                media_type="text/event-stream"
+            )
+
+        if generation_delay:
+            await asyncio.sleep(usage["completion_tokens"] * app.state.token_ms / 1000)
+
+        return {
+            "id": f"chatcmpl-fake-{app.state.request_count}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake-model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": usage
+        }
+
+    for path in ("/chat/completions", "/v1/chat/completions", "/openai/v1/chat/completions"):
+        app.add_api_route(path, chat_completions, methods=["POST"])
+
+    @app.get("/stats")
+    async def stats():
+        return {
+            "request_count": app.state.request_count,
+            "error_count": app.state.error_count,
+            "rate_limited_count": app.state.rate_limited_count
+        }
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class FakeLLMServer:
+    """
+    Runs the fake provider in a child process.
+
+    A separate process keeps the server's CPU work (and the GIL) away from
+    the event loop being measured.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 200.0,
+        port: Optional[int] = None,
+        token_ms: float = 20.0,
+        latency_dist: str = "fixed",
+        latency_spread_ms: float = 0.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (503,),
+        generation_delay: bool = False,
+        rate_limit_rps: float = 0.0,
+        rate_limit_burst: int = 0,
+        prefill_ms_per_1k: float = 0.0,
+        prefix_cache: bool = False,
+        seed: int = 0
+    ):
+        self.latency_ms = latency_ms
+        self.token_ms = token_ms
+        self.latency_dist = latency_dist
+        self.latency_spread_ms = latency_spread_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.generation_delay = generation_delay
+        self.rate_limit_rps = rate_limit_rps
+        self.rate_limit_burst = rate_limit_burst
+        self.prefill_ms_per_1k = prefill_ms_per_1k
+        self.prefix_cache = prefix_cache
+        self.seed = seed
+        self.port = port or _free_port()
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    def stats(self) -> Dict[str, int]:
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/stats") as response:
+            return json.loads(response.read())
+
+    @property
+    def request_count(self) -> int:
+        return self.stats()["request_count"]
+
+    def start(self) -> "FakeLLMServer":
+        self._process = subprocess.Popen(
+            [
+                sys.executable, "-m", "benchmarks.fake_llm_server",
+                "--port", str(self.port),
+                "--latency-ms", str(self.latency_ms),
+                "--token-ms", str(self.token_ms),
+                "--latency-dist", self.latency_dist,
+                "--latency-spread-ms", str(self.latency_spread_ms),
+                "--latency-sigma", str(self.latency_sigma),
+                "--error-rate", str(self.error_rate),
+                "--error-statuses", ",".join(str(status) for status in self.error_statuses),
+                "--rate-limit-rps", str(self.rate_limit_rps),
+                "--rate-limit-burst", str(self.rate_limit_burst),
+                "--prefill-ms-per-1k", str(self.prefill_ms_per_1k),
+                "--seed", str(self.seed),
+                "--quiet"
+            ]
+            + (["--generation-delay"] if self.generation_delay else [])
+            + (["--prefix-cache"] if self.prefix_cache else []),
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.2):
+                    return self
+            except OSError:
+                time.sleep(0.05)
+
+        self.stop()
+        raise RuntimeError(f"Fake LLM server did not start on port {self.port}")
+
+    def stop(self):
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            self._process.wait(timeout=5)
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI/Groq-compatible LLM server")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-spread-ms", type=float, default=0.0, help="uniform: ± spread around --latency-ms")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="lognormal shape")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-statuses", default="503", help="comma-separated HTTP statuses for injected errors")
+    parser.add_argument("--generation-delay", action="store_true", help="non-streamed responses also wait --token-ms per word")
+    parser.add_argument("--rate-limit-rps", type=float, default=0.0, help="requests per second before 429s (0 = unlimited)")
+    parser.add_argument("--rate-limit-burst", type=int, default=0, help="rate limit bucket size (default: one second)")
+    parser.add_argument("--prefill-ms-per-1k", type=float, default=0.0, help="extra latency per 1000 uncached prompt tokens")
+    parser.add_argument("--prefix-cache", action="store_true", help="serve repeated leading messages from a prefix cache")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    if not args.quiet:
+        print(f"🧪 Fake LLM provider on http://127.0.0.1:{args.port}/v1 ({args.latency_ms}ms {args.latency_dist} latency)")
+    uvicorn.run(
+        create_app(
+            args.latency_ms,
+            args.token_ms,
+            latency_dist=args.latency_dist,
+            latency_spread_ms=args.latency_spread_ms,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+            error_statuses=[int(status) for status in args.error_statuses.split(",") if status],
+            generation_delay=args.generation_delay,
+            rate_limit_rps=args.rate_limit_rps,
+            rate_limit_burst=args.rate_limit_burst,
+            prefill_ms_per_1k=args.prefill_ms_per_1k,
+            prefix_cache=args.prefix_cache,
+            seed=args.seed
+        ),
+        host="127.0.0.1",
+        port=args.port,
+        log_level="warning",
+        backlog=4096
+    )
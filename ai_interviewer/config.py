@@ -9,6 +9,27 @@ REDIS_PORT_STR = os.getenv("REDIS_PORT", "6379")
 REDIS_PORT = int(REDIS_PORT_STR) if REDIS_PORT_STR and REDIS_PORT_STR.strip() else 6379
 REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+# How long a request waits for a free pooled connection before failing
+REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "5"))
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "86400"))
+# Session state serialization: "orjson" (default), "msgpack" or "json"
+STATE_CODEC = os.getenv("STATE_CODEC", "orjson")
+# zstd-compress state payloads at least this large (0 = never)
+STATE_COMPRESS_THRESHOLD_BYTES = int(os.getenv("STATE_COMPRESS_THRESHOLD_BYTES", "0"))
+
+# ================================
+# Interview Database (storage/db_client.py)
+# ================================
+# e.g. sqlite+aiosqlite:///./interviews.db or postgresql+asyncpg://user:pass@db:5432/transfinitt_db
+# Empty = in-memory (single process only)
+INTERVIEW_DATABASE_URL = os.getenv("INTERVIEW_DATABASE_URL", "")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# Analyzed responses from concurrent requests are inserted together
+DB_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "50"))
+DB_BATCH_DELAY_MS = float(os.getenv("DB_BATCH_DELAY_MS", "5"))
+DB_CREATE_TABLES = os.getenv("DB_CREATE_TABLES", "true").lower() == "true"
 
 # ================================
 # AI API Keys
@@ -16,9 +37,37 @@ REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 CEREBRAS_API_KEY = os.getenv("CEREBRAS_API_KEY", "")
 
-MAX_QUESTIONS = 15
+MAX_QUESTIONS = int(os.getenv("MAX_QUESTIONS", "15"))
 MAX_CONSECUTIVE_PROBES = 3  
 
+# Prompt context (utils/context_window.py), in estimated tokens: the last
+# CONTEXT_RECENT_MESSAGES messages verbatim plus a rolling summary of older ones
+CONTEXT_RECENT_MESSAGES = int(os.getenv("CONTEXT_RECENT_MESSAGES", "6"))
+CONTEXT_MAX_TOKENS = int(os.getenv("CONTEXT_MAX_TOKENS", "600"))
+CONTEXT_SUMMARY_MAX_TOKENS = int(os.getenv("CONTEXT_SUMMARY_MAX_TOKENS", "300"))
+# Budgets for the final summary / key themes prompts
+SUMMARY_CONTEXT_MAX_TOKENS = int(os.getenv("SUMMARY_CONTEXT_MAX_TOKENS", "1200"))
+SUMMARY_INSIGHTS_MAX_TOKENS = int(os.getenv("SUMMARY_INSIGHTS_MAX_TOKENS", "400"))
+
+# Insights shown to the question prompts: the most relevant to the current
+# thread from the session's deduplicated insight index (utils/insight_index.py)
+INSIGHT_CONTEXT_SIZE = int(os.getenv("INSIGHT_CONTEXT_SIZE", "5"))
+# Sessions whose insight index is kept in memory per process (rebuilt from the
+# persisted insight list on a miss)
+INSIGHT_INDEX_CACHE_SESSIONS = int(os.getenv("INSIGHT_INDEX_CACHE_SESSIONS", "1000"))
+
+# Early termination phrase sets (utils/early_termination.py)
+TERMINATION_LOCALE = os.getenv("TERMINATION_LOCALE", "en")
+# Optional JSON file: {"<template_id or locale>": {"explicit_exit": [...], "exclusions": [...]}}
+TERMINATION_PHRASES_FILE = os.getenv("TERMINATION_PHRASES_FILE", "")
+
+# Agent prompt variants (llm/prompts.py), JSON:
+# {"<prompt>": {"<template_id or locale>": {"version": "...", "system": "...", "user": "..."}}}
+PROMPT_VARIANTS_FILE = os.getenv("PROMPT_VARIANTS_FILE", "")
+
+# Local sentiment engine (utils/sentiment.py): "lexicon" or "textblob"
+SENTIMENT_ENGINE = os.getenv("SENTIMENT_ENGINE", "lexicon")
+
 # ================================
 # Backend Service URL
 # ================================
@@ -28,6 +77,143 @@ GROQ_FAST_MODEL = os.getenv("GROQ_FAST_MODEL", "llama-3.3-70b-versatile")
 GROQ_QUALITY_MODEL = os.getenv("GROQ_QUALITY_MODEL", "llama-3.3-70b-versatile")
 ANALYSIS_MODEL = GROQ_QUALITY_MODEL
 
+# ================================
+# Shared LLM Client
+# ================================
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "200"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "50"))
+
+# ================================
+# LLM Routing (llm/router.py)
+# ================================
+# Groq is used when its key/URL is set (or when no other provider is);
+# Cerebras when CEREBRAS_API_KEY or CEREBRAS_BASE_URL is set
+GROQ_ENABLED = bool(GROQ_API_KEY or os.getenv("GROQ_BASE_URL"))
+CEREBRAS_BASE_URL = os.getenv("CEREBRAS_BASE_URL", "https://api.cerebras.ai/v1")
+CEREBRAS_ENABLED = bool(CEREBRAS_API_KEY or os.getenv("CEREBRAS_BASE_URL"))
+CEREBRAS_FAST_MODEL = os.getenv("CEREBRAS_FAST_MODEL", "llama3.1-8b")
+CEREBRAS_QUALITY_MODEL = os.getenv("CEREBRAS_QUALITY_MODEL", "llama-3.3-70b")
+# Providers per agent role: "fast" (relevance check, questions, probes) and
+# "quality" (deep analysis, fused turn analysis, summary)
+LLM_ROUTE_FAST = os.getenv("LLM_ROUTE_FAST", "groq,cerebras")
+LLM_ROUTE_QUALITY = os.getenv("LLM_ROUTE_QUALITY", "groq,cerebras")
+# Try the provider with the lowest latency EWMA first instead of the route order
+LLM_ROUTE_BY_LATENCY = os.getenv("LLM_ROUTE_BY_LATENCY", "true").lower() == "true"
+LLM_LATENCY_EWMA_ALPHA = float(os.getenv("LLM_LATENCY_EWMA_ALPHA", "0.2"))
+# Circuit breaker: skip a provider for the cooldown after N consecutive failures
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_COOLDOWN_SECONDS = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+# Hedged requests: start the next provider when the first runs past its p90
+# latency (at least LLM_HEDGE_MIN_DELAY_MS, after LLM_HEDGE_MIN_SAMPLES calls)
+LLM_HEDGE = os.getenv("LLM_HEDGE", "true").lower() == "true"
+LLM_HEDGE_MIN_DELAY_MS = float(os.getenv("LLM_HEDGE_MIN_DELAY_MS", "100"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+# Completion cache for deterministic prompts (relevance check, summary, themes)
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2048"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+LLM_CACHE_REDIS = os.getenv("LLM_CACHE_REDIS", "false").lower() == "true"
+
+# ================================
+# LLM Rate Limits (llm/scheduler.py)
+# ================================
+# Per-provider budgets, 0 = no client-side limit (429s are still backed off)
+GROQ_REQUESTS_PER_MINUTE = int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "0"))
+GROQ_TOKENS_PER_MINUTE = int(os.getenv("GROQ_TOKENS_PER_MINUTE", "0"))
+CEREBRAS_REQUESTS_PER_MINUTE = int(os.getenv("CEREBRAS_REQUESTS_PER_MINUTE", "0"))
+CEREBRAS_TOKENS_PER_MINUTE = int(os.getenv("CEREBRAS_TOKENS_PER_MINUTE", "0"))
+# Bucket size in seconds of budget (60 = a whole minute's budget may go out at once)
+LLM_RATE_BURST_SECONDS = float(os.getenv("LLM_RATE_BURST_SECONDS", "60"))
+# Longest a call may queue for budget before failing over to the next provider
+LLM_SCHEDULER_MAX_WAIT_SECONDS = float(os.getenv("LLM_SCHEDULER_MAX_WAIT_SECONDS", "20"))
+# Retries after a 429, waiting Retry-After (or exponential backoff from the base)
+LLM_RATE_LIMIT_RETRIES = int(os.getenv("LLM_RATE_LIMIT_RETRIES", "3"))
+LLM_RATE_LIMIT_BACKOFF_SECONDS = float(os.getenv("LLM_RATE_LIMIT_BACKOFF_SECONDS", "1.0"))
+
+# ================================
+# Workflow Modes
+# ================================
+# Run deep analysis concurrently with the probe decision (result discarded on probe).
+# Saves about one relevance call on turns the fast path leaves to the LLM and nothing
+# on the ones it decides locally; costs a wasted deep analysis call on probed turns
+SPECULATIVE_DEEP_ANALYSIS = os.getenv("SPECULATIVE_DEEP_ANALYSIS", "false").lower() == "true"
+# One structured LLM call for relevance + deep analysis + next question (multi-call fallback)
+FUSED_TURN_ANALYSIS = os.getenv("FUSED_TURN_ANALYSIS", "false").lower() == "true"
+# Decide confidently on/off-topic answers locally, only ambiguous ones go to the LLM
+RELEVANCE_FAST_PATH = os.getenv("RELEVANCE_FAST_PATH", "true").lower() == "true"
+
+# ================================
+# Background Jobs (jobs/queue.py)
+# ================================
+# "memory" (asyncio workers in this process) or "redis" (stream shared by all instances)
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "memory")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BACKOFF_SECONDS = float(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "1"))
+JOB_RETRY_BACKOFF_MAX_SECONDS = float(os.getenv("JOB_RETRY_BACKOFF_MAX_SECONDS", "30"))
+JOB_RESULT_TTL_SECONDS = int(os.getenv("JOB_RESULT_TTL_SECONDS", "3600"))
+JOB_VISIBILITY_TIMEOUT_SECONDS = float(os.getenv("JOB_VISIBILITY_TIMEOUT_SECONDS", "300"))
+JOB_CALLBACK_TIMEOUT_SECONDS = float(os.getenv("JOB_CALLBACK_TIMEOUT_SECONDS", "10"))
+# Base URLs (comma-separated) that /agent/end callback_url may point under. Callbacks
+# carry the transcript and summary: with none configured, callback_url is refused
+JOB_CALLBACK_ALLOWED_URLS = [
+    url.strip() for url in os.getenv("JOB_CALLBACK_ALLOWED_URLS", "").split(",") if url.strip()
+]
+JOB_STREAM_KEY = os.getenv("JOB_STREAM_KEY", "interview_jobs")
+# How long /agent/end waits for the summary job before answering with summary_status "pending"
+SUMMARY_JOB_WAIT_SECONDS = float(os.getenv("SUMMARY_JOB_WAIT_SECONDS", "0"))
+
+# ================================
+# Chat Single-Flight (storage/single_flight.py)
+# ================================
+# Per-session lock for /agent/chat: "redis" (shared by all instances, falls
+# back to in-process while Redis is unreachable) or "memory" (single instance)
+SESSION_LOCK_BACKEND = os.getenv("SESSION_LOCK_BACKEND", "redis")
+# The lock expires if its owner dies; keep it above the slowest turn
+SESSION_LOCK_TTL_SECONDS = float(os.getenv("SESSION_LOCK_TTL_SECONDS", "60"))
+# How long a request waits for the session lock before answering 409
+SESSION_LOCK_WAIT_SECONDS = float(os.getenv("SESSION_LOCK_WAIT_SECONDS", "30"))
+# How long a response is replayed for a repeated idempotency key
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "3600"))
+
+# ================================
+# Template Analytics (storage/template_analytics.py)
+# ================================
+# "memory" (this process only) or "redis" (aggregates shared by all instances)
+TEMPLATE_ANALYTICS_BACKEND = os.getenv("TEMPLATE_ANALYTICS_BACKEND", "memory")
+
+# ================================
+# Draft Prefetch (graph/draft_prefetch.py)
+# ================================
+# Run the turn's LLM work on drafts posted to /agent/chat/draft while the respondent types.
+# Off by default: every speculation costs a turn's LLM calls, and missed ones are
+# wasted spend and rate-limit budget (bench_draft_prefetch: drafts at 50%/80% typed
+# took provider calls per turn from 2.64 to 6.06 for a 50% hit rate)
+DRAFT_PREFETCH = os.getenv("DRAFT_PREFETCH", "false").lower() == "true"
+# Word-level similarity (0-1) between draft and sent message for the prefetched turn to be used
+DRAFT_MATCH_RATIO = float(os.getenv("DRAFT_MATCH_RATIO", "0.85"))
+DRAFT_MIN_WORDS = int(os.getenv("DRAFT_MIN_WORDS", "3"))
+# Speculations started per session and question (each costs the turn's LLM calls)
+DRAFT_MAX_PER_TURN = int(os.getenv("DRAFT_MAX_PER_TURN", "3"))
+DRAFT_MAX_SESSIONS = int(os.getenv("DRAFT_MAX_SESSIONS", "1000"))
+DRAFT_TTL_SECONDS = float(os.getenv("DRAFT_TTL_SECONDS", "120"))
+
+# ================================
+# Observability (utils/logger.py, utils/metrics.py, utils/tracing.py)
+# ================================
+# DEBUG / INFO / WARNING / ERROR; per-turn workflow logs are INFO/DEBUG, so the
+# default keeps them off the request path
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
+# "text" or "json" (one object per line, extra fields included)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+# Write log records from a background thread instead of the event loop
+LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() == "true"
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# OpenTelemetry spans for graph nodes and LLM calls (needs opentelemetry-api)
+OTEL_TRACING = os.getenv("OTEL_TRACING", "false").lower() == "true"
+
 # ================================
 # Redis Connection String
 # ================================
@@ -83,7 +269,7 @@ class AIConfig:
     
     @classmethod
     def get_active_ai_provider(cls) -> str:
-        """Return the active AI provider"""
+        """Return the preferred AI provider (llm/router.py routes between all configured ones)"""
         if cls.groq_api_key:
             return "groq"
         elif cls.cerebras_api_key:
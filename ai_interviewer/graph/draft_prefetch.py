@@ -0,0 +1,224 @@
+"""
+Draft Prefetch - speculative turn while the respondent is still typing
+The respondent UI posts the answer being typed to /agent/chat/draft, and the
+turn's LLM work (probe decision ‖ deep analysis, then the redirect probe or
+next question - workflow.speculate_turn) starts on the draft in the
+background. When the message is sent and its words are close enough to the
+draft (DRAFT_MATCH_RATIO), the workflow commits the prefetched result
+(prefetched_turn node) instead of calling the LLM; otherwise the speculation
+is cancelled, or discarded if it already finished.
+
+Bounded per session: one speculation at a time, replaced only when the draft
+changed beyond the match ratio, at most DRAFT_MAX_PER_TURN per question.
+Speculations live in this process, so a session's drafts and messages must
+reach the same instance (a message elsewhere simply runs the normal turn).
+"""
+
+import asyncio
+import time
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
+
+import config
+from graph.workflow import speculate_turn
+from utils.logger import get_logger
+from utils.metrics import metrics
+from utils.phrase_matcher import tokenize
+
+logger = get_logger("graph.draft_prefetch")
+
+DRAFTS = metrics.counter(
+    "draft_prefetch_drafts_total", "Drafts posted to /agent/chat/draft", ["status"]
+)
+TURNS = metrics.counter(
+    "draft_prefetch_turns_total", "Chat turns by draft prefetch outcome", ["result"]
+)
+SAVED = metrics.histogram(
+    "draft_prefetch_saved_seconds", "Turn latency saved by a prefetched turn"
+)
+
+
+def draft_similarity(draft_words: List[str], message_words: List[str]) -> float:
+    """Word-level similarity (0-1); a draft missing the last few words of the message still scores high."""
+    if not draft_words or not message_words:
+        return 0.0
+    return SequenceMatcher(None, draft_words, message_words, autojunk=False).ratio()
+
+
+def turn_of(state: Dict[str, Any]) -> Tuple[int, Optional[str]]:
+    """Identifies the question being answered, so a speculation is never used for a later turn."""
+    return len(state["conversation_history"]), state.get("current_question")
+
+
+class _Speculation:
+    """One speculate_turn task and the draft it runs on"""
+
+    def __init__(self, draft_words: List[str]):
+        self.draft_words = draft_words
+        self.task: Optional[asyncio.Task] = None
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+
+class _SessionDrafts:
+    """Speculation state of one session for the current question"""
+
+    def __init__(self, turn: Tuple[int, Optional[str]]):
+        self.turn = turn
+        self.started = 0
+        self.speculation: Optional[_Speculation] = None
+
+    def cancel(self) -> bool:
+        speculation = self.speculation
+        self.speculation = None
+        if speculation and not speculation.task.done():
+            speculation.task.cancel()
+            return True
+        return False
+
+
+class DraftPrefetcher:
+    """Per-session speculative turns started from drafts"""
+
+    def __init__(
+        self,
+        match_ratio: Optional[float] = None,
+        min_words: Optional[int] = None,
+        max_per_turn: Optional[int] = None,
+        max_sessions: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.match_ratio = config.DRAFT_MATCH_RATIO if match_ratio is None else match_ratio
+        self.min_words = config.DRAFT_MIN_WORDS if min_words is None else min_words
+        self.max_per_turn = config.DRAFT_MAX_PER_TURN if max_per_turn is None else max_per_turn
+        self.max_sessions = max_sessions or config.DRAFT_MAX_SESSIONS
+        self.ttl_seconds = ttl_seconds or config.DRAFT_TTL_SECONDS
+        self.enabled = config.DRAFT_PREFETCH
+        self._sessions: Dict[str, _SessionDrafts] = {}
+        self.counters = {
+            "drafts": 0, "speculations": 0, "cancelled": 0,
+            "hits": 0, "misses": 0, "stale": 0, "errors": 0, "no_draft": 0
+        }
+        self.saved_seconds = 0.0
+
+    def submit(self, session_id: str, state: Dict[str, Any], draft: str) -> str:
+        """
+        Start (or keep) a speculation for the draft. Returns the status:
+        started, unchanged (the running one still matches), limit (per-turn
+        budget spent), too_short, or skipped (disabled / interview over).
+        """
+        self.counters["drafts"] += 1
+        status = self._submit(session_id, state, draft)
+        DRAFTS.inc(status=status)
+        return status
+
+    def _submit(self, session_id: str, state: Dict[str, Any], draft: str) -> str:
+        if not self.enabled or state.get("is_complete"):
+            return "skipped"
+        words = tokenize(draft)
+        if len(words) < self.min_words:
+            return "too_short"
+
+        turn = turn_of(state)
+        entry = self._sessions.pop(session_id, None)
+        if entry is None or entry.turn != turn:
+            if entry is not None and entry.cancel():
+                self.counters["cancelled"] += 1
+            entry = _SessionDrafts(turn)
+        # Most recently drafted sessions last, for eviction
+        self._sessions[session_id] = entry
+        self._evict()
+
+        current = entry.speculation
+        if current and draft_similarity(current.draft_words, words) >= self.match_ratio:
+            return "unchanged"
+        if entry.started >= self.max_per_turn:
+            return "limit"
+
+        if entry.cancel():
+            self.counters["cancelled"] += 1
+        speculation = entry.speculation = _Speculation(words)
+        speculation.task = asyncio.create_task(self._speculate(speculation, state, draft))
+        entry.started += 1
+        self.counters["speculations"] += 1
+        logger.debug("🔮 Speculating on draft (%d words)", len(words), extra={"session_id": session_id})
+        return "started"
+
+    async def _speculate(self, speculation: _Speculation, state: Dict[str, Any], draft: str) -> Optional[Dict]:
+        try:
+            return await speculate_turn(dict(state), draft)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # The real turn recomputes; nothing to report to the respondent
+            logger.debug("⚠️ Draft speculation failed: %s", e)
+            return None
+        finally:
+            speculation.finished = time.monotonic()
+
+    def _evict(self):
+        while len(self._sessions) > self.max_sessions:
+            oldest = next(iter(self._sessions))
+            if self._sessions.pop(oldest).cancel():
+                self.counters["cancelled"] += 1
+
+    async def claim(self, session_id: str, state: Dict[str, Any], message: str) -> Optional[Dict]:
+        """
+        The prefetched turn for the message being processed, or None. A
+        speculation still running is awaited when it matches and cancelled
+        when it doesn't; either way the session's speculation is used up.
+        """
+        entry = self._sessions.pop(session_id, None)
+        speculation = entry.speculation if entry else None
+        if speculation is None:
+            return self._outcome("no_draft")
+
+        expired = time.monotonic() - speculation.started > self.ttl_seconds
+        if entry.turn != turn_of(state) or expired:
+            outcome = "stale"
+        elif draft_similarity(speculation.draft_words, tokenize(message)) < self.match_ratio:
+            outcome = "misses"
+        else:
+            outcome = None
+        if outcome is not None:
+            if entry.cancel():
+                self.counters["cancelled"] += 1
+            return self._outcome(outcome)
+
+        waited_from = time.monotonic()
+        result = await speculation.task
+        if result is None:
+            return self._outcome("errors")
+
+        # Speculation time the turn didn't have to wait for
+        saved = max(0.0, (speculation.finished - speculation.started) - (time.monotonic() - waited_from))
+        self.saved_seconds += saved
+        SAVED.observe(saved)
+        logger.debug("⚡ Prefetched turn used, %.0f ms saved", saved * 1000, extra={"session_id": session_id})
+        return self._outcome("hits", result)
+
+    def _outcome(self, counter: str, result: Optional[Dict] = None) -> Optional[Dict]:
+        self.counters[counter] += 1
+        TURNS.inc(result=counter)
+        return result
+
+    def discard(self, session_id: str):
+        """Drop the session's speculation (interview ended)."""
+        entry = self._sessions.pop(session_id, None)
+        if entry is not None and entry.cancel():
+            self.counters["cancelled"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        # Hit rate over turns that had a speculation to use
+        speculated = sum(self.counters[key] for key in ("hits", "misses", "stale", "errors"))
+        hits = self.counters["hits"]
+        return {
+            "sessions": len(self._sessions),
+            **self.counters,
+            "hit_rate": round(hits / speculated, 4) if speculated else 0.0,
+            "saved_seconds_total": round(self.saved_seconds, 3),
+            "saved_seconds_per_hit": round(self.saved_seconds / hits, 3) if hits else 0.0
+        }
+
+# Singleton instance
+draft_prefetch = DraftPrefetcher()
@@ -1,13 +1,27 @@
+import asyncio
+import contextlib
+import contextvars
 from langgraph.graph import StateGraph, END
-from typing import TypedDict, Optional, List, Dict
+from langgraph.config import get_stream_writer
+from langchain_core.runnables import RunnableConfig
+from typing import Any, TypedDict, Optional, List, Dict, Callable, Iterator, Tuple
+import config
 from models.schemas import AnalyzedResponse, ResponseQuality
 from agents.analyzer import analyzer, DeepAnalysis
 from agents.probe import probe_agent
 from agents.interviewer import interviewer_agent
 from agents.summary import summary_agent
 from agents.probe_decision import probe_decision_agent
+from agents.turn_analyzer import turn_analyzer_agent
 from storage.db_client import db_client
+from storage.template_analytics import interview_outcome, template_analytics
 from utils.early_termination import early_termination_detector
+from utils.context_window import context_window
+from utils.insight_index import add_insights, build_index, insight_index_cache, top_insights
+from utils.logger import get_logger
+from utils.tracing import traced_node
+
+logger = get_logger("graph.workflow")
 
 # ========================================================================
 # LANGGRAPH STATE DEFINITION
@@ -20,6 +34,7 @@ class InterviewGraphState(TypedDict):
     research_topic: str
     
     conversation_history: List[Dict[str, str]]
+    context_summary: Optional[Dict]  # rolling summary of messages older than the prompt window
     user_response: str
     current_question: Optional[str]
     
@@ -38,19 +53,119 @@ class InterviewGraphState(TypedDict):
     
     waiting_for_clarification: bool
     accumulated_insights: List[str]
+    session_insights: List[str]  # deduplicated insights, stored append-only; indexed by utils/insight_index.py
+    dismissive_streak: Optional[int]  # consecutive dismissive answers, so history isn't rescanned
     
     probe_decision: Optional[Dict]
+    prefetched_question: Optional[str]  # next question/probe drafted by the fused turn analysis
+    prefetched_turn: Optional[Dict]  # speculate_turn() result on the respondent's draft (graph/draft_prefetch.py)
     
+    summary_progress: Optional[Dict]  # running summary aggregates (SummaryAgent.record_response)
     summary: Optional[Dict]
 
+def create_initial_state(
+    session_id: str,
+    template_id: str,
+    research_topic: str,
+    max_questions: int = config.MAX_QUESTIONS
+) -> InterviewGraphState:
+    """Fresh graph state for a new interview, before the first question."""
+    return {
+        "session_id": session_id,
+        "respondent_id": session_id,
+        "template_id": template_id,
+        "research_topic": research_topic,
+        "conversation_history": [],
+        "context_summary": None,
+        "user_response": "",
+        "current_question": None,
+        "analyzed_response": None,
+        "deep_analysis": None,
+        "is_probe": False,
+        "is_complete": False,
+        "should_terminate_early": False,
+        "termination_reason": None,
+        "probe_count": 0,
+        "consecutive_probes": 0,  # NEW: Track consecutive probes
+        "question_count": 0,
+        "total_exchanges": 0,
+        "max_questions": max_questions,
+        "waiting_for_clarification": False,
+        "accumulated_insights": [],
+        "session_insights": [],
+        "dismissive_streak": 0,
+        "probe_decision": None,
+        "prefetched_question": None,
+        "prefetched_turn": None,
+        "summary_progress": summary_agent.empty_progress(),
+        "summary": None
+    }
+
+def create_started_state(session_id: str, template_id: str, research_topic: str) -> InterviewGraphState:
+    """Graph state for a new interview with the opening question already asked."""
+    state = create_initial_state(session_id, template_id, research_topic)
+    first_question = f"Hi! I'm really excited to learn about your experiences. {research_topic}"
+    state["conversation_history"].append({
+        "role": "assistant",
+        "content": first_question
+    })
+    state["current_question"] = first_question
+    state["question_count"] = 1
+    return state
+
+# ========================================================================
+# STORES
+# ========================================================================
+
+_stores: contextvars.ContextVar[Optional[Tuple[Any, Any]]] = contextvars.ContextVar("workflow_stores", default=None)
+
+@contextlib.contextmanager
+def workflow_stores(db: Any, analytics: Any) -> Iterator[None]:
+    """
+    Run the nodes inside the block, including tasks it starts (they inherit
+    the context), against these stores instead of the configured `db_client`
+    and `template_analytics`.
+    """
+    token = _stores.set((db, analytics))
+    try:
+        yield
+    finally:
+        _stores.reset(token)
+
+def _db() -> Any:
+    stores = _stores.get()
+    return stores[0] if stores else db_client
+
+def _analytics() -> Any:
+    stores = _stores.get()
+    return stores[1] if stores else template_analytics
+
 # ========================================================================
 # NODE IMPLEMENTATIONS
 # ========================================================================
 
+def _token_writers(
+    config: Optional[RunnableConfig]
+) -> Tuple[Optional[Callable[[str], None]], Optional[Callable[[str], None]]]:
+    """
+    (per-token, replace) callbacks for question generation, only when the
+    graph is run with `{"configurable": {"stream_tokens": True}}` and custom
+    stream mode. A replace event carries the whole question, superseding the
+    tokens streamed before it.
+    """
+    if not config or not config.get("configurable", {}).get("stream_tokens"):
+        return None, None
+    
+    writer = get_stream_writer()
+    return (
+        lambda token: writer({"type": "token", "content": token}),
+        lambda text: writer({"type": "replace", "content": text})
+    )
+
 async def analyze_response_node(state: InterviewGraphState) -> Dict:
     """Step 1: Fast analysis with early termination check."""
     user_response = state['user_response']
-    print(f"🔍 Analyzing response: {user_response[:80]}...")
+    logger.debug("🔍 Analyzing response: %.80s", user_response, extra={"session_id": state["session_id"]})
     
     # Add user response to conversation history
     new_history = state["conversation_history"].copy()
@@ -64,144 +179,405 @@ async def analyze_response_node(state: InterviewGraphState) -> Dict:
     analyzed.session_id = state["session_id"]
     analyzed.respondent_id = state["respondent_id"]
     
-    print(f"  📊 Quality: {analyzed.quality.value} | Sentiment: {analyzed.sentiment.value} | Words: {analyzed.word_count}")
+    logger.debug(
+        "📊 Quality: %s | Sentiment: %s | Words: %d",
+        analyzed.quality.value, analyzed.sentiment.value, analyzed.word_count
+    )
+    # Keyed on the answer's position, so a rerun of this turn (409 + resend) counts once
+    await _analytics().record_response(
+        state["template_id"], analyzed.sentiment.value, analyzed.sentiment_score, analyzed.word_count,
+        event_id=f"{state['session_id']}:response:{len(new_history)}"
+    )
     
     # Check for early termination
+    dismissive_streak = early_termination_detector.next_dismissive_streak(
+        user_response,
+        state.get("dismissive_streak"),
+        new_history,
+        state["template_id"]
+    )
     should_exit, exit_reason = early_termination_detector.should_terminate(
         user_response,
         analyzed.sentiment.value,
         new_history,
-        state.get("consecutive_probes", 0)  # Use consecutive probes
+        state.get("consecutive_probes", 0),  # Use consecutive probes
+        dismissive_streak=dismissive_streak,
+        template_id=state["template_id"]
     )
     
     current_exchanges = state.get("total_exchanges", 0)
     
+    # Fold messages that scrolled out of the prompt window (incremental)
+    context_summary = context_window.fold(state.get("context_summary"), new_history)
+    
     if should_exit:
-        print(f"🛑 EARLY TERMINATION: {exit_reason}")
+        logger.info("🛑 EARLY TERMINATION: %s", exit_reason, extra={"session_id": state["session_id"]})
         
         return {
             "analyzed_response": analyzed,
             "conversation_history": new_history,
+            "context_summary": context_summary,
             "should_terminate_early": True,
             "termination_reason": exit_reason,
             "is_complete": True,
             "total_exchanges": current_exchanges + 1,
+            "dismissive_streak": dismissive_streak,
             "waiting_for_clarification": False,
             "probe_decision": None
         }
     
-    print(f"  ✅ Continuing interview")
-    
     return {
         "analyzed_response": analyzed,
         "conversation_history": new_history,
+        "context_summary": context_summary,
         "should_terminate_early": False,
         "termination_reason": None,
         "total_exchanges": current_exchanges + 1,
+        "dismissive_streak": dismissive_streak,
         "waiting_for_clarification": False
     }
 
+def _last_question(state: InterviewGraphState) -> str:
+    """The assistant question the current user response answers."""
+    for msg in reversed(state["conversation_history"][:-1]):
+        if msg["role"] == "assistant":
+            return msg["content"]
+    
+    return f"about {state['research_topic']}"
+
 async def probe_decision_node(state: InterviewGraphState) -> Dict:
     """
     Step 2: Intelligent probe decision
     Uses AI to determine if response is TRULY irrelevant/off-topic
     """
     if state.get("should_terminate_early"):
-        print(f"  ⏭️ Skipping probe decision - terminating")
+        logger.debug("⏭️ Skipping probe decision - terminating")
         return {"probe_decision": {"should_probe": False, "reason": "terminating", "probe_type": "none"}}
     
     analyzed = state["analyzed_response"]
     
     # Get the question that was asked
-    last_question = None
-    for msg in reversed(state["conversation_history"][:-1]):
-        if msg["role"] == "assistant":
-            last_question = msg["content"]
-            break
-    
-    if not last_question:
-        last_question = f"about {state['research_topic']}"
-    
-    print(f"🤔 INTELLIGENT PROBE DECISION...")
-    print(f"   Question: {last_question[:60]}...")
-    print(f"   Response: {state['user_response'][:60]}...")
+    last_question = _last_question(state)
     
     # Use intelligent probe decision agent
     probe_decision = await probe_decision_agent.should_probe(
         question_asked=last_question,
         user_response=state["user_response"],
         research_topic=state["research_topic"],
-        response_quality=analyzed.quality.value
+        response_quality=analyzed.quality.value,
+        template_id=state["template_id"]
     )
     
-    print(f"   🎯 Decision: {'PROBE' if probe_decision['should_probe'] else 'NO PROBE'}")
-    print(f"   📝 Reason: {probe_decision['reason']}")
+    logger.debug(
+        "🎯 Decision: %s | Reason: %s | Question: %.60s",
+        "PROBE" if probe_decision["should_probe"] else "NO PROBE",
+        probe_decision["reason"], last_question
+    )
     
     return {
         "probe_decision": probe_decision
     }
 
+def _skipped_deep_analysis() -> DeepAnalysis:
+    """Placeholder deep analysis used when the response will be probed."""
+    return DeepAnalysis(
+        key_insights=[],
+        emotional_tone="neutral",
+        needs_follow_up=False,
+        suggested_follow_up_topic=""
+    )
+
+def _recent_context(state: InterviewGraphState) -> str:
+    """Rolling summary + last few exchanges, token-capped, for analysis prompts."""
+    return context_window.render(state["conversation_history"], state.get("context_summary"))
+
+async def _commit_deep_analysis(state: InterviewGraphState, deep_analysis_result: DeepAnalysis) -> Dict:
+    """Merge deep analysis insights into the analyzed response and persist it."""
+    logger.debug("💡 Insights: %d", len(deep_analysis_result.key_insights))
+    
+    analyzed = state["analyzed_response"]
+    
+    # Add insights, plus any accumulated during previous probing
+    # (which may already be on this response)
+    accumulated = state.get("accumulated_insights", [])
+    analyzed.key_insights = list(dict.fromkeys(
+        analyzed.key_insights + deep_analysis_result.key_insights + accumulated
+    ))
+    
+    index, added = add_insights(await _insight_index(state), analyzed.key_insights)
+    insight_index_cache.put(state["session_id"], index)
+    
+    # Save to database
+    await _db().save_analyzed_response(
+        analyzed,
+        state["session_id"],
+        state["respondent_id"]
+    )
+    
+    update = {
+        "deep_analysis": deep_analysis_result,
+        "analyzed_response": analyzed,
+        "accumulated_insights": [],
+        "session_insights": index["insights"]
+    }
+    
+    # Keep the summary aggregates current so completion only needs the LLM calls
+    # (sessions started before this existed have none and are summarized from the DB)
+    if state.get("summary_progress") is not None:
+        update["summary_progress"] = summary_agent.record_response(
+            state["summary_progress"],
+            analyzed,
+            added,
+            deep_analysis_result.suggested_follow_up_topic
+        )
+    
+    return update
+
+async def _session_insights(state: InterviewGraphState) -> List[str]:
+    """Insights collected so far, for sessions saved before session_insights existed."""
+    progress = state.get("summary_progress")
+    if progress is not None:
+        # Kept with the summary aggregates before session_insights existed
+        return progress.get("insights", [])
+    
+    return await _db().get_all_insights_for_session(state["session_id"])
+
+async def _insight_index(state: InterviewGraphState) -> Dict:
+    """Index of the session's insights, kept per process and extended as they are added."""
+    insights = state.get("session_insights")
+    if not insights:
+        return build_index(await _session_insights(state))
+    return insight_index_cache.get(state["session_id"], insights)
+
+async def _context_insights(state: InterviewGraphState, thread: str, index: Optional[Dict] = None) -> List[str]:
+    """The INSIGHT_CONTEXT_SIZE insights most relevant to the current thread."""
+    return top_insights(index or await _insight_index(state), thread)
+
 async def deep_analysis_node(state: InterviewGraphState) -> Dict:
     """Step 3: Deep analysis - for relevant, good quality responses."""
     if state.get("should_terminate_early"):
-        print(f"  ⏭️ Skipping deep analysis - terminating")
+        logger.debug("⏭️ Skipping deep analysis - terminating")
         return {"deep_analysis": None}
     
     probe_decision = state.get("probe_decision", {})
     
     # Skip deep analysis if we're going to probe
     if probe_decision.get("should_probe"):
-        print(f"  ⚡ Skipping deep analysis - response is irrelevant, will probe")
-        
-        minimal_deep = DeepAnalysis(
-            key_insights=[],
-            emotional_tone="neutral",
-            needs_follow_up=False,
-            suggested_follow_up_topic=""
-        )
-        
-        return {"deep_analysis": minimal_deep}
+        logger.debug("⚡ Skipping deep analysis - response is irrelevant, will probe")
+        return {"deep_analysis": _skipped_deep_analysis()}
     
     # Deep analysis for RELEVANT responses (even if short)
-    print(f"🧠 Deep analysis for relevant response...")
-    
-    recent_context = state["conversation_history"][-6:]
-    context_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in recent_context])
+    logger.debug("🧠 Deep analysis for relevant response...")
     
     deep_analysis_result = await analyzer.deep_analyze(
         state["user_response"],
-        context_str
+        _recent_context(state),
+        state["template_id"]
     )
     
-    print(f"  💡 Insights: {len(deep_analysis_result.key_insights)}")
+    return await _commit_deep_analysis(state, deep_analysis_result)
+
+def _discard_task(task: asyncio.Task):
+    """Cancel a task whose result is no longer wanted, retrieving its outcome so a failure isn't reported as unhandled."""
+    task.cancel()
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+async def speculative_analysis_node(state: InterviewGraphState) -> Dict:
+    """
+    Step 2+3 (speculative mode): probe decision and deep analysis in parallel.
+    Deep analysis starts immediately; its result is discarded (and the call
+    cancelled if still running) when the decision is to probe. Only turns
+    whose relevance check goes to the LLM gain anything: an answer the fast
+    path decides locally leaves nothing to overlap.
+    """
+    if state.get("should_terminate_early"):
+        logger.debug("⏭️ Skipping speculative analysis - terminating")
+        return {
+            "probe_decision": {"should_probe": False, "reason": "terminating", "probe_type": "none"},
+            "deep_analysis": None
+        }
     
-    analyzed = state["analyzed_response"]
+    logger.debug("🧠 Speculative deep analysis started alongside probe decision...")
+    deep_task = asyncio.create_task(
+        analyzer.deep_analyze(state["user_response"], _recent_context(state), state["template_id"])
+    )
     
-    # Add insights
-    analyzed.key_insights.extend(deep_analysis_result.key_insights)
+    try:
+        decision_update = await probe_decision_node(state)
+    except BaseException:
+        _discard_task(deep_task)
+        raise
     
-    # Get accumulated insights from any previous probing
-    accumulated = state.get("accumulated_insights", [])
-    analyzed.key_insights.extend(accumulated)
+    if decision_update["probe_decision"]["should_probe"]:
+        _discard_task(deep_task)
+        logger.debug("⚡ Discarding speculative deep analysis - will probe")
+        return {**decision_update, "deep_analysis": _skipped_deep_analysis()}
     
-    # Save to database
-    await db_client.save_analyzed_response(
-        analyzed,
-        state["session_id"],
-        state["respondent_id"]
+    deep_analysis_result = await deep_task
+    commit_update = await _commit_deep_analysis(state, deep_analysis_result)
+    
+    return {**decision_update, **commit_update}
+
+async def fused_turn_node(state: InterviewGraphState) -> Dict:
+    """
+    Step 2+3+4 (fused mode): relevance, deep analysis and the next
+    question/probe from a single structured LLM call. On invalid output
+    `probe_decision` stays unset and the graph falls back to the
+    multi-call path.
+    """
+    if state.get("should_terminate_early"):
+        logger.debug("⏭️ Skipping fused turn analysis - terminating")
+        return {
+            "probe_decision": {"should_probe": False, "reason": "terminating", "probe_type": "none"},
+            "deep_analysis": None,
+            "prefetched_question": None
+        }
+    
+    logger.debug("🧩 Fused turn analysis (relevance + deep analysis + next question)...")
+    
+    context_insights = await _context_insights(state, f"{_last_question(state)}\n{state['user_response']}")
+    
+    from models.schemas import InterviewState
+    temp_state = InterviewState(
+        session_id=state["session_id"],
+        respondent_id=state["respondent_id"],
+        template_id=state["template_id"],
+        research_topic=state["research_topic"],
+        conversation_history=state["conversation_history"],
+        current_question_count=state["question_count"] + 1,
+        max_questions=state["max_questions"]
+    )
+    
+    fused = await turn_analyzer_agent.analyze_turn(
+        temp_state,
+        question_asked=_last_question(state),
+        user_response=state["user_response"],
+        conversation_context=_recent_context(state),
+        collected_insights=context_insights
     )
     
+    if fused is None:
+        logger.info("↩️ Fused turn analysis failed, falling back to multi-call path")
+        return {"probe_decision": None, "prefetched_question": None}
+    
+    if not fused.is_relevant:
+        logger.debug("🚨 IRRELEVANT RESPONSE DETECTED (fused)")
+        return {
+            "probe_decision": {
+                "should_probe": True,
+                "reason": "Response is completely off-topic/irrelevant",
+                "probe_type": "irrelevant"
+            },
+            "deep_analysis": _skipped_deep_analysis(),
+            "prefetched_question": fused.next_question
+        }
+    
+    deep_analysis_result = DeepAnalysis(
+        key_insights=fused.key_insights,
+        emotional_tone=fused.emotional_tone,
+        needs_follow_up=fused.needs_follow_up,
+        suggested_follow_up_topic=fused.suggested_follow_up_topic
+    )
+    commit_update = await _commit_deep_analysis(state, deep_analysis_result)
+    
     return {
-        "deep_analysis": deep_analysis_result,
+        "probe_decision": {
+            "should_probe": False,
+            "reason": "Response is on-topic (fused analysis)",
+            "probe_type": "none"
+        },
+        "prefetched_question": fused.next_question,
+        **commit_update
+    }
+
+async def speculate_turn(state: InterviewGraphState, draft: str) -> Dict:
+    """
+    The LLM part of a turn, run on a draft of the answer before it is sent:
+    probe decision and deep analysis concurrently, then the redirect probe or
+    next question. Same agents and prompts as the real turn, but called
+    directly rather than through the nodes, so nothing is committed and node
+    metrics/spans and probe decision stats only count real turns. The result
+    is handed to prefetched_turn_node.
+    """
+    analyzed = await analyzer.analyze(draft)
+    history = state["conversation_history"] + [{"role": "user", "content": draft}]
+    draft_state = {
+        **state,
+        "user_response": draft,
         "analyzed_response": analyzed,
-        "accumulated_insights": []
+        "conversation_history": history,
+        "context_summary": context_window.fold(state.get("context_summary"), history)
     }
+    last_question = _last_question(draft_state)
+    
+    deep_task = asyncio.create_task(
+        analyzer.deep_analyze(draft, _recent_context(draft_state), state["template_id"])
+    )
+    try:
+        decision = await probe_decision_agent.should_probe(
+            question_asked=last_question,
+            user_response=draft,
+            research_topic=state["research_topic"],
+            response_quality=analyzed.quality.value,
+            template_id=state["template_id"],
+            record=False
+        )
+        if decision["should_probe"]:
+            _discard_task(deep_task)
+            probe_question = await probe_agent.generate_redirect_probe(
+                original_question=last_question,
+                user_response=draft,
+                research_topic=state["research_topic"],
+                template_id=state["template_id"]
+            )
+            return {"probe_decision": decision, "deep_analysis": None, "question": probe_question}
+        deep_analysis_result = await deep_task
+    except BaseException:
+        _discard_task(deep_task)
+        raise
+    
+    # Not put in insight_index_cache: the draft's insights are only committed by the real turn
+    index, _ = add_insights(
+        await _insight_index(state),
+        analyzed.key_insights + deep_analysis_result.key_insights + state.get("accumulated_insights", [])
+    )
+    temp_state, context_insights = await _next_question_inputs(
+        {**draft_state, "deep_analysis": deep_analysis_result}, index
+    )
+    question = await interviewer_agent.generate_next_question(temp_state, context_insights)
+    return {"probe_decision": decision, "deep_analysis": deep_analysis_result, "question": question}
 
-async def internal_probe_node(state: InterviewGraphState) -> Dict:
+async def prefetched_turn_node(state: InterviewGraphState) -> Dict:
+    """
+    Step 2+3 (draft prefetch): the probe decision and deep analysis computed
+    on the respondent's draft by speculate_turn, committed for the message
+    that was actually sent. The question nodes pick up the prefetched question.
+    """
+    prefetched = state["prefetched_turn"]
+    if state.get("should_terminate_early"):
+        logger.debug("⏭️ Discarding prefetched turn - terminating")
+        return {
+            "probe_decision": {"should_probe": False, "reason": "terminating", "probe_type": "none"},
+            "deep_analysis": None,
+            "prefetched_question": None,
+            "prefetched_turn": None
+        }
+    
+    logger.debug("⚡ Using turn prefetched from the draft")
+    update = {
+        "probe_decision": prefetched["probe_decision"],
+        "prefetched_question": prefetched["question"],
+        "prefetched_turn": None
+    }
+    if prefetched["probe_decision"]["should_probe"]:
+        return {**update, "deep_analysis": _skipped_deep_analysis()}
+    
+    commit_update = await _commit_deep_analysis(state, prefetched["deep_analysis"])
+    return {**update, **commit_update}
+
+async def internal_probe_node(state: InterviewGraphState, config: RunnableConfig = None) -> Dict:
     """Step 4a: PROBE - only for truly irrelevant responses."""
     consecutive_probes = state.get("consecutive_probes", 0)
-    print(f"⚡ PROBING IRRELEVANT RESPONSE (Consecutive: {consecutive_probes})")
-    
     # Find the original question
     original_question = None
     for i in range(len(state["conversation_history"]) - 1, -1, -1):
@@ -213,16 +589,26 @@ async def internal_probe_node(state: InterviewGraphState) -> Dict:
     if not original_question:
         original_question = f"the topic of {state['research_topic']}"
     
-    print(f"   🎯 Original question: {original_question[:50]}...")
-    
     # Generate redirect probe (since response was irrelevant)
-    probe_question = await probe_agent.generate_redirect_probe(
-        original_question=original_question,
-        user_response=state["user_response"],
-        research_topic=state["research_topic"]
-    )
+    on_token, on_replace = _token_writers(config)
+    if state.get("prefetched_question"):
+        probe_question = state["prefetched_question"]
+        if on_token:
+            on_token(probe_question)
+    else:
+        probe_question = await probe_agent.generate_redirect_probe(
+            original_question=original_question,
+            user_response=state["user_response"],
+            research_topic=state["research_topic"],
+            on_token=on_token,
+            template_id=state["template_id"],
+            on_replace=on_replace
+        )
     
-    print(f"   ✅ Probe: {probe_question[:80]}...")
+    logger.debug(
+        "⚡ Probe (consecutive: %d): %.80s | Original question: %.50s",
+        consecutive_probes, probe_question, original_question
+    )
     
     # Add probe to conversation history
     new_history = state["conversation_history"].copy()
@@ -241,32 +627,52 @@ async def internal_probe_node(state: InterviewGraphState) -> Dict:
         "is_probe": True,
         "total_exchanges": state["total_exchanges"] + 1,
         "waiting_for_clarification": True,
-        "accumulated_insights": accumulated
+        "accumulated_insights": accumulated,
+        "prefetched_question": None
     }
 
-async def generate_question_node(state: InterviewGraphState) -> Dict:
-    """Step 4b: Generate next main question."""
-    next_q_number = state["question_count"] + 1
-    print(f"📝 Generating Question {next_q_number}/{state['max_questions']}...")
-    
-    # Get insights for context
-    all_insights = await db_client.get_all_insights_for_session(state["session_id"])
-    
-    # Create temporary state for interviewer
+async def _next_question_inputs(
+    state: InterviewGraphState,
+    index: Optional[Dict] = None
+) -> Tuple["InterviewState", List[str]]:
+    """Interviewer state and the insights relevant to what was just asked and answered."""
     from models.schemas import InterviewState
+    deep_analysis = state.get("deep_analysis")
+    thread = f"{_last_question(state)}\n{state['user_response']}"
+    if deep_analysis and deep_analysis.suggested_follow_up_topic:
+        thread += f"\n{deep_analysis.suggested_follow_up_topic}"
+    context_insights = await _context_insights(state, thread, index)
+    
     temp_state = InterviewState(
         session_id=state["session_id"],
         respondent_id=state["respondent_id"],
         template_id=state["template_id"],
         research_topic=state["research_topic"],
         conversation_history=state["conversation_history"],
-        current_question_count=next_q_number,
+        current_question_count=state["question_count"] + 1,
         max_questions=state["max_questions"]
     )
+    return temp_state, context_insights
+
+async def generate_question_node(state: InterviewGraphState, config: RunnableConfig = None) -> Dict:
+    """Step 4b: Generate next main question."""
+    next_q_number = state["question_count"] + 1
+    temp_state, context_insights = await _next_question_inputs(state)
     
-    next_question = await interviewer_agent.generate_next_question(temp_state, all_insights)
+    on_token, on_replace = _token_writers(config)
+    if state.get("prefetched_question"):
+        next_question = state["prefetched_question"]
+        if on_token:
+            on_token(next_question)
+    else:
+        next_question = await interviewer_agent.generate_next_question(
+            temp_state,
+            context_insights,
+            on_token=on_token,
+            on_replace=on_replace
+        )
     
-    print(f"   ✅ Q{next_q_number}: {next_question[:80]}...")
+    logger.debug("📝 Q%d/%d: %.80s", next_q_number, state["max_questions"], next_question)
     
     new_history = state["conversation_history"].copy()
     new_history.append({"role": "assistant", "content": next_question})
@@ -281,17 +687,26 @@ async def generate_question_node(state: InterviewGraphState) -> Dict:
         "total_exchanges": state["total_exchanges"] + 1,
         "waiting_for_clarification": False,
         "accumulated_insights": [],
-        "probe_decision": None
+        "probe_decision": None,
+        "prefetched_question": None
     }
 
 async def generate_summary_node(state: InterviewGraphState) -> Dict:
     """Step 5: Generate final summary."""
     is_early = state.get("should_terminate_early", False)
     
-    print(f"📊 Generating {'EARLY TERMINATION' if is_early else 'FINAL'} summary...")
-    print(f"   Questions: {state['question_count']}/{state['max_questions']}")
+    logger.info(
+        "📊 Generating %s summary (questions: %d/%d)",
+        "EARLY TERMINATION" if is_early else "FINAL", state["question_count"], state["max_questions"],
+        extra={"session_id": state["session_id"]}
+    )
     
-    all_analyzed_responses = await db_client.get_analyzed_responses(state["session_id"])
+    progress = state.get("summary_progress")
+    all_analyzed_responses = insights = None
+    if progress is None:
+        all_analyzed_responses = await _db().get_analyzed_responses(state["session_id"])
+    else:
+        insights = state.get("session_insights") or await _session_insights(state)
     
     from models.schemas import InterviewState
     final_state = InterviewState(
@@ -300,6 +715,7 @@ async def generate_summary_node(state: InterviewGraphState) -> Dict:
         template_id=state["template_id"],
         research_topic=state["research_topic"],
         conversation_history=state["conversation_history"],
+        context_summary=state.get("context_summary"),
         current_question_count=state["question_count"],
         max_questions=state["max_questions"],
         is_complete=True,
@@ -311,13 +727,24 @@ async def generate_summary_node(state: InterviewGraphState) -> Dict:
         final_state, 
         all_analyzed_responses,
         early_termination=is_early,
-        termination_reason=state.get('termination_reason')
+        termination_reason=state.get('termination_reason'),
+        progress=progress,
+        insights=insights
     )
     
-    await db_client.save_summary(summary)
-    
     status = "terminated_early" if is_early else "completed"
-    await db_client.update_interview_status(state["session_id"], status)
+    await asyncio.gather(
+        _db().save_summary(summary),
+        _db().update_interview_status(state["session_id"], status),
+        _analytics().record_interview(
+            state["template_id"],
+            interview_outcome(state),
+            state["question_count"],
+            summary.average_sentiment_score,
+            state.get("termination_reason") if is_early else None,
+            event_id=f"{state['session_id']}:interview"
+        )
+    )
     
     return {
         "is_complete": True,
@@ -337,7 +764,7 @@ def should_probe(state: InterviewGraphState) -> str:
     """
     # Priority 1: Early termination
     if state.get("should_terminate_early"):
-        print(f"\n  🛑 TERMINATE → SUMMARY")
+        logger.debug("🛑 TERMINATE → SUMMARY")
         return "terminate"
     
     probe_decision = state.get("probe_decision", {})
@@ -345,76 +772,138 @@ def should_probe(state: InterviewGraphState) -> str:
     
     # Priority 2: Too many CONSECUTIVE irrelevant responses (3 in a row)
     if consecutive_probes >= 3:
-        print(f"\n  🛑 TOO MANY CONSECUTIVE IRRELEVANT RESPONSES ({consecutive_probes}) → TERMINATE")
+        logger.info("🛑 TOO MANY CONSECUTIVE IRRELEVANT RESPONSES (%d) → TERMINATE", consecutive_probes)
         return "terminate"
     
     # Priority 3: Check intelligent probe decision
     should_probe_now = probe_decision.get("should_probe", False)
     reason = probe_decision.get("reason", "No reason")
     
-    print(f"\n  🎯 Probe Decision: {should_probe_now}")
-    print(f"     Reason: {reason}")
-    print(f"     Consecutive probes: {consecutive_probes}/3")
+    logger.debug(
+        "🎯 Probe Decision: %s | Reason: %s | Consecutive probes: %d/3",
+        should_probe_now, reason, consecutive_probes
+    )
     
     if should_probe_now:
-        print(f"  ➡️ PROBE (Response is irrelevant/off-topic) ⚡")
         return "probe"
     else:
-        print(f"  ➡️ NO PROBE NEEDED → NEXT QUESTION 📝")
         return "next_question"
 
+def route_analysis(state: InterviewGraphState) -> str:
+    """Use the turn prefetched from the respondent's draft when there is one."""
+    return "prefetched" if state.get("prefetched_turn") else "analyze"
+
+def route_fused_turn(state: InterviewGraphState) -> str:
+    """Route after the fused turn analysis; no decision means it failed."""
+    if not state.get("should_terminate_early") and state.get("probe_decision") is None:
+        logger.debug("↩️ FUSED ANALYSIS FAILED → MULTI-CALL PATH")
+        return "fallback"
+    
+    return should_probe(state)
+
 def should_continue(state: InterviewGraphState) -> str:
     """Decides whether to continue or generate summary."""
     if state.get("should_terminate_early"):
-        print(f"\n  🛑 EARLY TERMINATION → SUMMARY")
+        logger.debug("🛑 EARLY TERMINATION → SUMMARY")
         return "summary"
     
     current_count = state["question_count"]
     max_count = state["max_questions"]
     
-    print(f"\n  📊 Progress: {current_count}/{max_count} questions")
+    logger.debug("📊 Progress: %d/%d questions", current_count, max_count)
     
     if current_count >= max_count:
-        print(f"  ➡️ COMPLETE → SUMMARY 📊")
         return "summary"
     
-    print(f"  ➡️ CONTINUE → WAIT FOR USER")
     return "continue"
 
 # ========================================================================
 # GRAPH CONSTRUCTION
 # ========================================================================
 
-def build_interview_workflow():
-    """Builds the interview workflow with INTELLIGENT probe decision."""
+def build_interview_workflow(speculative: Optional[bool] = None, fused: Optional[bool] = None):
+    """
+    Builds the interview workflow with INTELLIGENT probe decision.
+    
+    In speculative mode (SPECULATIVE_DEEP_ANALYSIS) the probe decision and
+    deep analysis run concurrently in a single `speculative_analysis` node.
+    In fused mode (FUSED_TURN_ANALYSIS) a single `fused_turn` LLM call
+    replaces relevance check, deep analysis and question generation, with
+    the multi-call path kept as a fallback. Either is skipped when the turn
+    was prefetched from the respondent's draft (`prefetched_turn`).
+    """
+    if speculative is None:
+        speculative = config.SPECULATIVE_DEEP_ANALYSIS
+    if fused is None:
+        fused = config.FUSED_TURN_ANALYSIS
     
     workflow = StateGraph(InterviewGraphState)
     
+    def add_node(name: str, node: Callable):
+        # Every node reports wall time / errors (utils/tracing.py)
+        workflow.add_node(name, traced_node(name, node))
+    
     # Add nodes
-    workflow.add_node("analyze_response", analyze_response_node)
-    workflow.add_node("probe_decision", probe_decision_node)
-    workflow.add_node("deep_analysis", deep_analysis_node)
-    workflow.add_node("internal_probe", internal_probe_node)
-    workflow.add_node("generate_question", generate_question_node)
-    workflow.add_node("generate_summary", generate_summary_node)
+    add_node("analyze_response", analyze_response_node)
+    if fused:
+        add_node("fused_turn", fused_turn_node)
+    if speculative:
+        add_node("speculative_analysis", speculative_analysis_node)
+    else:
+        add_node("probe_decision", probe_decision_node)
+        add_node("deep_analysis", deep_analysis_node)
+    add_node("prefetched_turn", prefetched_turn_node)
+    add_node("internal_probe", internal_probe_node)
+    add_node("generate_question", generate_question_node)
+    add_node("generate_summary", generate_summary_node)
     
     # Set entry point
     workflow.set_entry_point("analyze_response")
     
-    # Flow: analyze → probe_decision → deep_analysis → [probe OR next_question]
-    workflow.add_edge("analyze_response", "probe_decision")
-    workflow.add_edge("probe_decision", "deep_analysis")
+    if speculative:
+        # Flow: analyze → (probe_decision ‖ deep_analysis) → [probe OR next_question]
+        analysis_entry = "speculative_analysis"
+        decision_node = "speculative_analysis"
+    else:
+        # Flow: analyze → probe_decision → deep_analysis → [probe OR next_question]
+        analysis_entry = "probe_decision"
+        decision_node = "deep_analysis"
+        workflow.add_edge("probe_decision", "deep_analysis")
+    
+    if fused:
+        # Flow: analyze → fused_turn → [probe OR next_question], falling back to the multi-call path
+        turn_entry = "fused_turn"
+        workflow.add_conditional_edges(
+            "fused_turn",
+            route_fused_turn,
+            {
+                "terminate": "generate_summary",
+                "probe": "internal_probe",
+                "next_question": "generate_question",
+                "fallback": analysis_entry
+            }
+        )
+    else:
+        turn_entry = analysis_entry
     
+    # Flow with a prefetched turn: analyze → prefetched_turn → [probe OR next_question]
     workflow.add_conditional_edges(
-        "deep_analysis",
-        should_probe,
-        {
-            "terminate": "generate_summary",
-            "probe": "internal_probe",
-            "next_question": "generate_question"
-        }
+        "analyze_response",
+        route_analysis,
+        {"prefetched": "prefetched_turn", "analyze": turn_entry}
     )
     
+    for node in (decision_node, "prefetched_turn"):
+        workflow.add_conditional_edges(
+            node,
+            should_probe,
+            {
+                "terminate": "generate_summary",
+                "probe": "internal_probe",
+                "next_question": "generate_question"
+            }
+        )
+    
     workflow.add_edge("internal_probe", END)
     
     workflow.add_conditional_edges(
@@ -435,9 +924,10 @@ def build_interview_workflow():
 # ========================================================================
 interview_workflow = build_interview_workflow()
 
-print("✅ LangGraph workflow compiled with INTELLIGENT PROBE DECISION!")
-print("   🤖 AI Agent decides: Probe ONLY if response is IRRELEVANT/OFF-TOPIC")
-print("   ✅ Short answers OK if on-topic")
-print("   🚨 Probes only for: chess → dance, product → weather, etc.")
-print("   🔄 FIXED: Consecutive probes reset on good answer (max 3 consecutive)")
-print("   Flow: analyze → probe_decision → deep_analysis → [probe OR next_question]")
\ No newline at end of file
+if config.FUSED_TURN_ANALYSIS:
+    _flow = "analyze → fused_turn (fallback: multi-call) → [probe OR next_question]"
+elif config.SPECULATIVE_DEEP_ANALYSIS:
+    _flow = "analyze → (probe_decision ‖ deep_analysis) → [probe OR next_question]"
+else:
+    _flow = "analyze → probe_decision → deep_analysis → [probe OR next_question]"
+logger.info("✅ LangGraph workflow compiled with INTELLIGENT PROBE DECISION! Flow: %s", _flow)
\ No newline at end of file
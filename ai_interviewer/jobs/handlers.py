@@ -0,0 +1,68 @@
+"""
+Job handlers - post-interview work run by the job queue
+"""
+
+from typing import Any, Dict
+
+from graph.workflow import generate_summary_node
+from jobs.queue import JobQueue, PermanentJobError
+from storage.db_client import db_client
+from storage.session_store import session_store
+from utils.logger import get_logger
+
+logger = get_logger("jobs.handlers")
+
+FINALIZE_INTERVIEW = "finalize_interview"
+
+
+def finalize_idempotency_key(session_id: str) -> str:
+    """One finalization job per session, however often /agent/end is called."""
+    return f"{FINALIZE_INTERVIEW}:{session_id}"
+
+
+def summary_result(session_id: str, summary: Dict[str, Any]) -> Dict[str, Any]:
+    """The summary fields /agent/end returns, from an InterviewSummary dump."""
+    summary_text = summary.get("summary", "Interview completed successfully.")
+    terminated_early = summary.get("terminated_early", False)
+    termination_reason = summary.get("termination_reason")
+    if terminated_early:
+        summary_text = f"[Interview terminated early: {termination_reason}] {summary_text}"
+
+    return {
+        "session_id": session_id,
+        "summary": summary_text,
+        "sentiment_score": summary.get("average_sentiment_score", 0.5),
+        "key_themes": summary.get("key_themes", []),
+        "terminated_early": terminated_early,
+        "termination_reason": termination_reason
+    }
+
+
+async def finalize_interview(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate the summary if the interview ended before the workflow did,
+    persist it, then drop the session from Redis.
+    """
+    session_id = payload["session_id"]
+    state = await session_store.load(session_id)
+
+    if state is None:
+        # Already finalized by an earlier attempt that failed after cleanup
+        saved = await db_client.get_summary(session_id)
+        if saved is None:
+            raise PermanentJobError(f"Session {session_id} not found")
+        return summary_result(session_id, saved.model_dump(mode="json"))
+
+    summary = state.get("summary")
+    if not summary:
+        logger.info("⚡ Generating final summary", extra={"session_id": session_id})
+        update = await generate_summary_node({**state, "is_complete": True})
+        summary = update["summary"]
+
+    result = summary_result(session_id, summary)
+    await session_store.delete(session_id)
+    return result
+
+
+def register_handlers(queue: JobQueue):
+    queue.register(FINALIZE_INTERVIEW, finalize_interview)
@@ -0,0 +1,458 @@
+"""
+Job Queue - background work after an interview (summary, persistence, cleanup)
+Handlers are registered per job kind and run by a pool of asyncio workers.
+
+Two backends with the same interface:
+    InProcessJobQueue   asyncio.Queue inside this process (default)
+    RedisStreamJobQueue Redis stream + consumer group, shared by all workers;
+                        jobs left unacknowledged by a crashed worker are
+                        reclaimed after JOB_VISIBILITY_TIMEOUT_SECONDS
+
+Failed jobs are retried with exponential backoff up to JOB_MAX_ATTEMPTS.
+An idempotency key (e.g. one per session) maps repeated enqueues to the
+job that already exists.
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+import config
+from models.schemas import JobRecord, JobStatus
+from storage.codec import get_codec
+from utils.logger import get_logger
+
+logger = get_logger("jobs.queue")
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot help (e.g. the session is gone)"""
+
+
+class CallbackNotAllowedError(ValueError):
+    """Raised for a callback URL outside JOB_CALLBACK_ALLOWED_URLS"""
+
+
+def _url_parts(url: str) -> Optional[Tuple[str, str, int, str]]:
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    # Credentials in the authority ("http://allowed@elsewhere") are never legitimate here
+    if parts.scheme not in ("http", "https") or not parts.hostname or parts.username or parts.password:
+        return None
+    return parts.scheme, parts.hostname.lower(), port or (443 if parts.scheme == "https" else 80), parts.path or "/"
+
+
+def callback_allowed(url: str, allowed: Optional[List[str]] = None) -> bool:
+    """
+    Whether `url` is under one of the allowed base URLs: same scheme, host
+    and port, and a path at or below the base path. With no bases
+    configured every URL is refused.
+    """
+    target = _url_parts(url)
+    if target is None:
+        return False
+    for base_url in config.JOB_CALLBACK_ALLOWED_URLS if allowed is None else allowed:
+        base = _url_parts(base_url)
+        if base is None or base[:3] != target[:3]:
+            continue
+        base_path = base[3].rstrip("/")
+        if target[3] == base_path or target[3].startswith(base_path + "/"):
+            return True
+    return False
+
+
+class JobQueue:
+    """Shared worker / retry / callback logic; backends implement storage and delivery"""
+
+    backend = "base"
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        result_ttl_seconds: Optional[int] = None
+    ):
+        self.workers = workers or config.JOB_WORKERS
+        self.max_attempts = max_attempts or config.JOB_MAX_ATTEMPTS
+        self.retry_backoff_seconds = (
+            config.JOB_RETRY_BACKOFF_SECONDS if retry_backoff_seconds is None else retry_backoff_seconds
+        )
+        self.result_ttl_seconds = result_ttl_seconds or config.JOB_RESULT_TTL_SECONDS
+        self.handlers: Dict[str, JobHandler] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+        self.counters = {
+            "enqueued": 0,
+            "deduplicated": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "running": 0
+        }
+
+    # ---------------------------------------------------------------- API
+
+    def register(self, kind: str, handler: JobHandler):
+        self.handlers[kind] = handler
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        callback_url: Optional[str] = None
+    ) -> JobRecord:
+        """Queue a job, or return the existing one for `idempotency_key`."""
+        if kind not in self.handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        if callback_url and not callback_allowed(callback_url):
+            raise CallbackNotAllowedError(f"Callback URL not allowed: {callback_url}")
+
+        record = JobRecord(
+            job_id=uuid.uuid4().hex,
+            kind=kind,
+            payload=payload,
+            idempotency_key=idempotency_key,
+            callback_url=callback_url
+        )
+
+        if idempotency_key:
+            existing_id = await self._claim_idempotency_key(idempotency_key, record.job_id)
+            if existing_id is not None:
+                existing = await self.get(existing_id)
+                if existing is not None:
+                    self.counters["deduplicated"] += 1
+                    return existing
+
+        await self._save(record)
+        await self._push(record.job_id)
+        self.counters["enqueued"] += 1
+        return record
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        raise NotImplementedError
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[JobRecord]:
+        """Poll until the job finishes or `timeout` seconds pass; returns the latest record."""
+        deadline = time.monotonic() + timeout
+        while True:
+            record = await self.get(job_id)
+            if record is None or record.is_finished or time.monotonic() >= deadline:
+                return record
+            await asyncio.sleep(min(0.05, max(0.0, deadline - time.monotonic())))
+
+    async def start(self):
+        if self._tasks:
+            return
+        await self._prepare()
+        self._stopping = False
+        self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self.workers)]
+        logger.info("✅ Job queue started (%s, %d workers)", self.backend, self.workers)
+
+    async def stop(self, drain_timeout: float = 5.0):
+        """
+        Stop taking new jobs and let running ones finish; workers still busy
+        after `drain_timeout` are cancelled (their jobs stay queued in the
+        Redis backend and are reclaimed later).
+        """
+        if not self._tasks:
+            return
+        self._stopping = True
+        _, pending = await asyncio.wait(self._tasks, timeout=drain_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending, timeout=1)
+        self._tasks = []
+
+    async def depth(self) -> int:
+        """Jobs waiting for a worker."""
+        raise NotImplementedError
+
+    async def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend, "workers": self.workers, "depth": await self.depth(), **self.counters}
+
+    # ----------------------------------------------------------- backends
+
+    async def _prepare(self):
+        """Backend setup before the workers start."""
+
+    async def _claim_idempotency_key(self, key: str, job_id: str) -> Optional[str]:
+        """Bind `key` to `job_id`; returns the job id already bound to it, if any."""
+        raise NotImplementedError
+
+    async def _save(self, record: JobRecord):
+        raise NotImplementedError
+
+    async def _push(self, job_id: str):
+        raise NotImplementedError
+
+    async def _next(self) -> Optional[tuple]:
+        """Next (job_id, delivery token) to run, or None if nothing arrived within ~1s."""
+        raise NotImplementedError
+
+    async def _done(self, token: Any):
+        """Acknowledge a delivery once the job reached a final state."""
+
+    # ------------------------------------------------------------ workers
+
+    async def _worker(self, index: int):
+        # Deliveries wait at most ~1s, so the stop flag is seen promptly
+        while not self._stopping:
+            try:
+                delivery = await self._next()
+                if delivery is None:
+                    continue
+                job_id, token = delivery
+                record = await self.get(job_id)
+                if record is not None and not record.is_finished:
+                    await self._run(record)
+                await self._done(token)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("⚠️ Job worker %d error: %s", index, e)
+                await asyncio.sleep(1)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.retry_backoff_seconds * (2 ** (attempt - 1)), config.JOB_RETRY_BACKOFF_MAX_SECONDS)
+
+    async def _run(self, record: JobRecord):
+        handler = self.handlers.get(record.kind)
+        self.counters["running"] += 1
+        try:
+            while True:
+                record.attempts += 1
+                record.status = JobStatus.RUNNING
+                record.updated_at = datetime.now()
+                await self._save(record)
+
+                try:
+                    if handler is None:
+                        raise PermanentJobError(f"No handler registered for job kind '{record.kind}'")
+                    record.result = await handler(record.payload) or {}
+                    record.status = JobStatus.SUCCEEDED
+                    record.error = None
+                    self.counters["succeeded"] += 1
+                    break
+                except Exception as e:
+                    record.error = f"{type(e).__name__}: {e}"
+                    retryable = not isinstance(e, PermanentJobError)
+                    if not retryable or record.attempts >= self.max_attempts:
+                        record.status = JobStatus.FAILED
+                        self.counters["failed"] += 1
+                        logger.error("❌ Job %s %s failed after %d attempt(s): %s", record.kind, record.job_id, record.attempts, record.error)
+                        break
+
+                    delay = self._backoff(record.attempts)
+                    self.counters["retries"] += 1
+                    logger.warning(
+                        "⚠️ Job %s %s attempt %d failed, retrying in %.1fs: %s",
+                        record.kind, record.job_id, record.attempts, delay, record.error
+                    )
+                    record.status = JobStatus.QUEUED
+                    record.updated_at = datetime.now()
+                    await self._save(record)
+                    await asyncio.sleep(delay)
+        finally:
+            self.counters["running"] -= 1
+
+        record.updated_at = datetime.now()
+        await self._save(record)
+        if record.callback_url:
+            await self._callback(record)
+
+    async def _callback(self, record: JobRecord):
+        """POST the finished job to its callback URL (best effort)."""
+        # Checked again: a job from the shared stream may predate the current allowlist
+        if not callback_allowed(record.callback_url):
+            logger.warning("⚠️ Job callback to %s skipped: not in JOB_CALLBACK_ALLOWED_URLS", record.callback_url)
+            return
+        try:
+            # No redirects: the allowlist applies to the host that receives the data
+            async with httpx.AsyncClient(timeout=config.JOB_CALLBACK_TIMEOUT_SECONDS, follow_redirects=False) as client:
+                response = await client.post(record.callback_url, json=record.model_dump(mode="json"))
+                response.raise_for_status()
+        except Exception as e:
+            logger.warning("⚠️ Job callback to %s failed: %s", record.callback_url, e)
+
+
+class InProcessJobQueue(JobQueue):
+    """asyncio.Queue backend - jobs live in this process only"""
+
+    backend = "memory"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._records: Dict[str, JobRecord] = {}
+        self._idempotency: Dict[str, str] = {}
+        self._finished: Dict[str, asyncio.Event] = {}
+
+    def _prune(self):
+        """Forget finished jobs older than the result TTL."""
+        cutoff = time.time() - self.result_ttl_seconds
+        expired = [
+            job_id for job_id, record in self._records.items()
+            if record.is_finished and record.updated_at.timestamp() < cutoff
+        ]
+        for job_id in expired:
+            record = self._records.pop(job_id)
+            self._finished.pop(job_id, None)
+            if record.idempotency_key and self._idempotency.get(record.idempotency_key) == job_id:
+                del self._idempotency[record.idempotency_key]
+
+    async def _claim_idempotency_key(self, key: str, job_id: str) -> Optional[str]:
+        self._prune()
+        existing = self._idempotency.get(key)
+        if existing is not None and existing in self._records:
+            return existing
+        self._idempotency[key] = job_id
+        return None
+
+    async def _save(self, record: JobRecord):
+        self._records[record.job_id] = record
+        event = self._finished.setdefault(record.job_id, asyncio.Event())
+        if record.is_finished:
+            event.set()
+
+    async def _push(self, job_id: str):
+        self._queue.put_nowait(job_id)
+
+    async def _next(self) -> Optional[tuple]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=1), None
+        except asyncio.TimeoutError:
+            return None
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        return self._records.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[JobRecord]:
+        event = self._finished.get(job_id)
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._records.get(job_id)
+
+    async def depth(self) -> int:
+        return self._queue.qsize()
+
+
+class RedisStreamJobQueue(JobQueue):
+    """
+    Redis stream backend - any number of service instances share one queue.
+    Job records and idempotency keys are plain keys with the result TTL;
+    stream entries are acknowledged and deleted once a job is final.
+    """
+
+    backend = "redis"
+
+    def __init__(self, redis_client: Any = None, stream_key: Optional[str] = None, group: str = "interview-jobs", **kwargs):
+        super().__init__(**kwargs)
+        if redis_client is None:
+            from storage.redis_client import redis_client as default_redis_client
+            redis_client = default_redis_client
+        self.redis = redis_client
+        self.codec = get_codec()
+        self.stream_key = stream_key or config.JOB_STREAM_KEY
+        self.group = group
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._last_reclaim = 0.0
+
+    def _record_key(self, job_id: str) -> str:
+        return f"{self.stream_key}:job:{job_id}"
+
+    def _idempotency_key(self, key: str) -> str:
+        return f"{self.stream_key}:idempotency:{key}"
+
+    async def _prepare(self):
+        try:
+            await self.redis.xgroup_create(self.stream_key, self.group, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _claim_idempotency_key(self, key: str, job_id: str) -> Optional[str]:
+        redis_key = self._idempotency_key(key)
+        if await self.redis.set(redis_key, job_id, nx=True, ex=self.result_ttl_seconds):
+            return None
+        existing = await self.redis.get(redis_key)
+        if existing is None:
+            return None
+        return existing.decode() if isinstance(existing, bytes) else existing
+
+    async def _save(self, record: JobRecord):
+        await self.redis.set(
+            self._record_key(record.job_id),
+            self.codec.dumps(record.model_dump(mode="json")),
+            ex=self.result_ttl_seconds
+        )
+
+    async def _push(self, job_id: str):
+        await self.redis.xadd(self.stream_key, {"job_id": job_id})
+
+    async def _next(self) -> Optional[tuple]:
+        # Entries a dead consumer never acknowledged come back after the visibility timeout
+        now = time.monotonic()
+        if now - self._last_reclaim >= config.JOB_VISIBILITY_TIMEOUT_SECONDS / 2:
+            self._last_reclaim = now
+            _, claimed, *_ = await self.redis.xautoclaim(
+                self.stream_key, self.group, self.consumer,
+                min_idle_time=int(config.JOB_VISIBILITY_TIMEOUT_SECONDS * 1000),
+                count=1
+            )
+            if claimed:
+                return self._delivery(claimed[0])
+
+        response = await self.redis.xreadgroup(
+            self.group, self.consumer, {self.stream_key: ">"}, count=1, block=1000
+        )
+        if not response:
+            return None
+        _, entries = response[0]
+        return self._delivery(entries[0]) if entries else None
+
+    def _delivery(self, entry) -> tuple:
+        entry_id, fields = entry
+        job_id = fields.get(b"job_id", fields.get("job_id"))
+        return (job_id.decode() if isinstance(job_id, bytes) else job_id), entry_id
+
+    async def _done(self, token: Any):
+        await self.redis.xack(self.stream_key, self.group, token)
+        await self.redis.xdel(self.stream_key, token)
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        raw = await self.redis.get(self._record_key(job_id))
+        if raw is None:
+            return None
+        return JobRecord.model_validate(self.codec.loads(raw))
+
+    async def depth(self) -> int:
+        # Entries are deleted once done, so the stream length is queued + in flight
+        return int(await self.redis.xlen(self.stream_key))
+
+
+def create_job_queue() -> JobQueue:
+    """Job queue for JOB_QUEUE_BACKEND ("memory" or "redis")."""
+    if config.JOB_QUEUE_BACKEND == "redis":
+        return RedisStreamJobQueue()
+    return InProcessJobQueue()
+
+# Singleton instance
+job_queue = create_job_queue()
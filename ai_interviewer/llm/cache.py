@@ -0,0 +1,132 @@
+"""
+Completion Cache - reuse results of deterministic LLM calls
+In-process LRU tier with TTL, plus an optional shared Redis tier.
+"""
+
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import config
+from utils.logger import get_logger
+
+logger = get_logger("llm.cache")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace so formatting-only prompt differences share a key."""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class CompletionCache:
+    """
+    Two-tier completion cache.
+
+    Keys are a SHA-256 of the model, the normalized messages and the sampling
+    parameters. Only callers that opt in (deterministic, low-temperature
+    prompts) read or write it.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        redis_client: Optional[Any] = None,
+        key_prefix: str = "llm_cache:"
+    ):
+        self.max_entries = max_entries or config.LLM_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or config.LLM_CACHE_TTL_SECONDS
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, content)
+        self.hits = 0
+        self.misses = 0
+        self.redis_hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": msg["role"], "content": _normalize(msg["content"])}
+                for msg in messages
+            ],
+            "params": params
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, content = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return content
+            del self._entries[key]
+
+        if self.redis_client is not None:
+            try:
+                content = await self.redis_client.get(self.key_prefix + key)
+            except Exception as e:
+                logger.warning("⚠️ Completion cache Redis read error: %s", e)
+                content = None
+
+            if content is not None:
+                if isinstance(content, bytes):
+                    content = content.decode()
+                self._store_local(key, content)
+                self.hits += 1
+                self.redis_hits += 1
+                return content
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, content: str):
+        self._store_local(key, content)
+
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.set(self.key_prefix + key, content, ex=int(self.ttl_seconds))
+            except Exception as e:
+                logger.warning("⚠️ Completion cache Redis write error: %s", e)
+
+    def _store_local(self, key: str, content: str):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, content)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "redis_hits": self.redis_hits,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+def _build_redis_tier():
+    if not config.LLM_CACHE_REDIS:
+        return None
+    import redis.asyncio as aioredis
+    return aioredis.from_url(config.get_redis_url(), decode_responses=True)
+
+# Singleton instance
+completion_cache = CompletionCache(redis_client=_build_redis_tier())
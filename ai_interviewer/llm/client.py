@@ -0,0 +1,323 @@
+"""
+Async LLM Client - single pooled HTTP client shared by every agent
+Talks to any OpenAI-compatible chat completions API (Groq by default)
+"""
+
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Callable, List, Dict, Optional
+
+import httpx
+from pydantic import BaseModel
+
+import config
+from llm.cache import CompletionCache, completion_cache
+from utils.tracing import record_cache_lookup, record_llm_call, span
+
+
+class LLMError(Exception):
+    """Raised when the provider returns an error or an unusable response"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after  # seconds, from the provider's Retry-After header
+
+
+class LLMTimeoutError(LLMError):
+    """Raised when a call exceeds its per-call deadline"""
+
+
+class LLMRateLimitError(LLMError):
+    """Raised when a call could not get rate-limit budget in time (llm/scheduler.py)"""
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds form only)."""
+    value = response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class LLMResponse(BaseModel):
+    """Result of one chat completion"""
+    content: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_prompt_tokens: int = 0  # prompt prefix the provider served from its cache
+    latency_ms: float = 0.0
+    cached: bool = False
+    provider: str = ""  # set by llm/router.py
+
+
+def _cached_tokens(usage: Dict) -> int:
+    """Prompt tokens served from the provider's prefix cache (OpenAI-style usage details)."""
+    return (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+
+
+class AsyncLLMClient:
+    """
+    Non-blocking chat completions client.
+
+    One httpx.AsyncClient (and therefore one connection pool) is shared by
+    all agents, so a single worker can keep many interviews in flight while
+    waiting on the provider.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        cache: Optional[CompletionCache] = None
+    ):
+        self.base_url = (base_url or config.GROQ_BASE_URL).rstrip("/")
+        self.api_key = api_key if api_key is not None else config.GROQ_API_KEY
+        self.timeout = timeout or config.LLM_TIMEOUT_SECONDS
+        self.limits = httpx.Limits(
+            max_connections=max_connections or config.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=max_keepalive_connections or config.LLM_MAX_KEEPALIVE_CONNECTIONS
+        )
+        self.cache = cache or completion_cache
+        self._http: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it lazily for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._loop is not loop:
+            # Pooled connections are bound to the loop that opened them
+            headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                limits=self.limits,
+                timeout=httpx.Timeout(self.timeout)
+            )
+            self._loop = loop
+        return self._http
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+        cache: bool = False
+    ) -> LLMResponse:
+        """
+        Run one chat completion.
+
+        The whole round trip is bounded by `timeout` (defaults to
+        LLM_TIMEOUT_SECONDS). Cancelling the calling task aborts the
+        in-flight HTTP request and returns the connection to the pool.
+        Pass `cache=True` for deterministic prompts to reuse earlier results.
+        """
+        cache_key = None
+        if cache:
+            cache_key = self.cache.make_key(
+                model, messages, {"max_tokens": max_tokens, "temperature": temperature}
+            )
+            cached_content = await self.cache.get(cache_key)
+            record_cache_lookup(cached_content is not None)
+            if cached_content is not None:
+                return LLMResponse(content=cached_content, model=model, cached=True)
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        deadline = timeout or self.timeout
+        started = time.perf_counter()
+
+        with span("llm.chat", model=model, max_tokens=max_tokens):
+            try:
+                data, content = await self._post_chat(payload, deadline)
+            except LLMError as e:
+                record_llm_call(model, "chat", time.perf_counter() - started, error=e)
+                raise
+
+        if cache_key is not None:
+            await self.cache.set(cache_key, content)
+
+        usage = data.get("usage") or {}
+        result = LLMResponse(
+            content=content,
+            model=data.get("model", model),
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            cached_prompt_tokens=_cached_tokens(usage),
+            latency_ms=(time.perf_counter() - started) * 1000
+        )
+        record_llm_call(
+            model, "chat", result.latency_ms / 1000,
+            prompt_tokens=result.prompt_tokens,
+            completion_tokens=result.completion_tokens,
+            cached_prompt_tokens=result.cached_prompt_tokens
+        )
+        return result
+
+    async def _post_chat(self, payload: Dict, deadline: float):
+        """One non-streaming request; returns (response json, message content)."""
+        try:
+            response = await asyncio.wait_for(
+                self._get_http().post("/chat/completions", json=payload),
+                timeout=deadline
+            )
+        except asyncio.TimeoutError:
+            raise LLMTimeoutError(f"LLM call exceeded {deadline}s")
+        except httpx.TimeoutException as e:
+            raise LLMTimeoutError(f"LLM transport timeout: {e}")
+        except httpx.HTTPError as e:
+            raise LLMError(f"LLM transport error: {e}")
+
+        if response.status_code >= 400:
+            raise LLMError(
+                f"LLM provider returned {response.status_code}: {response.text[:200]}",
+                status_code=response.status_code,
+                retry_after=_retry_after(response)
+            )
+
+        try:
+            data = response.json()
+            content = data["choices"][0]["message"]["content"] or ""
+        except (ValueError, KeyError, IndexError) as e:
+            raise LLMError(f"Malformed LLM response: {e}")
+        return data, content
+
+    async def complete(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+        cache: bool = False
+    ) -> str:
+        """Single user-message completion, returns the stripped text."""
+        response = await self.chat(
+            messages=[{"role": "user", "content": prompt}],
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=timeout,
+            cache=cache
+        )
+        return response.content.strip()
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive.
+
+        `timeout` bounds each network read rather than the whole stream.
+        Token usage comes from the provider's final usage chunk.
+        """
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        }
+        request_timeout = httpx.Timeout(timeout or self.timeout)
+        started = time.perf_counter()
+        usage: Dict = {}
+
+        try:
+            async with self._get_http().stream(
+                "POST", "/chat/completions", json=payload, timeout=request_timeout
+            ) as response:
+                if response.status_code >= 400:
+                    body = await response.aread()
+                    raise LLMError(
+                        f"LLM provider returned {response.status_code}: {body[:200]!r}",
+                        status_code=response.status_code,
+                        retry_after=_retry_after(response)
+                    )
+
+                done = False
+                async for line in response.aiter_lines():
+                    if done or not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        # Read on to the end of the body: a response left
+                        # unread closes its connection instead of pooling it
+                        done = True
+                        continue
+                    try:
+                        chunk = json.loads(data)
+                        usage = chunk.get("usage") or usage
+                        choices = chunk["choices"]
+                        delta = choices[0].get("delta", {}) if choices else {}
+                    except (ValueError, KeyError, AttributeError) as e:
+                        raise LLMError(f"Malformed LLM stream chunk: {e}")
+                    if delta.get("content"):
+                        yield delta["content"]
+        except httpx.TimeoutException as e:
+            error = LLMTimeoutError(f"LLM stream timeout: {e}")
+            record_llm_call(model, "stream", time.perf_counter() - started, error=error)
+            raise error
+        except httpx.HTTPError as e:
+            error = LLMError(f"LLM transport error: {e}")
+            record_llm_call(model, "stream", time.perf_counter() - started, error=error)
+            raise error
+        except LLMError as e:
+            record_llm_call(model, "stream", time.perf_counter() - started, error=e)
+            raise
+
+        record_llm_call(
+            model, "stream", time.perf_counter() - started,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            cached_prompt_tokens=_cached_tokens(usage)
+        )
+
+    async def complete_streaming(
+        self,
+        prompt: str,
+        model: str,
+        on_token: Callable[[str], None],
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None
+    ) -> str:
+        """Like complete(), but reports each delta to `on_token` as it arrives."""
+        parts = []
+        async for delta in self.stream(
+            messages=[{"role": "user", "content": prompt}],
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=timeout
+        ):
+            parts.append(delta)
+            on_token(delta)
+        return "".join(parts).strip()
+
+    async def aclose(self):
+        """Close the pooled connections (called on app shutdown)."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._loop = None
+
+# Singleton instance
+llm_client = AsyncLLMClient()
@@ -0,0 +1,166 @@
+"""
+Prompt Registry - precompiled, versioned agent prompts
+Every agent prompt is a static system prefix (role, rules, few-shot
+examples) plus a short dynamic user suffix. The system message is
+byte-identical on every call, so providers with prompt prefix caching only
+process the suffix; before, the per-call values came first in a single user
+message and no two prompts shared a prefix.
+
+Templates are parsed once when registered (at import, i.e. startup) and
+rendering is a join over the precompiled pieces. A prompt can have variants
+per template_id or locale, each with its own version; they come from
+templates/agent_prompts.py or PROMPT_VARIANTS_FILE.
+"""
+
+import json
+import string
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import config
+from templates.agent_prompts import AGENT_PROMPTS
+from utils.context_window import estimate_tokens
+from utils.logger import get_logger
+from utils.metrics import TOKEN_BUCKETS, metrics
+
+logger = get_logger("llm.prompts")
+
+PROMPT_TOKENS = metrics.histogram(
+    "llm_prompt_tokens", "Estimated prompt tokens per rendered prompt", ["prompt", "version", "part"],
+    buckets=TOKEN_BUCKETS
+)
+
+_formatter = string.Formatter()
+
+
+def _compile(text: str) -> List[Tuple[str, Optional[str]]]:
+    """Split a str.format template into (literal, field name or None) pieces."""
+    pieces = []
+    for literal, field, format_spec, conversion in _formatter.parse(text):
+        if field is not None and (format_spec or conversion or not field.isidentifier()):
+            raise ValueError(f"Only plain {{name}} fields are supported, got {{{field}}}")
+        pieces.append((literal, field))
+    return pieces
+
+
+class RenderedPrompt(NamedTuple):
+    """Chat messages for one call, with the template identity and token counts"""
+    name: str
+    version: str
+    messages: List[Dict[str, str]]
+    system_tokens: int
+    user_tokens: int
+
+    @property
+    def prompt_tokens(self) -> int:
+        return self.system_tokens + self.user_tokens
+
+
+class PromptTemplate:
+    """One prompt version: static system text and a user template with {fields}"""
+
+    def __init__(self, name: str, system: str, user: str, version: str = "1"):
+        self.name = name
+        self.version = version
+
+        system_pieces = _compile(system)
+        if any(field for _, field in system_pieces):
+            raise ValueError(f"Prompt '{name}': the system prefix must be static (no {{fields}})")
+        self.system = "".join(literal for literal, _ in system_pieces)
+        self.system_tokens = estimate_tokens(self.system)
+
+        self._user_pieces = _compile(user)
+        self.fields = frozenset(field for _, field in self._user_pieces if field)
+
+    def render(self, **values) -> RenderedPrompt:
+        missing = self.fields - values.keys()
+        if missing:
+            raise KeyError(f"Prompt '{self.name}' is missing values for {sorted(missing)}")
+
+        user = "".join(
+            literal + (str(values[field]) if field else "")
+            for literal, field in self._user_pieces
+        )
+        user_tokens = estimate_tokens(user)
+        if config.METRICS_ENABLED:
+            PROMPT_TOKENS.observe(self.system_tokens, prompt=self.name, version=self.version, part="system")
+            PROMPT_TOKENS.observe(user_tokens, prompt=self.name, version=self.version, part="user")
+
+        return RenderedPrompt(
+            name=self.name,
+            version=self.version,
+            messages=[
+                {"role": "system", "content": self.system},
+                {"role": "user", "content": user}
+            ],
+            system_tokens=self.system_tokens,
+            user_tokens=user_tokens
+        )
+
+
+class PromptRegistry:
+    """Prompt templates by name, with optional variants per template_id/locale"""
+
+    def __init__(self):
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._variants: Dict[Tuple[str, str], PromptTemplate] = {}
+
+    def register(self, name: str, system: str, user: str, version: str = "1", variant: Optional[str] = None):
+        """Compile and register a prompt, or a variant of an already registered one."""
+        template = PromptTemplate(name, system, user, version)
+        if variant is None:
+            self._templates[name] = template
+            return
+        default = self._templates.get(name)
+        if default is None:
+            raise KeyError(f"Unknown prompt '{name}' for variant '{variant}'")
+        if not template.fields <= default.fields:
+            # Agents only pass the default's values
+            raise ValueError(f"Variant '{variant}' of '{name}' uses unknown fields {sorted(template.fields - default.fields)}")
+        self._variants[(name, variant)] = template
+
+    def load_variants(self, path: str):
+        """
+        Load variants from JSON:
+        {"<prompt>": {"<template_id or locale>": {"version": "...", "system": "...", "user": "..."}}}
+        A missing "system" or "user" keeps the default prompt's text.
+        """
+        with open(path, encoding="utf-8") as f:
+            for name, variants in json.load(f).items():
+                default = AGENT_PROMPTS.get(name, {})
+                for variant, prompt in variants.items():
+                    self.register(
+                        name,
+                        prompt.get("system", default.get("system", "")),
+                        prompt.get("user", default.get("user", "")),
+                        version=prompt.get("version", "1"),
+                        variant=variant
+                    )
+        logger.info("📝 Loaded prompt variants from %s", path)
+
+    def get(self, name: str, variant: Optional[str] = None) -> PromptTemplate:
+        if variant is not None:
+            template = self._variants.get((name, variant))
+            if template is not None:
+                return template
+        return self._templates[name]
+
+    def render(self, name: str, variant: Optional[str] = None, **values) -> RenderedPrompt:
+        return self.get(name, variant).render(**values)
+
+    def versions(self) -> Dict[str, str]:
+        """Version of every prompt and variant, e.g. for logging with results."""
+        versions = {name: template.version for name, template in self._templates.items()}
+        versions.update({f"{name}:{variant}": template.version for (name, variant), template in self._variants.items()})
+        return versions
+
+
+def create_prompt_registry() -> PromptRegistry:
+    registry = PromptRegistry()
+    for name, prompt in AGENT_PROMPTS.items():
+        registry.register(name, prompt["system"], prompt["user"], version=prompt["version"])
+    if config.PROMPT_VARIANTS_FILE:
+        registry.load_variants(config.PROMPT_VARIANTS_FILE)
+    return registry
+
+# Singleton instance
+prompt_registry = create_prompt_registry()
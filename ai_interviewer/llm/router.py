@@ -0,0 +1,498 @@
+"""
+LLM Router - routes agent calls over several OpenAI-compatible providers
+Each agent asks for a role ("fast" for the relevance check, questions and
+probes, "quality" for analysis and summaries); the role maps to an ordered
+list of providers (Groq, Cerebras), each with its own pooled AsyncLLMClient.
+
+- Providers are tried by latency EWMA (or in configured order), skipping
+  those whose circuit breaker is open after repeated failures.
+- A failed call fails over to the next provider.
+- Hedging: if the first provider hasn't answered within its p90 latency, the
+  next one is started as well and whichever answers first wins (the other
+  request is cancelled).
+- Every attempt first reserves rate-limit budget from the provider's
+  RateLimiter (llm/scheduler.py); a 429 is retried on the same provider
+  after its Retry-After.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence, Union
+
+import config
+from llm.client import AsyncLLMClient, LLMError, LLMRateLimitError, LLMResponse, LLMTimeoutError, llm_client
+from llm.scheduler import RateLimiter, estimate_call_tokens
+from utils.logger import get_logger
+from utils.metrics import metrics
+
+logger = get_logger("llm.router")
+
+ROLES = ("fast", "quality")
+LATENCY_WINDOW = 200
+
+ROUTER_CALLS = metrics.counter(
+    "llm_router_calls_total", "Provider attempts made by the LLM router", ["provider", "role", "outcome"]
+)
+ROUTER_HEDGES = metrics.counter(
+    "llm_router_hedges_total", "Hedged calls, by the provider that answered first", ["role", "winner"]
+)
+
+
+def _as_messages(prompt: Union[str, List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    if isinstance(prompt, str):
+        return [{"role": "user", "content": prompt}]
+    return prompt
+
+
+def is_provider_failure(error: LLMError) -> bool:
+    """Timeouts, transport errors, 5xx and 429 count against provider health; other 4xx don't."""
+    if isinstance(error, LLMRateLimitError):
+        # Our own budget ran out, the provider itself is fine
+        return False
+    if isinstance(error, LLMTimeoutError) or error.status_code is None:
+        return True
+    return error.status_code >= 500 or error.status_code == 429
+
+
+class CircuitBreaker:
+    """
+    Closed → open after `failure_threshold` consecutive failures; after
+    `cooldown_seconds` one trial call is let through (half-open), which
+    closes the breaker on success or reopens it on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.cooldown_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (does not change state)."""
+        state = self.state
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self._trial_in_flight)
+
+    def begin(self):
+        """A call is going out; in half-open state it is the single trial call."""
+        if self.state == self.HALF_OPEN:
+            self._trial_in_flight = True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+        self._trial_in_flight = False
+
+    def release(self):
+        """A half-open trial ended without a verdict (e.g. cancelled)."""
+        self._trial_in_flight = False
+
+
+class LLMProvider:
+    """One provider backend: client, per-role models, latency stats and breaker"""
+
+    def __init__(
+        self,
+        name: str,
+        client: AsyncLLMClient,
+        models: Dict[str, str],
+        breaker: Optional[CircuitBreaker] = None,
+        ewma_alpha: Optional[float] = None,
+        limiter: Optional[RateLimiter] = None
+    ):
+        self.name = name
+        self.client = client
+        self.models = models
+        self.breaker = breaker or CircuitBreaker(config.LLM_BREAKER_FAILURES, config.LLM_BREAKER_COOLDOWN_SECONDS)
+        self.limiter = limiter or RateLimiter(name, max_wait_seconds=config.LLM_SCHEDULER_MAX_WAIT_SECONDS)
+        self.ewma_alpha = ewma_alpha or config.LLM_LATENCY_EWMA_ALPHA
+        self.ewma_ms: Optional[float] = None
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def model_for(self, role: str) -> str:
+        return self.models.get(role) or self.models["quality"]
+
+    def observe(self, latency_ms: float):
+        self._latencies.append(latency_ms)
+        if self.ewma_ms is None:
+            self.ewma_ms = latency_ms
+        else:
+            self.ewma_ms += self.ewma_alpha * (latency_ms - self.ewma_ms)
+
+    def p90_ms(self, min_samples: int) -> Optional[float]:
+        if len(self._latencies) < min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[int(0.9 * (len(ordered) - 1))]
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.breaker.state,
+            "ewma_ms": round(self.ewma_ms, 1) if self.ewma_ms is not None else None,
+            "p90_ms": round(self.p90_ms(1), 1) if self._latencies else None,
+            "samples": len(self._latencies),
+            **self.limiter.stats()
+        }
+
+
+class LLMRouter:
+    """Same call surface as AsyncLLMClient, with `role` in place of `model`"""
+
+    def __init__(
+        self,
+        providers: Sequence[LLMProvider],
+        routes: Dict[str, List[str]],
+        by_latency: Optional[bool] = None,
+        hedge: Optional[bool] = None,
+        hedge_min_delay_ms: Optional[float] = None,
+        hedge_min_samples: Optional[int] = None
+    ):
+        self.providers = {provider.name: provider for provider in providers}
+        self.routes = {
+            role: [name for name in names if name in self.providers] or list(self.providers)
+            for role, names in routes.items()
+        }
+        self.by_latency = config.LLM_ROUTE_BY_LATENCY if by_latency is None else by_latency
+        self.hedge = config.LLM_HEDGE if hedge is None else hedge
+        self.hedge_min_delay_ms = config.LLM_HEDGE_MIN_DELAY_MS if hedge_min_delay_ms is None else hedge_min_delay_ms
+        self.hedge_min_samples = config.LLM_HEDGE_MIN_SAMPLES if hedge_min_samples is None else hedge_min_samples
+
+    def candidates(self, role: str) -> List[LLMProvider]:
+        """Providers for `role` in the order to try them, skipping open breakers."""
+        providers = [self.providers[name] for name in self.routes.get(role, self.routes["quality"])]
+        if self.by_latency:
+            # Stable sort: providers without samples keep their configured place up front
+            providers.sort(key=lambda provider: provider.ewma_ms or 0.0)
+        healthy = [provider for provider in providers if provider.breaker.allow()]
+        # With every breaker open, still try them rather than fail outright
+        return healthy or providers
+
+    def _hedge_delay(self, provider: LLMProvider) -> Optional[float]:
+        """Seconds to wait on `provider` before hedging; None until it has enough samples."""
+        if not self.hedge:
+            return None
+        p90 = provider.p90_ms(self.hedge_min_samples)
+        if p90 is None:
+            return None
+        return max(p90, self.hedge_min_delay_ms) / 1000
+
+    def _should_retry(self, provider: LLMProvider, error: LLMError, retry: int) -> bool:
+        """After a provider 429: pause the provider's limiter and say whether to try it again."""
+        if error.status_code != 429 or isinstance(error, LLMRateLimitError):
+            return False
+        backoff = config.LLM_RATE_LIMIT_BACKOFF_SECONDS * 2 ** retry
+        provider.limiter.rate_limited(error.retry_after if error.retry_after is not None else backoff)
+        return retry < config.LLM_RATE_LIMIT_RETRIES
+
+    def _failed(self, provider: LLMProvider, role: str, error: LLMError):
+        if is_provider_failure(error):
+            provider.breaker.record_failure()
+        else:
+            provider.breaker.release()
+        outcome = "rate_limited" if isinstance(error, LLMRateLimitError) else "error"
+        ROUTER_CALLS.inc(provider=provider.name, role=role, outcome=outcome)
+
+    async def _attempt(
+        self, provider: LLMProvider, role: str, priority: str, messages, max_tokens, temperature, timeout, cache
+    ) -> LLMResponse:
+        reserved = estimate_call_tokens(messages, max_tokens)
+        retry = 0
+        while True:
+            try:
+                await provider.limiter.acquire(reserved, priority)
+                started = time.perf_counter()
+                response = await provider.client.chat(
+                    messages=messages,
+                    model=provider.model_for(role),
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    timeout=timeout,
+                    cache=cache
+                )
+                break
+            except asyncio.CancelledError:
+                provider.breaker.release()
+                ROUTER_CALLS.inc(provider=provider.name, role=role, outcome="cancelled")
+                raise
+            except LLMError as e:
+                if self._should_retry(provider, e, retry):
+                    retry += 1
+                    continue
+                if isinstance(e, LLMTimeoutError):
+                    # A stalled provider's latency should rise, not stay at its last good value
+                    provider.observe((time.perf_counter() - started) * 1000)
+                self._failed(provider, role, e)
+                raise
+
+        if response.cached:
+            provider.limiter.settle(reserved, 0, cached=True)
+        else:
+            provider.observe((time.perf_counter() - started) * 1000)
+            if response.prompt_tokens or response.completion_tokens:
+                provider.limiter.settle(reserved, response.prompt_tokens + response.completion_tokens)
+        provider.limiter.succeeded()
+        provider.breaker.record_success()
+        ROUTER_CALLS.inc(provider=provider.name, role=role, outcome="success")
+        return response.model_copy(update={"provider": provider.name})
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        role: str = "quality",
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+        cache: bool = False,
+        priority: str = "interactive"
+    ) -> LLMResponse:
+        """
+        Run one chat completion on the best available provider for `role`.
+
+        On error the next provider is tried; with hedging, the next provider
+        is also started when the current one runs past its p90 latency.
+        `priority` ("interactive" or "background") orders calls queued for
+        rate-limit budget. Raises the last provider error when every provider failed.
+        """
+        candidates = iter(self.candidates(role))
+        pending: Dict[asyncio.Task, LLMProvider] = {}
+        last_error: Optional[LLMError] = None
+        hedged = False
+
+        def launch() -> bool:
+            provider = next(candidates, None)
+            if provider is None:
+                return False
+            provider.breaker.begin()
+            task = asyncio.create_task(
+                self._attempt(provider, role, priority, messages, max_tokens, temperature, timeout, cache)
+            )
+            pending[task] = provider
+            return True
+
+        launch()
+        try:
+            while pending:
+                delay = None
+                if not hedged and len(pending) == 1:
+                    delay = self._hedge_delay(next(iter(pending.values())))
+                done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # Hedge once: the slow request keeps running alongside the next provider
+                    hedged = True
+                    launch()
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        if hedged:
+                            ROUTER_HEDGES.inc(role=role, winner=provider.name)
+                        return task.result()
+                    if not isinstance(error, LLMError):
+                        raise error
+                    last_error = error
+                    logger.info("⚠️ LLM provider %s failed (%s), failing over", provider.name, error)
+
+                if not pending:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        raise last_error or LLMError(f"No LLM provider available for role '{role}'")
+
+    async def complete(
+        self,
+        prompt: Union[str, List[Dict[str, str]]],
+        role: str = "quality",
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+        cache: bool = False,
+        priority: str = "interactive"
+    ) -> str:
+        """Completion of a prompt string (one user message) or message list, returns the stripped text."""
+        response = await self.chat(
+            messages=_as_messages(prompt),
+            role=role,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=timeout,
+            cache=cache,
+            priority=priority
+        )
+        return response.content.strip()
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        role: str = "fast",
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+        priority: str = "interactive"
+    ) -> AsyncIterator[str]:
+        """
+        Stream from the best available provider. Fails over (or retries a
+        429) only before the first delta - once text reached the caller a
+        failure is raised.
+        """
+        reserved = estimate_call_tokens(messages, max_tokens)
+        last_error: Optional[LLMError] = None
+        for provider in self.candidates(role):
+            provider.breaker.begin()
+            retry = 0
+            while True:
+                started = False
+                try:
+                    await provider.limiter.acquire(reserved, priority)
+                    async for delta in provider.client.stream(
+                        messages=messages,
+                        model=provider.model_for(role),
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        timeout=timeout
+                    ):
+                        started = True
+                        yield delta
+                except LLMError as e:
+                    if not started and self._should_retry(provider, e, retry):
+                        retry += 1
+                        continue
+                    self._failed(provider, role, e)
+                    if started:
+                        raise
+                    last_error = e
+                    logger.info("⚠️ LLM provider %s stream failed (%s), failing over", provider.name, e)
+                    break
+                except BaseException as e:
+                    # Cancelled, or the caller stopped reading: no verdict on the provider
+                    provider.breaker.release()
+                    if isinstance(e, (asyncio.CancelledError, GeneratorExit)):
+                        ROUTER_CALLS.inc(provider=provider.name, role=role, outcome="cancelled")
+                    raise
+                provider.limiter.succeeded()
+                provider.breaker.record_success()
+                ROUTER_CALLS.inc(provider=provider.name, role=role, outcome="success")
+                return
+
+        raise last_error or LLMError(f"No LLM provider available for role '{role}'")
+
+    async def complete_streaming(
+        self,
+        prompt: Union[str, List[Dict[str, str]]],
+        on_token: Callable[[str], None],
+        role: str = "fast",
+        max_tokens: int = 200,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+        priority: str = "interactive"
+    ) -> str:
+        """Like complete(), but reports each delta to `on_token` as it arrives."""
+        parts = []
+        async for delta in self.stream(
+            messages=_as_messages(prompt),
+            role=role,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=timeout,
+            priority=priority
+        ):
+            parts.append(delta)
+            on_token(delta)
+        return "".join(parts).strip()
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: provider.stats() for name, provider in self.providers.items()}
+
+    async def aclose(self):
+        """Close every provider's pooled connections (called on app shutdown)."""
+        for provider in self.providers.values():
+            await provider.client.aclose()
+
+
+def _split(names: str) -> List[str]:
+    return [name.strip() for name in names.split(",") if name.strip()]
+
+
+def _groq_provider() -> LLMProvider:
+    return LLMProvider(
+        "groq",
+        llm_client,
+        {"fast": config.GROQ_FAST_MODEL, "quality": config.GROQ_QUALITY_MODEL},
+        limiter=RateLimiter(
+            "groq",
+            config.GROQ_REQUESTS_PER_MINUTE,
+            config.GROQ_TOKENS_PER_MINUTE,
+            config.LLM_SCHEDULER_MAX_WAIT_SECONDS,
+            config.LLM_RATE_BURST_SECONDS
+        )
+    )
+
+
+def create_llm_router() -> LLMRouter:
+    """Router over the providers configured in config.py (Groq always, when nothing else is)."""
+    providers = []
+    if config.GROQ_ENABLED:
+        providers.append(_groq_provider())
+    if config.CEREBRAS_ENABLED:
+        providers.append(LLMProvider(
+            "cerebras",
+            AsyncLLMClient(base_url=config.CEREBRAS_BASE_URL, api_key=config.CEREBRAS_API_KEY),
+            {"fast": config.CEREBRAS_FAST_MODEL, "quality": config.CEREBRAS_QUALITY_MODEL},
+            limiter=RateLimiter(
+                "cerebras",
+                config.CEREBRAS_REQUESTS_PER_MINUTE,
+                config.CEREBRAS_TOKENS_PER_MINUTE,
+                config.LLM_SCHEDULER_MAX_WAIT_SECONDS,
+                config.LLM_RATE_BURST_SECONDS
+            )
+        ))
+    if not providers:
+        providers.append(_groq_provider())
+
+    return LLMRouter(providers, {
+        "fast": _split(config.LLM_ROUTE_FAST),
+        "quality": _split(config.LLM_ROUTE_QUALITY)
+    })
+
+# Singleton instance
+llm_router = create_llm_router()
+
+
+def _export_router_gauges():
+    breaker_open = metrics.gauge("llm_provider_breaker_open", "1 while the provider's circuit breaker is open", ["provider"])
+    ewma = metrics.gauge("llm_provider_latency_ewma_seconds", "Provider latency EWMA", ["provider"])
+    queued = metrics.gauge("llm_scheduler_queued", "Calls waiting for rate-limit budget", ["provider"])
+    for name, provider in llm_router.providers.items():
+        breaker_open.set(1 if provider.breaker.state == CircuitBreaker.OPEN else 0, provider=name)
+        queued.set(provider.limiter.queued, provider=name)
+        if provider.ewma_ms is not None:
+            ewma.set(provider.ewma_ms / 1000, provider=name)
+
+
+metrics.add_collector(_export_router_gauges)
@@ -0,0 +1,216 @@
+"""
+LLM Scheduler - per-provider rate limits with priority queueing
+Each provider gets a RateLimiter holding two token buckets (requests per
+minute and tokens per minute). Calls reserve budget before going out and
+queue when there is none, interactive turns ahead of background work
+(summaries), instead of hitting the provider and getting a 429.
+
+A 429 from the provider pauses the limiter for its Retry-After and halves
+the refill rate; successful calls bring the rate back up (AIMD), so the
+budget adapts when the configured limits are higher than what the account
+really gets.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, List, Tuple
+
+from llm.client import LLMRateLimitError
+from utils.context_window import estimate_tokens
+from utils.logger import get_logger
+from utils.metrics import metrics
+
+logger = get_logger("llm.scheduler")
+
+# Lower value = served first
+PRIORITIES = {"interactive": 0, "background": 1}
+
+# AIMD on the refill rate after 429s
+MIN_RATE_SCALE = 0.1
+RATE_DECREASE = 0.5
+RATE_INCREASE = 0.05
+
+SCHEDULER_WAIT = metrics.histogram(
+    "llm_scheduler_wait_seconds", "Time LLM calls queued for rate-limit budget", ["provider", "priority"]
+)
+SCHEDULER_TIMEOUTS = metrics.counter(
+    "llm_scheduler_timeouts_total", "Calls that gave up waiting for rate-limit budget", ["provider", "priority"]
+)
+RATE_LIMITED = metrics.counter(
+    "llm_rate_limited_total", "429 responses received from the provider", ["provider"]
+)
+
+
+def estimate_call_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+    """Tokens a call may use against a tokens-per-minute budget: prompt estimate plus max output."""
+    return sum(estimate_tokens(message.get("content") or "") for message in messages) + max_tokens
+
+
+class TokenBucket:
+    """
+    Refills at `per_minute` units per minute and holds `burst_seconds` worth
+    (60 = the whole minute's budget, the window providers count over). The
+    level may go negative when actual usage turns out higher than reserved.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.scale = 1.0
+        self.clock = clock
+        self.level = self.capacity
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate * self.scale)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until `amount` is available (0 if it is now)."""
+        self._refill()
+        # A single call larger than the whole bucket waits for a full bucket
+        missing = min(amount, self.capacity) - self.level
+        return 0.0 if missing <= 0 else missing / (self.rate * self.scale)
+
+    def take(self, amount: float):
+        self._refill()
+        self.level -= amount
+
+    def give(self, amount: float):
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """One provider's request/token budgets and the queue of calls waiting on them"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_wait_seconds: float = 20.0,
+        burst_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute, burst_seconds, clock) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute, burst_seconds, clock) if tokens_per_minute > 0 else None
+        self.max_wait_seconds = max_wait_seconds
+        self.clock = clock
+        self.paused_until = 0.0
+        self.rate_scale = 1.0
+        self._waiters: List[Tuple[int, int, asyncio.Event]] = []
+        self._sequence = itertools.count()
+
+    def _delay(self, tokens: int) -> float:
+        delay = self.paused_until - self.clock()
+        if self.requests is not None:
+            delay = max(delay, self.requests.delay(1))
+        if self.tokens is not None:
+            delay = max(delay, self.tokens.delay(tokens))
+        return max(delay, 0.0)
+
+    def _take(self, tokens: int):
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(tokens)
+
+    def _wake_head(self):
+        if self._waiters:
+            self._waiters[0][2].set()
+
+    async def acquire(self, tokens: int, priority: str = "interactive") -> float:
+        """
+        Wait until one request and `tokens` tokens are available, then reserve
+        them. Waiters are served strictly by priority, then arrival order.
+
+        Returns the seconds spent queued. Raises LLMRateLimitError after
+        max_wait_seconds so the router can fail over.
+        """
+        started = self.clock()
+        if not self._waiters and self._delay(tokens) <= 0:
+            self._take(tokens)
+            SCHEDULER_WAIT.observe(0.0, provider=self.name, priority=priority)
+            return 0.0
+
+        event = asyncio.Event()
+        entry = (PRIORITIES.get(priority, PRIORITIES["background"]), next(self._sequence), event)
+        heapq.heappush(self._waiters, entry)
+        try:
+            while True:
+                delay = None
+                if self._waiters[0] is entry:
+                    delay = self._delay(tokens)
+                    if delay <= 0:
+                        heapq.heappop(self._waiters)
+                        self._take(tokens)
+                        break
+
+                remaining = started + self.max_wait_seconds - self.clock()
+                if remaining <= 0 or (delay is not None and delay > remaining):
+                    SCHEDULER_TIMEOUTS.inc(provider=self.name, priority=priority)
+                    raise LLMRateLimitError(
+                        f"No {self.name} rate-limit budget within {self.max_wait_seconds}s", status_code=429
+                    )
+
+                # The head sleeps until its budget refills; the rest wait to become head
+                event.clear()
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=remaining if delay is None else delay)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+        finally:
+            self._wake_head()
+
+        waited = self.clock() - started
+        SCHEDULER_WAIT.observe(waited, provider=self.name, priority=priority)
+        if waited >= 1.0:
+            logger.info("⏳ %s call queued %.1fs for rate-limit budget (%s)", self.name, waited, priority)
+        return waited
+
+    def settle(self, reserved_tokens: int, used_tokens: int, cached: bool = False):
+        """Replace a call's reserved token estimate with its reported usage (cache hits cost nothing)."""
+        if cached and self.requests is not None:
+            self.requests.give(1)
+        if self.tokens is not None:
+            self.tokens.give(reserved_tokens - used_tokens)
+        self._wake_head()
+
+    def rate_limited(self, retry_after: float):
+        """The provider answered 429: pause for `retry_after` and slow the refill."""
+        RATE_LIMITED.inc(provider=self.name)
+        self.paused_until = max(self.paused_until, self.clock() + retry_after)
+        self._set_scale(max(MIN_RATE_SCALE, self.rate_scale * RATE_DECREASE))
+        logger.warning("⚠️ %s rate limited, pausing %.1fs (rate x%.2f)", self.name, retry_after, self.rate_scale)
+
+    def succeeded(self):
+        if self.rate_scale < 1.0:
+            self._set_scale(min(1.0, self.rate_scale + RATE_INCREASE))
+
+    def _set_scale(self, scale: float):
+        for bucket in (self.requests, self.tokens):
+            if bucket is not None:
+                bucket._refill()
+                bucket.scale = scale
+        self.rate_scale = scale
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def stats(self) -> Dict:
+        return {
+            "queued": self.queued,
+            "paused_seconds": round(max(0.0, self.paused_until - self.clock()), 2),
+            "rate_scale": round(self.rate_scale, 2)
+        }
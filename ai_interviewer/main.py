@@ -1,43 +1,55 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from contextlib import asynccontextmanager
 import json
-import redis
-from groq import Groq
+import time
 import config
 
 # ========================================================================
 # IMPORT LANGGRAPH WORKFLOW
 # ========================================================================
-from graph.workflow import interview_workflow, InterviewGraphState
-from models.schemas import InterviewState
+from graph.workflow import interview_workflow, InterviewGraphState, create_started_state
+from graph.draft_prefetch import draft_prefetch
+from models.schemas import InterviewState, JobRecord, JobStatus, TemplateAnalytics
 from storage.db_client import db_client
+from llm.router import llm_router
+from storage.session_store import session_store, SessionConflictError
+from storage.single_flight import chat_flight, SessionBusyError
+from storage.template_analytics import template_analytics
+from jobs.queue import callback_allowed, job_queue
+from jobs.handlers import FINALIZE_INTERVIEW, finalize_idempotency_key, register_handlers, summary_result
+from llm.cache import completion_cache
+from utils.insight_index import insight_index_cache
+from utils.logger import get_logger
+from utils.metrics import HTTP_DURATION, metrics
 
-# ========================================================================
-# REDIS CLIENT SETUP
-# ========================================================================
-redis_client = redis.Redis(
-    host=config.REDIS_HOST,
-    port=config.REDIS_PORT,
-    db=config.REDIS_DB,
-    password=config.REDIS_PASSWORD,
-    decode_responses=True
-)
+logger = get_logger("main")
 
-# ========================================================================
-# GROQ CLIENT SETUP
-# ========================================================================
-groq_client = Groq(api_key=config.GROQ_API_KEY)
+register_handlers(job_queue)
 
 # ========================================================================
 # FASTAPI APP INITIALIZATION
 # ========================================================================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the database and job workers; release the shared LLM, Redis and DB pools on shutdown."""
+    await db_client.connect()
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    await llm_router.aclose()
+    await session_store.redis.aclose()
+    await db_client.close()
+
 app = FastAPI(
     title="AI Interview Agent with Intelligent Probe Decision",
     description="Interview agent that ONLY probes when responses are truly irrelevant",
-    version="2.1.0"
+    version="2.1.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -48,6 +60,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Request wall time by route template (not raw path, to keep labels bounded)."""
+    if not config.METRICS_ENABLED:
+        return await call_next(request)
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_DURATION.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status)
+        )
+
 # ========================================================================
 # REQUEST/RESPONSE MODELS
 # ========================================================================
@@ -65,6 +97,17 @@ class StartResponse(BaseModel):
 class ChatRequest(BaseModel):
     session_id: str
     message: str
+    # Same key on a retry = same response, the turn is not processed again
+    # (also accepted as an Idempotency-Key header)
+    idempotency_key: Optional[str] = None
+
+class DraftRequest(BaseModel):
+    session_id: str
+    draft: str  # the answer as typed so far
+
+class DraftResponse(BaseModel):
+    success: bool
+    status: str  # started / unchanged / limit / too_short / skipped
 
 class ProgressInfo(BaseModel):
     current: int
@@ -82,6 +125,7 @@ class ChatResponse(BaseModel):
 
 class EndRequest(BaseModel):
     session_id: str
+    callback_url: Optional[str] = None  # receives the finished summary job (POST)
 
 class TranscriptMessage(BaseModel):
     role: str
@@ -97,31 +141,41 @@ class EndResponse(BaseModel):
     total_duration_seconds: int
     terminated_early: bool = False
     termination_reason: Optional[str] = None
+    summary_status: str = "ready"  # "pending" until the summary job finishes
+    summary_job_id: Optional[str] = None
 
 class HealthResponse(BaseModel):
     status: str
     groq_connected: bool
     redis_connected: bool
+    llm_providers: Dict[str, str] = {}  # provider -> circuit breaker state
 
 # ========================================================================
 # HELPER FUNCTIONS
 # ========================================================================
 
-def get_state_from_redis(session_id: str) -> Optional[Dict]:
-    """Retrieve LangGraph state from Redis"""
-    state_json = redis_client.get(f"langgraph_state:{session_id}")
-    if state_json:
-        return json.loads(state_json)
-    return None
-
-def save_state_to_redis(session_id: str, state: Dict):
-    """Save LangGraph state to Redis"""
-    redis_client.set(
-        f"langgraph_state:{session_id}",
-        json.dumps(state, default=str),
-        ex=86400  # 24 hour expiry
+def build_chat_response(result: Dict) -> ChatResponse:
+    """Build the /agent/chat response from a finished workflow state"""
+    analyzed = result.get("analyzed_response")
+    
+    return ChatResponse(
+        success=True,
+        next_question=result.get("current_question"),
+        is_probe=result.get("is_probe", False),
+        sentiment=analyzed.sentiment.value if analyzed else "neutral",
+        progress=ProgressInfo(
+            current=result["question_count"],
+            total=result["max_questions"]
+        ),
+        is_complete=result.get("is_complete", False),
+        terminated_early=result.get("should_terminate_early", False),
+        termination_reason=result.get("termination_reason")
     )
 
+def sse_event(event: str, data: Dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 # ========================================================================
 # ENDPOINTS
 # ========================================================================
@@ -129,19 +183,15 @@ def save_state_to_redis(session_id: str, state: Dict):
 @app.get("/agent/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    redis_ok = False
-    try:
-        redis_client.ping()
-        redis_ok = True
-    except Exception:
-        pass
+    redis_ok = await session_store.ping()
     
     groq_ok = bool(config.GROQ_API_KEY)
     
     return HealthResponse(
         status="ok" if (redis_ok and groq_ok) else "degraded",
         groq_connected=groq_ok,
-        redis_connected=redis_ok
+        redis_connected=redis_ok,
+        llm_providers={name: stats["state"] for name, stats in llm_router.stats().items()}
     )
 
 @app.post("/agent/start", response_model=StartResponse)
@@ -151,59 +201,23 @@ async def start_interview(request: StartRequest):
         session_id = request.session_id
         template_id = request.template_id
         
-        print(f"\n{'='*60}")
-        print(f"🚀 STARTING INTERVIEW: {session_id}")
-        print(f"   Template: {template_id}")
-        
         # Get research topic from starter questions
         research_topic = request.starter_questions[0] if request.starter_questions else "your experiences"
         
-        # Initialize LangGraph state
-        initial_state: InterviewGraphState = {
-            "session_id": session_id,
-            "respondent_id": session_id,
-            "template_id": template_id,
-            "research_topic": research_topic,
-            "conversation_history": [],
-            "user_response": "",
-            "current_question": None,
-            "analyzed_response": None,
-            "deep_analysis": None,
-            "is_probe": False,
-            "is_complete": False,
-            "should_terminate_early": False,
-            "termination_reason": None,
-            "probe_count": 0,
-            "consecutive_probes": 0,  # NEW: Track consecutive probes
-            "question_count": 0,
-            "total_exchanges": 0,
-            "max_questions": 15,
-            "waiting_for_clarification": False,
-            "accumulated_insights": [],
-            "probe_decision": None,
-            "summary": None
-        }
-        
-        # Create first question
-        first_question = f"Hi! I'm really excited to learn about your experiences. {research_topic}"
-        
-        # Add to conversation history
-        initial_state["conversation_history"].append({
-            "role": "assistant",
-            "content": first_question
-        })
-        initial_state["current_question"] = first_question
-        initial_state["question_count"] = 1
+        # Initialize LangGraph state with the first question
+        initial_state = create_started_state(session_id, template_id, research_topic)
+        first_question = initial_state["current_question"]
         
         # Save state to Redis
-        save_state_to_redis(session_id, initial_state)
+        await session_store.save(session_id, initial_state)
         
         # Initialize in database
         await db_client.initialize_session(session_id, template_id, research_topic)
+        await template_analytics.record_started(template_id)
         
-        print(f"✅ Interview initialized with INTELLIGENT PROBE DECISION")
-        print(f"   First question: {first_question[:50]}...")
-        print(f"{'='*60}\n")
+        logger.info(
+            "🚀 Interview started", extra={"session_id": session_id, "template_id": template_id}
+        )
         
         return StartResponse(
             success=True,
@@ -212,113 +226,196 @@ async def start_interview(request: StartRequest):
         )
     
     except Exception as e:
-        print(f"❌ Error starting interview: {e}")
+        logger.exception("❌ Error starting interview: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to start interview: {str(e)}")
 
 @app.post("/agent/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+async def chat(
+    request: ChatRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None)
+):
     """
     Process user message using LangGraph workflow with INTELLIGENT probe decision.
     Only probes if response is TRULY irrelevant/off-topic.
+    
+    Turns for one session run one at a time. A repeated idempotency key
+    returns the first request's response (waiting for it if it is still
+    running) with an `Idempotent-Replayed: true` header.
     """
     try:
         session_id = request.session_id
         user_message = request.message
-        
-        print(f"\n{'='*60}")
-        print(f"💬 USER: {user_message[:100]}...")
-        
-        # Retrieve current state from Redis
-        state = get_state_from_redis(session_id)
-        if not state:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        print(f"📊 Current state: Q{state['question_count']}/{state['max_questions']}, Probes: {state['probe_count']}")
-        
-        # Update state with user response
-        state["user_response"] = user_message
-        
-        # ========================================================================
-        # 🎯 RUN LANGGRAPH WORKFLOW WITH INTELLIGENT PROBE DECISION
-        # ========================================================================
-        print(f"🔄 Running LangGraph workflow with AI probe decision...")
-        
-        # Invoke the workflow
-        result = await interview_workflow.ainvoke(state)
-        
-        print(f"✅ Workflow completed")
-        print(f"   Complete: {result.get('is_complete', False)}")
-        print(f"   Early termination: {result.get('should_terminate_early', False)}")
-        
-        # ========================================================================
-        # Extract results from workflow
-        # ========================================================================
-        
-        next_question = result.get("current_question")
-        is_probe = result.get("is_probe", False)
-        is_complete = result.get("is_complete", False)
-        terminated_early = result.get("should_terminate_early", False)
-        termination_reason = result.get("termination_reason")
-        
-        # Get sentiment from analyzed response
-        analyzed = result.get("analyzed_response")
-        sentiment = analyzed.sentiment.value if analyzed else "neutral"
-        
-        # Progress info
-        progress = ProgressInfo(
-            current=result["question_count"],
-            total=result["max_questions"]
-        )
-        
-        print(f"🤖 AGENT: {next_question[:100] if next_question else 'COMPLETE'}...")
-        
-        # Save updated state to Redis
-        save_state_to_redis(session_id, result)
-        
-        print(f"{'='*60}\n")
-        
-        return ChatResponse(
-            success=True,
-            next_question=next_question,
-            is_probe=is_probe,
-            sentiment=sentiment,
-            progress=progress,
-            is_complete=is_complete,
-            terminated_early=terminated_early,
-            termination_reason=termination_reason
-        )
+        key = request.idempotency_key or idempotency_key
+        
+        async def run_turn(state: Dict) -> Dict:
+            logger.debug(
+                "💬 Turn at Q%d/%d, probes: %d", state["question_count"], state["max_questions"], state["probe_count"],
+                extra={"session_id": session_id}
+            )
+            
+            # Update state with user response
+            state["user_response"] = user_message
+            state["prefetched_turn"] = await draft_prefetch.claim(session_id, state, user_message)
+            
+            # ========================================================================
+            # 🎯 RUN LANGGRAPH WORKFLOW WITH INTELLIGENT PROBE DECISION
+            # ========================================================================
+            # Invoke the workflow
+            return await interview_workflow.ainvoke(state)
+        
+        async def process() -> Dict:
+            # Load, run and save back under the session lock; optimistic
+            # locking still guards against writers outside the lock (/agent/end).
+            # No retry on conflict: the turn already saved rows, recorded analytics
+            # and used up its draft prefetch, so it is reported as a 409 instead
+            result = await session_store.update(session_id, run_turn, retries=0)
+            if result is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            
+            logger.debug(
+                "✅ Workflow completed (complete: %s, early termination: %s)",
+                result.get("is_complete", False), result.get("should_terminate_early", False),
+                extra={"session_id": session_id}
+            )
+            return build_chat_response(result).model_dump()
+        
+        payload, replayed = await chat_flight.run(session_id, key, process)
+        if replayed:
+            logger.info("♻️ Replayed response for idempotency key %s", key, extra={"session_id": session_id})
+            response.headers["Idempotent-Replayed"] = "true"
+        
+        return ChatResponse(**payload)
     
     except HTTPException:
         raise
+    except SessionBusyError as e:
+        logger.warning("⚠️ %s", e)
+        raise HTTPException(status_code=409, detail="Session is busy with another message, please retry")
+    except SessionConflictError as e:
+        logger.warning("⚠️ %s", e)
+        raise HTTPException(status_code=409, detail="Session was modified concurrently, please retry")
     except Exception as e:
-        print(f"❌ Error in chat: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error in chat: %s", e)
         raise HTTPException(status_code=500, detail=f"Error processing response: {str(e)}")
 
+@app.post("/agent/chat/stream")
+async def chat_stream(request: ChatRequest, idempotency_key: Optional[str] = Header(None)):
+    """
+    Streaming variant of /agent/chat (Server-Sent Events).
+    
+    Emits `token` events with the interviewer/probe question as it is
+    generated (a `replace` event with the whole question supersedes the
+    tokens sent so far), then a final `done` event carrying the same payload as
+    /agent/chat (progress, sentiment, is_probe, ...). Holds the session
+    lock while streaming; a repeated idempotency key gets only the `done`
+    event of the first request.
+    """
+    session_id = request.session_id
+    key = request.idempotency_key or idempotency_key
+    if not await session_store.exists(session_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    async def event_stream():
+        result = None
+        try:
+            previous = await chat_flight.wait(session_id, key) if key else None
+            if previous is not None:
+                yield sse_event("done", previous)
+                return
+            
+            async with chat_flight.lock(session_id):
+                # A duplicate may have finished while this request waited
+                previous = await chat_flight.recall(session_id, key) if key else None
+                if previous is not None:
+                    yield sse_event("done", previous)
+                    return
+                
+                state, version = await session_store.load_versioned(session_id)
+                if not state:
+                    yield sse_event("error", {"detail": "Session not found"})
+                    return
+                state["user_response"] = request.message
+                state["prefetched_turn"] = await draft_prefetch.claim(session_id, state, request.message)
+                
+                async for mode, chunk in interview_workflow.astream(
+                    state,
+                    config={"configurable": {"stream_tokens": True}},
+                    stream_mode=["custom", "values"]
+                ):
+                    if mode == "custom" and chunk.get("type") in ("token", "replace"):
+                        yield sse_event(chunk["type"], {"content": chunk["content"]})
+                    elif mode == "values":
+                        result = chunk
+                
+                # Tokens are already out, so a conflicting write is reported rather than retried
+                await session_store.save(session_id, result, expected_version=version)
+                payload = build_chat_response(result).model_dump()
+                if key:
+                    await chat_flight.remember(session_id, key, payload)
+            yield sse_event("done", payload)
+        
+        except SessionBusyError as e:
+            logger.warning("⚠️ %s", e)
+            yield sse_event("error", {"detail": "Session is busy with another message, please retry"})
+        except SessionConflictError as e:
+            logger.warning("⚠️ %s", e)
+            yield sse_event("error", {"detail": "Session was modified concurrently, please retry"})
+        except Exception as e:
+            logger.exception("❌ Error in streaming chat: %s", e)
+            yield sse_event("error", {"detail": f"Error processing response: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/agent/chat/draft", response_model=DraftResponse)
+async def chat_draft(request: DraftRequest):
+    """
+    The respondent's answer while it is being typed. Starts the turn's LLM
+    work on the draft in the background; /agent/chat uses the result when
+    the sent message is close enough to the draft. Post it as typing pauses.
+    """
+    state = await session_store.load(request.session_id)
+    if not state:
+        raise HTTPException(status_code=404, detail="Session not found")
+    status = draft_prefetch.submit(request.session_id, state, request.draft)
+    return DraftResponse(success=True, status=status)
+
 @app.post("/agent/end", response_model=EndResponse)
 async def end_interview(request: EndRequest):
-    """End the interview and return transcript and summary."""
+    """
+    End the interview: return the transcript right away and hand summary
+    generation, persistence and Redis cleanup to a background job.
+    Poll GET /agent/jobs/{summary_job_id} (or pass callback_url) for the
+    summary when summary_status is "pending".
+    """
     try:
         session_id = request.session_id
-        
-        print(f"\n{'='*60}")
-        print(f"🏁 ENDING INTERVIEW: {session_id}")
+        if request.callback_url and not callback_allowed(request.callback_url):
+            raise HTTPException(
+                status_code=400,
+                detail="callback_url is not under an allowed base URL (JOB_CALLBACK_ALLOWED_URLS)"
+            )
         
         # Retrieve final state
-        state = get_state_from_redis(session_id)
+        state = await session_store.load(session_id)
         if not state:
             raise HTTPException(status_code=404, detail="Session not found")
-        
-        # If not complete, run workflow one more time to generate summary
-        if not state.get("is_complete"):
-            print(f"⚡ Generating final summary...")
-            state["is_complete"] = True
-            result = await interview_workflow.ainvoke(state)
-            state = result
-        
-        # Extract summary from state
-        summary_data = state.get("summary", {})
+        draft_prefetch.discard(session_id)
+        insight_index_cache.discard(session_id)
+        
+        # Summary (if still missing), persistence and cleanup run in the background
+        job = await job_queue.enqueue(
+            FINALIZE_INTERVIEW,
+            {"session_id": session_id},
+            idempotency_key=finalize_idempotency_key(session_id),
+            callback_url=request.callback_url
+        )
+        if config.SUMMARY_JOB_WAIT_SECONDS > 0 and not job.is_finished:
+            job = await job_queue.wait(job.job_id, config.SUMMARY_JOB_WAIT_SECONDS) or job
         
         # Build transcript from conversation history
         transcript = []
@@ -332,49 +429,103 @@ async def end_interview(request: EndRequest):
         # Calculate duration (approximate)
         duration_seconds = len(transcript) * 30  # Rough estimate
         
-        # Extract data from summary
-        if isinstance(summary_data, dict):
-            summary_text = summary_data.get("summary", "Interview completed successfully.")
-            sentiment_score = summary_data.get("average_sentiment_score", 0.5)
-            key_themes = summary_data.get("key_themes", [])
+        # Summary from the finished job, or from the workflow if it already completed
+        if job.status == JobStatus.SUCCEEDED:
+            summary_fields = job.result
+            summary_status = "ready"
+        elif isinstance(state.get("summary"), dict):
+            summary_fields = summary_result(session_id, state["summary"])
+            summary_status = "ready"
         else:
-            summary_text = "Interview completed successfully."
-            sentiment_score = 0.5
-            key_themes = []
-        
-        terminated_early = state.get("should_terminate_early", False)
-        termination_reason = state.get("termination_reason")
-        
-        if terminated_early:
-            summary_text = f"[Interview terminated early: {termination_reason}] {summary_text}"
-        
-        print(f"✅ Interview ended")
-        print(f"   Questions: {state['question_count']}/{state['max_questions']}")
-        print(f"   Early termination: {terminated_early}")
-        print(f"{'='*60}\n")
-        
-        # Clean up Redis
-        redis_client.delete(f"langgraph_state:{session_id}")
+            summary_fields = {
+                "summary": "",
+                "sentiment_score": 0.5,
+                "key_themes": [],
+                "terminated_early": state.get("should_terminate_early", False),
+                "termination_reason": state.get("termination_reason")
+            }
+            summary_status = "failed" if job.status == JobStatus.FAILED else "pending"
+        
+        logger.info(
+            "🏁 Interview ended (summary %s, job %s, questions %d/%d)",
+            summary_status, job.job_id, state["question_count"], state["max_questions"],
+            extra={"session_id": session_id}
+        )
         
         return EndResponse(
             success=True,
             transcript=transcript,
-            summary=summary_text,
-            sentiment_score=sentiment_score,
-            key_themes=key_themes,
+            summary=summary_fields["summary"],
+            sentiment_score=summary_fields["sentiment_score"],
+            key_themes=summary_fields["key_themes"],
             total_duration_seconds=duration_seconds,
-            terminated_early=terminated_early,
-            termination_reason=termination_reason
+            terminated_early=summary_fields["terminated_early"],
+            termination_reason=summary_fields["termination_reason"],
+            summary_status=summary_status,
+            summary_job_id=job.job_id
         )
     
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error ending interview: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error ending interview: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to end interview: {str(e)}")
 
+@app.get("/agent/jobs/stats")
+async def job_stats():
+    """Queue depth and job counters."""
+    return await job_queue.stats()
+
+@app.get("/agent/jobs/{job_id}", response_model=JobRecord)
+async def get_job(job_id: str):
+    """Poll a background job (e.g. the summary job returned by /agent/end)."""
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/agent/analytics/templates/{template_id}", response_model=TemplateAnalytics)
+async def get_template_analytics(template_id: str):
+    """
+    Completion rate, questions asked, sentiment and termination reasons for a
+    template, from aggregates kept up to date as interviews run (no scan of
+    the summaries).
+    """
+    analytics = await template_analytics.get(template_id)
+    if analytics is None:
+        raise HTTPException(status_code=404, detail="No interviews recorded for this template")
+    return analytics
+
+def _export_runtime_gauges(job_stats: Dict[str, Any]):
+    """Copy queue / cache / session store counters into gauges for a scrape."""
+    gauge = metrics.gauge("interview_jobs", "Background job queue counters", ["stat"])
+    for stat, value in job_stats.items():
+        if isinstance(value, (int, float)):
+            gauge.set(value, stat=stat)
+    
+    gauge = metrics.gauge("llm_completion_cache", "Completion cache counters", ["stat"])
+    for stat, value in completion_cache.stats().items():
+        gauge.set(value, stat=stat)
+    
+    gauge = metrics.gauge("session_store", "Session store write counters", ["stat"])
+    for stat, value in session_store.stats().items():
+        gauge.set(value, stat=stat)
+    
+    gauge = metrics.gauge("draft_prefetch", "Draft prefetch counters", ["stat"])
+    for stat, value in draft_prefetch.stats().items():
+        gauge.set(value, stat=stat)
+    
+    gauge = metrics.gauge("chat_single_flight", "Chat single-flight counters", ["stat"])
+    for stat, value in chat_flight.stats().items():
+        if isinstance(value, (int, float)):
+            gauge.set(value, stat=stat)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus scrape endpoint: node / LLM / HTTP histograms and runtime gauges."""
+    _export_runtime_gauges(await job_queue.stats())
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # ========================================================================
 # APPLICATION ENTRY POINT
 # ========================================================================
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from enum import Enum
 from datetime import datetime
 
@@ -18,6 +18,12 @@ class Sentiment(str, Enum):
     NEUTRAL = "neutral"
     NEGATIVE = "negative"
 
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
 # ========================================================================
 # ANALYZED RESPONSE MODEL
 # ========================================================================
@@ -30,6 +36,7 @@ class AnalyzedResponse(BaseModel):
     
     quality: ResponseQuality
     sentiment: Sentiment
+    sentiment_score: float = 0.0  # compound polarity in [-1, 1]
     word_count: int
     key_insights: List[str] = []
     
@@ -51,6 +58,19 @@ class DeepAnalysis(BaseModel):
     needs_follow_up: bool
     suggested_follow_up_topic: str
 
+# ========================================================================
+# FUSED TURN ANALYSIS (from turn analyzer agent)
+# ========================================================================
+
+class FusedTurnAnalysis(BaseModel):
+    """Relevance, deep analysis and next question from one LLM call"""
+    is_relevant: bool
+    key_insights: List[str] = []
+    emotional_tone: str = "neutral"
+    needs_follow_up: bool = False
+    suggested_follow_up_topic: str = ""
+    next_question: str  # next main question, or a redirect probe if irrelevant
+
 # ========================================================================
 # PROBE DECISION MODEL (NEW)
 # ========================================================================
@@ -73,6 +93,7 @@ class InterviewState(BaseModel):
     research_topic: str
     
     conversation_history: List[Dict[str, str]] = []
+    context_summary: Optional[Dict] = None  # rolling summary of older turns (utils/context_window.py)
     
     current_question_count: int = 0
     max_questions: int = 15
@@ -101,10 +122,72 @@ class InterviewSummary(BaseModel):
     
     terminated_early: bool = False
     termination_reason: Optional[str] = None
+    sentiment_distribution: Dict[str, int] = {}  # responses per sentiment
     
     generated_at: datetime = None
     
     def __init__(self, **data):
         if 'generated_at' not in data or data['generated_at'] is None:
             data['generated_at'] = datetime.now()
-        super().__init__(**data)
\ No newline at end of file
+        super().__init__(**data)
+
+# ========================================================================
+# BACKGROUND JOB MODEL (jobs/queue.py)
+# ========================================================================
+
+class JobRecord(BaseModel):
+    """A unit of post-interview work and its outcome"""
+    job_id: str
+    kind: str
+    payload: Dict[str, Any] = {}
+    
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    
+    idempotency_key: Optional[str] = None
+    callback_url: Optional[str] = None
+    
+    created_at: datetime = None
+    updated_at: datetime = None
+    
+    def __init__(self, **data):
+        if 'created_at' not in data or data['created_at'] is None:
+            data['created_at'] = datetime.now()
+        if 'updated_at' not in data or data['updated_at'] is None:
+            data['updated_at'] = data['created_at']
+        super().__init__(**data)
+    
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+# ========================================================================
+# TEMPLATE ANALYTICS MODEL (storage/template_analytics.py)
+# ========================================================================
+
+class RunningStat(BaseModel):
+    """Streaming count / mean / sample variance of one measure"""
+    count: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+
+class TemplateAnalytics(BaseModel):
+    """Aggregates over every interview run with one template"""
+    template_id: str
+    
+    interviews_started: int = 0
+    interviews_finished: int = 0
+    outcomes: Dict[str, int] = {}  # completed / terminated_early / incomplete
+    completion_rate: float = 0.0  # completed / finished
+    questions_asked: RunningStat = RunningStat()
+    interview_sentiment: RunningStat = RunningStat()  # average_sentiment_score per interview (0-1)
+    termination_reasons: Dict[str, int] = {}  # most frequent first
+    
+    responses: int = 0
+    sentiment_distribution: Dict[str, int] = {}
+    response_sentiment: RunningStat = RunningStat()  # compound score per response (-1..1)
+    response_words: RunningStat = RunningStat()
+    
+    updated_at: Optional[datetime] = None
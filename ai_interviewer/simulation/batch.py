@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Batch Simulation - scripted respondents through the interview graph, offline
+Drives the compiled workflow directly in this process for many sessions at
+once: no HTTP and no Redis, the graph state stays in memory between turns.
+Agents and LLM calls go through the same router as the API, so a batch is a
+regression run of the templates and prompts as deployed.
+
+Scripts are JSONL, one respondent per line (see
+benchmarks/fixtures/respondent_scripts.jsonl):
+    {"persona": "...", "template_id": "...", "topic": "...", "answers": ["...", ...]}
+
+Each answer is one turn. An interview that is still open when the answers
+run out is summarized like /agent/end does. One NDJSON result line per
+interview is written as soon as it finishes; throughput and LLM calls per
+interview go to stderr.
+
+Analyzed responses, summaries and template analytics go to an in-memory
+database and analytics store private to the run, so a batch never counts
+toward production aggregates. --use-configured-stores writes to the
+configured INTERVIEW_DATABASE_URL / TEMPLATE_ANALYTICS_BACKEND instead.
+
+Run from ai_interviewer/:
+    python -m simulation.batch --scripts benchmarks/fixtures/respondent_scripts.jsonl --interviews 1000 > results.ndjson
+    python -m simulation.batch --concurrency 50 --workflow fused --transcripts --output results.ndjson
+    python -m simulation.batch --use-configured-stores --keep-records --output results.ndjson
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+from graph.workflow import (
+    build_interview_workflow, create_started_state, generate_summary_node, interview_workflow, workflow_stores
+)
+from storage.db_client import DatabaseClient, db_client
+from storage.template_analytics import InMemoryTemplateAnalytics, interview_outcome, template_analytics
+from utils.logger import get_logger
+from utils.tracing import llm_usage
+
+logger = get_logger("simulation.batch")
+
+DEFAULT_SCRIPTS = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "fixtures", "respondent_scripts.jsonl")
+
+
+def load_scripts(path: str) -> Iterable[Dict[str, Any]]:
+    """Respondent scripts from a JSONL file, read lazily."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class BatchRunner:
+    """
+    Runs scripted interviews through the workflow with bounded concurrency.
+    `db` and `analytics` default to fresh in-memory stores; pass the
+    configured singletons to write the results where the API does.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 20,
+        workflow: Any = None,
+        max_turns: Optional[int] = None,
+        keep_records: bool = False,
+        transcripts: bool = False,
+        db: Any = None,
+        analytics: Any = None
+    ):
+        self.concurrency = concurrency
+        self.workflow = workflow or interview_workflow
+        self.db = db if db is not None else DatabaseClient()
+        self.analytics = analytics if analytics is not None else InMemoryTemplateAnalytics()
+        self.max_turns = max_turns
+        self.keep_records = keep_records
+        self.transcripts = transcripts
+        self.outcomes: Counter = Counter()
+        self.totals = Counter()
+        self.elapsed_seconds = 0.0
+
+    async def simulate(self, script: Dict[str, Any], session_id: str) -> Dict[str, Any]:
+        """One interview from its script; failures become an "error" result."""
+        started = time.perf_counter()
+        state = create_started_state(session_id, script.get("template_id", "simulation"), script["topic"])
+        answers = script["answers"][:self.max_turns] if self.max_turns else script["answers"]
+        turns = 0
+        error = None
+
+        with llm_usage() as usage, workflow_stores(self.db, self.analytics):
+            try:
+                await self.db.initialize_session(session_id, state["template_id"], state["research_topic"])
+                for answer in answers:
+                    state["user_response"] = answer
+                    state = await self.workflow.ainvoke(state)
+                    turns += 1
+                    if state.get("is_complete"):
+                        break
+                else:
+                    # Answers ran out before the interview finished
+                    state = {**state, **await generate_summary_node({**state, "is_complete": True})}
+            except Exception as e:
+                logger.exception("❌ Simulated interview %s failed: %s", session_id, e)
+                error = f"{type(e).__name__}: {e}"
+            finally:
+                if not self.keep_records:
+                    await self.db.delete_session(session_id)
+
+        outcome = "error" if error is not None else interview_outcome(state)
+
+        summary = state.get("summary") or {}
+        result = {
+            "session_id": session_id,
+            "persona": script.get("persona"),
+            "template_id": state["template_id"],
+            "outcome": outcome,
+            "error": error,
+            "turns": turns,
+            "questions": state["question_count"],
+            "probes": state["probe_count"],
+            "termination_reason": state.get("termination_reason"),
+            "summary": summary.get("summary"),
+            "sentiment_score": summary.get("average_sentiment_score"),
+            "key_themes": summary.get("key_themes", []),
+            "llm": dict(usage),
+            "seconds": round(time.perf_counter() - started, 3)
+        }
+        if self.transcripts:
+            result["transcript"] = state["conversation_history"]
+        return result
+
+    async def run(self, scripts: Iterable[Dict[str, Any]], prefix: str = "sim") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield one result per script in completion order. Scripts are pulled
+        lazily, so at most `concurrency` interviews are in memory at once.
+        """
+        started = time.perf_counter()
+        numbered = enumerate(scripts)
+        pending = set()
+        try:
+            while True:
+                for index, script in itertools.islice(numbered, self.concurrency - len(pending)):
+                    pending.add(asyncio.ensure_future(self.simulate(script, f"{prefix}-{index}")))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    self._record(result)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            self.elapsed_seconds += time.perf_counter() - started
+
+    def _record(self, result: Dict[str, Any]):
+        self.outcomes[result["outcome"]] += 1
+        self.totals["interviews"] += 1
+        self.totals["turns"] += result["turns"]
+        for key, value in result["llm"].items():
+            self.totals[key] += value
+
+    def stats(self) -> Dict[str, Any]:
+        interviews = self.totals["interviews"]
+
+        def per_interview(key: str) -> float:
+            return round(self.totals[key] / interviews, 2) if interviews else 0.0
+
+        return {
+            "interviews": interviews,
+            "turns": self.totals["turns"],
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "interviews_per_second": round(interviews / self.elapsed_seconds, 2) if self.elapsed_seconds else 0.0,
+            "turns_per_second": round(self.totals["turns"] / self.elapsed_seconds, 2) if self.elapsed_seconds else 0.0,
+            "llm_calls_per_interview": per_interview("calls"),
+            "llm_errors_per_interview": per_interview("errors"),
+            "cache_hits_per_interview": per_interview("cache_hits"),
+            "prompt_tokens_per_interview": per_interview("prompt_tokens"),
+            "completion_tokens_per_interview": per_interview("completion_tokens"),
+            "outcomes": dict(self.outcomes)
+        }
+
+
+def build_workflow(mode: Optional[str]):
+    if mode is None:
+        return interview_workflow
+    return build_interview_workflow(speculative=(mode == "speculative"), fused=(mode == "fused"))
+
+
+async def run_batch(args) -> Dict[str, Any]:
+    from llm.router import llm_router
+
+    scripts = list(load_scripts(args.scripts))
+    if not scripts:
+        raise SystemExit(f"No scripts in {args.scripts}")
+    count = args.interviews or len(scripts)
+
+    runner = BatchRunner(
+        concurrency=args.concurrency,
+        workflow=build_workflow(args.workflow),
+        max_turns=args.max_turns,
+        keep_records=args.keep_records,
+        transcripts=args.transcripts,
+        db=db_client if args.use_configured_stores else None,
+        analytics=template_analytics if args.use_configured_stores else None
+    )
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        async for result in runner.run(itertools.islice(itertools.cycle(scripts), count), prefix=args.prefix):
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        await llm_router.aclose()
+        await runner.db.close()
+    return runner.stats()
+
+
+def print_stats(stats: Dict[str, Any]):
+    print(
+        f"\n📊 {stats['interviews']} interviews, {stats['turns']} turns in {stats['elapsed_seconds']:.1f}s"
+        f" | {stats['interviews_per_second']:.2f} interviews/s, {stats['turns_per_second']:.1f} turns/s",
+        file=sys.stderr
+    )
+    print(
+        f"🤖 per interview: {stats['llm_calls_per_interview']:.1f} LLM calls"
+        f" ({stats['llm_errors_per_interview']:.2f} failed, {stats['cache_hits_per_interview']:.2f} cache hits),"
+        f" {stats['prompt_tokens_per_interview']:.0f} prompt / {stats['completion_tokens_per_interview']:.0f} completion tokens",
+        file=sys.stderr
+    )
+    outcomes = ", ".join(f"{outcome} {count}" for outcome, count in sorted(stats["outcomes"].items()))
+    print(f"🏁 {outcomes}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scripts", default=DEFAULT_SCRIPTS, help="Respondent scripts (JSONL)")
+    parser.add_argument("--interviews", type=int, default=0, help="Interviews to run, cycling the scripts (default: one per script)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Interviews in flight at once")
+    parser.add_argument("--max-turns", type=int, default=None, help="Use at most this many answers per script")
+    parser.add_argument("--workflow", choices=["sequential", "speculative", "fused"], default=None,
+                        help="Graph variant (default: SPECULATIVE_DEEP_ANALYSIS / FUSED_TURN_ANALYSIS)")
+    parser.add_argument("--output", default=None, help="NDJSON results file (default: stdout)")
+    parser.add_argument("--transcripts", action="store_true", help="Include each conversation in the results")
+    parser.add_argument("--use-configured-stores", action="store_true",
+                        help="Write to the configured database and template analytics instead of in-memory ones")
+    parser.add_argument("--keep-records", action="store_true", help="Keep analyzed responses and summaries in the database")
+    parser.add_argument("--prefix", default="sim", help="Session id prefix")
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(run_batch(args))
+    print_stats(stats)
+
+
+if __name__ == "__main__":
+    main()
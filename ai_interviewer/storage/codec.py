@@ -0,0 +1,205 @@
+"""
+State Codec - serialization for persisted graph state
+orjson by default, msgpack optionally, stdlib json as the baseline. Models,
+enums and datetimes are written as tagged objects so state decodes back into
+real types; payloads above a threshold can be zstd-compressed.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+import config
+from models.schemas import AnalyzedResponse, DeepAnalysis, ResponseQuality, Sentiment
+from utils.logger import get_logger
+
+logger = get_logger("storage.codec")
+
+# Types that live in graph state and must come back as themselves
+STATE_MODELS = {model.__name__: model for model in (AnalyzedResponse, DeepAnalysis)}
+STATE_ENUMS = {enum.__name__: enum for enum in (ResponseQuality, Sentiment)}
+
+MODEL_TAG = "__model__"
+ENUM_TAG = "__enum__"
+DATETIME_TAG = "__datetime__"
+
+# Every zstd frame starts with this; JSON and msgpack maps never do
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def to_tagged(value: Any) -> Any:
+    """Recursively replace models, enums and datetimes with tagged dicts."""
+    value_type = type(value)
+    if value_type in _PLAIN_TYPES:
+        return value
+    if value_type is dict:
+        return {
+            key: item if type(item) in _PLAIN_TYPES else to_tagged(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [item if type(item) in _PLAIN_TYPES else to_tagged(item) for item in value]
+    if isinstance(value, BaseModel):
+        name = value_type.__name__
+        if name in STATE_MODELS:
+            return {MODEL_TAG: name, "data": value.model_dump(mode="json")}
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        name = value_type.__name__
+        if name in STATE_ENUMS:
+            return {ENUM_TAG: name, "value": value.value}
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return {DATETIME_TAG: value.isoformat()}
+    if isinstance(value, dict):
+        return to_tagged(dict(value))
+    return str(value)
+
+
+def from_tagged(value: Any) -> Any:
+    """
+    Inverse of to_tagged, in place (decoded payloads are fresh objects).
+    Unknown tags are left as plain dicts.
+    """
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                value[index] = from_tagged(item)
+        return value
+    if not isinstance(value, dict):
+        return value
+
+    if MODEL_TAG in value:
+        model = STATE_MODELS.get(value[MODEL_TAG])
+        if model is not None and "data" in value:
+            return model.model_validate(value["data"])
+    elif ENUM_TAG in value:
+        enum = STATE_ENUMS.get(value[ENUM_TAG])
+        if enum is not None and "value" in value:
+            return enum(value["value"])
+    elif DATETIME_TAG in value:
+        return datetime.fromisoformat(value[DATETIME_TAG])
+
+    for key, item in value.items():
+        if isinstance(item, (dict, list)):
+            value[key] = from_tagged(item)
+    return value
+
+
+def _has_tags(data: bytes) -> bool:
+    """Cheap pre-check so untagged payloads (history messages) skip the walk."""
+    return MODEL_TAG.encode() in data or ENUM_TAG.encode() in data or DATETIME_TAG.encode() in data
+
+
+class StateCodec:
+    """Base codec: tagging and optional compression around a raw serializer"""
+
+    name = "base"
+
+    def __init__(self, compress_threshold: int = 0, compression_level: int = 3):
+        self.compress_threshold = compress_threshold
+        self._compressor = None
+        self._decompressor = None
+
+        if compress_threshold:
+            try:
+                import zstandard
+                self._compressor = zstandard.ZstdCompressor(level=compression_level)
+                self._decompressor = zstandard.ZstdDecompressor()
+            except ImportError:
+                logger.warning("⚠️ zstandard not installed, state compression disabled")
+                self.compress_threshold = 0
+
+    def dumps(self, value: Any) -> bytes:
+        raw = self._dumps(to_tagged(value))
+        if self.compress_threshold and len(raw) >= self.compress_threshold:
+            return self._compressor.compress(raw)
+        return raw
+
+    def loads(self, data: Any) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        if data.startswith(ZSTD_MAGIC):
+            if self._decompressor is None:
+                import zstandard
+                self._decompressor = zstandard.ZstdDecompressor()
+            data = self._decompressor.decompress(data)
+        value = self._loads(data)
+        return from_tagged(value) if _has_tags(data) else value
+
+    def _dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def _loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(StateCodec):
+    """Stdlib json - the baseline"""
+
+    name = "json"
+
+    def _dumps(self, value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    def _loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(StateCodec):
+    """orjson - same JSON on the wire, several times faster"""
+
+    name = "orjson"
+
+    def __init__(self, **kwargs):
+        import orjson
+        self._orjson = orjson
+        super().__init__(**kwargs)
+
+    def _dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+
+    def _loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(StateCodec):
+    """msgpack - compact binary; payloads are not human-readable in redis-cli"""
+
+    name = "msgpack"
+
+    def __init__(self, **kwargs):
+        import msgpack
+        self._msgpack = msgpack
+        super().__init__(**kwargs)
+
+    def _dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def _loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)}
+
+
+def get_codec(name: Optional[str] = None, compress_threshold: Optional[int] = None) -> StateCodec:
+    """Build the configured codec, falling back to stdlib json if it isn't installed."""
+    name = name or config.STATE_CODEC
+    if compress_threshold is None:
+        compress_threshold = config.STATE_COMPRESS_THRESHOLD_BYTES
+
+    codec_class = CODECS.get(name)
+    if codec_class is None:
+        raise ValueError(f"Unknown state codec '{name}', expected one of {sorted(CODECS)}")
+
+    try:
+        return codec_class(compress_threshold=compress_threshold)
+    except ImportError:
+        logger.warning("⚠️ %s not installed, falling back to json state codec", name)
+        return JsonCodec(compress_threshold=compress_threshold)
@@ -1,11 +1,16 @@
 """
 Database client for storing interview data.
-Uses in-memory storage for now, but can be replaced with PostgreSQL/MongoDB.
+Uses in-memory storage unless INTERVIEW_DATABASE_URL points at SQLite/PostgreSQL
+(see storage/sql_client.py - same interface).
 """
 
 from typing import List, Optional
 from models.schemas import AnalyzedResponse, InterviewSummary
 from datetime import datetime
+import config
+from utils.logger import get_logger
+
+logger = get_logger("storage.db_client")
 
 class DatabaseClient:
     """Simple in-memory database client"""
@@ -15,6 +20,12 @@ class DatabaseClient:
         self.analyzed_responses = {}  # session_id -> List[AnalyzedResponse]
         self.summaries = {}  # session_id -> InterviewSummary
     
+    async def connect(self):
+        """Nothing to set up for in-memory storage"""
+    
+    async def close(self):
+        """Nothing to release for in-memory storage"""
+    
     async def initialize_session(self, session_id: str, template_id: str, research_topic: str):
         """Initialize a new interview session"""
         self.sessions[session_id] = {
@@ -24,7 +35,7 @@ class DatabaseClient:
             "status": "active"
         }
         self.analyzed_responses[session_id] = []
-        print(f"✅ Session initialized in database: {session_id}")
+        logger.debug("✅ Session initialized in database: %s", session_id)
     
     async def save_analyzed_response(
         self, 
@@ -40,7 +51,7 @@ class DatabaseClient:
             self.analyzed_responses[session_id] = []
         
         self.analyzed_responses[session_id].append(analyzed)
-        print(f"💾 Saved analyzed response: {len(analyzed.key_insights)} insights")
+        logger.debug("💾 Saved analyzed response: %d insights", len(analyzed.key_insights))
     
     async def get_analyzed_responses(self, session_id: str) -> List[AnalyzedResponse]:
         """Get all analyzed responses for a session"""
@@ -57,7 +68,7 @@ class DatabaseClient:
     async def save_summary(self, summary: InterviewSummary):
         """Save interview summary"""
         self.summaries[summary.session_id] = summary
-        print(f"💾 Summary saved for session: {summary.session_id}")
+        logger.debug("💾 Summary saved for session: %s", summary.session_id)
     
     async def get_summary(self, session_id: str) -> Optional[InterviewSummary]:
         """Get summary for a session"""
@@ -68,11 +79,24 @@ class DatabaseClient:
         if session_id in self.sessions:
             self.sessions[session_id]["status"] = status
             self.sessions[session_id]["completed_at"] = datetime.now()
-            print(f"✅ Interview status updated: {status}")
+            logger.debug("✅ Interview status updated: %s", status)
     
     async def get_session(self, session_id: str) -> Optional[dict]:
         """Get session data"""
         return self.sessions.get(session_id)
+    
+    async def delete_session(self, session_id: str):
+        """Drop everything stored for a session"""
+        self.sessions.pop(session_id, None)
+        self.analyzed_responses.pop(session_id, None)
+        self.summaries.pop(session_id, None)
+
+def create_db_client():
+    """SQL backend when INTERVIEW_DATABASE_URL is set, otherwise in-memory."""
+    if config.INTERVIEW_DATABASE_URL:
+        from storage.sql_client import SQLDatabaseClient
+        return SQLDatabaseClient(config.INTERVIEW_DATABASE_URL)
+    return DatabaseClient()
 
 # Singleton instance
-db_client = DatabaseClient()
\ No newline at end of file
+db_client = create_db_client()
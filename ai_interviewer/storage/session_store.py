@@ -0,0 +1,211 @@
+"""
+Session Store - async Redis persistence for LangGraph interview state
+Optimistic locking (WATCH/MULTI on a per-session version counter) keeps two
+concurrent requests for the same session from silently overwriting each other.
+
+Layout per session:
+    {prefix}{id}           scalar fields + small sub-objects (rewritten each turn)
+    {prefix}{id}:history   conversation_history as an append-only list
+    {prefix}{id}:insights  session_insights (deduplicated insights) as an append-only list
+    {prefix}{id}:version   version counter for optimistic locking
+"""
+
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from redis.exceptions import WatchError
+
+import config
+from storage.codec import StateCodec, get_codec
+from storage.redis_client import redis_client as default_redis_client
+from utils.logger import get_logger
+
+logger = get_logger("storage.session_store")
+
+
+class SessionConflictError(Exception):
+    """Raised when a session was modified concurrently and retries ran out"""
+
+
+StateMutator = Callable[[Dict], Union[Dict, Awaitable[Dict]]]
+
+HISTORY_FIELD = "conversation_history"
+INSIGHTS_FIELD = "session_insights"
+# State fields that only grow, stored as Redis lists: field -> key suffix
+LIST_FIELDS = {HISTORY_FIELD: "history", INSIGHTS_FIELD: "insights"}
+
+
+class SessionStore:
+    """Loads and saves interview graph state in Redis"""
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        ttl_seconds: Optional[int] = None,
+        key_prefix: str = "langgraph_state:",
+        codec: Optional[StateCodec] = None
+    ):
+        self.redis = redis_client if redis_client is not None else default_redis_client
+        self.codec = codec or get_codec()
+        self.ttl_seconds = ttl_seconds or config.SESSION_TTL_SECONDS
+        self.key_prefix = key_prefix
+        self.saves = 0
+        self.bytes_written = 0
+
+    def _state_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    def _list_key(self, session_id: str, field: str) -> str:
+        return f"{self.key_prefix}{session_id}:{LIST_FIELDS[field]}"
+
+    def _version_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}:version"
+
+    def _encode(self, value: Any) -> bytes:
+        return self.codec.dumps(value)
+
+    def _decode(self, raw: bytes) -> Any:
+        return self.codec.loads(raw)
+
+    async def load(self, session_id: str) -> Optional[Dict]:
+        """Retrieve the state for a session, or None if it doesn't exist."""
+        state, _ = await self.load_versioned(session_id)
+        return state
+
+    async def load_versioned(self, session_id: str) -> Tuple[Optional[Dict], int]:
+        """Retrieve the state together with its version (one round trip)."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.mget(self._state_key(session_id), self._version_key(session_id))
+            for field in LIST_FIELDS:
+                pipe.lrange(self._list_key(session_id, field), 0, -1)
+            (raw, version), *lists = await pipe.execute()
+
+        if raw is None:
+            return None, 0
+
+        state = self._decode(raw)
+        for field, items in zip(LIST_FIELDS, lists):
+            # Sessions written before a list existed carry the field inline
+            if field not in state:
+                state[field] = [self._decode(item) for item in items]
+        return state, int(version or 0)
+
+    async def save(self, session_id: str, state: Dict, expected_version: Optional[int] = None) -> int:
+        """
+        Write the state and bump its version.
+
+        With `expected_version` the write only succeeds if nobody else saved
+        the session since it was loaded; otherwise SessionConflictError.
+        Only items past the persisted length of each list field (history,
+        insights) are appended, so the bytes written per turn don't grow with
+        the interview. Without `expected_version` the lists are rewritten in full.
+        Returns the new version.
+        """
+        state_key = self._state_key(session_id)
+        version_key = self._version_key(session_id)
+        list_keys = {field: self._list_key(session_id, field) for field in LIST_FIELDS}
+
+        scalars = {key: value for key, value in state.items() if key not in LIST_FIELDS}
+        payload = self._encode(scalars)
+        written = len(payload)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                persisted = {}
+                if expected_version is not None:
+                    await pipe.watch(version_key, *list_keys.values())
+                    current = int(await pipe.get(version_key) or 0)
+                    if current != expected_version:
+                        raise SessionConflictError(
+                            f"Session {session_id} changed (version {current}, expected {expected_version})"
+                        )
+                    for field, key in list_keys.items():
+                        persisted[field] = await pipe.llen(key)
+                    pipe.multi()
+
+                for field, key in list_keys.items():
+                    items = state.get(field) or []
+                    count = persisted.get(field)
+                    if count is None or count > len(items):
+                        # Blind write or the list was rewritten - replace it
+                        pipe.delete(key)
+                        new_items = items
+                    else:
+                        new_items = items[count:]
+
+                    encoded_items = [self._encode(item) for item in new_items]
+                    if encoded_items:
+                        pipe.rpush(key, *encoded_items)
+                        written += sum(len(item) for item in encoded_items)
+                    pipe.expire(key, self.ttl_seconds)
+
+                pipe.set(state_key, payload, ex=self.ttl_seconds)
+                pipe.incr(version_key)
+                pipe.expire(version_key, self.ttl_seconds)
+                results = await pipe.execute()
+
+            except WatchError:
+                raise SessionConflictError(f"Session {session_id} changed during save")
+
+        self.saves += 1
+        self.bytes_written += written
+        return int(results[-2])
+
+    async def update(
+        self,
+        session_id: str,
+        mutate: StateMutator,
+        retries: int = 2
+    ) -> Optional[Dict]:
+        """
+        Read-modify-write with optimistic locking.
+
+        `mutate` receives the current state and returns the new one (it may be
+        async). On a concurrent modification the state is re-read and `mutate`
+        re-applied, up to `retries` times - so only retry mutations without
+        side effects; a workflow run (LLM calls, DB rows, analytics) should
+        pass retries=0 and let the conflict reach the caller.
+        Returns None if the session doesn't exist.
+        """
+        for attempt in range(retries + 1):
+            state, version = await self.load_versioned(session_id)
+            if state is None:
+                return None
+
+            new_state = mutate(state)
+            if inspect.isawaitable(new_state):
+                new_state = await new_state
+
+            try:
+                await self.save(session_id, new_state, expected_version=version)
+                return new_state
+            except SessionConflictError:
+                if attempt == retries:
+                    raise
+                logger.info("⚠️ Concurrent update on session %s, retrying (%d/%d)", session_id, attempt + 1, retries)
+
+    async def delete(self, session_id: str):
+        await self.redis.delete(
+            self._state_key(session_id),
+            self._version_key(session_id),
+            *(self._list_key(session_id, field) for field in LIST_FIELDS)
+        )
+
+    async def exists(self, session_id: str) -> bool:
+        return await self.redis.exists(self._state_key(session_id)) > 0
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self.redis.ping())
+        except Exception:
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "saves": self.saves,
+            "bytes_written": self.bytes_written,
+            "avg_bytes_per_save": round(self.bytes_written / self.saves) if self.saves else 0
+        }
+
+# Singleton instance
+session_store = SessionStore()
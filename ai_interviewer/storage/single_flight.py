@@ -0,0 +1,282 @@
+"""
+Single-Flight - one chat turn at a time per session, idempotent retries
+A double-submit from the respondent UI or a client retry used to run the
+whole workflow twice on the same state. Requests for a session now take a
+per-session lock, and a request carrying an idempotency key that was already
+processed (or is being processed) gets the stored response back instead of
+recomputing it.
+
+Lock and results per session:
+    {prefix}{id}:lock          owner token, SET NX PX (expires if the owner dies)
+    {prefix}{id}:result:{key}  the response for an idempotency key (result TTL)
+
+With SESSION_LOCK_BACKEND "memory", or while Redis is unreachable, the lock
+and results fall back to this process only. Duplicates in the same process
+always wait on the in-flight request instead of polling.
+"""
+
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from redis.exceptions import RedisError, WatchError
+
+import config
+from storage.codec import get_codec
+from utils.logger import get_logger
+from utils.metrics import metrics
+
+logger = get_logger("storage.single_flight")
+
+LOCK_WAIT = metrics.histogram(
+    "session_lock_wait_seconds", "Time a chat request waited for its session lock", ["backend"]
+)
+DEDUPLICATED = metrics.counter(
+    "chat_deduplicated_total", "Chat requests answered from an earlier request with the same idempotency key",
+    ["source"]
+)
+
+LOCK_POLL_SECONDS = 0.01
+LOCK_POLL_MAX_SECONDS = 0.1
+
+
+class SessionBusyError(Exception):
+    """Raised when the session lock could not be acquired within the wait timeout"""
+
+
+class SingleFlight:
+    """Per-session lock plus idempotency-key results for chat turns"""
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        backend: Optional[str] = None,
+        key_prefix: str = "chat_flight:",
+        lock_ttl_seconds: Optional[float] = None,
+        wait_timeout_seconds: Optional[float] = None,
+        result_ttl_seconds: Optional[int] = None
+    ):
+        if redis_client is None:
+            from storage.redis_client import redis_client as default_redis_client
+            redis_client = default_redis_client
+        self.redis = redis_client
+        self.backend = backend or config.SESSION_LOCK_BACKEND
+        self.codec = get_codec()
+        self.key_prefix = key_prefix
+        self.lock_ttl_seconds = lock_ttl_seconds or config.SESSION_LOCK_TTL_SECONDS
+        self.wait_timeout_seconds = (
+            config.SESSION_LOCK_WAIT_SECONDS if wait_timeout_seconds is None else wait_timeout_seconds
+        )
+        self.result_ttl_seconds = result_ttl_seconds or config.IDEMPOTENCY_TTL_SECONDS
+        # session_id -> [lock, holders + waiters]
+        self._locks: Dict[str, list] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._results: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        self.counters = {"computed": 0, "deduplicated": 0, "busy": 0, "redis_fallbacks": 0}
+
+    def _lock_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}:lock"
+
+    def _result_key(self, session_id: str, key: str) -> str:
+        return f"{self.key_prefix}{session_id}:result:{key}"
+
+    def _use_redis(self) -> bool:
+        return self.backend == "redis"
+
+    def _redis_failed(self, action: str, error: Exception):
+        self.counters["redis_fallbacks"] += 1
+        logger.warning("⚠️ Redis unavailable for session %s, using the in-process fallback: %s", action, error)
+
+    # ---------------------------------------------------------------- results
+
+    def _prune(self):
+        now = time.monotonic()
+        expired = [entry for entry, (expires_at, _) in self._results.items() if expires_at <= now]
+        for entry in expired:
+            del self._results[entry]
+
+    async def recall(self, session_id: str, key: str) -> Optional[Dict]:
+        """The stored response for an idempotency key, or None."""
+        if self._use_redis():
+            try:
+                raw = await self.redis.get(self._result_key(session_id, key))
+                if raw is not None:
+                    return self.codec.loads(raw)
+            except RedisError as e:
+                self._redis_failed("results", e)
+        self._prune()
+        entry = self._results.get((session_id, key))
+        return entry[1] if entry else None
+
+    async def remember(self, session_id: str, key: str, result: Dict):
+        """Store the response for an idempotency key for IDEMPOTENCY_TTL_SECONDS."""
+        if self._use_redis():
+            try:
+                await self.redis.set(
+                    self._result_key(session_id, key), self.codec.dumps(result), ex=self.result_ttl_seconds
+                )
+                return
+            except RedisError as e:
+                self._redis_failed("results", e)
+        self._prune()
+        self._results[(session_id, key)] = (time.monotonic() + self.result_ttl_seconds, result)
+
+    async def wait(self, session_id: str, key: str) -> Optional[Dict]:
+        """The response of an in-flight request in this process, else the stored one."""
+        future = self._inflight.get((session_id, key))
+        if future is not None:
+            return await asyncio.shield(future)
+        return await self.recall(session_id, key)
+
+    # ------------------------------------------------------------------- lock
+
+    async def _acquire_redis(self, session_id: str, token: str, deadline: float) -> bool:
+        """Poll SET NX until acquired; False on timeout. Raises RedisError."""
+        lock_key = self._lock_key(session_id)
+        ttl_ms = int(self.lock_ttl_seconds * 1000)
+        delay = LOCK_POLL_SECONDS
+        while True:
+            if await self.redis.set(lock_key, token, nx=True, px=ttl_ms):
+                return True
+            if time.monotonic() + delay > deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LOCK_POLL_MAX_SECONDS)
+
+    async def _release_redis(self, session_id: str, token: str):
+        """Delete the lock only if this request still owns it (it may have expired)."""
+        lock_key = self._lock_key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(lock_key)
+                owner = await pipe.get(lock_key)
+                if owner is None or (owner.decode() if isinstance(owner, bytes) else owner) != token:
+                    await pipe.unwatch()
+                    return
+                pipe.multi()
+                pipe.delete(lock_key)
+                await pipe.execute()
+            except WatchError:
+                pass
+
+    @asynccontextmanager
+    async def lock(self, session_id: str) -> AsyncIterator[None]:
+        """
+        Hold the session's lock. Requests in this process queue on an
+        asyncio.Lock first, so only one of them polls Redis at a time.
+        Raises SessionBusyError after SESSION_LOCK_WAIT_SECONDS.
+        """
+        started = time.monotonic()
+        deadline = started + self.wait_timeout_seconds
+        entry = self._locks.setdefault(session_id, [asyncio.Lock(), 0])
+        entry[1] += 1
+        token = None
+        try:
+            try:
+                await asyncio.wait_for(entry[0].acquire(), timeout=max(deadline - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                self.counters["busy"] += 1
+                raise SessionBusyError(f"Session {session_id} is busy with another message")
+
+            try:
+                if self._use_redis():
+                    try:
+                        token = uuid.uuid4().hex
+                        if not await self._acquire_redis(session_id, token, deadline):
+                            self.counters["busy"] += 1
+                            raise SessionBusyError(f"Session {session_id} is busy with another message")
+                    except RedisError as e:
+                        token = None
+                        self._redis_failed("lock", e)
+
+                if config.METRICS_ENABLED:
+                    LOCK_WAIT.observe(time.monotonic() - started, backend="redis" if token else "memory")
+                yield
+
+            finally:
+                if token is not None:
+                    try:
+                        await self._release_redis(session_id, token)
+                    except RedisError as e:
+                        # The lock expires after SESSION_LOCK_TTL_SECONDS
+                        logger.warning("⚠️ Could not release lock for session %s: %s", session_id, e)
+                entry[0].release()
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[session_id]
+
+    # -------------------------------------------------------------------- run
+
+    async def run(
+        self,
+        session_id: str,
+        key: Optional[str],
+        compute: Callable[[], Awaitable[Dict]]
+    ) -> Tuple[Dict, bool]:
+        """
+        Run `compute` under the session lock and return (result, deduplicated).
+
+        With an idempotency key, a duplicate of a request in flight in this
+        process waits for its result; a duplicate of a finished request (or
+        one that finished on another instance while this one waited for the
+        lock) gets the stored result. Failed requests are not stored, so a
+        retry recomputes.
+        """
+        if key is None:
+            async with self.lock(session_id):
+                self.counters["computed"] += 1
+                return await compute(), False
+
+        flight = (session_id, key)
+        if flight not in self._inflight:
+            previous = await self.recall(session_id, key)
+            if previous is not None:
+                self._deduplicated("stored")
+                return previous, True
+        if flight in self._inflight:
+            self._deduplicated("inflight")
+            return await asyncio.shield(self._inflight[flight]), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight] = future
+        try:
+            async with self.lock(session_id):
+                result = await self.recall(session_id, key)
+                deduplicated = result is not None
+                if deduplicated:
+                    self._deduplicated("stored")
+                else:
+                    self.counters["computed"] += 1
+                    result = await compute()
+                    await self.remember(session_id, key, result)
+            future.set_result(result)
+            return result, deduplicated
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; nobody may be waiting
+            future.exception()
+            raise
+        finally:
+            del self._inflight[flight]
+
+    def _deduplicated(self, source: str):
+        self.counters["deduplicated"] += 1
+        if config.METRICS_ENABLED:
+            DEDUPLICATED.inc(source=source)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "locked_sessions": len(self._locks),
+            "inflight": len(self._inflight),
+            **self.counters
+        }
+
+# Singleton instance
+chat_flight = SingleFlight()
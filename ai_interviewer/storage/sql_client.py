@@ -0,0 +1,397 @@
+"""
+SQL database client for storing interview data (SQLite / PostgreSQL).
+Same async interface as the in-memory DatabaseClient, backed by SQLAlchemy's
+async engine with a connection pool. Analyzed responses from concurrent
+requests are group-committed: one multi-row INSERT per short window, and each
+caller returns only once its row is committed.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import (
+    BigInteger, Boolean, Column, DateTime, Float, Index, Integer, JSON, MetaData,
+    Table, Text, delete, event, select, update
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import config
+from models.schemas import AnalyzedResponse, InterviewSummary, ResponseQuality, Sentiment
+from utils.logger import get_logger
+
+logger = get_logger("storage.sql_client")
+
+metadata = MetaData()
+
+# SQLite only autoincrements INTEGER PRIMARY KEY
+_BIG_ID = BigInteger().with_variant(Integer, "sqlite")
+
+interview_sessions = Table(
+    "interview_sessions", metadata,
+    Column("session_id", Text, primary_key=True),
+    Column("respondent_id", Text),
+    Column("template_id", Text),
+    Column("research_topic", Text),
+    Column("status", Text, nullable=False, default="active"),
+    Column("metadata", JSON, default=dict),
+    Column("created_at", DateTime(timezone=True)),
+    Column("completed_at", DateTime(timezone=True)),
+    Index("idx_sessions_template", "template_id"),
+)
+
+analyzed_responses = Table(
+    "analyzed_responses", metadata,
+    Column("id", _BIG_ID, primary_key=True, autoincrement=True),
+    Column("session_id", Text, nullable=False),
+    Column("respondent_id", Text),
+    Column("response_text", Text, nullable=False),
+    Column("sentiment", Text),
+    Column("sentiment_score", Float),
+    Column("quality", Text),
+    Column("word_count", Integer, default=0),
+    Column("key_insights", JSON, default=list),
+    Column("created_at", DateTime(timezone=True)),
+    Index("idx_analyzed_responses_session", "session_id", "id"),
+)
+
+interview_summaries = Table(
+    "interview_summaries", metadata,
+    Column("id", _BIG_ID, primary_key=True, autoincrement=True),
+    Column("session_id", Text, nullable=False, unique=True),
+    Column("template_id", Text),
+    Column("conversation_summary", Text),
+    Column("key_insights", JSON, default=list),
+    Column("average_sentiment_score", Float),
+    Column("sentiment_distribution", JSON, default=dict),
+    Column("total_questions", Integer, default=0),
+    Column("terminated_early", Boolean, default=False),
+    Column("metadata", JSON, default=dict),  # full InterviewSummary payload
+    Column("created_at", DateTime(timezone=True)),
+    Index("idx_summaries_template", "template_id"),
+)
+
+
+def to_async_url(url: str) -> str:
+    """Map plain SQLAlchemy/Prisma-style URLs onto the async drivers."""
+    if url.startswith(("postgres://", "postgresql://")):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    if url.startswith("sqlite://") and not url.startswith("sqlite+"):
+        return "sqlite+aiosqlite://" + url.split("://", 1)[1]
+    return url
+
+
+def create_engine(database_url: str, pool_size: Optional[int] = None) -> AsyncEngine:
+    """Async engine with a bounded pool (shared in-process connection for SQLite :memory:)."""
+    url = to_async_url(database_url)
+
+    if url.startswith("sqlite"):
+        if ":memory:" in url or url.rstrip("/").endswith("aiosqlite:"):
+            engine = create_async_engine(
+                url,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False}
+            )
+        else:
+            engine = create_async_engine(url, pool_size=pool_size or config.DB_POOL_SIZE)
+
+            @event.listens_for(engine.sync_engine, "connect")
+            def _enable_wal(dbapi_connection, connection_record):
+                # Readers don't block the writer across workers
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+
+        return engine
+
+    return create_async_engine(
+        url,
+        pool_size=pool_size or config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_pre_ping=True
+    )
+
+
+class _BatchInserter:
+    """Coalesces concurrent single-row inserts into one multi-row INSERT"""
+
+    def __init__(self, engine: AsyncEngine, table: Table, max_batch: int, max_delay_seconds: float):
+        self.engine = engine
+        self.table = table
+        self.max_batch = max_batch
+        self.max_delay_seconds = max_delay_seconds
+        self._pending: List[Tuple[Dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._writes: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.rows = 0
+
+    async def insert(self, row: Dict):
+        """Queue a row and wait until the batch containing it is committed."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((row, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._start_write()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+        # The batch is written by its own task: a caller cancelled here (client
+        # disconnect) stops waiting without interrupting the other rows' commit
+        await future
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.max_delay_seconds)
+        self._timer = None
+        self._start_write()
+
+    def _start_write(self):
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: List[Tuple[Dict, asyncio.Future]]):
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(self.table.insert(), [row for row, _ in batch])
+        except BaseException as e:
+            # Cancelled too (shutdown): no waiter may be left pending
+            error = e if isinstance(e, Exception) else RuntimeError("Insert batch was cancelled")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        self.batches += 1
+        self.rows += len(batch)
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def flush(self):
+        """Write the pending rows now and wait for every batch being written."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._start_write()
+        if self._writes:
+            # asyncio.wait, unlike gather, doesn't cancel the writes if this caller is cancelled
+            await asyncio.wait(set(self._writes))
+
+
+class SQLDatabaseClient:
+    """DatabaseClient backed by SQLite/PostgreSQL"""
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_delay_ms: Optional[float] = None,
+        create_tables: Optional[bool] = None
+    ):
+        self.engine = create_engine(database_url, pool_size)
+        self.create_tables = config.DB_CREATE_TABLES if create_tables is None else create_tables
+        self._responses = _BatchInserter(
+            self.engine,
+            analyzed_responses,
+            max_batch=batch_size or config.DB_BATCH_SIZE,
+            max_delay_seconds=(batch_delay_ms if batch_delay_ms is not None else config.DB_BATCH_DELAY_MS) / 1000
+        )
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
+
+    async def connect(self):
+        """Create the tables if configured to (idempotent)."""
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if self._ready:
+                return
+            if self.create_tables:
+                async with self.engine.begin() as conn:
+                    await conn.run_sync(metadata.create_all)
+            self._ready = True
+
+    async def close(self):
+        await self._responses.flush()
+        await self.engine.dispose()
+
+    async def initialize_session(self, session_id: str, template_id: str, research_topic: str):
+        """Initialize a new interview session"""
+        await self.connect()
+        async with self.engine.begin() as conn:
+            # Restarting a session id starts from a clean slate, as the in-memory client does
+            await conn.execute(delete(analyzed_responses).where(analyzed_responses.c.session_id == session_id))
+            await conn.execute(delete(interview_sessions).where(interview_sessions.c.session_id == session_id))
+            await conn.execute(interview_sessions.insert().values(
+                session_id=session_id,
+                respondent_id=session_id,
+                template_id=template_id,
+                research_topic=research_topic,
+                status="active",
+                metadata={},
+                created_at=_now()
+            ))
+        logger.debug("✅ Session initialized in database: %s", session_id)
+
+    async def save_analyzed_response(
+        self,
+        analyzed: AnalyzedResponse,
+        session_id: str,
+        respondent_id: str
+    ):
+        """Save an analyzed response"""
+        analyzed.session_id = session_id
+        analyzed.respondent_id = respondent_id
+
+        await self.connect()
+        await self._responses.insert({
+            "session_id": session_id,
+            "respondent_id": respondent_id,
+            "response_text": analyzed.user_response,
+            "sentiment": analyzed.sentiment.value,
+            "sentiment_score": analyzed.sentiment_score,
+            "quality": analyzed.quality.value,
+            "word_count": analyzed.word_count,
+            "key_insights": list(analyzed.key_insights),
+            "created_at": _as_utc(analyzed.timestamp)
+        })
+        logger.debug("💾 Saved analyzed response: %d insights", len(analyzed.key_insights))
+
+    async def get_analyzed_responses(self, session_id: str) -> List[AnalyzedResponse]:
+        """Get all analyzed responses for a session"""
+        await self.connect()
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(analyzed_responses)
+                .where(analyzed_responses.c.session_id == session_id)
+                .order_by(analyzed_responses.c.id)
+            )
+            rows = result.mappings().all()
+
+        return [
+            AnalyzedResponse(
+                session_id=row["session_id"],
+                respondent_id=row["respondent_id"] or "",
+                user_response=row["response_text"],
+                quality=ResponseQuality(row["quality"]),
+                sentiment=Sentiment(row["sentiment"]),
+                sentiment_score=row["sentiment_score"] or 0.0,
+                word_count=row["word_count"] or 0,
+                key_insights=row["key_insights"] or [],
+                timestamp=row["created_at"]
+            )
+            for row in rows
+        ]
+
+    async def get_all_insights_for_session(self, session_id: str) -> List[str]:
+        """Get all insights collected so far"""
+        await self.connect()
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(analyzed_responses.c.key_insights)
+                .where(analyzed_responses.c.session_id == session_id)
+                .order_by(analyzed_responses.c.id)
+            )
+            all_insights = []
+            for (insights,) in result:
+                all_insights.extend(insights or [])
+        return all_insights
+
+    async def save_summary(self, summary: InterviewSummary):
+        """Save interview summary"""
+        await self.connect()
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                delete(interview_summaries).where(interview_summaries.c.session_id == summary.session_id)
+            )
+            await conn.execute(interview_summaries.insert().values(
+                session_id=summary.session_id,
+                template_id=summary.template_id,
+                conversation_summary=summary.summary,
+                key_insights=summary.key_themes,
+                average_sentiment_score=summary.average_sentiment_score,
+                sentiment_distribution=summary.sentiment_distribution,
+                total_questions=summary.questions_asked,
+                terminated_early=summary.terminated_early,
+                metadata=summary.model_dump(mode="json"),
+                created_at=_as_utc(summary.generated_at)
+            ))
+        logger.debug("💾 Summary saved for session: %s", summary.session_id)
+
+    async def get_summary(self, session_id: str) -> Optional[InterviewSummary]:
+        """Get summary for a session"""
+        await self.connect()
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(interview_summaries.c.metadata)
+                .where(interview_summaries.c.session_id == session_id)
+            )
+            payload = result.scalar_one_or_none()
+        return InterviewSummary.model_validate(payload) if payload else None
+
+    async def update_interview_status(self, session_id: str, status: str):
+        """Update interview status"""
+        await self.connect()
+        async with self.engine.begin() as conn:
+            result = await conn.execute(
+                update(interview_sessions)
+                .where(interview_sessions.c.session_id == session_id)
+                .values(status=status, completed_at=_now())
+            )
+        if result.rowcount:
+            logger.debug("✅ Interview status updated: %s", status)
+
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        """Get session data"""
+        await self.connect()
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(interview_sessions).where(interview_sessions.c.session_id == session_id)
+            )
+            row = result.mappings().first()
+
+        if row is None:
+            return None
+        session = {
+            "template_id": row["template_id"],
+            "research_topic": row["research_topic"],
+            "started_at": row["created_at"],
+            "status": row["status"]
+        }
+        if row["completed_at"] is not None:
+            session["completed_at"] = row["completed_at"]
+        return session
+
+    async def delete_session(self, session_id: str):
+        """Drop everything stored for a session"""
+        await self.connect()
+        await self._responses.flush()
+        async with self.engine.begin() as conn:
+            for table in (analyzed_responses, interview_summaries, interview_sessions):
+                await conn.execute(delete(table).where(table.c.session_id == session_id))
+
+    def stats(self) -> Dict[str, Any]:
+        batches = self._responses.batches
+        return {
+            "insert_batches": batches,
+            "inserted_rows": self._responses.rows,
+            "avg_batch_size": round(self._responses.rows / batches, 2) if batches else 0.0
+        }
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: Optional[datetime]) -> datetime:
+    """Model timestamps are naive local time; timestamptz columns want aware values."""
+    return value.astimezone(timezone.utc) if value else _now()
@@ -0,0 +1,259 @@
+"""
+Template Analytics - per-template aggregates, maintained as interviews run
+The workflow adds every analyzed response (sentiment, length) and every
+finished interview (outcome, questions asked, average sentiment, termination
+reason) to its template's counters, so a dashboard read is a fixed number of
+fields instead of a scan over all summaries.
+
+Each aggregate is a set of additive fields: counters plus count / sum / sum
+of squares per measure, from which mean and sample variance are derived on
+read. Additive fields can be incremented atomically by any instance.
+Termination reasons keep counts for the TERMINATION_REASONS_KEPT most
+frequent ones.
+
+A turn can run more than once: /agent/chat answers a concurrent save with 409
+and the client resends, a finalization job is retried. Increments that pass
+an `event_id` (session + turn) are applied once per id; the ids are kept for
+SESSION_TTL_SECONDS in Redis, and the RECORDED_EVENTS_KEPT most recent in memory.
+
+Two backends with the same interface (TEMPLATE_ANALYTICS_BACKEND):
+    InMemoryTemplateAnalytics  dicts in this process (default)
+    RedisTemplateAnalytics     one hash + one sorted set per template, updated
+                               with HINCRBYFLOAT / ZINCRBY in one pipeline
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import config
+from models.schemas import RunningStat, TemplateAnalytics
+from utils.logger import get_logger
+
+logger = get_logger("storage.template_analytics")
+
+TERMINATION_REASONS_KEPT = 50
+TERMINATION_REASONS_SHOWN = 10
+RECORDED_EVENTS_KEPT = 100_000
+OUTCOMES = ("completed", "terminated_early", "incomplete")
+SENTIMENTS = ("positive", "neutral", "negative")
+
+
+def _measure(fields: Dict[str, float], name: str, value: float):
+    fields[f"{name}:count"] = 1
+    fields[f"{name}:sum"] = value
+    fields[f"{name}:sumsq"] = value * value
+
+
+def running_stat(fields: Dict[str, float], name: str) -> RunningStat:
+    """Mean and sample variance from the count / sum / sum-of-squares fields."""
+    count = int(fields.get(f"{name}:count", 0))
+    if not count:
+        return RunningStat()
+    total = fields.get(f"{name}:sum", 0.0)
+    mean = total / count
+    variance = 0.0
+    if count > 1:
+        variance = max(0.0, (fields.get(f"{name}:sumsq", 0.0) - total * mean) / (count - 1))
+    return RunningStat(count=count, mean=round(mean, 4), variance=round(variance, 4))
+
+
+def interview_outcome(state: Dict[str, Any]) -> str:
+    """completed (all questions asked), terminated_early, or incomplete (ended before that)."""
+    if state.get("should_terminate_early"):
+        return "terminated_early"
+    if state["question_count"] >= state["max_questions"]:
+        return "completed"
+    return "incomplete"
+
+
+class TemplateAnalyticsStore:
+    """Shared increment / read logic; backends implement _apply and _load"""
+
+    backend = "base"
+
+    async def record_started(self, template_id: str):
+        await self._record(template_id, {"interviews_started": 1})
+
+    async def record_response(
+        self,
+        template_id: str,
+        sentiment: str,
+        sentiment_score: float,
+        word_count: int,
+        event_id: Optional[str] = None
+    ):
+        """One analyzed response (every turn, on- or off-topic)."""
+        fields = {"responses": 1, f"sentiment:{sentiment}": 1}
+        _measure(fields, "response_sentiment", sentiment_score)
+        _measure(fields, "response_words", word_count)
+        await self._record(template_id, fields, event_id=event_id)
+
+    async def record_interview(
+        self,
+        template_id: str,
+        outcome: str,
+        questions_asked: int,
+        average_sentiment: float,
+        termination_reason: Optional[str] = None,
+        event_id: Optional[str] = None
+    ):
+        """One finished interview (its summary was generated)."""
+        fields = {"interviews_finished": 1, f"outcome:{outcome}": 1}
+        _measure(fields, "questions_asked", questions_asked)
+        _measure(fields, "interview_sentiment", average_sentiment)
+        await self._record(template_id, fields, termination_reason, event_id)
+
+    async def _record(
+        self,
+        template_id: str,
+        fields: Dict[str, float],
+        reason: Optional[str] = None,
+        event_id: Optional[str] = None
+    ):
+        # Analytics must never fail an interview turn
+        try:
+            if event_id is not None and not await self._claim(event_id):
+                logger.debug("Template analytics event %s already recorded", event_id)
+                return
+            await self._apply(template_id, fields, reason)
+        except Exception as e:
+            logger.warning("⚠️ Template analytics update failed for %s: %s", template_id, e)
+
+    async def get(self, template_id: str) -> Optional[TemplateAnalytics]:
+        """Aggregates for a template, or None if nothing was recorded for it."""
+        fields, reasons = await self._load(template_id)
+        if not fields:
+            return None
+        finished = int(fields.get("interviews_finished", 0))
+        outcomes = {outcome: int(fields.get(f"outcome:{outcome}", 0)) for outcome in OUTCOMES}
+        updated_at = fields.get("updated_at")
+        return TemplateAnalytics(
+            template_id=template_id,
+            interviews_started=int(fields.get("interviews_started", 0)),
+            interviews_finished=finished,
+            outcomes=outcomes,
+            completion_rate=round(outcomes["completed"] / finished, 4) if finished else 0.0,
+            questions_asked=running_stat(fields, "questions_asked"),
+            interview_sentiment=running_stat(fields, "interview_sentiment"),
+            termination_reasons=dict(reasons),
+            responses=int(fields.get("responses", 0)),
+            sentiment_distribution={sentiment: int(fields.get(f"sentiment:{sentiment}", 0)) for sentiment in SENTIMENTS},
+            response_sentiment=running_stat(fields, "response_sentiment"),
+            response_words=running_stat(fields, "response_words"),
+            updated_at=datetime.fromtimestamp(updated_at) if updated_at else None
+        )
+
+    async def _claim(self, event_id: str) -> bool:
+        """True the first time `event_id` is seen, False for a replay."""
+        raise NotImplementedError
+
+    async def _apply(self, template_id: str, fields: Dict[str, float], reason: Optional[str]):
+        raise NotImplementedError
+
+    async def _load(self, template_id: str) -> Tuple[Dict[str, float], List[Tuple[str, int]]]:
+        """(fields, top termination reasons with counts, most frequent first)"""
+        raise NotImplementedError
+
+
+class InMemoryTemplateAnalytics(TemplateAnalyticsStore):
+    """Aggregates in this process only"""
+
+    backend = "memory"
+
+    def __init__(self):
+        self._fields: Dict[str, Dict[str, float]] = {}
+        self._reasons: Dict[str, Dict[str, int]] = {}
+        self._events: OrderedDict = OrderedDict()
+
+    async def _claim(self, event_id: str) -> bool:
+        if event_id in self._events:
+            return False
+        self._events[event_id] = None
+        if len(self._events) > RECORDED_EVENTS_KEPT:
+            self._events.popitem(last=False)
+        return True
+
+    async def _apply(self, template_id: str, fields: Dict[str, float], reason: Optional[str]):
+        aggregate = self._fields.setdefault(template_id, {})
+        for field, value in fields.items():
+            aggregate[field] = aggregate.get(field, 0) + value
+        aggregate["updated_at"] = time.time()
+
+        if reason:
+            reasons = self._reasons.setdefault(template_id, {})
+            reasons[reason] = reasons.get(reason, 0) + 1
+            if len(reasons) > TERMINATION_REASONS_KEPT:
+                # Drop the least frequent (the one just added wins a tie)
+                rarest = min((r for r in reasons if r != reason), key=reasons.get)
+                del reasons[rarest]
+
+    async def _load(self, template_id: str) -> Tuple[Dict[str, float], List[Tuple[str, int]]]:
+        reasons = self._reasons.get(template_id, {})
+        top = sorted(reasons.items(), key=lambda item: -item[1])[:TERMINATION_REASONS_SHOWN]
+        return dict(self._fields.get(template_id, {})), top
+
+
+class RedisTemplateAnalytics(TemplateAnalyticsStore):
+    """
+    Aggregates shared by all instances:
+        {prefix}{template_id}          hash of additive fields
+        {prefix}{template_id}:reasons  sorted set, termination reason -> count
+        {prefix}event:{event_id}       marks an event id as recorded (SET NX, expires)
+    """
+
+    backend = "redis"
+
+    def __init__(self, redis_client: Any = None, key_prefix: str = "template_analytics:"):
+        if redis_client is None:
+            from storage.redis_client import redis_client as default_redis_client
+            redis_client = default_redis_client
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+
+    def _key(self, template_id: str) -> str:
+        return f"{self.key_prefix}{template_id}"
+
+    def _reasons_key(self, template_id: str) -> str:
+        return f"{self.key_prefix}{template_id}:reasons"
+
+    async def _claim(self, event_id: str) -> bool:
+        return bool(await self.redis.set(
+            f"{self.key_prefix}event:{event_id}", 1, nx=True, ex=config.SESSION_TTL_SECONDS
+        ))
+
+    async def _apply(self, template_id: str, fields: Dict[str, float], reason: Optional[str]):
+        key = self._key(template_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for field, value in fields.items():
+                pipe.hincrbyfloat(key, field, value)
+            pipe.hset(key, "updated_at", time.time())
+            if reason:
+                reasons_key = self._reasons_key(template_id)
+                pipe.zincrby(reasons_key, 1, reason)
+                pipe.zremrangebyrank(reasons_key, 0, -(TERMINATION_REASONS_KEPT + 1))
+            await pipe.execute()
+
+    async def _load(self, template_id: str) -> Tuple[Dict[str, float], List[Tuple[str, int]]]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._key(template_id))
+            pipe.zrevrange(self._reasons_key(template_id), 0, TERMINATION_REASONS_SHOWN - 1, withscores=True)
+            raw_fields, raw_reasons = await pipe.execute()
+
+        def text(value) -> str:
+            return value.decode() if isinstance(value, bytes) else value
+
+        fields = {text(field): float(value) for field, value in raw_fields.items()}
+        reasons = [(text(reason), int(score)) for reason, score in raw_reasons]
+        return fields, reasons
+
+
+def create_template_analytics() -> TemplateAnalyticsStore:
+    """Analytics store for TEMPLATE_ANALYTICS_BACKEND ("memory" or "redis")."""
+    if config.TEMPLATE_ANALYTICS_BACKEND == "redis":
+        return RedisTemplateAnalytics()
+    return InMemoryTemplateAnalytics()
+
+# Singleton instance
+template_analytics = create_template_analytics()
@@ -0,0 +1,23 @@
+from typing import Dict, List
+
+# Extra early-termination phrases, keyed by template_id or locale, merged onto
+# the built-in English sets of EarlyTerminationDetector. Keys per entry:
+# "explicit_exit", "negative_emotion", "dismissive", "exclusions".
+# More sets can be loaded from JSON with TERMINATION_PHRASES_FILE.
+TERMINATION_PHRASE_OVERRIDES: Dict[str, Dict[str, List[str]]] = {
+    # Frustration with the product is the feedback we are collecting,
+    # not frustration with the interview
+    "product-001": {
+        "exclusions": [
+            "frustrated with the app", "frustrated with the product",
+            "frustrated with it", "frustrating to use", "this is frustrating when",
+            "not comfortable with the", "not comfortable using",
+        ]
+    },
+    "wellness-001": {
+        "exclusions": [
+            "not feeling good about myself", "feeling bad about myself",
+            "i feel bad when", "not comfortable with my",
+        ]
+    },
+}
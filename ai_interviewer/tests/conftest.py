@@ -0,0 +1,22 @@
+"""
+Shared pytest setup. Run from ai_interviewer/:
+    python -m pytest -q tests
+
+Async tests use the anyio pytest plugin (installed with httpx) on asyncio:
+mark them with `pytest.mark.anyio`.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Modules import each other from the ai_interviewer/ root (config, storage, ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
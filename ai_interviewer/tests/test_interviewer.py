@@ -0,0 +1,97 @@
+"""Streamed interviewer questions: quotes stripped on the fly, replace events on fallback."""
+
+import pytest
+
+from agents.interviewer import FALLBACK_QUESTION, InterviewerAgent, _UnquotedTokens
+from llm.client import LLMError
+from models.schemas import InterviewState
+
+pytestmark = pytest.mark.anyio
+
+STATE = InterviewState(session_id="s1", respondent_id="s1", template_id="t", research_topic="coffee")
+
+
+class StreamingLLM:
+    """Streams `deltas` to on_token, then fails with `error` if given."""
+
+    def __init__(self, deltas, error=None):
+        self.deltas = deltas
+        self.error = error
+
+    async def complete_streaming(self, prompt, on_token, **kwargs):
+        for delta in self.deltas:
+            on_token(delta)
+        if self.error:
+            raise self.error
+        return "".join(self.deltas).strip()
+
+    async def complete(self, prompt, **kwargs):
+        return "".join(self.deltas).strip()
+
+
+async def ask(deltas, error=None):
+    agent = InterviewerAgent()
+    agent.llm = StreamingLLM(deltas, error)
+    tokens, replaced = [], []
+    question = await agent.generate_next_question(STATE, [], on_token=tokens.append, on_replace=replaced.append)
+    return question, "".join(tokens), replaced
+
+
+@pytest.mark.parametrize("deltas", [
+    ['"What', " do you", ' drink?"'],
+    ['"', "What do you drink?", '"'],
+    ["  ", '"What do', ' you drink?', '"', "\n"],
+    ['"What do you drink?"'],
+])
+async def test_wrapping_quotes_never_reach_the_stream(deltas):
+    question, streamed, replaced = await ask(deltas)
+
+    assert question == streamed == "What do you drink?"
+    assert replaced == []
+
+
+async def test_inner_quotes_are_streamed():
+    question, streamed, replaced = await ask(['"He said', ' "decaf"', ' twice?"'])
+
+    assert question == streamed == 'He said "decaf" twice?'
+    assert replaced == []
+
+
+async def test_closing_quote_without_opening_one_is_kept():
+    question, streamed, replaced = await ask(["Is it", ' really "', 'fresh"'])
+
+    assert question == streamed == 'Is it really "fresh"'
+    assert replaced == []
+
+
+async def test_unmatched_opening_quote_is_replaced():
+    question, streamed, replaced = await ask(['"Fresh', '" is what you said?'])
+
+    assert question == '"Fresh" is what you said?'
+    assert streamed == 'Fresh" is what you said?'
+    assert replaced == [question]
+
+
+async def test_mid_stream_error_replaces_with_the_fallback():
+    question, streamed, replaced = await ask(["What do", " you"], error=LLMError("stream reset"))
+
+    assert question == FALLBACK_QUESTION
+    assert streamed == "What do you"
+    assert replaced == [FALLBACK_QUESTION]
+
+
+async def test_non_streaming_question_is_unquoted():
+    agent = InterviewerAgent()
+    agent.llm = StreamingLLM(['"What do you drink?"'])
+
+    assert await agent.generate_next_question(STATE, []) == "What do you drink?"
+
+
+def test_whitespace_between_deltas_is_kept():
+    sent = []
+    tokens = _UnquotedTokens(sent.append)
+    for delta in ["What ", "do ", "you ", "drink?"]:
+        tokens(delta)
+
+    assert tokens.finish() == "What do you drink?"
+    assert sent == ["What", " do", " you", " drink?"]
@@ -0,0 +1,157 @@
+"""AsyncLLMClient against the fake provider (benchmarks/fake_llm_server.py)."""
+
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.fake_llm_server import FakeLLMServer, _free_port
+from llm.cache import CompletionCache
+from llm.client import AsyncLLMClient, LLMError, LLMTimeoutError
+
+pytestmark = pytest.mark.anyio
+
+MESSAGES = [{"role": "user", "content": "Ask me a follow-up question about coffee."}]
+REPLY = "That's interesting! Can you walk me through a specific example of when that happened?"
+
+
+@pytest.fixture(scope="module")
+def fast_server():
+    with FakeLLMServer(latency_ms=5, token_ms=1) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def slow_server():
+    with FakeLLMServer(latency_ms=1000, token_ms=1) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def failing_server():
+    with FakeLLMServer(latency_ms=5, error_rate=1.0, error_statuses=(503,)) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def rate_limited_server():
+    with FakeLLMServer(latency_ms=5, rate_limit_rps=0.2, rate_limit_burst=1) as server:
+        yield server
+
+
+@pytest.fixture
+async def make_client():
+    clients = []
+
+    def make(server_or_url, **kwargs):
+        base_url = getattr(server_or_url, "base_url", server_or_url)
+        client = AsyncLLMClient(base_url=base_url, api_key="test", cache=CompletionCache(), **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.aclose()
+
+
+def pool_connections(client: AsyncLLMClient) -> int:
+    return len(client._get_http()._transport._pool.connections)
+
+
+async def test_chat_returns_content_and_usage(fast_server, make_client):
+    response = await make_client(fast_server).chat(MESSAGES, model="fake-model")
+
+    assert response.content == REPLY
+    assert response.model == "fake-model"
+    assert response.prompt_tokens == len(MESSAGES[0]["content"].split())
+    assert response.completion_tokens == len(REPLY.split())
+    assert not response.cached
+
+
+async def test_sequential_calls_reuse_one_connection(fast_server, make_client):
+    client = make_client(fast_server)
+    http = client._get_http()
+    for _ in range(5):
+        await client.chat(MESSAGES, model="fake-model")
+    async for _ in client.stream(MESSAGES, model="fake-model"):
+        pass
+
+    assert client._get_http() is http
+    assert pool_connections(client) == 1
+
+
+async def test_concurrent_calls_stay_within_the_pool(fast_server, make_client):
+    client = make_client(fast_server, max_connections=2, max_keepalive_connections=2)
+    responses = await asyncio.gather(*(client.chat(MESSAGES, model="fake-model") for _ in range(8)))
+
+    assert all(response.content == REPLY for response in responses)
+    assert pool_connections(client) <= 2
+
+
+async def test_cached_completion_skips_the_provider(fast_server, make_client):
+    client = make_client(fast_server)
+    before = fast_server.request_count
+    first = await client.chat(MESSAGES, model="fake-model", temperature=0.0, cache=True)
+    second = await client.chat(MESSAGES, model="fake-model", temperature=0.0, cache=True)
+
+    assert second.cached and second.content == first.content
+    assert fast_server.request_count == before + 1
+
+
+async def test_stream_yields_the_full_reply(fast_server, make_client):
+    deltas = [delta async for delta in make_client(fast_server).stream(MESSAGES, model="fake-model")]
+
+    assert len(deltas) > 1
+    assert "".join(deltas).strip() == REPLY
+
+
+async def test_provider_error_keeps_the_status(failing_server, make_client):
+    client = make_client(failing_server)
+    with pytest.raises(LLMError) as excinfo:
+        await client.chat(MESSAGES, model="fake-model")
+    assert excinfo.value.status_code == 503
+    assert not isinstance(excinfo.value, LLMTimeoutError)
+
+    with pytest.raises(LLMError) as excinfo:
+        async for _ in client.stream(MESSAGES, model="fake-model"):
+            pass
+    assert excinfo.value.status_code == 503
+
+
+async def test_rate_limit_carries_retry_after(rate_limited_server, make_client):
+    client = make_client(rate_limited_server)
+    await client.chat(MESSAGES, model="fake-model")
+    with pytest.raises(LLMError) as excinfo:
+        await client.chat(MESSAGES, model="fake-model")
+
+    assert excinfo.value.status_code == 429
+    assert 0 < excinfo.value.retry_after <= 5
+
+
+async def test_connection_refused_is_a_transport_error(make_client):
+    client = make_client(f"http://127.0.0.1:{_free_port()}/v1")
+    with pytest.raises(LLMError) as excinfo:
+        await client.chat(MESSAGES, model="fake-model")
+
+    assert excinfo.value.status_code is None
+    assert not isinstance(excinfo.value, LLMTimeoutError)
+
+
+async def test_chat_deadline_raises_timeout(slow_server, make_client):
+    client = make_client(slow_server)
+    started = time.perf_counter()
+    with pytest.raises(LLMTimeoutError):
+        await client.chat(MESSAGES, model="fake-model", timeout=0.2)
+    assert time.perf_counter() - started < 0.8
+
+    # The aborted request doesn't poison the pool
+    response = await client.chat(MESSAGES, model="fake-model", timeout=5)
+    assert response.content == REPLY
+
+
+async def test_stream_read_timeout_raises_timeout(slow_server, make_client):
+    started = time.perf_counter()
+    with pytest.raises(LLMTimeoutError):
+        async for _ in make_client(slow_server).stream(MESSAGES, model="fake-model", timeout=0.2):
+            pass
+    assert time.perf_counter() - started < 0.8
@@ -0,0 +1,271 @@
+"""LLMRouter: failover, circuit breakers and hedging over scripted providers."""
+
+import asyncio
+import time
+
+import pytest
+
+from llm.client import LLMError, LLMResponse, LLMTimeoutError
+from llm.router import CircuitBreaker, LLMProvider, LLMRouter
+
+pytestmark = pytest.mark.anyio
+
+MESSAGES = [{"role": "user", "content": "Next question?"}]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedClient:
+    """
+    Stands in for AsyncLLMClient. Each call takes the next step of `script`
+    (the last one repeats): an LLMError to raise, or seconds to wait before
+    answering. Streams raise a scripted error before the first delta, or
+    after it with `fail_after_first_delta`.
+    """
+
+    def __init__(self, name: str, script=(0.0,), fail_after_first_delta: bool = False):
+        self.name = name
+        self.script = list(script)
+        self.fail_after_first_delta = fail_after_first_delta
+        self.calls = 0
+        self.cancelled = 0
+
+    def _next_step(self):
+        step = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        return step
+
+    async def chat(self, messages, model, max_tokens=200, temperature=0.3, timeout=None, cache=False):
+        step = self._next_step()
+        if isinstance(step, LLMError):
+            raise step
+        try:
+            await asyncio.sleep(step)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return LLMResponse(content=f"from {self.name}", model=model, prompt_tokens=3, completion_tokens=2)
+
+    async def stream(self, messages, model, max_tokens=200, temperature=0.3, timeout=None):
+        step = self._next_step()
+        if isinstance(step, LLMError) and not self.fail_after_first_delta:
+            raise step
+        yield f"{self.name}:"
+        if isinstance(step, LLMError):
+            raise step
+        await asyncio.sleep(step)
+        yield "done"
+
+    async def aclose(self):
+        pass
+
+
+def provider(name: str, clock: Clock, script=(0.0,), **client_options) -> LLMProvider:
+    return LLMProvider(
+        name,
+        ScriptedClient(name, script, **client_options),
+        {"fast": f"{name}-fast", "quality": f"{name}-quality"},
+        breaker=CircuitBreaker(failure_threshold=2, cooldown_seconds=30, clock=clock)
+    )
+
+
+def router(*providers: LLMProvider, hedge: bool = False, **options) -> LLMRouter:
+    names = [p.name for p in providers]
+    return LLMRouter(providers, {"fast": names, "quality": names}, by_latency=False, hedge=hedge, **options)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+# ------------------------------------------------------------------------
+# Circuit breaker
+# ------------------------------------------------------------------------
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=30, clock=clock)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+    breaker.record_failure()
+    clock.now += 30
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    breaker.begin()
+    assert not breaker.allow()
+
+    # A failed trial reopens it for another cooldown
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 30
+    breaker.begin()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_breaker_release_frees_the_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.begin()
+    breaker.release()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker.allow()
+
+
+# ------------------------------------------------------------------------
+# Failover
+# ------------------------------------------------------------------------
+
+async def test_chat_fails_over_to_the_next_provider(clock):
+    a = provider("a", clock, [LLMError("down", status_code=503)])
+    b = provider("b", clock)
+
+    response = await router(a, b).chat(MESSAGES, role="fast")
+
+    assert response.provider == "b" and response.content == "from b"
+    assert a.breaker.failures == 1 and b.breaker.failures == 0
+
+
+async def test_client_errors_fail_over_without_counting_against_the_provider(clock):
+    a = provider("a", clock, [LLMError("bad request", status_code=400)])
+    b = provider("b", clock)
+
+    assert (await router(a, b).chat(MESSAGES)).provider == "b"
+    assert a.breaker.failures == 0
+
+
+async def test_chat_raises_the_last_error_when_every_provider_fails(clock):
+    a = provider("a", clock, [LLMError("down", status_code=503)])
+    b = provider("b", clock, [LLMTimeoutError("slow")])
+
+    with pytest.raises(LLMTimeoutError):
+        await router(a, b).chat(MESSAGES)
+
+
+async def test_open_breaker_is_skipped_until_the_cooldown_ends(clock):
+    a = provider("a", clock, [LLMError("down", status_code=503)] * 2 + [0.0])
+    b = provider("b", clock)
+    llm = router(a, b)
+
+    for _ in range(2):
+        await llm.chat(MESSAGES)
+    assert a.breaker.state == CircuitBreaker.OPEN
+
+    assert (await llm.chat(MESSAGES)).provider == "b"
+    assert a.client.calls == 2
+
+    # Half-open: the next call is a's trial, and its success closes the breaker
+    clock.now += 30
+    assert (await llm.chat(MESSAGES)).provider == "a"
+    assert a.breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_stream_fails_over_before_the_first_delta(clock):
+    a = provider("a", clock, [LLMError("down", status_code=503)])
+    b = provider("b", clock)
+
+    deltas = [delta async for delta in router(a, b).stream(MESSAGES)]
+
+    assert deltas == ["b:", "done"]
+    assert a.breaker.failures == 1 and b.breaker.failures == 0
+
+
+async def test_stream_error_after_the_first_delta_is_raised(clock):
+    a = provider("a", clock, [LLMError("reset", status_code=502)], fail_after_first_delta=True)
+    b = provider("b", clock)
+
+    deltas = []
+    with pytest.raises(LLMError):
+        async for delta in router(a, b).stream(MESSAGES):
+            deltas.append(delta)
+
+    assert deltas == ["a:"]
+    assert b.client.calls == 0
+    assert a.breaker.failures == 1
+
+
+async def test_cancelled_stream_releases_the_half_open_trial(clock):
+    a = provider("a", clock, [10.0])
+    a.breaker.failures = 2
+    a.breaker.opened_at = clock.now - 30
+    stream = router(a).stream(MESSAGES)
+
+    assert await stream.__anext__() == "a:"
+    assert not a.breaker.allow()
+    await stream.aclose()
+
+    assert a.breaker.state == CircuitBreaker.HALF_OPEN and a.breaker.allow()
+
+
+# ------------------------------------------------------------------------
+# Hedging
+# ------------------------------------------------------------------------
+
+def warmed(p: LLMProvider, latency_ms: float, samples: int = 5) -> LLMProvider:
+    for _ in range(samples):
+        p.observe(latency_ms)
+    return p
+
+
+async def test_slow_provider_is_hedged_past_its_p90(clock):
+    a = warmed(provider("a", clock, [2.0]), 20)
+    b = provider("b", clock, [0.0])
+    llm = router(a, b, hedge=True, hedge_min_delay_ms=20, hedge_min_samples=5)
+
+    started = time.perf_counter()
+    response = await llm.chat(MESSAGES)
+
+    assert response.provider == "b"
+    assert time.perf_counter() - started < 1.0
+    # The losing request is cancelled, and cancelling is no verdict on a
+    assert a.client.cancelled == 1
+    assert a.breaker.failures == 0
+
+
+async def test_fast_answer_is_not_hedged(clock):
+    a = warmed(provider("a", clock, [0.0]), 200)
+    b = provider("b", clock)
+
+    response = await router(a, b, hedge=True, hedge_min_delay_ms=20, hedge_min_samples=5).chat(MESSAGES)
+
+    assert response.provider == "a"
+    assert b.client.calls == 0
+
+
+async def test_no_hedge_without_enough_latency_samples(clock):
+    a = warmed(provider("a", clock, [0.1]), 1, samples=2)
+    b = provider("b", clock)
+
+    response = await router(a, b, hedge=True, hedge_min_delay_ms=0, hedge_min_samples=5).chat(MESSAGES)
+
+    assert response.provider == "a"
+    assert b.client.calls == 0
+
+
+async def test_hedge_still_fails_over_when_the_first_provider_errors(clock):
+    a = warmed(provider("a", clock, [LLMError("down", status_code=503)]), 20)
+    b = provider("b", clock, [0.0])
+
+    response = await router(a, b, hedge=True, hedge_min_delay_ms=20, hedge_min_samples=5).chat(MESSAGES)
+
+    assert response.provider == "b"
+    assert a.breaker.failures == 1
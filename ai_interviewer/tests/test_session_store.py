@@ -0,0 +1,216 @@
+"""SessionStore on fakeredis: round trips, append-only lists, optimistic locking."""
+
+import fakeredis
+import pytest
+
+from graph.workflow import create_started_state
+from models.schemas import AnalyzedResponse, ResponseQuality, Sentiment
+from storage.session_store import SessionConflictError, SessionStore
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis(server):
+    return fakeredis.FakeAsyncRedis(server=server)
+
+
+@pytest.fixture
+def store(redis):
+    return SessionStore(redis_client=redis, ttl_seconds=60, key_prefix="test:")
+
+
+def answered(state: dict, answer: str, insight: str) -> dict:
+    """The state after one more turn: answer + question appended, one new insight."""
+    return {
+        **state,
+        "conversation_history": state["conversation_history"] + [
+            {"role": "user", "content": answer},
+            {"role": "assistant", "content": f"Why {answer}?"}
+        ],
+        "session_insights": state["session_insights"] + [insight],
+        "question_count": state["question_count"] + 1
+    }
+
+
+async def test_round_trip_keeps_fields_and_models(store):
+    state = create_started_state("s1", "template-1", "How do you make coffee?")
+    state["analyzed_response"] = AnalyzedResponse(
+        session_id="s1",
+        respondent_id="s1",
+        user_response="French press",
+        quality=ResponseQuality.GOOD,
+        sentiment=Sentiment.POSITIVE,
+        word_count=2,
+        key_insights=["Uses a French press"]
+    )
+    state["session_insights"] = ["Uses a French press"]
+    await store.save("s1", state)
+
+    loaded = await store.load("s1")
+    assert loaded == state
+    assert isinstance(loaded["analyzed_response"], AnalyzedResponse)
+    assert loaded["analyzed_response"].sentiment is Sentiment.POSITIVE
+
+
+async def test_missing_session(store):
+    assert await store.load("nope") is None
+    assert await store.load_versioned("nope") == (None, 0)
+    assert await store.update("nope", lambda state: state) is None
+    assert not await store.exists("nope")
+
+
+async def test_version_key_counts_saves(store, redis):
+    state = create_started_state("s1", "template-1", "topic")
+    assert await store.save("s1", state) == 1
+    assert await store.save("s1", state, expected_version=1) == 2
+
+    assert int(await redis.get("test:s1:version")) == 2
+    assert (await store.load_versioned("s1"))[1] == 2
+    assert 0 < await redis.ttl("test:s1:version") <= 60
+
+
+async def test_lists_are_kept_out_of_the_scalar_payload(store, redis):
+    state = answered(create_started_state("s1", "template-1", "topic"), "daily", "Drinks coffee daily")
+    await store.save("s1", state)
+
+    scalars = store.codec.loads(await redis.get("test:s1"))
+    assert "conversation_history" not in scalars and "session_insights" not in scalars
+    assert await redis.llen("test:s1:history") == 3
+    assert await redis.llen("test:s1:insights") == 1
+
+
+async def test_versioned_save_appends_only_new_items(store, redis):
+    state = create_started_state("s1", "template-1", "topic")
+    version = await store.save("s1", state)
+    for turn in range(3):
+        state, version = await store.load_versioned("s1")
+        before = store.bytes_written
+        version = await store.save("s1", answered(state, f"answer {turn}", f"insight {turn}"), expected_version=version)
+        appended = store.bytes_written - before
+
+    # The last save wrote the scalars plus two messages and one insight, not the whole history
+    new_items = [
+        {"role": "user", "content": "answer 2"}, {"role": "assistant", "content": "Why answer 2?"}, "insight 2"
+    ]
+    scalars = {key: value for key, value in state.items() if key not in ("conversation_history", "session_insights")}
+    scalars["question_count"] += 1
+    assert appended == len(store.codec.dumps(scalars)) + sum(len(store.codec.dumps(item)) for item in new_items)
+
+    loaded = await store.load("s1")
+    assert len(loaded["conversation_history"]) == 7
+    assert loaded["session_insights"] == ["insight 0", "insight 1", "insight 2"]
+    assert [store.codec.loads(raw) for raw in await redis.lrange("test:s1:insights", 0, -1)] == loaded["session_insights"]
+
+
+async def test_blind_save_rewrites_the_lists(store):
+    state = answered(create_started_state("s1", "template-1", "topic"), "daily", "Drinks coffee daily")
+    await store.save("s1", state)
+    await store.save("s1", {**state, "conversation_history": state["conversation_history"][:1], "session_insights": []})
+
+    loaded = await store.load("s1")
+    assert len(loaded["conversation_history"]) == 1
+    assert loaded["session_insights"] == []
+
+
+async def test_stale_version_raises_conflict(store):
+    state = create_started_state("s1", "template-1", "topic")
+    await store.save("s1", state)
+    first, version = await store.load_versioned("s1")
+    second, _ = await store.load_versioned("s1")
+
+    await store.save("s1", answered(first, "mine", "first writer"), expected_version=version)
+    with pytest.raises(SessionConflictError):
+        await store.save("s1", answered(second, "theirs", "second writer"), expected_version=version)
+
+    loaded = await store.load("s1")
+    assert loaded["session_insights"] == ["first writer"]
+    assert loaded["conversation_history"][-2]["content"] == "mine"
+
+
+async def test_concurrent_write_during_save_raises_conflict(store, redis, server):
+    """A write by another instance between WATCH and EXEC aborts the transaction."""
+    state = create_started_state("s1", "template-1", "topic")
+    version = await store.save("s1", state)
+    other = SessionStore(redis_client=fakeredis.FakeAsyncRedis(server=server), ttl_seconds=60, key_prefix="test:")
+
+    original_pipeline = redis.pipeline
+
+    def pipeline(*args, **kwargs):
+        pipe = original_pipeline(*args, **kwargs)
+        llen = pipe.llen
+
+        async def llen_then_interleave(key):
+            result = await llen(key)
+            if key.endswith(":insights"):
+                # Another instance saves the session while this one is inside WATCH
+                await other.save("s1", answered(state, "other", "other writer"), expected_version=version)
+            return result
+
+        pipe.llen = llen_then_interleave
+        return pipe
+
+    redis.pipeline = pipeline
+    try:
+        with pytest.raises(SessionConflictError):
+            await store.save("s1", answered(state, "mine", "mine"), expected_version=version)
+    finally:
+        redis.pipeline = original_pipeline
+
+    loaded, current = await store.load_versioned("s1")
+    assert current == version + 1
+    assert loaded["session_insights"] == ["other writer"]
+
+
+async def test_update_retries_on_conflict(store):
+    await store.save("s1", create_started_state("s1", "template-1", "topic"))
+    calls = []
+
+    async def mutate(state):
+        calls.append(len(state["session_insights"]))
+        if len(calls) == 1:
+            # Someone else commits a turn after this read
+            current, version = await store.load_versioned("s1")
+            await store.save("s1", answered(current, "other", "other writer"), expected_version=version)
+        return answered(state, "mine", "mine")
+
+    result = await store.update("s1", mutate, retries=1)
+
+    assert calls == [0, 1]
+    assert result["session_insights"] == ["other writer", "mine"]
+    assert (await store.load("s1"))["session_insights"] == ["other writer", "mine"]
+
+
+async def test_update_without_retries_surfaces_conflict(store):
+    await store.save("s1", create_started_state("s1", "template-1", "topic"))
+
+    async def mutate(state):
+        current, version = await store.load_versioned("s1")
+        await store.save("s1", current, expected_version=version)
+        return state
+
+    with pytest.raises(SessionConflictError):
+        await store.update("s1", mutate, retries=0)
+
+
+async def test_legacy_inline_lists_still_load(store, redis):
+    """Sessions saved before a list existed carry the field in the scalar payload."""
+    state = answered(create_started_state("s1", "template-1", "topic"), "daily", "Drinks coffee daily")
+    await redis.set("test:s1", store.codec.dumps(state))
+
+    loaded = await store.load("s1")
+    assert loaded["conversation_history"] == state["conversation_history"]
+    assert loaded["session_insights"] == ["Drinks coffee daily"]
+
+
+async def test_delete_removes_every_key(store, redis):
+    await store.save("s1", answered(create_started_state("s1", "template-1", "topic"), "daily", "insight"))
+    await store.delete("s1")
+
+    assert await redis.keys("test:s1*") == []
+    assert not await store.exists("s1")
@@ -0,0 +1,171 @@
+"""SQLDatabaseClient against SQLite (aiosqlite): round trips and insert batching."""
+
+import asyncio
+
+import pytest
+
+from models.schemas import AnalyzedResponse, InterviewSummary, ResponseQuality, Sentiment
+from storage.sql_client import SQLDatabaseClient
+
+pytestmark = pytest.mark.anyio
+
+
+def analyzed(text: str, insights=None) -> AnalyzedResponse:
+    return AnalyzedResponse(
+        session_id="",
+        respondent_id="",
+        user_response=text,
+        quality=ResponseQuality.GOOD,
+        sentiment=Sentiment.POSITIVE,
+        sentiment_score=0.6,
+        word_count=len(text.split()),
+        key_insights=insights or []
+    )
+
+
+@pytest.fixture
+async def db(tmp_path):
+    client = SQLDatabaseClient(
+        f"sqlite+aiosqlite:///{tmp_path / 'interviews.db'}",
+        batch_size=10,
+        batch_delay_ms=5,
+        create_tables=True
+    )
+    await client.connect()
+    yield client
+    await client.close()
+
+
+async def test_session_round_trip(db):
+    await db.initialize_session("s1", "coffee", "How often do you drink coffee?")
+    session = await db.get_session("s1")
+    assert session["template_id"] == "coffee"
+    assert session["research_topic"] == "How often do you drink coffee?"
+    assert session["status"] == "active"
+    assert "completed_at" not in session
+
+    await db.update_interview_status("s1", "completed")
+    session = await db.get_session("s1")
+    assert session["status"] == "completed"
+    assert session["completed_at"] is not None
+
+    assert await db.get_session("missing") is None
+
+
+async def test_analyzed_responses_round_trip_in_order(db):
+    await db.initialize_session("s1", "coffee", "topic")
+    await db.save_analyzed_response(analyzed("Every morning", ["Daily drinker"]), "s1", "r1")
+    await db.save_analyzed_response(analyzed("With oat milk", ["Likes oat milk", "Avoids dairy"]), "s1", "r1")
+
+    responses = await db.get_analyzed_responses("s1")
+    assert [r.user_response for r in responses] == ["Every morning", "With oat milk"]
+    assert responses[0].session_id == "s1"
+    assert responses[0].respondent_id == "r1"
+    assert responses[1].sentiment is Sentiment.POSITIVE
+    assert responses[1].quality is ResponseQuality.GOOD
+    assert responses[1].sentiment_score == pytest.approx(0.6)
+    assert await db.get_all_insights_for_session("s1") == ["Daily drinker", "Likes oat milk", "Avoids dairy"]
+
+
+async def test_initialize_session_starts_clean(db):
+    await db.initialize_session("s1", "coffee", "topic")
+    await db.save_analyzed_response(analyzed("First run"), "s1", "r1")
+    await db.initialize_session("s1", "coffee", "topic")
+    assert await db.get_analyzed_responses("s1") == []
+
+
+async def test_summary_round_trip_and_replace(db):
+    summary = InterviewSummary(
+        session_id="s1",
+        template_id="coffee",
+        summary="Drinks coffee daily.",
+        key_themes=["routine"],
+        average_sentiment_score=0.7,
+        total_insights_count=3,
+        questions_asked=5,
+        total_exchanges=10,
+        sentiment_distribution={"positive": 4, "neutral": 1}
+    )
+    await db.save_summary(summary)
+    await db.save_summary(summary.model_copy(update={"summary": "Updated."}))
+
+    saved = await db.get_summary("s1")
+    assert saved.summary == "Updated."
+    assert saved.key_themes == ["routine"]
+    assert saved.sentiment_distribution == {"positive": 4, "neutral": 1}
+    assert await db.get_summary("missing") is None
+
+
+async def test_delete_session_drops_every_table(db):
+    await db.initialize_session("s1", "coffee", "topic")
+    await db.initialize_session("s2", "coffee", "topic")
+    for session_id in ("s1", "s2"):
+        await db.save_analyzed_response(analyzed("answer", ["insight"]), session_id, session_id)
+        await db.save_summary(InterviewSummary(
+            session_id=session_id, template_id="coffee", summary="x", key_themes=[],
+            average_sentiment_score=0.5, total_insights_count=1, questions_asked=1, total_exchanges=2
+        ))
+
+    await db.delete_session("s1")
+    assert await db.get_session("s1") is None
+    assert await db.get_analyzed_responses("s1") == []
+    assert await db.get_summary("s1") is None
+    assert await db.get_session("s2") is not None
+    assert len(await db.get_analyzed_responses("s2")) == 1
+
+
+async def test_concurrent_inserts_coalesce_into_one_batch(db):
+    await db.initialize_session("s1", "coffee", "topic")
+    await asyncio.gather(*(
+        db.save_analyzed_response(analyzed(f"answer {i}"), "s1", "r1") for i in range(8)
+    ))
+
+    assert db.stats()["insert_batches"] == 1
+    assert db.stats()["inserted_rows"] == 8
+    assert len(await db.get_analyzed_responses("s1")) == 8
+
+
+async def test_full_batch_is_written_without_waiting_for_the_timer(tmp_path):
+    db = SQLDatabaseClient(
+        f"sqlite+aiosqlite:///{tmp_path / 'full.db'}", batch_size=4, batch_delay_ms=60_000, create_tables=True
+    )
+    await db.connect()
+    await asyncio.wait_for(asyncio.gather(*(
+        db.save_analyzed_response(analyzed(f"answer {i}"), "s1", "r1") for i in range(4)
+    )), timeout=5)
+    assert db.stats() == {"insert_batches": 1, "inserted_rows": 4, "avg_batch_size": 4.0}
+    await db.close()
+
+
+async def test_cancelled_caller_does_not_strand_the_batch(tmp_path):
+    db = SQLDatabaseClient(
+        f"sqlite+aiosqlite:///{tmp_path / 'cancel.db'}", batch_size=3, batch_delay_ms=60_000, create_tables=True
+    )
+    await db.connect()
+    waiters = [asyncio.create_task(db.save_analyzed_response(analyzed(f"answer {i}"), "s1", "r1")) for i in range(2)]
+    await asyncio.sleep(0)
+    # The caller that fills the batch goes away (client disconnect) while it is written
+    filler = asyncio.create_task(db.save_analyzed_response(analyzed("answer 2"), "s1", "r1"))
+    await asyncio.sleep(0)
+    filler.cancel()
+
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=5)
+    with pytest.raises(asyncio.CancelledError):
+        await filler
+    await db.close()
+    assert db.stats()["inserted_rows"] == 3
+
+
+async def test_close_writes_pending_rows(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'close.db'}"
+    db = SQLDatabaseClient(url, batch_size=10, batch_delay_ms=60_000, create_tables=True)
+    await db.connect()
+    pending = asyncio.create_task(db.save_analyzed_response(analyzed("answer"), "s1", "r1"))
+    await asyncio.sleep(0)
+
+    await db.close()
+    await asyncio.wait_for(pending, timeout=5)
+
+    reopened = SQLDatabaseClient(url, create_tables=True)
+    assert len(await reopened.get_analyzed_responses("s1")) == 1
+    await reopened.close()
@@ -0,0 +1,55 @@
+"""Template analytics: replayed turns and retried summaries count once."""
+
+import fakeredis
+import pytest
+
+from storage import template_analytics as analytics_module
+from storage.template_analytics import InMemoryTemplateAnalytics, RedisTemplateAnalytics
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request):
+    if request.param == "memory":
+        return InMemoryTemplateAnalytics()
+    return RedisTemplateAnalytics(redis_client=fakeredis.FakeAsyncRedis())
+
+
+async def test_replayed_response_counts_once(store):
+    for _ in range(2):
+        await store.record_response("t", "positive", 0.8, 12, event_id="s1:response:2")
+    await store.record_response("t", "negative", -0.5, 4, event_id="s1:response:4")
+
+    analytics = await store.get("t")
+    assert analytics.responses == 2
+    assert analytics.sentiment_distribution == {"positive": 1, "neutral": 0, "negative": 1}
+    assert analytics.response_words.count == 2
+
+
+async def test_retried_interview_counts_once(store):
+    for _ in range(3):
+        await store.record_interview("t", "terminated_early", 4, 0.3, "dismissive", event_id="s1:interview")
+    await store.record_interview("t", "completed", 8, 0.7, event_id="s2:interview")
+
+    analytics = await store.get("t")
+    assert analytics.interviews_finished == 2
+    assert analytics.outcomes["terminated_early"] == 1
+    assert analytics.termination_reasons == {"dismissive": 1}
+
+
+async def test_without_event_id_every_call_counts(store):
+    for _ in range(2):
+        await store.record_response("t", "neutral", 0.0, 5)
+
+    assert (await store.get("t")).responses == 2
+
+
+async def test_memory_forgets_oldest_events(monkeypatch):
+    monkeypatch.setattr(analytics_module, "RECORDED_EVENTS_KEPT", 2)
+    store = InMemoryTemplateAnalytics()
+    for event_id in ("a", "b", "c", "a"):
+        await store.record_response("t", "neutral", 0.0, 5, event_id=event_id)
+
+    assert len(store._events) == 2
+    assert (await store.get("t")).responses == 4
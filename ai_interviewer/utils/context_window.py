@@ -0,0 +1,232 @@
+"""
+Context Window - bounded conversation context for prompts
+The last few messages are kept verbatim; everything older is folded, one
+message at a time as it leaves the window, into a rolling summary: short
+question → answer notes for the most recent of them, and a tally of the
+topics mentioned for the ones pushed out of the note budget. The summary has
+a fixed token budget, so prompt size stays flat however long the interview runs.
+Sizes are in tokens, estimated locally (no tokenizer download or API call).
+"""
+
+import re
+from typing import Dict, List, Optional
+
+import config
+from utils.phrase_matcher import tokenize
+
+# Words, numbers and single punctuation marks; long words count as several
+# BPE tokens (roughly one per 6 characters)
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
+NOTE_QUESTION_TOKENS = 12
+NOTE_ANSWER_TOKENS = 40
+TOPICS_SHOWN = 20
+TOPICS_KEPT = 200
+TOPICS_MAX_TOKENS = 80
+
+STOPWORDS = frozenset("""
+a about after again all also am an and any are as at be because been before
+being but by can could did do does doing don't for from get got had has have
+having he her here him his how i i'd i'll i'm i've if in into is it it's its
+just like me more most my no not now of off on once only or other our out over
+really same she should so some such than that that's the their them then there
+these they thing things this those through to too up us very was we well were
+what when where which while who why will with would yeah yes you your
+""".split())
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count of `text`."""
+    return sum(1 + len(piece) // 6 for piece in _PIECE_RE.findall(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut `text` after roughly `max_tokens` tokens (on a word boundary)."""
+    used = 0
+    for match in _PIECE_RE.finditer(text):
+        used += 1 + len(match.group()) // 6
+        if used > max_tokens:
+            return text[:match.start()].rstrip() + "…"
+    return text
+
+
+def _count_topics(note: str, topics: Dict[str, int]):
+    # Only the answer side of "question → answer" carries the respondent's topics
+    answer = note.split(" → ", 1)[-1]
+    for word in tokenize(answer):
+        if len(word) > 2 and word.isalpha() and word not in STOPWORDS:
+            topics[word] = topics.get(word, 0) + 1
+
+
+def fit_lines(lines: List[str], max_tokens: int) -> List[str]:
+    """
+    Lines that fit in `max_tokens`, spread evenly over the whole list
+    (first and last kept) instead of only the head, so late-interview
+    content is not the part that gets dropped. When not even the first and
+    last line fit together, only the last one is kept, cut to the budget.
+    """
+    costs = [estimate_tokens(line) + 1 for line in lines]
+    if sum(costs) <= max_tokens:
+        return list(lines)
+
+    # Halve the stride until the sample fits
+    step = 2
+    while True:
+        indices = sorted(set(range(0, len(lines), step)) | {len(lines) - 1})
+        if sum(costs[i] for i in indices) <= max_tokens:
+            break
+        if step >= len(lines):
+            # Down to first + last: keep the newest line alone (line break and "…" cost a token each)
+            if costs[-1] <= max_tokens:
+                return [lines[-1]]
+            return [truncate_to_tokens(lines[-1], max_tokens - 2)] if max_tokens > 2 else []
+        step *= 2
+
+    kept = []
+    used = 0
+    for index in indices:
+        if used + costs[index] > max_tokens:
+            break
+        kept.append(lines[index])
+        used += costs[index]
+    return kept
+
+
+class ContextWindow:
+    """Recent messages verbatim + rolling summary, both token-capped"""
+
+    def __init__(
+        self,
+        recent_messages: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        summary_max_tokens: Optional[int] = None
+    ):
+        self.recent_messages = recent_messages or config.CONTEXT_RECENT_MESSAGES
+        self.max_tokens = max_tokens or config.CONTEXT_MAX_TOKENS
+        self.summary_max_tokens = summary_max_tokens or config.CONTEXT_SUMMARY_MAX_TOKENS
+
+    def empty_summary(self) -> Dict:
+        return {"notes": [], "topics": {}, "covered": 0, "tokens": 0}
+
+    def fold(self, summary: Optional[Dict], history: List[Dict[str, str]]) -> Dict:
+        """
+        Fold messages that left the recent window into the summary.
+
+        Only messages not covered yet are processed, so per turn this costs
+        the one or two messages that just scrolled out. Sessions without a
+        summary (or a history rewritten shorter) are folded from scratch.
+        Returns a new summary dict; the input is not modified.
+        """
+        if not summary or summary.get("covered", 0) > len(history):
+            summary = self.empty_summary()
+
+        end = max(0, len(history) - self.recent_messages)
+        covered = summary["covered"]
+        if end <= covered:
+            return summary
+
+        notes = list(summary["notes"])
+        topics = dict(summary["topics"])
+        question = None
+        # A question answered after the window boundary still belongs to its answer
+        if covered and history[covered - 1]["role"] == "assistant":
+            question = history[covered - 1]["content"]
+
+        for message in history[covered:end]:
+            if message["role"] == "assistant":
+                question = message["content"]
+                continue
+            notes.append(self._note(question, message["content"]))
+            question = None
+
+        # Oldest notes beyond the budget survive only as topic counts
+        costs = [estimate_tokens(note) + 1 for note in notes]
+        topics_budget = min(TOPICS_MAX_TOKENS, self.summary_max_tokens // 3)
+        while len(notes) > 1 and sum(costs) > self.summary_max_tokens - topics_budget:
+            _count_topics(notes.pop(0), topics)
+            costs.pop(0)
+        if len(topics) > TOPICS_KEPT:
+            topics = dict(sorted(topics.items(), key=lambda item: -item[1])[:TOPICS_KEPT])
+
+        tokens = sum(costs) + estimate_tokens(self.topics_line({"topics": topics}))
+        return {"notes": notes, "topics": topics, "covered": end, "tokens": tokens}
+
+    def _note(self, question: Optional[str], answer: str) -> str:
+        answer = truncate_to_tokens(" ".join(answer.split()), NOTE_ANSWER_TOKENS)
+        if not question:
+            return answer
+        question = truncate_to_tokens(" ".join(question.split()), NOTE_QUESTION_TOKENS)
+        return f"{question} → {answer}"
+
+    def topics_line(self, summary: Dict) -> str:
+        """Most mentioned words of the oldest answers, e.g. "latte (5), price (3)"."""
+        topics = sorted(summary.get("topics", {}).items(), key=lambda item: (-item[1], item[0]))
+        line = ", ".join(f"{word} ({count})" for word, count in topics[:TOPICS_SHOWN])
+        return truncate_to_tokens(line, TOPICS_MAX_TOKENS)
+
+    def recent(self, history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        return history[-self.recent_messages:] if self.recent_messages else []
+
+    def render(
+        self,
+        history: List[Dict[str, str]],
+        summary: Optional[Dict] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Prompt context: "Earlier in the interview" notes, then the recent
+        messages verbatim, within `max_tokens` (the oldest recent messages
+        are trimmed first).
+        """
+        max_tokens = max_tokens or self.max_tokens
+        summary = self.fold(summary, history)
+
+        recent_lines = [f"{msg['role']}: {msg['content']}" for msg in self.recent(history)]
+        notes = summary["notes"]
+        topics = self.topics_line(summary)
+        if topics:
+            notes = [f"topics mentioned: {topics}"] + notes
+        notes = fit_lines(notes, max(0, max_tokens // 3))
+        budget = max_tokens - sum(estimate_tokens(note) + 1 for note in notes)
+
+        kept: List[str] = []
+        for line in reversed(recent_lines):
+            cost = estimate_tokens(line) + 1
+            if cost > budget:
+                if not kept:
+                    kept.append(truncate_to_tokens(line, max(1, budget)))
+                break
+            kept.append(line)
+            budget -= cost
+        kept.reverse()
+
+        if not notes:
+            return "\n".join(kept)
+        earlier = "\n".join(f"- {note}" for note in notes)
+        return f"Earlier in the interview:\n{earlier}\n\nRecent conversation:\n" + "\n".join(kept)
+
+    def user_context(
+        self,
+        history: List[Dict[str, str]],
+        summary: Optional[Dict] = None,
+        max_tokens: Optional[int] = None
+    ) -> List[str]:
+        """
+        What the respondent said over the whole interview as prompt lines:
+        summary notes for older answers plus recent answers verbatim, within
+        `max_tokens` (spread evenly across the interview when over budget).
+        """
+        summary = self.fold(summary, history)
+        recent_answers = [
+            " ".join(msg["content"].split())
+            for msg in self.recent(history)
+            if msg["role"] == "user"
+        ]
+        lines = summary["notes"] + recent_answers
+        topics = self.topics_line(summary)
+        if topics:
+            lines = [f"Earlier topics mentioned: {topics}"] + lines
+        return fit_lines(lines, max_tokens or self.max_tokens)
+
+# Singleton instance
+context_window = ContextWindow()
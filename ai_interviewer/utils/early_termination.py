@@ -1,8 +1,13 @@
 """
 Early Termination Detector - Detects when user wants to end interview
+Phrase sets are compiled once per template/locale into a PhraseMatcher.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+from utils.phrase_matcher import PhraseMatcher
+from templates.termination_phrases import TERMINATION_PHRASE_OVERRIDES
+import config
+import json
 
 class EarlyTerminationDetector:
     """Detects signals that user wants to end the interview"""
@@ -38,19 +43,84 @@ class EarlyTerminationDetector:
         "sure", "meh", "nah", "nope"
     ]
     
-    def check_exit_intent(self, text: str) -> Tuple[bool, str]:
+    # Phrases that contain an exit/emotion phrase but don't mean it
+    EXCLUSION_PHRASES = [
+        "no more than", "no more of", "no more often", "no more expensive",
+        "not enough", "good enough", "fair enough", "sure enough", "often enough",
+        "long enough", "big enough", "easy enough", "fast enough", "cheap enough",
+        "strong enough", "enough time", "enough money", "enough sleep",
+        "enough coffee", "enough caffeine", "enough energy",
+        "not too long", "too long ago", "takes too long", "took too long",
+        "no time to", "in no time", "no time at all",
+        "get bored", "got bored", "gets bored", "getting bored of",
+        "get frustrated", "got frustrated", "gets frustrated",
+        "not interested in trying",
+    ]
+    
+    def __init__(self):
+        self.phrase_overrides: Dict[str, Dict[str, List[str]]] = {
+            key: dict(phrases) for key, phrases in TERMINATION_PHRASE_OVERRIDES.items()
+        }
+        self._exit_matchers: Dict[str, PhraseMatcher] = {}
+        self._dismissive_matchers: Dict[str, PhraseMatcher] = {}
+        if config.TERMINATION_PHRASES_FILE:
+            self.load_phrase_sets(config.TERMINATION_PHRASES_FILE)
+    
+    def load_phrase_sets(self, path: str):
+        """Load extra phrase sets ({key: {category: [phrases]}}) from a JSON file."""
+        with open(path) as f:
+            for key, phrases in json.load(f).items():
+                self.register_phrase_set(key, phrases)
+    
+    def register_phrase_set(self, key: str, phrases: Dict[str, List[str]]):
+        """Add phrases for a template_id or locale; its matchers are rebuilt on next use."""
+        merged = self.phrase_overrides.setdefault(key, {})
+        for category, values in phrases.items():
+            merged[category] = list(merged.get(category, [])) + list(values)
+        self._exit_matchers.pop(key, None)
+        self._dismissive_matchers.pop(key, None)
+    
+    def _phrases_for(self, key: Optional[str], category: str, defaults: List[str]) -> List[str]:
+        extra = self.phrase_overrides.get(key, {}).get(category, []) if key else []
+        return list(defaults) + list(extra)
+    
+    def _phrase_set_key(self, template_id: Optional[str]) -> str:
+        if template_id and template_id in self.phrase_overrides:
+            return template_id
+        return config.TERMINATION_LOCALE
+    
+    def exit_matcher(self, template_id: Optional[str] = None) -> PhraseMatcher:
+        """Compiled exit/negative-emotion matcher for a template (or the locale)."""
+        key = self._phrase_set_key(template_id)
+        matcher = self._exit_matchers.get(key)
+        if matcher is None:
+            matcher = PhraseMatcher(
+                {
+                    "explicit_exit": self._phrases_for(key, "explicit_exit", self.EXIT_PHRASES),
+                    "negative_emotion": self._phrases_for(key, "negative_emotion", self.NEGATIVE_EMOTION_PHRASES),
+                },
+                exclusions=self._phrases_for(key, "exclusions", self.EXCLUSION_PHRASES)
+            )
+            self._exit_matchers[key] = matcher
+        return matcher
+    
+    def dismissive_matcher(self, template_id: Optional[str] = None) -> PhraseMatcher:
+        key = self._phrase_set_key(template_id)
+        matcher = self._dismissive_matchers.get(key)
+        if matcher is None:
+            matcher = PhraseMatcher({
+                "dismissive": self._phrases_for(key, "dismissive", self.DISMISSIVE_RESPONSES)
+            })
+            self._dismissive_matchers[key] = matcher
+        return matcher
+    
+    def check_exit_intent(self, text: str, template_id: Optional[str] = None) -> Tuple[bool, str]:
         """Check if user wants to exit the interview."""
-        text_lower = text.lower().strip()
-        
-        # Check for explicit exit phrases
-        for phrase in self.EXIT_PHRASES:
-            if phrase in text_lower:
-                return True, f"explicit_exit: '{phrase}'"
-        
-        # Check for negative emotions
-        for phrase in self.NEGATIVE_EMOTION_PHRASES:
-            if phrase in text_lower:
-                return True, f"negative_emotion: '{phrase}'"
+        # One pass over the text; explicit exit phrases take priority over negative emotions
+        match = self.exit_matcher(template_id).search(text)
+        if match:
+            category, phrase = match
+            return True, f"{category}: '{phrase}'"
         
         return False, ""
     
@@ -59,47 +129,54 @@ class EarlyTerminationDetector:
         word_count = len(text.split())
         return word_count <= 2 and sentiment == "negative"
     
-    def is_repeated_dismissive(
-        self, 
-        text: str, 
-        conversation_history: List[Dict], 
-        threshold: int = 2
-    ) -> bool:
-        """Check if user has given multiple dismissive responses in a row."""
-        text_lower = text.lower().strip()
-        
-        # Check if current response is dismissive
-        current_is_dismissive = (
-            any(d in text_lower for d in self.DISMISSIVE_RESPONSES) or 
-            len(text.split()) <= 2
-        )
-        
-        if not current_is_dismissive:
-            return False
-        
-        # Count recent consecutive dismissive responses
-        dismissive_count = 1  # Current response
-        
-        # Look at last few user responses
+    def is_dismissive(self, text: str, template_id: Optional[str] = None) -> bool:
+        """Single response: dismissive word or two words at most."""
+        return len(text.split()) <= 2 or self.dismissive_matcher(template_id).matches(text)
+    
+    def next_dismissive_streak(
+        self,
+        text: str,
+        previous_streak: Optional[int],
+        conversation_history: List[Dict],
+        template_id: Optional[str] = None
+    ) -> int:
+        """
+        Consecutive dismissive responses including this one. The streak is
+        carried in graph state, so history is only scanned for sessions that
+        started before it was tracked (previous_streak is None).
+        """
+        if not self.is_dismissive(text, template_id):
+            return 0
+        if previous_streak is None:
+            previous_streak = self._count_dismissive_history(conversation_history, template_id)
+        return previous_streak + 1
+    
+    def _count_dismissive_history(self, conversation_history: List[Dict], template_id: Optional[str] = None) -> int:
         user_responses = [
             msg.get("content", msg.get("message", ""))
             for msg in reversed(conversation_history)
             if msg.get("role") == "user"
         ][1:5]  # Skip current, check last 4
         
+        count = 0
         for response in user_responses:
-            response_lower = response.lower().strip()
-            is_dismissive = (
-                any(d in response_lower for d in self.DISMISSIVE_RESPONSES) or
-                len(response.split()) <= 2
-            )
-            
-            if is_dismissive:
-                dismissive_count += 1
-            else:
+            if not self.is_dismissive(response, template_id):
                 break  # Stop at first non-dismissive
-        
-        return dismissive_count >= threshold
+            count += 1
+        return count
+    
+    def is_repeated_dismissive(
+        self, 
+        text: str, 
+        conversation_history: List[Dict], 
+        threshold: int = 2,
+        dismissive_streak: Optional[int] = None,
+        template_id: Optional[str] = None
+    ) -> bool:
+        """Check if user has given multiple dismissive responses in a row."""
+        if dismissive_streak is None:
+            dismissive_streak = self.next_dismissive_streak(text, None, conversation_history, template_id)
+        return dismissive_streak >= threshold
     
     def should_terminate(
         self, 
@@ -107,14 +184,17 @@ class EarlyTerminationDetector:
         sentiment: str,
         conversation_history: List[Dict],
         consecutive_probes: int = 0,
-        max_probes: int = 3
+        max_probes: int = 3,
+        dismissive_streak: Optional[int] = None,
+        template_id: Optional[str] = None
     ) -> Tuple[bool, str]:
         """
         Comprehensive termination check.
+        Pass `dismissive_streak` (from next_dismissive_streak) to avoid rescanning history.
         Returns: (should_terminate, reason)
         """
         # Check 1: Explicit exit intent
-        should_exit, reason = self.check_exit_intent(text)
+        should_exit, reason = self.check_exit_intent(text, template_id)
         if should_exit:
             return True, reason
         
@@ -127,7 +207,10 @@ class EarlyTerminationDetector:
             return True, "disengagement: very short negative response"
         
         # Check 4: Repeated dismissive responses
-        if self.is_repeated_dismissive(text, conversation_history, threshold=3):
+        if self.is_repeated_dismissive(
+            text, conversation_history, threshold=3,
+            dismissive_streak=dismissive_streak, template_id=template_id
+        ):
             return True, "disengagement: repeated dismissive responses"
         
         return False, ""
@@ -0,0 +1,201 @@
+"""
+Insight Index - deduplicated session insights with relevance-ranked retrieval
+Insights are added once, as each analyzed response is committed: an insight
+whose content words mostly overlap an existing one (the same point
+re-extracted on a later turn, or carried over from a probe) is dropped.
+Each insight is kept with its content terms and an inverted index from term
+to insights, so retrieving the top-k insights for the current thread scores
+only the insights sharing a term with it (TF-IDF cosine over this session's
+insights) instead of rescanning everything collected.
+
+The deduplicated insights are kept in graph state as `session_insights` and
+persisted append-only next to the history (storage/session_store.py), so a
+turn writes only its new insights. The index derived from them,
+    {"insights": [...], "terms": [[term, ...], ...], "postings": {term: [position, ...]}}
+is not stored: InsightIndexCache keeps it per session in this process,
+extends it with the insights added since, and rebuilds it from the list
+(one tokenize per insight, no duplicate checks) after a restart or when the
+session was last served elsewhere.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import config
+from utils.context_window import STOPWORDS
+from utils.phrase_matcher import tokenize
+
+DUPLICATE_OVERLAP = 0.8  # Jaccard overlap of terms, as for the summary's insight list
+# Weight of recency next to similarity (0-1): breaks ties and fills the
+# context with the latest insights when nothing matches the thread
+RECENCY_WEIGHT = 0.15
+
+
+def _stem(word: str) -> str:
+    # Plural/tense variants of a word in short insights ("cups" / "cup")
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3 and not word.endswith("ss"):
+            return word[:-len(suffix)]
+    return word
+
+
+def insight_terms(text: str) -> List[str]:
+    """Distinct content terms of a text, in order of appearance."""
+    terms = {}
+    for word in tokenize(text):
+        if word.isdigit() or (len(word) > 2 and word.isalpha() and word not in STOPWORDS):
+            terms[_stem(word)] = None
+    return list(terms)
+
+
+def empty_index() -> Dict:
+    return {"insights": [], "terms": [], "postings": {}}
+
+
+def build_index(insights: Iterable[str]) -> Dict:
+    """Index over insights that may contain duplicates (e.g. read back from the DB)."""
+    index, _ = add_insights(None, insights)
+    return index
+
+
+def index_insights(insights: Sequence[str], index: Optional[Dict] = None) -> Dict:
+    """
+    Index over an already deduplicated insight list, such as `session_insights`.
+    With `index` (built from a prefix of the list), only the insights past it
+    are added. Returns a new index.
+    """
+    index = index or empty_index()
+    start = len(index["insights"])
+    terms = list(index["terms"])
+    postings = dict(index["postings"])
+    for position in range(start, len(insights)):
+        insight_term_list = insight_terms(insights[position])
+        terms.append(insight_term_list)
+        for term in insight_term_list:
+            postings[term] = postings.get(term, []) + [position]
+    return {"insights": list(insights), "terms": terms, "postings": postings}
+
+
+def _is_duplicate(terms: List[str], index: Dict, postings: Dict[str, List[int]]) -> bool:
+    term_set = set(terms)
+    candidates = {position for term in term_set for position in postings.get(term, ())}
+    for position in candidates:
+        other = set(index["terms"][position])
+        if len(term_set & other) / len(term_set | other) >= DUPLICATE_OVERLAP:
+            return True
+    return False
+
+
+def add_insights(index: Optional[Dict], insights: Iterable[str]) -> Tuple[Dict, List[str]]:
+    """
+    Add insights, skipping duplicates and ones without content words.
+    Returns a new index (the given one is not modified) and the insights
+    that were added.
+    """
+    index = index or empty_index()
+    new_insights = list(index["insights"])
+    new_terms = list(index["terms"])
+    postings = dict(index["postings"])
+    current = {"insights": new_insights, "terms": new_terms}
+    added = []
+
+    for insight in insights:
+        terms = insight_terms(insight)
+        if not terms or _is_duplicate(terms, current, postings):
+            continue
+        position = len(new_insights)
+        new_insights.append(insight)
+        new_terms.append(terms)
+        for term in terms:
+            # Copy on first touch so the previous index stays unchanged
+            postings[term] = postings.get(term, []) + [position]
+        added.append(insight)
+
+    return {"insights": new_insights, "terms": new_terms, "postings": postings}, added
+
+
+def top_insights(index: Optional[Dict], query: str, k: Optional[int] = None) -> List[str]:
+    """
+    The k insights most relevant to `query` (e.g. the last question and
+    answer), in the order they were collected. Sub-millisecond for a
+    session's worth of insights: only insights sharing a term are scored.
+    """
+    k = config.INSIGHT_CONTEXT_SIZE if k is None else k
+    if not index or not index["insights"] or k <= 0:
+        return []
+    insights = index["insights"]
+    count = len(insights)
+    if count <= k:
+        return list(insights)
+
+    postings = index["postings"]
+    idf_cache: Dict[str, float] = {}
+
+    def idf(term: str) -> float:
+        weight = idf_cache.get(term)
+        if weight is None:
+            weight = idf_cache[term] = math.log((1 + count) / (1 + len(postings.get(term, ())))) + 1
+        return weight
+
+    query_terms = [term for term in insight_terms(query) if term in postings]
+    query_norm = math.sqrt(sum(idf(term) ** 2 for term in query_terms)) or 1.0
+    overlap: Dict[int, float] = {}
+    for term in query_terms:
+        weight = idf(term) ** 2
+        for position in postings[term]:
+            overlap[position] = overlap.get(position, 0.0) + weight
+
+    scores = {}
+    for position, dot in overlap.items():
+        norm = math.sqrt(sum(idf(term) ** 2 for term in index["terms"][position]))
+        scores[position] = dot / (query_norm * norm)
+    # Recency prior for every insight that could still make the cut
+    for position in range(max(0, count - k), count):
+        scores.setdefault(position, 0.0)
+    ranked = sorted(
+        scores,
+        key=lambda position: scores[position] + RECENCY_WEIGHT * (position + 1) / count,
+        reverse=True
+    )
+    return [insights[position] for position in sorted(ranked[:k])]
+
+
+class InsightIndexCache:
+    """Per-session indexes of `session_insights`, least recently used evicted"""
+
+    def __init__(self, max_sessions: Optional[int] = None):
+        self.max_sessions = max_sessions or config.INSIGHT_INDEX_CACHE_SESSIONS
+        self._indexes: "OrderedDict[str, Dict]" = OrderedDict()
+        self.hits = 0
+        self.rebuilds = 0
+
+    def get(self, session_id: str, insights: Sequence[str]) -> Dict:
+        """The index of `insights`, the session's current (append-only) list."""
+        index = self._indexes.get(session_id)
+        cached = index["insights"] if index else []
+        # Reusable while the cached list is a prefix of the current one; a
+        # turn that wasn't saved (conflict) or another instance diverges
+        if index is not None and len(cached) <= len(insights) and (
+            not cached or cached[-1] == insights[len(cached) - 1]
+        ):
+            self.hits += 1
+            if len(cached) < len(insights):
+                index = index_insights(insights, index)
+        else:
+            self.rebuilds += 1
+            index = index_insights(insights)
+        self.put(session_id, index)
+        return index
+
+    def put(self, session_id: str, index: Dict):
+        self._indexes[session_id] = index
+        self._indexes.move_to_end(session_id)
+        while len(self._indexes) > self.max_sessions:
+            self._indexes.popitem(last=False)
+
+    def discard(self, session_id: str):
+        self._indexes.pop(session_id, None)
+
+# Singleton instance
+insight_index_cache = InsightIndexCache()
@@ -0,0 +1,115 @@
+"""
+Logger - leveled, structured logging for the interviewer
+Records go through the standard logging module under the "ai_interviewer"
+namespace. Per-turn messages are INFO/DEBUG and the default level is WARNING,
+so on the request path a disabled call costs one level check (use lazy
+%-style arguments, not f-strings). With LOG_ASYNC, encoding and writing
+enabled records happens on a background thread, never on the event loop.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+import config
+
+ROOT_LOGGER = "ai_interviewer"
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_STANDARD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+
+def _extra_fields(record: logging.LogRecord) -> dict:
+    return {key: value for key, value in vars(record).items() if key not in _STANDARD_ATTRS}
+
+
+class StructuredFormatter(logging.Formatter):
+    """`json`: one object per line; `text`: message followed by key=value extras"""
+
+    def __init__(self, fmt: str = "text"):
+        super().__init__()
+        self.json = fmt == "json"
+
+    def format(self, record: logging.LogRecord) -> str:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        fields = _extra_fields(record)
+        if self.json:
+            entry = {
+                "ts": round(record.created, 3),
+                "level": record.levelname.lower(),
+                "logger": record.name,
+                "msg": record.getMessage(),
+                **fields
+            }
+            if record.exc_text:
+                entry["exc"] = record.exc_text
+            return json.dumps(entry, ensure_ascii=False, default=str)
+
+        timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+        line = f"{timestamp} {record.levelname:<7} {record.getMessage()}"
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the listener thread with only the message merged."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Arguments may change after the call returns, so merge them now;
+        # everything else (timestamps, JSON, extras) is formatted by the listener
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener = None
+
+
+def configure_logging(level: str = None, fmt: str = None, use_thread: bool = None):
+    """(Re)configure the ai_interviewer logger tree; safe to call more than once."""
+    global _listener
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(getattr(logging, (level or config.LOG_LEVEL).upper(), logging.WARNING))
+    root.propagate = False
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(StructuredFormatter(fmt or config.LOG_FORMAT))
+    if use_thread if use_thread is not None else config.LOG_ASYNC:
+        records = queue.SimpleQueue()
+        root.addHandler(_RecordQueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, handler)
+        _listener.start()
+    else:
+        root.addHandler(handler)
+
+
+def _shutdown():
+    # Flush queued records before the interpreter exits
+    if _listener is not None:
+        _listener.stop()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module, e.g. get_logger("graph.workflow")."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+configure_logging()
+atexit.register(_shutdown)
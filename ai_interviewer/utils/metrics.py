@@ -0,0 +1,246 @@
+"""
+Metrics - in-process counters, gauges and histograms in Prometheus text format
+Small enough to need no client library; `/metrics` renders the registry.
+Label values are kept low-cardinality (node, model, route - never session ids).
+"""
+
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Seconds; LLM calls and graph nodes range from sub-millisecond to tens of seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TOKEN_BUCKETS = (16, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple([str(labels[name]) for name in self.labelnames])
+        except KeyError:
+            pass
+        raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+
+    def _labels_text(self, key: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def reset(self):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{self._labels_text(key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def total(self, **labels) -> float:
+        return self._sums.get(self._key(labels), 0.0)
+
+    def label_values(self) -> List[LabelValues]:
+        return list(self._counts)
+
+    def quantile(self, q: float, **labels) -> float:
+        """
+        Estimated q-quantile (0-1), interpolated linearly inside the bucket
+        like Prometheus' histogram_quantile(); 0.0 without observations.
+        """
+        counts = self._counts.get(self._key(labels))
+        if not counts:
+            return 0.0
+        rank = q * sum(counts)
+        cumulative = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, counts):
+            if count and cumulative + count >= rank:
+                return lower + (bound - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = bound
+        # In the +Inf bucket: the highest finite bound is the best estimate
+        return self.buckets[-1]
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = [(key, list(counts), self._sums[key]) for key, counts in self._counts.items()]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{self._labels_text(key, ('le', _format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels_text(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._labels_text(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors; renders the text exposition format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self):
+        """Drop every recorded value (e.g. after a benchmark warm-up)."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def add_collector(self, collect: Callable[[], None]):
+        """`collect` runs before every render, e.g. to copy pool stats into gauges."""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        for collect in self._collectors:
+            try:
+                collect()
+            except Exception:
+                pass
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.samples()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+# Singleton instance
+metrics = MetricsRegistry()
+
+# Interview workflow
+NODE_DURATION = metrics.histogram(
+    "interview_node_duration_seconds", "Wall time of LangGraph workflow nodes", ["node"]
+)
+NODE_ERRORS = metrics.counter(
+    "interview_node_errors_total", "Workflow nodes that raised", ["node"]
+)
+
+# LLM calls (llm/client.py)
+LLM_DURATION = metrics.histogram(
+    "llm_request_duration_seconds", "Wall time of LLM calls", ["model", "mode"]
+)
+LLM_TOKENS = metrics.histogram(
+    "llm_tokens", "Tokens per LLM call", ["model", "kind"], buckets=TOKEN_BUCKETS
+)
+LLM_TOKENS_TOTAL = metrics.counter(
+    "llm_tokens_total", "Tokens used by LLM calls", ["model", "kind"]
+)
+LLM_CACHE = metrics.counter(
+    "llm_cache_lookups_total", "Completion cache lookups", ["result"]
+)
+LLM_ERRORS = metrics.counter(
+    "llm_errors_total", "Failed LLM calls", ["model", "error"]
+)
+
+# HTTP API (main.py)
+HTTP_DURATION = metrics.histogram(
+    "http_request_duration_seconds", "Wall time of API requests", ["method", "route", "status"]
+)
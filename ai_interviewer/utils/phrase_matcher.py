@@ -0,0 +1,95 @@
+"""
+Phrase Matcher - precompiled single-pass multi-phrase matching
+All phrase categories and exclusions are compiled into one word-level trie,
+so a text is tokenized once and walked once no matter how many phrases there
+are. Matching whole words means "no more" does not fire inside "no more than
+once" (an exclusion) and "ok" does not fire inside "book".
+"""
+
+import string
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Punctuation becomes whitespace (apostrophes stay inside words); a translate
+# table plus str.split is several times faster than a tokenizing regex
+_SEPARATORS = {char: " " for char in string.punctuation + "“”—–…" if char != "'"}
+_TOKEN_TABLE = str.maketrans({**_SEPARATORS, "’": "'", "‘": "'", "`": "'"})
+
+_END = ""  # trie key marking "a phrase ends here"; never a token
+_EXCLUDED = None  # category of exclusion phrases
+
+
+def tokenize(text: str) -> List[str]:
+    return text.lower().translate(_TOKEN_TABLE).split()
+
+
+class PhraseMatcher:
+    """
+    Matches categorized phrases on word boundaries in one left-to-right pass.
+
+    `categories` is ordered by priority: when a text contains phrases from
+    several categories, the first category wins (regardless of position).
+    At each word the longest phrase starting there is taken; `exclusions`
+    win ties and swallow the words they cover, so "good enough" hides
+    "enough" and "no more than" hides "no more".
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]], exclusions: Iterable[str] = ()):
+        self.categories = list(categories)
+        self._priority = {category: index for index, category in enumerate(self.categories)}
+        self._trie: Dict = {}
+
+        # Categories in reverse priority, exclusions last: on a duplicate
+        # phrase the later insert wins
+        for category in reversed(self.categories):
+            for phrase in categories[category]:
+                self._insert(phrase, category)
+        for phrase in exclusions:
+            self._insert(phrase, _EXCLUDED)
+
+    def _insert(self, phrase: str, category: Optional[str]):
+        words = tokenize(phrase)
+        if not words:
+            return
+        node = self._trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node[_END] = (category, " ".join(words))
+
+    def _longest_at(self, words: List[str], start: int) -> Tuple[int, Optional[tuple]]:
+        node = self._trie
+        found, found_end = None, start
+        for index in range(start, len(words)):
+            node = node.get(words[index])
+            if node is None:
+                break
+            if _END in node:
+                found, found_end = node[_END], index + 1
+        return found_end, found
+
+    def search(self, text: str) -> Optional[Tuple[str, str]]:
+        """Highest-priority (category, matched phrase) in the text, or None."""
+        words = tokenize(text)
+        trie = self._trie
+        best = None
+        position = 0
+        while position < len(words):
+            if words[position] not in trie:
+                position += 1
+                continue
+
+            end, found = self._longest_at(words, position)
+            if found is None:
+                position += 1
+                continue
+
+            category, phrase = found
+            if category is not _EXCLUDED:
+                if best is None or self._priority[category] < self._priority[best[0]]:
+                    best = (category, phrase)
+                    if self._priority[category] == 0:
+                        break
+            position = end
+        return best
+
+    def matches(self, text: str) -> bool:
+        return self.search(text) is not None
@@ -0,0 +1,158 @@
+"""
+Relevance Pre-Classifier - local fast path in front of the LLM relevance check
+Decides confidently on-topic / off-topic answers without a network call and
+leaves everything else ("ambiguous") to ProbeDecisionAgent's LLM check.
+"""
+
+import re
+from typing import List, Set, Tuple
+
+RELEVANT = "relevant"
+IRRELEVANT = "irrelevant"
+AMBIGUOUS = "ambiguous"
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "so", "of", "to", "in", "on", "at",
+    "for", "with", "about", "from", "by", "as", "into", "than", "then",
+    "i", "i'm", "im", "i've", "i'd", "i'll", "me", "my", "mine", "we", "our",
+    "you", "your", "yours", "he", "she", "his", "her", "their", "us",
+    "is", "am", "are", "was", "were", "be", "been", "being", "do", "does",
+    "did", "have", "has", "had", "will", "would", "could", "should", "can",
+    "just", "really", "very", "also", "too", "there", "here", "what", "how",
+    "when", "where", "why", "who", "which", "tell", "describe", "share",
+    "think", "feel", "its", "it's", "that's", "thats", "up", "out", "all",
+    "some", "any", "more", "most", "much", "lot", "lots", "bit", "kind",
+    "sort", "thing", "things", "get", "got", "go", "went", "like", "well",
+    "hi", "let's", "lets", "excited", "learn", "experiences", "curious",
+    "love", "hear", "interesting", "that's", "fascinating", "specific",
+    "example", "walk", "through", "time", "times",
+}
+
+# Words that on their own are a legitimate (if short) answer
+SHORT_ANSWER_WORDS = {
+    "yes", "yeah", "yep", "yup", "no", "nope", "nah", "sure", "definitely",
+    "absolutely", "maybe", "perhaps", "probably", "not", "never", "always",
+    "sometimes", "often", "rarely", "usually", "occasionally", "seldom",
+    "daily", "weekly", "monthly", "yearly", "every", "each", "once", "twice",
+    "day", "days", "week", "weeks", "month", "months", "year", "years",
+    "morning", "mornings", "afternoon", "evening", "evenings", "night",
+    "nights", "weekend", "weekends", "hour", "hours", "minute", "minutes",
+    "good", "great", "bad", "okay", "ok", "fine", "alright", "decent",
+    "terrible", "awful", "amazing", "excellent", "poor", "average", "nice",
+    "love", "like", "hate", "dislike", "enjoy", "prefer", "sure", "unsure",
+    "know", "don't", "dont", "idea", "depends", "mostly", "hardly", "few",
+    "couple", "one", "two", "three", "four", "five", "several", "many",
+    "none", "lot", "little", "less", "more", "same", "different", "it",
+}
+
+# Pronouns that refer back to whatever the question was about
+REFERENTIAL_WORDS = {"it", "it's", "its", "that", "this", "these", "those", "them", "they", "one", "ones"}
+
+# Conditional/temporal markers - "only when I have deadlines" answers a frequency question
+TEMPORAL_WORDS = {
+    "when", "whenever", "if", "only", "after", "before", "during", "until",
+    "while", "now", "then", "today", "yesterday", "tomorrow", "lately",
+    "recently", "am", "pm", "noon", "lunch", "breakfast", "dinner",
+}
+
+YES_NO_OPENERS = (
+    "do ", "does ", "did ", "is ", "are ", "was ", "were ", "have ", "has ",
+    "can ", "could ", "would ", "will ", "should "
+)
+
+# "Can you walk me through..." is a polite open request, not a yes/no question
+POLITE_REQUEST_RE = re.compile(
+    r"^(can|could|would|will) you (please )?(walk|tell|describe|share|explain|give|talk|say|help)"
+)
+
+FREQUENCY_PATTERNS = ("how often", "how many times", "how frequently", "how much")
+
+ANSWER_VOCABULARY = SHORT_ANSWER_WORDS | TEMPORAL_WORDS
+
+
+def _stem(word: str) -> str:
+    """Very light suffix stripping so 'drinking'/'drinks' match 'drink'."""
+    for suffix in ("ing", "ies", "ed", "es", "ly", "s"):
+        if len(word) > len(suffix) + 2 and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+def _tokens(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def _content_terms(tokens: List[str]) -> Set[str]:
+    return {_stem(token) for token in tokens if token not in STOPWORDS and len(token) > 1}
+
+
+def _question_kind(question: str) -> str:
+    """
+    "frequency" and "yes_no" questions have a closed answer vocabulary, so an
+    answer with none of it and no overlap is confidently off-topic. Every
+    other question is "open": answers legitimately introduce new words.
+    """
+    question_lower = question.lower()
+    # The first question is prefixed with a greeting, so look at the last sentence
+    last_sentence = re.split(r"(?<=[.!])\s+", question_lower.strip())[-1]
+
+    if any(pattern in last_sentence for pattern in FREQUENCY_PATTERNS):
+        return "frequency"
+    if last_sentence.startswith(YES_NO_OPENERS) and not POLITE_REQUEST_RE.match(last_sentence):
+        return "yes_no"
+    return "open"
+
+
+class RelevancePreClassifier:
+    """Lexical-overlap pre-classifier for (question, response, topic) triples"""
+
+    def __init__(self, min_offtopic_terms: int = 2, overlap_threshold: float = 0.34):
+        self.min_offtopic_terms = min_offtopic_terms
+        self.overlap_threshold = overlap_threshold
+
+    def classify(self, question: str, response: str, topic: str) -> Tuple[str, str]:
+        """
+        Returns (verdict, reason) where verdict is RELEVANT, IRRELEVANT or
+        AMBIGUOUS. Only AMBIGUOUS answers need the LLM.
+        """
+        response_tokens = _tokens(response)
+        if not response_tokens:
+            return AMBIGUOUS, "empty response"
+
+        residual = {
+            _stem(token) for token in response_tokens
+            if token not in STOPWORDS and token not in SHORT_ANSWER_WORDS and len(token) > 1
+        }
+
+        # "yes", "daily", "it's good", "not sure" - nothing but short-answer vocabulary
+        if not residual:
+            return RELEVANT, "short answer vocabulary"
+
+        subject_terms = _content_terms(_tokens(question)) | _content_terms(_tokens(topic))
+        shared = residual & subject_terms
+
+        if shared and len(shared) / len(residual) >= self.overlap_threshold:
+            return RELEVANT, f"overlaps question/topic: {', '.join(sorted(shared))}"
+
+        if shared:
+            return AMBIGUOUS, "partial overlap"
+
+        kind = _question_kind(question)
+        if kind == "open":
+            return AMBIGUOUS, "open question, answer may introduce new terms"
+
+        if any(token in REFERENTIAL_WORDS for token in response_tokens):
+            return AMBIGUOUS, "answer refers back to the question"
+
+        if any(token in ANSWER_VOCABULARY for token in response_tokens):
+            return AMBIGUOUS, f"{kind} question with answer vocabulary"
+
+        if len(residual) >= self.min_offtopic_terms:
+            return IRRELEVANT, f"{kind} question, no answer vocabulary or overlap: {', '.join(sorted(residual))}"
+
+        return AMBIGUOUS, "insufficient evidence"
+
+# Singleton instance
+relevance_classifier = RelevancePreClassifier()
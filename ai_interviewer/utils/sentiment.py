@@ -1,27 +1,229 @@
-from textblob import TextBlob
-from models.schemas import SentimentType, ResponseQuality
-from typing import Tuple
+"""
+Sentiment engines - local sentiment scoring for interview responses
+A lexicon + negation engine (VADER-style) by default, TextBlob optionally.
+Scores are compound polarity in [-1, 1]; engines are built once and reused.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+from models.schemas import Sentiment, ResponseQuality
+from utils.phrase_matcher import tokenize
 import config
+from utils.logger import get_logger
+
+logger = get_logger("utils.sentiment")
+
+# Compound score thresholds for the positive / negative labels
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+# Word valences on VADER's -4..+4 scale, focused on how respondents talk
+# about products, habits and experiences
+LEXICON: Dict[str, float] = {
+    # positive
+    "good": 1.9, "great": 3.1, "excellent": 3.2, "amazing": 2.8, "awesome": 3.1,
+    "fantastic": 3.1, "wonderful": 2.7, "perfect": 2.7, "brilliant": 2.8,
+    "love": 3.2, "loved": 2.9, "loves": 2.7, "lovely": 2.8, "enjoy": 2.2,
+    "enjoyed": 2.3, "enjoyable": 1.9, "enjoying": 2.2, "like": 1.5, "liked": 1.8,
+    "happy": 2.7, "glad": 2.0, "pleased": 1.9, "satisfied": 1.8, "satisfying": 2.0,
+    "fun": 2.3, "nice": 1.8, "pleasant": 2.3, "delicious": 2.7, "tasty": 2.1,
+    "fresh": 1.3, "easy": 1.9, "simple": 1.0, "convenient": 1.6, "helpful": 1.8,
+    "useful": 1.9, "reliable": 1.8, "fast": 1.0, "quick": 1.0, "smooth": 1.3,
+    "seamless": 2.0, "intuitive": 1.7, "comfortable": 1.5, "relaxing": 2.0,
+    "relaxed": 2.0, "calm": 1.3, "energized": 1.9, "motivated": 1.8,
+    "productive": 1.7, "favorite": 2.0, "favourite": 2.0, "best": 3.2,
+    "better": 1.9, "improved": 1.9, "recommend": 1.5, "worth": 0.9,
+    "affordable": 1.4, "cheap": 0.5, "clean": 1.7, "friendly": 2.2,
+    "excited": 2.5, "exciting": 2.4, "interesting": 1.7, "impressed": 2.2,
+    "impressive": 2.3, "thankful": 2.1, "grateful": 2.1, "fine": 0.8,
+    "okay": 0.9, "ok": 0.9, "alright": 1.0, "decent": 1.1, "solid": 1.2,
+    "wow": 2.2, "yes": 1.1, "appreciate": 2.0, "appreciated": 2.0,
+    "refreshing": 2.1, "cozy": 1.9, "rewarding": 2.4, "healthy": 1.7,
+    "win": 2.7, "works": 0.8, "help": 1.7, "helps": 1.3, "benefit": 1.6, "benefits": 1.6,
+    # negative
+    "bad": -2.5, "terrible": -3.3, "awful": -3.1, "horrible": -3.3, "worst": -3.1,
+    "worse": -2.1, "poor": -2.1, "hate": -2.7, "hated": -3.0, "hates": -2.7,
+    "dislike": -1.6, "disliked": -1.7, "annoying": -2.2, "annoyed": -1.6,
+    "annoys": -1.6, "frustrating": -1.9, "frustrated": -1.9, "frustration": -2.1,
+    "disappointed": -1.9, "disappointing": -2.2, "disappointment": -2.3,
+    "angry": -2.3, "upset": -1.6, "sad": -2.1, "unhappy": -1.8, "stressed": -1.7,
+    "stress": -1.8, "stressful": -2.1, "anxious": -1.0, "worried": -1.2,
+    "tired": -1.9, "exhausted": -1.7, "exhausting": -1.5, "bored": -1.1, "boring": -1.3,
+    "confusing": -1.3, "confused": -1.3, "difficult": -1.5, "hard": -0.4,
+    "complicated": -1.2, "slow": -1.0, "expensive": -1.1, "overpriced": -1.7,
+    "broken": -1.9, "buggy": -1.6, "crash": -1.7, "crashes": -1.7,
+    "crashed": -1.7, "crashing": -1.7, "fail": -2.3, "failed": -2.3, "fails": -2.2, "problem": -1.7,
+    "problems": -1.7, "issue": -1.2, "issues": -1.2, "bitter": -0.8,
+    "burnt": -1.4, "stale": -1.6, "gross": -2.1, "disgusting": -2.4,
+    "uncomfortable": -1.6, "painful": -1.9, "pain": -2.3, "sick": -2.0,
+    "jittery": -1.1, "crap": -1.6, "useless": -1.8, "waste": -1.8,
+    "wasted": -2.2, "unfortunately": -1.6, "sadly": -1.9,
+    "regret": -1.6, "mess": -1.5, "messy": -1.5, "ugly": -2.3, "hassle": -1.7,
+    "rude": -2.0, "unreliable": -1.9, "dirty": -1.9, "miss": -0.6,
+    "lacking": -1.2, "lack": -1.1, "meh": -0.4, "nope": -1.2,
+    "struggle": -1.5, "struggling": -1.6, "hurt": -2.4, "hurts": -2.2,
+    "lonely": -1.5, "awkward": -1.3, "overwhelmed": -1.5, "overwhelming": -1.4,
+}
+
+NEGATIONS = {
+    "not", "no", "never", "neither", "nor", "without", "hardly", "barely",
+    "nothing", "nobody", "none", "cannot", "dont", "doesnt", "didnt", "isnt",
+    "wasnt", "arent", "werent", "cant", "wont", "wouldnt", "couldnt",
+    "shouldnt", "havent", "hasnt", "hadnt", "aint",
+}
+
+# Intensity modifiers applied to the next sentiment word
+BOOSTERS = {
+    "very": 0.293, "really": 0.293, "so": 0.293, "extremely": 0.293,
+    "super": 0.293, "incredibly": 0.293, "totally": 0.293, "absolutely": 0.293,
+    "completely": 0.293, "truly": 0.293, "especially": 0.293, "quite": 0.2,
+    "most": 0.293, "more": 0.293, "such": 0.293,
+    "slightly": -0.293, "somewhat": -0.293, "kinda": -0.293,
+    "fairly": -0.2, "pretty": 0.15, "little": -0.293, "less": -0.293,
+}
+
+NEGATION_SCALAR = -0.74
+NORMALIZATION_ALPHA = 15
+
+
+def _is_negation(token: str) -> bool:
+    return token in NEGATIONS or token.endswith("n't")
+
+
+def score_to_unit(score: float) -> float:
+    """Map a compound score in [-1, 1] onto [0, 1] (summary averages)."""
+    return (score + 1) / 2
+
+
+def sentiment_label(score: float) -> Sentiment:
+    if score >= POSITIVE_THRESHOLD:
+        return Sentiment.POSITIVE
+    if score <= NEGATIVE_THRESHOLD:
+        return Sentiment.NEGATIVE
+    return Sentiment.NEUTRAL
+
+
+class SentimentEngine:
+    """Interface: compound polarity in [-1, 1] for one text or a batch"""
+
+    name = "base"
+
+    def score(self, text: str) -> float:
+        raise NotImplementedError
+
+    def score_batch(self, texts: List[str]) -> List[float]:
+        return [self.score(text) for text in texts]
+
+    def classify(self, text: str) -> Tuple[Sentiment, float]:
+        score = self.score(text)
+        return sentiment_label(score), score
+
+
+class LexiconSentimentEngine(SentimentEngine):
+    """
+    VADER-style rules over a word lexicon: boosters/dampeners, negation in
+    the three preceding words ("not good" is negative), "but" shifting weight
+    to the second clause, and exclamation emphasis.
+    """
+
+    name = "lexicon"
 
-def analyze_sentiment(text: str) -> SentimentType:
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None):
+        self.lexicon = lexicon or LEXICON
+
+    def score(self, text: str) -> float:
+        tokens = tokenize(text)
+        if not tokens:
+            return 0.0
+
+        valences = []
+        for index, token in enumerate(tokens):
+            valence = self.lexicon.get(token)
+            if valence is None:
+                continue
+
+            window = tokens[max(0, index - 3):index]
+            for distance, previous in enumerate(reversed(window)):
+                boost = BOOSTERS.get(previous)
+                if boost:
+                    # Farther modifiers count a bit less
+                    scaled = boost * (1 - 0.05 * distance)
+                    valence += scaled if valence > 0 else -scaled
+            if any(_is_negation(previous) for previous in window):
+                valence *= NEGATION_SCALAR
+            valences.append((index, valence))
+
+        if not valences:
+            return 0.0
+
+        if "but" in tokens:
+            but_index = tokens.index("but")
+            valences = [
+                (index, valence * (0.5 if index < but_index else 1.5))
+                for index, valence in valences
+            ]
+
+        total = sum(valence for _, valence in valences)
+        exclamations = min(text.count("!"), 4)
+        if exclamations and total:
+            total += math.copysign(0.292 * exclamations, total)
+
+        return max(-1.0, min(1.0, total / math.sqrt(total * total + NORMALIZATION_ALPHA)))
+
+
+class TextBlobSentimentEngine(SentimentEngine):
+    """TextBlob pattern-analyzer polarity (optional dependency)"""
+
+    name = "textblob"
+
+    def __init__(self):
+        from textblob import TextBlob
+        self._textblob = TextBlob
+
+    def score(self, text: str) -> float:
+        if not text.strip():
+            return 0.0
+        return float(self._textblob(text).sentiment.polarity)
+
+
+SENTIMENT_ENGINES = {engine.name: engine for engine in (LexiconSentimentEngine, TextBlobSentimentEngine)}
+
+_engines: Dict[str, SentimentEngine] = {}
+
+
+def get_sentiment_engine(name: Optional[str] = None) -> SentimentEngine:
+    """Shared engine instance (built on first use, falls back to the lexicon engine)."""
+    name = name or config.SENTIMENT_ENGINE
+    engine = _engines.get(name)
+    if engine is not None:
+        return engine
+
+    engine_class = SENTIMENT_ENGINES.get(name)
+    if engine_class is None:
+        raise ValueError(f"Unknown sentiment engine '{name}', expected one of {sorted(SENTIMENT_ENGINES)}")
+
+    try:
+        engine = engine_class()
+    except ImportError:
+        logger.warning("⚠️ %s sentiment engine unavailable, using lexicon engine", name)
+        engine = get_sentiment_engine(LexiconSentimentEngine.name)
+
+    _engines[name] = engine
+    return engine
+
+
+def analyze_sentiment(text: str) -> Sentiment:
     """
-    Analyzes the sentiment of a given text using TextBlob's polarity score.
+    Analyzes the sentiment of a given text with the configured engine.
 
     Args:
         text: The input string to analyze.
 
     Returns:
-        A SentimentType enum (POSITIVE, NEGATIVE, or NEUTRAL).
+        A Sentiment enum (POSITIVE, NEGATIVE, or NEUTRAL).
     """
-    blob = TextBlob(text)
-    polarity = blob.sentiment.polarity
-
-    if polarity > 0.1:
-        return SentimentType.POSITIVE
-    elif polarity < -0.1:
-        return SentimentType.NEGATIVE
-    else:
-        return SentimentType.NEUTRAL
+    return sentiment_label(get_sentiment_engine().score(text))
 
 def assess_response_quality(text: str) -> Tuple[ResponseQuality, int]:
     """
@@ -69,6 +271,8 @@ def extract_key_phrases(text: str, top_n: int = 5) -> list:
     Returns:
         A list of unique key phrases.
     """
+    from textblob import TextBlob
+
     blob = TextBlob(text)
     # Using noun phrases is a good heuristic for identifying key topics
     noun_phrases = list(blob.noun_phrases)
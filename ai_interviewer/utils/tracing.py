@@ -0,0 +1,125 @@
+"""
+Tracing - per-node and per-LLM-call instrumentation
+Every LangGraph node is wrapped with traced_node() and every LLM call reports
+through record_llm_call(): wall time, prompt/completion tokens, cache hits and
+errors go to the Prometheus registry (utils/metrics.py). When OTEL_TRACING is
+on and opentelemetry-api is installed, each node and call is also a span.
+llm_usage() additionally tallies the calls of one unit of work (e.g. one
+simulated interview) while many run concurrently.
+"""
+
+import contextlib
+import contextvars
+import functools
+import time
+from typing import Awaitable, Callable, Dict, Iterator, Optional
+
+import config
+from utils.metrics import (
+    LLM_CACHE, LLM_DURATION, LLM_ERRORS, LLM_TOKENS, LLM_TOKENS_TOTAL,
+    NODE_DURATION, NODE_ERRORS
+)
+from utils.logger import get_logger
+
+logger = get_logger("utils.tracing")
+
+_tracer = None
+if config.OTEL_TRACING:
+    try:
+        from opentelemetry import trace as _otel_trace
+        _tracer = _otel_trace.get_tracer("ai_interviewer")
+    except ImportError:
+        logger.warning("⚠️ opentelemetry-api not installed, OTEL_TRACING disabled")
+
+
+_usage: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar("llm_usage", default=None)
+
+
+@contextlib.contextmanager
+def llm_usage() -> Iterator[Dict[str, int]]:
+    """
+    Count the LLM calls made inside the block, including tasks it starts
+    (they inherit the context): calls, errors, cache hits and tokens.
+    """
+    usage = {"calls": 0, "errors": 0, "cache_hits": 0, "prompt_tokens": 0, "completion_tokens": 0}
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def span(name: str, **attributes):
+    """OpenTelemetry span when tracing is enabled, otherwise a no-op context."""
+    if _tracer is None:
+        return contextlib.nullcontext()
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def traced_node(name: str, node: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    """
+    Wrap an async LangGraph node to record its wall time and failures.
+
+    functools.wraps keeps the node's signature, so LangGraph still passes
+    `config` only to nodes that accept it.
+    """
+    if not config.METRICS_ENABLED and _tracer is None:
+        return node
+
+    @functools.wraps(node)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            if _tracer is None:
+                return await node(*args, **kwargs)
+            with _tracer.start_as_current_span(f"node.{name}"):
+                return await node(*args, **kwargs)
+        except BaseException:
+            NODE_ERRORS.inc(node=name)
+            raise
+        finally:
+            NODE_DURATION.observe(time.perf_counter() - started, node=name)
+
+    return wrapper
+
+
+def record_llm_call(
+    model: str,
+    mode: str,
+    seconds: float,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    error: Optional[BaseException] = None,
+    cached_prompt_tokens: int = 0
+):
+    """Report one finished LLM call (mode: "chat" or "stream")."""
+    usage = _usage.get()
+    if usage is not None:
+        usage["calls"] += 1
+        if error is not None:
+            usage["errors"] += 1
+        else:
+            usage["prompt_tokens"] += prompt_tokens
+            usage["completion_tokens"] += completion_tokens
+    if not config.METRICS_ENABLED:
+        return
+    LLM_DURATION.observe(seconds, model=model, mode=mode)
+    if error is not None:
+        LLM_ERRORS.inc(model=model, error=type(error).__name__)
+        return
+    if prompt_tokens:
+        LLM_TOKENS.observe(prompt_tokens, model=model, kind="prompt")
+        LLM_TOKENS_TOTAL.inc(prompt_tokens, model=model, kind="prompt")
+    if completion_tokens:
+        LLM_TOKENS.observe(completion_tokens, model=model, kind="completion")
+        LLM_TOKENS_TOTAL.inc(completion_tokens, model=model, kind="completion")
+    if cached_prompt_tokens:
+        LLM_TOKENS_TOTAL.inc(cached_prompt_tokens, model=model, kind="cached_prompt")
+
+
+def record_cache_lookup(hit: bool):
+    usage = _usage.get()
+    if usage is not None and hit:
+        usage["cache_hits"] += 1
+    if config.METRICS_ENABLED:
+        LLM_CACHE.inc(result="hit" if hit else "miss")